@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""
+Benchmark the bodygraph engines.
+
+Resolves channels, centers, type and authority for random active-gate
+sets with the set-based and the bitmask engine, checks that both agree
+and reports throughput.
+"""
+
+import random
+import sys
+import time
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.services.calculation.bodygraph_calculator import BodygraphCalculator
+
+
+def benchmark(samples: int = 20000, repeats: int = 3, seed: int = 0) -> float:
+    """
+    Time both engines over the same gate sets.
+
+    Args:
+        samples: Number of random gate sets
+        repeats: Timing runs per engine (best run is reported)
+        seed: Random seed
+
+    Returns:
+        Speedup of the bitmask engine over the set engine
+    """
+    rng = random.Random(seed)
+    # Real charts activate 26 gate slots, usually 20-26 distinct gates
+    gate_sets = [set(rng.sample(range(1, 65), rng.randint(18, 26))) for _ in range(samples)]
+    calculator = BodygraphCalculator()
+
+    mismatches = sum(
+        calculator._resolve_sets(gates) != calculator._resolve_bitmask(gates)
+        for gates in gate_sets
+    )
+    print(f"Checked {samples} gate sets: {mismatches} mismatches")
+
+    results = {}
+    for name, resolve in (("sets", calculator._resolve_sets), ("bitmask", calculator._resolve_bitmask)):
+        best = float("inf")
+        for _ in range(repeats):
+            start = time.perf_counter()
+            for gates in gate_sets:
+                resolve(gates)
+            best = min(best, time.perf_counter() - start)
+        results[name] = best
+        print(f"  {name:8s} {best / samples * 1e6:7.2f}µs per chart  ({samples / best:,.0f}/s)")
+
+    speedup = results["sets"] / results["bitmask"]
+    print(f"  Speedup: {speedup:.2f}x")
+    return speedup
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Benchmark set vs bitmask bodygraph engines")
+    parser.add_argument("--samples", type=int, default=20000, help="Random gate sets")
+    parser.add_argument("--repeats", type=int, default=3, help="Timing runs per engine")
+    args = parser.parse_args()
+
+    benchmark(samples=args.samples, repeats=args.repeats)
@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+Benchmark chart response serialization.
+
+Encodes the same charts through FastAPI's response_model path
+(validation, jsonable_encoder, Starlette JSONResponse) and through
+ChartJSONResponse's prebuilt fragments, checks that the bytes match and
+reports throughput.
+"""
+
+import asyncio
+import random
+import sys
+import time
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from fastapi.responses import JSONResponse
+from fastapi.routing import serialize_response
+from fastapi.utils import create_model_field
+
+from src.api.responses import get_chart_fragments
+from src.models.chart import ChartResponse
+from src.services.calculation.activations import BODIES, ActivationSet
+from src.services.calculation.bodygraph_calculator import BodygraphCalculator
+
+
+def benchmark(samples: int = 2000, repeats: int = 3, seed: int = 0) -> float:
+    """
+    Time both serialization paths over the same charts.
+
+    Args:
+        samples: Number of random charts
+        repeats: Timing runs per path (best run is reported)
+        seed: Random seed
+
+    Returns:
+        Speedup of the fragment path over the response_model path
+    """
+    rng = random.Random(seed)
+    calculator = BodygraphCalculator()
+
+    def side():
+        return ActivationSet.from_longitudes(BODIES, [rng.uniform(0, 360) for _ in BODIES], 0.0, "benchmark")
+
+    charts = [calculator.calculate_chart(side(), side(), "Anna") for _ in range(samples)]
+    field = create_model_field(name="Response_generate_chart", type_=ChartResponse, mode="serialization")
+    fragments = get_chart_fragments()
+
+    async def response_model_path():
+        return [JSONResponse(await serialize_response(field=field, response_content=chart)).body for chart in charts]
+
+    async def fragment_path():
+        return [fragments.encode(chart) for chart in charts]
+
+    expected = asyncio.run(response_model_path())
+    mismatches = sum(a != b for a, b in zip(expected, asyncio.run(fragment_path())))
+    total_bytes = sum(len(body) for body in expected)
+    print(f"Checked {samples} charts ({total_bytes / samples:.0f} bytes each): {mismatches} mismatches")
+
+    results = {}
+    for name, path in (("response_model", response_model_path), ("fragments", fragment_path)):
+        best = float("inf")
+        for _ in range(repeats):
+            start = time.perf_counter()
+            asyncio.run(path())
+            best = min(best, time.perf_counter() - start)
+        results[name] = best
+        print(f"  {name:15s} {best / samples * 1e6:7.2f}µs per chart  "
+              f"({total_bytes / best / 1e6:,.1f} MB/s)")
+
+    speedup = results["response_model"] / results["fragments"]
+    print(f"  Speedup: {speedup:.2f}x")
+    return speedup
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Benchmark response_model vs fragment chart serialization")
+    parser.add_argument("--samples", type=int, default=2000, help="Random charts")
+    parser.add_argument("--repeats", type=int, default=3, help="Timing runs per path")
+    args = parser.parse_args()
+
+    benchmark(samples=args.samples, repeats=args.repeats)
@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+Benchmark hedged ephemeris calls.
+
+Runs the same workload through a CompositeEphemerisSource with and without
+hedging. The primary is a simulated source with a long tail (most calls are
+fast, a few stall); the secondary is slower but steady. Reports end-to-end
+and per-source latency quantiles from the composite's own metrics.
+"""
+
+import random
+import sys
+import threading
+import time
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.models.celestial import CelestialBody
+from src.services.ephemeris.base import EphemerisSource
+from src.services.ephemeris.composite import CompositeEphemerisSource
+
+
+class SimulatedSource(EphemerisSource):
+    """Source sleeping for a random latency per batch."""
+
+    def __init__(self, name: str, fast: float, slow: float, slow_share: float, seed: int):
+        self.name = name
+        self.fast = fast
+        self.slow = slow
+        self.slow_share = slow_share
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+
+    def calculate_position(self, body: CelestialBody, julian_day: float) -> float:
+        return self.calculate_positions([body], julian_day)[0]
+
+    def calculate_positions(self, bodies, julian_day):
+        with self._lock:
+            stall = self._rng.random() < self.slow_share
+        time.sleep(self.slow if stall else self.fast)
+        return [0.0] * len(bodies)
+
+    def get_source_name(self) -> str:
+        return self.name
+
+    def is_available(self) -> bool:
+        return True
+
+
+def run(hedge: bool, calls: int, seed: int) -> dict:
+    """
+    Send `calls` batches through a composite.
+
+    Args:
+        hedge: Enable hedging
+        calls: Number of batches
+        seed: Random seed of the simulated latencies
+
+    Returns:
+        Composite stats
+    """
+    primary = SimulatedSource("primary", fast=0.002, slow=0.050, slow_share=0.04, seed=seed)
+    secondary = SimulatedSource("secondary", fast=0.006, slow=0.006, slow_share=0.0, seed=seed + 1)
+    composite = CompositeEphemerisSource(
+        [("primary", primary), ("secondary", secondary)], hedge=hedge, hedge_min_samples=20
+    )
+    bodies = list(CelestialBody)
+    for i in range(calls):
+        composite.calculate_positions(bodies, 2451545.0 + i)
+    stats = composite.stats()
+    composite.close()
+    return stats
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Benchmark tail latency with and without hedged ephemeris calls")
+    parser.add_argument("--calls", type=int, default=500, help="Batches per run")
+    parser.add_argument("--seed", type=int, default=0, help="Random seed")
+    args = parser.parse_args()
+
+    for hedge in (False, True):
+        stats = run(hedge, args.calls, args.seed)
+        overall = stats["overall"]
+        print(f"hedge={'on ' if hedge else 'off'}  p50 {overall['p50_ms']:6.2f}ms  "
+              f"p95 {overall['p95_ms']:6.2f}ms  p99 {overall['p99_ms']:6.2f}ms")
+        for name, source in stats["sources"].items():
+            print(f"    {name:10s} calls {source['calls']:4d}  hedges {source['hedges']:3d}  "
+                  f"wins {source['hedge_wins']:3d}  p99 {source['p99_ms'] or 0:6.2f}ms")
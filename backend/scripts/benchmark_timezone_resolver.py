@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+Benchmark timezone resolution.
+
+Loads TimezoneFinder with polygon data on disk and in memory, reporting
+load time and the memory the load allocates (traced with tracemalloc, so
+it is only measured here and not on the service's startup path), then
+resolves random points in the precomputed region through the cell table
+and exactly.
+"""
+
+import random
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from timezonefinder import TimezoneFinder
+
+from src.services.timezone_resolver import TimezoneResolver, parse_bounds
+
+
+def measure_load(in_memory: bool) -> TimezoneFinder:
+    """
+    Load TimezoneFinder and print load time and allocated memory.
+
+    Args:
+        in_memory: Load polygon data into memory
+
+    Returns:
+        Loaded TimezoneFinder
+    """
+    tracemalloc.start()
+    start = time.perf_counter()
+    finder = TimezoneFinder(in_memory=in_memory)
+    seconds = time.perf_counter() - start
+    allocated = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    print(f"in_memory={'on ' if in_memory else 'off'}  load {seconds:6.3f}s  memory {allocated / 2**20:7.1f} MiB")
+    return finder
+
+
+def measure_lookups(finder: TimezoneFinder, bounds: tuple, points: int, seed: int) -> None:
+    """
+    Resolve random points through the cell table and exactly.
+
+    Args:
+        finder: Loaded TimezoneFinder
+        bounds: (lat_min, lat_max, lng_min, lng_max) region to sample
+        points: Number of points
+        seed: Random seed
+    """
+    resolver = TimezoneResolver(finder=finder)
+    resolver.precompute(*bounds)
+    rng = random.Random(seed)
+    lat_min, lat_max, lng_min, lng_max = bounds
+    coordinates = [(rng.uniform(lat_min, lat_max), rng.uniform(lng_min, lng_max)) for _ in range(points)]
+
+    start = time.perf_counter()
+    for lat, lng in coordinates:
+        resolver.timezone_at(lat, lng)
+    resolved = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for lat, lng in coordinates:
+        finder.timezone_at(lat=lat, lng=lng)
+    exact = time.perf_counter() - start
+
+    print(f"    resolver {resolved / points * 1e6:8.1f}us/lookup  exact {exact / points * 1e6:8.1f}us/lookup")
+    for mode, counter in resolver.stats()["lookups"].items():
+        print(f"    {mode:12s} count {counter['count']:6d}  mean {counter['mean_us']:8.1f}us")
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Benchmark TimezoneFinder loading and cell-table lookups")
+    parser.add_argument("--bounds", default="45.5,55.5,5.5,17.5", help="lat_min,lat_max,lng_min,lng_max")
+    parser.add_argument("--points", type=int, default=10000, help="Random points per run")
+    parser.add_argument("--seed", type=int, default=0, help="Random seed")
+    args = parser.parse_args()
+
+    bounds = parse_bounds(args.bounds)
+    if bounds is None:
+        parser.error("--bounds must not be empty")
+    for in_memory in (False, True):
+        finder = measure_load(in_memory)
+        measure_lookups(finder, bounds, args.points, args.seed)
@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""
+Build the Chebyshev ephemeris.
+
+Fits per-body Chebyshev series to Swiss Ephemeris over the supported date
+range, writes the memory-mappable file read by the chebyshev source and
+verifies longitudes against Swiss Ephemeris at random moments.
+"""
+
+import os
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.services.ephemeris.initializer import apply_ephemeris_path
+from src.services.ephemeris.swiss_ephemeris import SwissEphemerisSource
+from src.services.ephemeris.chebyshev import (
+    DEFAULT_JD_END,
+    DEFAULT_JD_START,
+    ChebyshevEphemeris,
+)
+
+
+def build_chebyshev_ephemeris(
+    output: str,
+    ephemeris_dir: str,
+    jd_start: float = DEFAULT_JD_START,
+    jd_end: float = DEFAULT_JD_END,
+    verify_samples: int = 2000,
+    tolerance_arcsec: float = 5.0,
+) -> bool:
+    """
+    Build, save and verify a Chebyshev ephemeris.
+
+    Args:
+        output: Output file path
+        ephemeris_dir: Swiss Ephemeris data directory (used if it exists)
+        jd_start: First Julian Day to cover
+        jd_end: Last Julian Day to cover
+        verify_samples: Number of random moments to verify
+        tolerance_arcsec: Allowed longitude error against Swiss Ephemeris
+
+    Returns:
+        True if verification passed
+    """
+    if Path(ephemeris_dir).is_dir():
+        apply_ephemeris_path(ephemeris_dir)
+    else:
+        print(f"WARNING: {ephemeris_dir} not found, using built-in ephemeris")
+
+    def progress(key, series):
+        name = getattr(key, "value", key)
+        print(f"  {name}: {series.count} intervals of {series.interval_days:g} days, degree {series.degree}")
+
+    print(f"Fitting Chebyshev series from JD {jd_start} to {jd_end}")
+    start = time.perf_counter()
+    ephemeris = ChebyshevEphemeris.build(jd_start, jd_end, progress=progress)
+    ephemeris.save(output)
+    size_kb = Path(output).stat().st_size / 1024
+    print(f"✓ Wrote {output} ({len(ephemeris.series)} series, {size_kb:.0f} KB) "
+          f"in {time.perf_counter() - start:.1f}s")
+
+    if verify_samples <= 0:
+        return True
+
+    rng = np.random.default_rng(0)
+    julian_days = rng.uniform(jd_start, jd_end, verify_samples)
+    report = ChebyshevEphemeris.load(output).verify_against(
+        SwissEphemerisSource(), julian_days, tolerance_arcsec=tolerance_arcsec
+    )
+    for body, errors in report["bodies"].items():
+        print(f"  {body}: max error {errors['max_error_arcsec']:.3f}\"")
+    status = "✓" if report["passed"] else "✗"
+    print(f"{status} Verified {report['samples']} moments: max error {report['max_error_arcsec']:.3f}\" "
+          f"({report['max_error_line_fraction']:.2e} of a line, tolerance {tolerance_arcsec}\")")
+    return report["passed"]
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        description="Build the Chebyshev ephemeris used by the chebyshev source"
+    )
+    parser.add_argument(
+        "--output",
+        default=os.getenv("EPHEMERIS_CHEBYSHEV_PATH", "/app/data/ephemeris/chebyshev.bin"),
+        help="Output file path",
+    )
+    parser.add_argument(
+        "--ephemeris-dir",
+        default=os.getenv("EPHEMERIS_PATH", "/app/data/ephemeris"),
+        help="Directory containing Swiss Ephemeris files",
+    )
+    parser.add_argument("--jd-start", type=float, default=DEFAULT_JD_START, help="First Julian Day")
+    parser.add_argument("--jd-end", type=float, default=DEFAULT_JD_END, help="Last Julian Day")
+    parser.add_argument("--verify-samples", type=int, default=2000, help="Random moments to verify (0 to skip)")
+    parser.add_argument("--tolerance-arcsec", type=float, default=5.0, help="Allowed longitude error")
+
+    args = parser.parse_args()
+
+    try:
+        passed = build_chebyshev_ephemeris(
+            output=args.output,
+            ephemeris_dir=args.ephemeris_dir,
+            jd_start=args.jd_start,
+            jd_end=args.jd_end,
+            verify_samples=args.verify_samples,
+            tolerance_arcsec=args.tolerance_arcsec,
+        )
+        sys.exit(0 if passed else 1)
+
+    except KeyboardInterrupt:
+        print("\n\nBuild cancelled by user")
+        sys.exit(1)
+    except Exception as e:
+        print(f"\n\nFATAL ERROR: {e}")
+        import traceback
+        traceback.print_exc()
+        sys.exit(1)
@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+Build the offline gazetteer.
+
+Reads a GeoNames dump (e.g. cities15000.txt from
+https://download.geonames.org/export/dump/) and writes the memory-mapped
+place index used by GeocodingService before it falls back to Nominatim.
+"""
+
+import os
+import sys
+import time
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.services.gazetteer import Gazetteer, build_gazetteer, iter_geonames
+
+# Spot checks that should resolve in any reasonably complete dump
+SAMPLE_QUERIES = ["Berlin, Deutschland", "München", "Muenchen", "Munich", "London, UK"]
+
+
+def build(input_path: str, output: str, min_population: int = 0) -> bool:
+    """
+    Build and spot-check a gazetteer.
+
+    Args:
+        input_path: GeoNames tab-separated dump
+        output: Output file path
+        min_population: Skip places with a smaller population
+
+    Returns:
+        True if the index was written
+    """
+    if not Path(input_path).is_file():
+        print(f"ERROR: {input_path} not found")
+        return False
+
+    print(f"Reading places from {input_path} (min population {min_population})")
+    start = time.perf_counter()
+    counts = build_gazetteer(iter_geonames(input_path, min_population), output)
+    size_mb = Path(output).stat().st_size / (1024 * 1024)
+    print(f"✓ Wrote {output} ({counts['places']} places, {counts['keys']} names, "
+          f"{counts['timezones']} timezones, {size_mb:.1f} MB) in {time.perf_counter() - start:.1f}s")
+
+    gazetteer = Gazetteer(output)
+    for query in SAMPLE_QUERIES:
+        entry = gazetteer.lookup(query)
+        if entry is None:
+            print(f"  {query}: not found")
+        else:
+            print(f"  {query}: {entry.latitude:.4f}, {entry.longitude:.4f} "
+                  f"{entry.timezone} ({entry.country_code})")
+
+    iterations = 10000
+    start = time.perf_counter()
+    for _ in range(iterations):
+        gazetteer.lookup("München, Deutschland")
+    per_lookup = (time.perf_counter() - start) / iterations * 1e6
+    print(f"  Lookup time: {per_lookup:.1f}µs")
+    gazetteer.close()
+    return True
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        description="Build the offline gazetteer from a GeoNames dump"
+    )
+    parser.add_argument("--input", required=True, help="GeoNames dump (e.g. cities15000.txt)")
+    parser.add_argument(
+        "--output",
+        default=os.getenv("GAZETTEER_PATH", "/app/data/gazetteer/gazetteer.bin"),
+        help="Output file path",
+    )
+    parser.add_argument("--min-population", type=int, default=0, help="Skip smaller places")
+
+    args = parser.parse_args()
+
+    try:
+        ok = build(args.input, args.output, args.min_population)
+        sys.exit(0 if ok else 1)
+
+    except KeyboardInterrupt:
+        print("\n\nBuild cancelled by user")
+        sys.exit(1)
+    except Exception as e:
+        print(f"\n\nFATAL ERROR: {e}")
+        import traceback
+        traceback.print_exc()
+        sys.exit(1)
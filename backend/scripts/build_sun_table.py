@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""
+Build the precomputed Sun-longitude table.
+
+Samples the Sun with Swiss Ephemeris over the supported date range, writes
+the memory-mappable table used for design-time lookup and verifies it
+against the ephemeris design-time solver.
+"""
+
+import os
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.services.ephemeris.initializer import apply_ephemeris_path
+from src.services.ephemeris.swiss_ephemeris import SwissEphemerisSource
+from src.services.calculation.sun_table import (
+    DEFAULT_JD_END,
+    DEFAULT_JD_START,
+    SunLongitudeTable,
+)
+
+
+def build_sun_table(
+    output: str,
+    ephemeris_dir: str,
+    jd_start: float = DEFAULT_JD_START,
+    jd_end: float = DEFAULT_JD_END,
+    step: float = 1.0,
+    verify_samples: int = 1000,
+    tolerance_seconds: float = 1.0,
+) -> bool:
+    """
+    Build, save and verify a Sun table.
+
+    Args:
+        output: Output file path
+        ephemeris_dir: Swiss Ephemeris data directory (used if it exists)
+        jd_start: First Julian Day to cover
+        jd_end: Last Julian Day to cover
+        step: Sample spacing in days
+        verify_samples: Number of random birth moments to verify
+        tolerance_seconds: Allowed design-time difference against the solver
+
+    Returns:
+        True if verification passed
+    """
+    if Path(ephemeris_dir).is_dir():
+        apply_ephemeris_path(ephemeris_dir)
+    else:
+        print(f"WARNING: {ephemeris_dir} not found, using built-in ephemeris")
+
+    source = SwissEphemerisSource()
+
+    print(f"Sampling Sun from JD {jd_start} to {jd_end} every {step} day(s)")
+    start = time.perf_counter()
+    table = SunLongitudeTable.build(source, jd_start, jd_end, step)
+    table.save(output)
+    size_kb = Path(output).stat().st_size / 1024
+    print(f"✓ Wrote {output} ({len(table.samples)} samples, {size_kb:.0f} KB) "
+          f"in {time.perf_counter() - start:.1f}s")
+
+    if verify_samples <= 0:
+        return True
+
+    # Birth moments whose design moment is still inside the table
+    rng = np.random.default_rng(0)
+    birth_jds = rng.uniform(jd_start + 100.0, jd_end, verify_samples)
+    report = SunLongitudeTable.load(output).verify_against(
+        source, birth_jds, tolerance_seconds=tolerance_seconds
+    )
+    status = "✓" if report["passed"] else "✗"
+    print(f"{status} Verified {report['samples']} design moments: "
+          f"max error {report['max_error_seconds']:.3f}s (tolerance {tolerance_seconds}s)")
+    return report["passed"]
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        description="Build the precomputed Sun-longitude table for design-time lookup"
+    )
+    parser.add_argument(
+        "--output",
+        default=os.getenv("EPHEMERIS_SUN_TABLE_PATH", "/app/data/ephemeris/sun_table.bin"),
+        help="Output file path",
+    )
+    parser.add_argument(
+        "--ephemeris-dir",
+        default=os.getenv("EPHEMERIS_PATH", "/app/data/ephemeris"),
+        help="Directory containing Swiss Ephemeris files",
+    )
+    parser.add_argument("--jd-start", type=float, default=DEFAULT_JD_START, help="First Julian Day")
+    parser.add_argument("--jd-end", type=float, default=DEFAULT_JD_END, help="Last Julian Day")
+    parser.add_argument("--step", type=float, default=1.0, help="Sample spacing in days")
+    parser.add_argument("--verify-samples", type=int, default=1000, help="Random moments to verify (0 to skip)")
+    parser.add_argument("--tolerance-seconds", type=float, default=1.0, help="Allowed design-time error")
+
+    args = parser.parse_args()
+
+    try:
+        passed = build_sun_table(
+            output=args.output,
+            ephemeris_dir=args.ephemeris_dir,
+            jd_start=args.jd_start,
+            jd_end=args.jd_end,
+            step=args.step,
+            verify_samples=args.verify_samples,
+            tolerance_seconds=args.tolerance_seconds,
+        )
+        sys.exit(0 if passed else 1)
+
+    except KeyboardInterrupt:
+        print("\n\nBuild cancelled by user")
+        sys.exit(1)
+    except Exception as e:
+        print(f"\n\nFATAL ERROR: {e}")
+        import traceback
+        traceback.print_exc()
+        sys.exit(1)
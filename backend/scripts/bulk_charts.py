@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""
+Calculate charts for a CSV or Parquet file of birth records.
+
+Rows need birthDate (TT.MM.JJJJ), birthTime (HH:MM, 12:00 if empty) and
+either timezone (IANA name) or birthPlace (resolved with the offline
+gazetteer). Results are written as one part file per chunk with gate
+bitmasks, type, authority, profile and cross; re-running the same command
+resumes after the last finished chunk.
+"""
+
+import os
+import sys
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.services.calculation.bulk import OUTPUT_FORMATS, run_bulk
+
+
+def print_progress(totals: dict) -> None:
+    """Print running throughput after each chunk."""
+    print(f"  {totals['rows']:>10} rows  {totals['errors']:>8} errors  "
+          f"{totals['rows_per_second']:>8.0f} rows/s  ({totals['seconds']:.0f}s)")
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        description="Calculate Human Design charts for a CSV or Parquet file"
+    )
+    parser.add_argument("--input", required=True, help="Input .csv or .parquet file")
+    parser.add_argument("--output", required=True, help="Output directory for part files")
+    parser.add_argument("--format", choices=OUTPUT_FORMATS, default="csv", help="Output file format")
+    parser.add_argument("--chunk-size", type=int, default=10000, help="Rows per chunk (keep when resuming)")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1,
+                        help="Worker processes (0 runs in this process)")
+    parser.add_argument("--id-column", default="id", help="Input column copied to the output id")
+    parser.add_argument(
+        "--ephemeris-dir",
+        default=os.getenv("EPHEMERIS_PATH", "/app/data/ephemeris"),
+        help="Directory containing Swiss Ephemeris files",
+    )
+    parser.add_argument("--restart", action="store_true", help="Discard existing results instead of resuming")
+
+    args = parser.parse_args()
+
+    try:
+        print(f"Calculating charts for {args.input} with {args.workers} worker(s)")
+        totals = run_bulk(
+            input_path=args.input,
+            output_dir=args.output,
+            output_format=args.format,
+            chunk_size=args.chunk_size,
+            workers=args.workers,
+            id_column=args.id_column,
+            ephemeris_dir=args.ephemeris_dir,
+            restart=args.restart,
+            progress=print_progress,
+        )
+        if totals["skipped_chunks"]:
+            print(f"Resumed: {totals['skipped_chunks']} chunk(s) already done")
+        print(f"✓ {totals['rows']} rows ({totals['errors']} errors) in {totals['seconds']:.1f}s, "
+              f"{totals['rows_per_second']:.0f} rows/s -> {args.output}")
+        sys.exit(0)
+
+    except KeyboardInterrupt:
+        print("\n\nInterrupted; re-run the same command to resume")
+        sys.exit(1)
+    except Exception as e:
+        print(f"\n\nFATAL ERROR: {e}")
+        import traceback
+        traceback.print_exc()
+        sys.exit(1)
@@ -3,24 +3,47 @@
 Load ephemeris files from Postgres to filesystem.
 
 Extracts .se1 files from database to ephemeris directory at application startup.
+Blobs are streamed in chunks, verified against their stored SHA-256 and
+renamed into place atomically; files already on disk with a matching hash
+are skipped.
 """
 
 import os
 import sys
+import time
 from pathlib import Path
 from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
 
 # Add parent directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from src.models.ephemeris_storage import Base, EphemerisFile
+from src.services.ephemeris.extraction import (
+    DEFAULT_CHUNK_SIZE,
+    DEFAULT_WORKERS,
+    EXTRACTED,
+    SKIPPED,
+    ExtractionResult,
+    extract_ephemeris_files,
+)
+
+
+def print_result(result: ExtractionResult) -> None:
+    """Print one finished file."""
+    size_mb = result.file_size / (1024 * 1024)
+    if result.status == EXTRACTED:
+        print(f"✓ Extracted {result.filename} ({size_mb:.2f} MB, SHA256 verified)")
+    elif result.status == SKIPPED:
+        print(f"⊙ Skipping {result.filename} (already exists, hash matches)")
+    else:
+        print(f"✗ Failed {result.filename}: {result.error}")
 
 
 def load_ephemeris_files(
     database_url: str,
     output_dir: str = "/app/data/ephemeris",
-    force: bool = False
+    force: bool = False,
+    workers: int = DEFAULT_WORKERS,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
 ):
     """
     Extract ephemeris files from database to filesystem.
@@ -28,54 +51,51 @@ def load_ephemeris_files(
     Args:
         database_url: SQLAlchemy database URL
         output_dir: Directory to extract files to
-        force: Overwrite existing files if True
+        force: Overwrite existing files even if their hash matches
+        workers: Number of files extracted concurrently
+        chunk_size: Bytes fetched per database round trip
     """
-    # Create database engine and session
-    engine = create_engine(database_url)
-    Session = sessionmaker(bind=engine)
-    session = Session()
+    # One pooled connection per extraction thread
+    engine = create_engine(
+        database_url,
+        pool_size=max(1, workers),
+        max_overflow=0,
+        connect_args={"check_same_thread": False} if "sqlite" in database_url else {},
+    )
 
-    # Create output directory
-    output_path = Path(output_dir)
-    output_path.mkdir(parents=True, exist_ok=True)
+    print(f"Extracting to: {output_dir} ({workers} workers, {chunk_size // (1024 * 1024)} MB chunks)")
+    print("-" * 60)
 
-    # Get all ephemeris files from database
-    files = session.query(EphemerisFile).all()
+    started = time.perf_counter()
+    try:
+        totals = extract_ephemeris_files(
+            engine,
+            output_dir,
+            force=force,
+            workers=workers,
+            chunk_size=chunk_size,
+            progress=print_result,
+        )
+    finally:
+        engine.dispose()
+    elapsed = time.perf_counter() - started
 
-    if not files:
+    if not totals["files"]:
         print("WARNING: No ephemeris files found in database!")
         print("Run upload_ephemeris_to_db.py first to populate the database.")
         sys.exit(1)
 
-    print(f"Found {len(files)} ephemeris files in database")
-    print(f"Extracting to: {output_dir}")
     print("-" * 60)
+    print(f"Extracted: {totals['extracted']}, Skipped: {totals['skipped']}, "
+          f"Failed: {totals['failed']}, Total: {totals['files']} "
+          f"({totals['bytes'] / (1024 * 1024):.1f} MB in {elapsed:.1f}s)")
 
-    extracted = 0
-    skipped = 0
-
-    for ephemeris_file in files:
-        dest_path = output_path / ephemeris_file.filename
-
-        # Skip if exists and not forcing
-        if dest_path.exists() and not force:
-            print(f"⊙ Skipping {ephemeris_file.filename} (already exists)")
-            skipped += 1
-            continue
-
-        # Write file data to disk
-        dest_path.write_bytes(ephemeris_file.file_data)
-
-        size_mb = ephemeris_file.file_size / (1024 * 1024)
-        print(f"✓ Extracted {ephemeris_file.filename} ({size_mb:.2f} MB)")
-        extracted += 1
+    if totals["failed"]:
+        print("ERROR: Some ephemeris files could not be extracted")
+        sys.exit(1)
 
-    print("-" * 60)
-    print(f"Extracted: {extracted}, Skipped: {skipped}, Total: {len(files)}")
     print(f"✓ Ephemeris files ready at: {output_dir}")
 
-    session.close()
-
 
 if __name__ == "__main__":
     import argparse
@@ -96,7 +116,19 @@ if __name__ == "__main__":
     parser.add_argument(
         "--force",
         action="store_true",
-        help="Overwrite existing files",
+        help="Overwrite existing files even if their hash matches",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=DEFAULT_WORKERS,
+        help="Files extracted concurrently",
+    )
+    parser.add_argument(
+        "--chunk-size-mb",
+        type=int,
+        default=DEFAULT_CHUNK_SIZE // (1024 * 1024),
+        help="Megabytes fetched per database round trip",
     )
 
     args = parser.parse_args()
@@ -105,7 +137,9 @@ if __name__ == "__main__":
         load_ephemeris_files(
             database_url=args.database_url,
             output_dir=args.output_dir,
-            force=args.force
+            force=args.force,
+            workers=args.workers,
+            chunk_size=args.chunk_size_mb * 1024 * 1024,
         )
         sys.exit(0)
 
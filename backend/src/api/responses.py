@@ -0,0 +1,181 @@
+"""
+Fast JSON responses for charts.
+
+Most of a ChartResponse is text chosen by code: type, authority and profile
+descriptions, the nine centers and the impulse. ChartFragments serializes
+each distinct value once and reuses the bytes; ChartJSONResponse assembles
+a chart from those fragments and encodes only the per-chart parts (name,
+channels, gates, cross) with orjson. The output is byte-identical to
+FastAPI's response_model path through Starlette's JSONResponse.
+"""
+
+import threading
+from typing import Any, Dict, Hashable, Iterable, Mapping, Optional
+
+import orjson
+from fastapi.responses import JSONResponse
+
+from src.models.chart import (
+    AuthorityInfo,
+    Center,
+    Channel,
+    ChartResponse,
+    ProfileInfo,
+    TypeInfo,
+)
+
+# Fragment tables are cleared when they grow past this (content reloads add new texts)
+MAX_FRAGMENTS = 4096
+
+
+class ChartFragments:
+    """
+    Memoized JSON fragments of the static parts of a chart, keyed by value.
+    """
+
+    def __init__(self, max_fragments: int = MAX_FRAGMENTS):
+        """
+        Initialize empty fragment tables.
+
+        Args:
+            max_fragments: Entries per table before it is cleared
+        """
+        self.max_fragments = max_fragments
+        self._tables: Dict[str, Dict[Hashable, bytes]] = {
+            name: {} for name in ("type", "authority", "profile", "centers", "channel", "impulse")
+        }
+        self._lock = threading.Lock()
+
+    def _fragment(self, table: str, key: Hashable, value: Any) -> bytes:
+        """Get the cached JSON of a value, encoding it on first use."""
+        fragments = self._tables[table]
+        encoded = fragments.get(key)
+        if encoded is None:
+            encoded = orjson.dumps(value)
+            with self._lock:
+                if len(fragments) >= self.max_fragments:
+                    fragments.clear()
+                fragments[key] = encoded
+        return encoded
+
+    def type_info(self, info: TypeInfo) -> bytes:
+        key = (info.code, info.label, info.shortDescription)
+        return self._fragment("type", key, {"code": key[0], "label": key[1], "shortDescription": key[2]})
+
+    def authority_info(self, info: AuthorityInfo) -> bytes:
+        key = (info.code, info.label, info.decisionHint)
+        return self._fragment("authority", key, {"code": key[0], "label": key[1], "decisionHint": key[2]})
+
+    def profile_info(self, info: ProfileInfo) -> bytes:
+        key = (info.code, info.shortDescription)
+        return self._fragment("profile", key, {"code": key[0], "shortDescription": key[1]})
+
+    def centers(self, centers: Iterable[Center]) -> bytes:
+        key = tuple((center.name, center.code, center.defined) for center in centers)
+        return self._fragment(
+            "centers", key, [{"name": name, "code": code, "defined": defined} for name, code, defined in key]
+        )
+
+    def channel(self, channel: Channel) -> bytes:
+        return self._fragment("channel", channel.code, {"code": channel.code})
+
+    def impulse(self, text: str) -> bytes:
+        return self._fragment("impulse", text, text)
+
+    def warm(
+        self,
+        types: Iterable[TypeInfo],
+        authorities: Iterable[AuthorityInfo],
+        profiles: Mapping[str, str],
+        impulses: Iterable[str] = (),
+    ) -> None:
+        """
+        Prebuild fragments for every known code.
+
+        Args:
+            types: All TypeInfo values
+            authorities: All AuthorityInfo values
+            profiles: Profile code to description
+            impulses: Impulse texts
+        """
+        for type_info in types:
+            self.type_info(type_info)
+        for authority in authorities:
+            self.authority_info(authority)
+        for code, description in profiles.items():
+            self.profile_info(ProfileInfo(code=code, shortDescription=description))
+        for text in impulses:
+            self.impulse(text)
+
+    def encode(self, chart: ChartResponse) -> bytes:
+        """
+        Serialize a chart.
+
+        Args:
+            chart: Chart to encode
+
+        Returns:
+            UTF-8 JSON bytes, identical to JSONResponse(jsonable_encoder(chart)).body
+        """
+        cross = chart.incarnationCross
+        return b"".join((
+            b'{"firstName":', orjson.dumps(chart.firstName),
+            b',"type":', self.type_info(chart.type),
+            b',"authority":', self.authority_info(chart.authority),
+            b',"profile":', self.profile_info(chart.profile),
+            b',"centers":', self.centers(chart.centers),
+            b',"channels":[', b",".join(self.channel(channel) for channel in chart.channels),
+            b'],"gates":', orjson.dumps(chart.gates),
+            b',"incarnationCross":',
+            orjson.dumps({"code": cross.code, "name": cross.name, "gates": cross.gates}),
+            b',"shortImpulse":', self.impulse(chart.shortImpulse),
+            b',"calculationSource":', orjson.dumps(chart.calculationSource),
+            b"}",
+        ))
+
+
+_fragments: Optional[ChartFragments] = None
+_fragments_lock = threading.Lock()
+
+
+def get_chart_fragments() -> ChartFragments:
+    """
+    Get the process-wide fragment tables, prebuilding them on first use.
+
+    Returns:
+        Shared ChartFragments instance
+    """
+    global _fragments
+    with _fragments_lock:
+        if _fragments is None:
+            from src.services.calculation.bodygraph_calculator import (
+                AUTHORITIES,
+                TYPES,
+                build_authority_info,
+                build_type_info,
+            )
+            from src.services.content_registry import get_content_registry
+
+            snapshot = get_content_registry().snapshot
+            _fragments = ChartFragments()
+            _fragments.warm(
+                types=[build_type_info(code) for code in TYPES],
+                authorities=[build_authority_info(code) for code in AUTHORITIES],
+                profiles=snapshot.profiles,
+                impulses=snapshot.impulses.values(),
+            )
+        return _fragments
+
+
+class ChartJSONResponse(JSONResponse):
+    """
+    JSONResponse that encodes ChartResponse content from prebuilt fragments.
+
+    Endpoints return ChartJSONResponse(chart) directly; any other content
+    is rendered exactly like JSONResponse.
+    """
+
+    def render(self, content: Any) -> bytes:
+        if isinstance(content, ChartResponse):
+            return get_chart_fragments().encode(content)
+        return super().render(content)
@@ -0,0 +1,74 @@
+"""Admin routes for inspecting in-process state"""
+
+import os
+import secrets
+from typing import Optional
+
+from fastapi import APIRouter, Depends, Header, HTTPException
+
+from src.services.calculation.design_time import design_time_stats
+from src.services.chart_cache import get_chart_cache
+from src.services.ephemeris.registry import get_source_registry
+from src.services.shadow_validation import get_shadow_validator
+from src.services.timezone_resolver import get_timezone_resolver
+
+
+def require_admin_token(x_admin_token: Optional[str] = Header(default=None)) -> None:
+    """
+    Check the X-Admin-Token header against ADMIN_API_TOKEN.
+
+    Admin routes are disabled entirely while ADMIN_API_TOKEN is unset.
+
+    Raises:
+        HTTPException: 403 if the token is missing, wrong or not configured
+    """
+    expected = os.getenv("ADMIN_API_TOKEN")
+    if not expected or not x_admin_token or not secrets.compare_digest(x_admin_token, expected):
+        raise HTTPException(
+            status_code=403,
+            detail={"field": "authorization", "error": "Zugriff verweigert."},
+        )
+
+
+router = APIRouter(
+    prefix="/api/admin",
+    tags=["admin"],
+    dependencies=[Depends(require_admin_token)],
+)
+
+
+@router.get("/cache")
+async def get_cache_stats():
+    """Get chart cache usage and hit/miss/eviction counters"""
+    return get_chart_cache().stats()
+
+
+@router.delete("/cache")
+async def flush_cache():
+    """Drop all cached charts"""
+    removed = get_chart_cache().clear()
+    return {"flushed": removed}
+
+
+@router.get("/design-time")
+async def get_design_time_stats():
+    """Get design-time solver convergence: solves, iterations and residuals"""
+    return design_time_stats.snapshot()
+
+
+@router.get("/timezones")
+async def get_timezone_stats():
+    """Get timezone resolver load cost, cell table size and lookup latency per mode"""
+    return get_timezone_resolver().stats()
+
+
+@router.get("/ephemeris")
+async def get_ephemeris_stats():
+    """Get built ephemeris sources and their cached availability"""
+    return get_source_registry().stats()
+
+
+@router.get("/shadow")
+async def get_shadow_stats():
+    """Get shadow validation counters, per-body deltas and recent mismatching charts"""
+    return get_shadow_validator().stats()
@@ -1,32 +1,44 @@
 """FastAPI main application"""
 
-from fastapi import FastAPI, HTTPException, Request
+from fastapi import BackgroundTasks, FastAPI, HTTPException, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, StreamingResponse
 import os
 from dotenv import load_dotenv
-import html
+from contextlib import asynccontextmanager
 import asyncio
-import re
 from slowapi import Limiter
 from slowapi.util import get_remote_address
 from slowapi.errors import RateLimitExceeded
 
-from src.models.chart import ChartRequest, ChartResponse
+from src.models.chart import ChartBatchRequest, ChartRequest, ChartResponse
 from src.models.email import EmailCaptureRequest, EmailCaptureResponse
 from src.services.validation_service import ValidationService, ValidationError
 from src.services.hd_api_client import HDAPIClient
 from src.services.normalization_service import NormalizationService
 from src.api.routes.chart import router as chart_router
+from src.api.routes.admin import router as admin_router
+from src.api.responses import ChartJSONResponse, get_chart_fragments
 from src.handlers.email_handler import EmailHandler, EmailCaptureError
 from src.database import get_db_session
-from datetime import datetime
-import pytz
 from src.services.geocoding_service import GeocodingService
-from src.services.calculation.bodygraph_calculator import BodygraphCalculator
-from src.services.ephemeris.source_factory import get_ephemeris_source
-from src.services.calculation.position_calculator import PositionCalculator
-from src.services.calculation.design_time import calculate_design_datetime
+from src.services.chart_cache import get_chart_cache
+from src.services.content_registry import get_content_registry
+from src.services.shadow_validation import get_shadow_validator
+from src.services.ephemeris.initializer import get_ephemeris_initializer
+from src.services.ephemeris.registry import get_source_registry
+from src.services.calculation.engine import (
+    CalculationEngine,
+    EngineOverloadedError,
+    calculate_chart_for_instant,
+    chart_source_name,
+)
+from src.services.chart_batch import (
+    NDJSON_MEDIA_TYPE,
+    ChartBatchProcessor,
+    localize_birth_datetime,
+    prepare_birth_input,
+)
 
 # Load environment variables
 load_dotenv()
@@ -34,11 +46,30 @@ load_dotenv()
 # Initialize rate limiter
 limiter = Limiter(key_func=get_remote_address)
 
+# Chart calculations run off the event loop on a bounded worker pool
+calculation_engine = CalculationEngine.from_config()
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Application startup and shutdown hooks"""
+    # Warm the ephemeris off the event loop; /ready turns green when it is done
+    warmup = asyncio.create_task(asyncio.to_thread(ephemeris_initializer.initialize))
+    await asyncio.to_thread(source_registry.startup)
+    yield
+    await warmup
+    calculation_engine.shutdown()
+    shadow_validator.close()
+    await asyncio.to_thread(source_registry.shutdown)
+    await geocoding_service.aclose()
+
+
 # Initialize FastAPI app
 app = FastAPI(
     title="Human Design Chart Generator API",
     description="Backend API for generating Human Design charts",
     version="1.0.0",
+    lifespan=lifespan,
 )
 
 # Add rate limiter to app state
@@ -72,10 +103,19 @@ hd_client = HDAPIClient()
 normalization_service = NormalizationService()
 email_handler = EmailHandler()
 geocoding_service = GeocodingService()
-bodygraph_calculator = BodygraphCalculator()
+chart_cache = get_chart_cache()
+content_registry = get_content_registry()
+chart_fragments = get_chart_fragments()
+ephemeris_initializer = get_ephemeris_initializer()
+source_registry = get_source_registry()
+shadow_validator = get_shadow_validator()
+chart_batch_processor = ChartBatchProcessor.from_config(
+    geocoding_service, calculation_engine, chart_cache, chart_source_name
+)
 
 # Include routers
 app.include_router(chart_router)
+app.include_router(admin_router)
 
 
 @app.get("/health")
@@ -84,9 +124,21 @@ async def health_check():
     return {"status": "healthy", "service": "hd-chart-generator"}
 
 
-@app.post("/api/hd-chart", response_model=ChartResponse)
+@app.get("/ready")
+async def readiness_check():
+    """Readiness probe: 200 once the ephemeris files are applied, complete and warm, else 503"""
+    status = ephemeris_initializer.status()
+    return JSONResponse(
+        status_code=200 if ephemeris_initializer.ready else 503,
+        content={"service": "hd-chart-generator", **status},
+    )
+
+
+@app.post("/api/hd-chart", response_model=ChartResponse, response_class=ChartJSONResponse)
 @limiter.limit("10/minute")  # 10 requests per minute for expensive calculation
-async def generate_chart(request: Request, chart_request: ChartRequest):
+async def generate_chart(
+    request: Request, chart_request: ChartRequest, background_tasks: BackgroundTasks
+):
     """
     Generate Human Design chart from birth data
 
@@ -100,46 +152,23 @@ async def generate_chart(request: Request, chart_request: ChartRequest):
         HTTPException: 400 for validation errors, 500 for API errors
     """
     try:
-        # Sanitize input to prevent XSS with strict validation
-        name = chart_request.firstName.strip()
-
-        # Only allow German characters, spaces, hyphens, and apostrophes
-        if not re.match(r'^[a-zA-ZäöüßÄÖÜ\s\-\.\']+$', name):
-            raise ValidationError(
-                "firstName",
-                "Name darf nur Buchstaben, Leerzeichen, Bindestriche und Apostrophe enthalten."
-            )
-
-        # Additional length check
-        if len(name) < 2 or len(name) > 100:
-            raise ValidationError(
-                "firstName",
-                "Name muss zwischen 2 und 100 Zeichen lang sein."
-            )
-
-        # HTML escape for safe output rendering
-        sanitized_name = html.escape(name)
-
-        # Validate input
-        is_valid, error_msg = validation_service.validate_name(sanitized_name)
-        if not is_valid:
-            raise ValidationError("firstName", error_msg)
-
-        is_valid, error_msg = validation_service.validate_birth_date(chart_request.birthDate)
-        if not is_valid:
-            raise ValidationError("birthDate", error_msg)
-
-        # Handle approximate time
-        if chart_request.birthTimeApproximate and not chart_request.birthTime:
-            chart_request.birthTime = "12:00"
-
-        birth_time: str = chart_request.birthTime or "12:00"
-        is_valid, error_msg = validation_service.validate_birth_time(birth_time)
-        if not is_valid:
-            raise ValidationError("birthTime", error_msg)
+        # Sanitize and validate name, date and time (approximate times use 12:00)
+        sanitized_name, birth_time = prepare_birth_input(chart_request, validation_service)
 
         # 1. Geocode birth place
-        lat, lng, tz_str = geocoding_service.get_location_data(chart_request.birthPlace)
+        try:
+            lat, lng, tz_str = await geocoding_service.get_location_data_async(
+                chart_request.birthPlace
+            )
+        except TimeoutError as e:
+            print(f"Geocoding timeout: {e}")
+            raise HTTPException(
+                status_code=504,
+                detail={
+                    "field": "birthPlace",
+                    "error": "Die Ortssuche hat zu lange gedauert. Bitte versuchen Sie es später noch einmal.",
+                },
+            )
         if not lat or not lng or not tz_str:
             raise HTTPException(
                 status_code=400,
@@ -149,61 +178,46 @@ async def generate_chart(request: Request, chart_request: ChartRequest):
                 },
             )
 
-        # 2. Parse datetime
-        try:
-            birth_dt_str = f"{chart_request.birthDate} {birth_time}"
-            birth_dt = datetime.strptime(birth_dt_str, "%d.%m.%Y %H:%M")
-        except ValueError:
-            raise ValidationError("birthDate", "Ungültiges Datumsformat")
+        # 2. Parse datetime and localize to the birth place's timezone
+        birth_dt_utc = localize_birth_datetime(chart_request.birthDate, birth_time, tz_str)
+
+        # Sampled requests are recomputed with the shadow source after the
+        # response has been sent (no-op unless CHART_SHADOW_ENABLED)
+        if shadow_validator.should_sample():
+            background_tasks.add_task(shadow_validator.submit, birth_dt_utc)
 
-        # 3. Localize to timezone
+        # 3. Serve repeat instants from the chart cache (only the name differs),
+        # looked up under the source that would calculate the chart now
+        cache_key = chart_cache.make_key(birth_dt_utc, chart_source_name())
+        cached_chart = chart_cache.get(cache_key, sanitized_name)
+        if cached_chart is not None:
+            return ChartJSONResponse(cached_chart)
+
+        # 4. Calculate chart on the bounded calculation engine so the event
+        # loop stays free for health checks and other requests
         try:
-            tz = pytz.timezone(tz_str)
-            birth_dt_local = tz.localize(birth_dt)
-            birth_dt_utc = birth_dt_local.astimezone(pytz.UTC)
-        except Exception as e:
-            print(f"Timezone error: {e}")
+            chart_response = await calculation_engine.run(
+                calculate_chart_for_instant, birth_dt_utc, sanitized_name
+            )
+            # Stored under the source that actually served it, so a failover
+            # chart is never returned once the preferred source is back
+            chart_cache.put(
+                chart_cache.make_key(birth_dt_utc, chart_response.calculationSource or cache_key[1]),
+                chart_response,
+            )
+            # Returned as a response so it is encoded from prebuilt fragments
+            # instead of being re-validated against response_model
+            return ChartJSONResponse(chart_response)
+        except EngineOverloadedError as e:
+            print(f"Calculation rejected: {e}")
             raise HTTPException(
-                status_code=400,
-                detail={"field": "birthPlace", "error": "Fehler bei der Zeitzonenverarbeitung. Bitte prüfen Sie den Ort."},
+                status_code=503,
+                detail={
+                    "field": "calculation",
+                    "error": "Der Berechnungsdienst ist ausgelastet. Bitte versuchen Sie es in Kürze noch einmal."
+                },
+                headers={"Retry-After": "5"},
             )
-
-        # 4. Calculate positions with timeout protection (60s for cold starts)
-        try:
-            # Use asyncio.timeout for async-safe timeout handling
-            # Works reliably in async contexts and on all platforms (Windows, Linux, macOS)
-            timeout_seconds = 60  # Allows time for cold starts on Railway
-
-            async def calculate_with_timeout():
-                """Calculate chart with timeout protection"""
-                ephemeris_source = get_ephemeris_source()
-                pos_calculator = PositionCalculator(ephemeris_source)
-
-                personality_positions = pos_calculator.calculate_positions(birth_dt_utc)
-
-                design_dt_utc = calculate_design_datetime(
-                    birth_dt_utc, ephemeris_source, target_arc=88.0
-                )
-                design_positions = pos_calculator.calculate_positions(design_dt_utc)
-
-                # 5. Calculate Bodygraph
-                chart_response = bodygraph_calculator.calculate_chart(
-                    personality_positions,
-                    design_positions,
-                    sanitized_name,
-                    calculation_source=ephemeris_source.get_source_name(),
-                )
-                return chart_response
-
-            try:
-                chart_response = await asyncio.wait_for(
-                    calculate_with_timeout(),
-                    timeout=timeout_seconds
-                )
-                return chart_response
-            except asyncio.TimeoutError:
-                raise TimeoutError(f"Calculation exceeded maximum time limit ({timeout_seconds} seconds)")
-
         except TimeoutError as e:
             print(f"Calculation timeout: {e}")
             raise HTTPException(
@@ -256,6 +270,29 @@ async def generate_chart(request: Request, chart_request: ChartRequest):
         )
 
 
+@app.post("/api/hd-chart/batch")
+@limiter.limit("5/minute")
+async def generate_chart_batch(request: Request, batch_request: ChartBatchRequest):
+    """
+    Generate Human Design charts for a batch of birth records
+
+    Results are streamed as NDJSON in completion order, one line per record
+    with its index and either the chart or a per-record error, followed by
+    a summary line.
+
+    Args:
+        batch_request: ChartBatchRequest with up to CHART_BATCH_MAX_RECORDS
+            records (larger batches fail request validation with 422)
+
+    Returns:
+        StreamingResponse with application/x-ndjson lines
+    """
+    return StreamingResponse(
+        chart_batch_processor.stream(batch_request.records),
+        media_type=NDJSON_MEDIA_TYPE,
+    )
+
+
 @app.post("/api/email-capture", response_model=EmailCaptureResponse)
 @limiter.limit("5/minute")  # 5 requests per minute for email capture
 async def capture_email(request: Request, email_request: EmailCaptureRequest):
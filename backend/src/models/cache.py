@@ -0,0 +1,40 @@
+"""
+Chart cache configuration models.
+
+Defines limits for the in-process chart result cache.
+"""
+
+from pydantic_settings import BaseSettings, SettingsConfigDict
+from pydantic import Field
+
+
+class ChartCacheConfig(BaseSettings):
+    """
+    Chart result cache configuration.
+    Loaded from environment variables with CHART_CACHE_ prefix.
+    """
+
+    model_config = SettingsConfigDict(
+        env_prefix="CHART_CACHE_",
+        case_sensitive=False,
+    )
+
+    enabled: bool = Field(
+        default=True,
+        description="Serve repeat charts for the same instant and source from memory",
+    )
+    max_entries: int = Field(
+        default=2048,
+        ge=1,
+        description="Maximum number of cached charts",
+    )
+    max_bytes: int = Field(
+        default=8 * 1024 * 1024,
+        ge=1024,
+        description="Maximum estimated size of all cached charts in bytes",
+    )
+    ttl_seconds: float = Field(
+        default=24 * 3600.0,
+        gt=0,
+        description="Time after which a cached chart is recomputed",
+    )
@@ -2,6 +2,7 @@ from pydantic import BaseModel, Field, validator, root_validator
 from typing import List, Optional, Annotated
 from datetime import datetime
 from src.models.celestial import CelestialBody
+from src.models.engine import ChartBatchConfig
 
 
 class ChartRequest(BaseModel):
@@ -31,6 +32,20 @@ class ChartRequest(BaseModel):
         return values
 
 
+class ChartBatchRequest(BaseModel):
+    """Birth records for the batch chart endpoint"""
+
+    records: List[ChartRequest] = Field(..., min_length=1)
+
+    @validator("records", pre=True)
+    def limit_batch_size(cls, v):
+        """Reject batches above CHART_BATCH_MAX_RECORDS before their records are parsed"""
+        max_records = ChartBatchConfig().max_records
+        if isinstance(v, list) and len(v) > max_records:
+            raise ValueError(f"Es sind höchstens {max_records} Datensätze pro Anfrage erlaubt.")
+        return v
+
+
 class TypeInfo(BaseModel):
     """Human Design Type information"""
 
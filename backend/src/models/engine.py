@@ -0,0 +1,72 @@
+"""
+Calculation engine configuration models.
+
+Defines how chart calculations are scheduled off the event loop.
+"""
+
+from typing import Literal
+from pydantic_settings import BaseSettings, SettingsConfigDict
+from pydantic import Field
+
+
+class CalculationEngineConfig(BaseSettings):
+    """
+    Calculation engine configuration.
+    Loaded from environment variables with CALC_ENGINE_ prefix.
+    """
+
+    model_config = SettingsConfigDict(
+        env_prefix="CALC_ENGINE_",
+        case_sensitive=False,
+    )
+
+    mode: Literal["thread", "process"] = Field(
+        default="thread",
+        description="Worker pool type used for chart calculations",
+    )
+    max_workers: int = Field(
+        default=4,
+        ge=1,
+        description="Number of calculations that may run concurrently",
+    )
+    max_queue: int = Field(
+        default=16,
+        ge=0,
+        description="Number of calculations that may wait for a free worker before requests are rejected",
+    )
+    timeout_seconds: float = Field(
+        default=60.0,
+        gt=0,
+        description="Maximum time a request waits for its calculation (allows for cold starts)",
+    )
+
+
+class ChartBatchConfig(BaseSettings):
+    """
+    Batch chart endpoint configuration.
+    Loaded from environment variables with CHART_BATCH_ prefix.
+    """
+
+    model_config = SettingsConfigDict(
+        env_prefix="CHART_BATCH_",
+        case_sensitive=False,
+    )
+
+    max_records: int = Field(
+        default=1000,
+        ge=1,
+        description="Maximum number of birth records accepted in one batch request",
+    )
+    max_concurrency: int = Field(
+        default=4,
+        ge=1,
+        description=(
+            "Calculations a batch may run at once (capped at the engine's worker count); "
+            "they only run on several cores with CALC_ENGINE_MODE=process"
+        ),
+    )
+    place_concurrency: int = Field(
+        default=8,
+        ge=1,
+        description="Distinct birth places a batch may resolve at once",
+    )
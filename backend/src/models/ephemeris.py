@@ -4,10 +4,12 @@ Ephemeris configuration models.
 Defines configuration for ephemeris calculation sources and settings.
 """
 
-from typing import Literal, Optional
+from typing import List, Literal, Optional
 from pydantic_settings import BaseSettings, SettingsConfigDict
 from pydantic import Field
 
+SourceName = Literal["swiss_ephemeris", "openastro_api", "nasa_jpl", "chebyshev"]
+
 
 class EphemerisConfig(BaseSettings):
     """
@@ -20,7 +22,7 @@ class EphemerisConfig(BaseSettings):
         case_sensitive=False,
     )
 
-    source: Literal["swiss_ephemeris", "openastro_api", "nasa_jpl"] = Field(
+    source: SourceName = Field(
         default="swiss_ephemeris",
         description="Primary ephemeris source to use for calculations",
     )
@@ -34,3 +36,119 @@ class EphemerisConfig(BaseSettings):
         description="OpenAstro API endpoint (if using openastro_api source)",
         validation_alias="OPENASTRO_API_URL",
     )
+    jpl_kernel_path: Optional[str] = Field(
+        default=None,
+        description="JPL DE kernel (.bsp, e.g. de440s.bsp) used by the nasa_jpl source",
+    )
+    chebyshev_path: Optional[str] = Field(
+        default=None,
+        description="Chebyshev ephemeris built by scripts/build_chebyshev_ephemeris.py, used by the chebyshev source",
+    )
+    worker_pool_size: int = Field(
+        default=2,
+        ge=1,
+        description="Number of persistent swisseph worker processes used when calculations cannot run in-thread",
+    )
+    sun_table_path: Optional[str] = Field(
+        default=None,
+        description="Optional precomputed Sun-longitude table for design-time lookup without ephemeris calls",
+    )
+    supported_start_year: int = Field(
+        default=1850,
+        description="First year charts must be calculable for; ephemeris files must cover it",
+    )
+    supported_end_year: int = Field(
+        default=2100,
+        description="Last year charts must be calculable for; ephemeris files must cover it",
+    )
+    availability_ttl_seconds: float = Field(
+        default=60.0,
+        gt=0,
+        description="How long an ephemeris source availability check result is reused",
+    )
+    availability_refresh_seconds: float = Field(
+        default=30.0,
+        gt=0,
+        description="Interval of the background availability refresh started at application startup",
+    )
+    failover: List[SourceName] = Field(
+        default_factory=list,
+        description='Sources tried in this order after `source` fails or is unavailable, e.g. ["openastro_api"]',
+    )
+    hedge_requests: bool = Field(
+        default=False,
+        description="Send a call to the next source too once the current one exceeds its observed latency quantile",
+    )
+    hedge_quantile: float = Field(
+        default=0.95,
+        gt=0,
+        lt=1,
+        description="Latency quantile of a source after which a hedged call is sent",
+    )
+    hedge_min_samples: int = Field(
+        default=20,
+        ge=1,
+        description="Latency samples a source needs before its calls are hedged",
+    )
+    hedge_workers: int = Field(
+        default=8,
+        ge=2,
+        description="Threads running hedged calls",
+    )
+    latency_window: int = Field(
+        default=512,
+        ge=10,
+        description="Recent calls per source kept for latency quantiles",
+    )
+
+
+class OpenAstroConfig(BaseSettings):
+    """
+    OpenAstro API client configuration.
+    Loaded from environment variables with OPENASTRO_ prefix.
+    """
+
+    model_config = SettingsConfigDict(
+        env_prefix="OPENASTRO_",
+        case_sensitive=False,
+    )
+
+    timeout_seconds: float = Field(
+        default=10.0,
+        gt=0,
+        description="Timeout of a single API request",
+    )
+    max_retries: int = Field(
+        default=3,
+        ge=0,
+        description="Retries after a failed request (connection errors, 429 and 5xx)",
+    )
+    backoff_base_seconds: float = Field(
+        default=0.2,
+        ge=0,
+        description="Backoff before the first retry; doubles per retry and is fully jittered",
+    )
+    backoff_max_seconds: float = Field(
+        default=2.0,
+        ge=0,
+        description="Upper bound of a single retry backoff",
+    )
+    breaker_failure_threshold: int = Field(
+        default=5,
+        ge=1,
+        description="Consecutive failed requests after which the circuit opens and calls fail fast",
+    )
+    breaker_reset_seconds: float = Field(
+        default=30.0,
+        gt=0,
+        description="Time the circuit stays open before one trial request is let through",
+    )
+    max_connections: int = Field(
+        default=20,
+        ge=1,
+        description="Size of the shared HTTP connection pool",
+    )
+    http2: bool = Field(
+        default=True,
+        description="Use HTTP/2 when the h2 package is installed",
+    )
@@ -0,0 +1,83 @@
+"""
+Geocoding configuration models.
+
+Defines how the Nominatim fallback for place lookups is accessed and how
+coordinates are resolved to timezones.
+"""
+
+from typing import Optional
+from pydantic_settings import BaseSettings, SettingsConfigDict
+from pydantic import Field
+
+
+class NominatimConfig(BaseSettings):
+    """
+    Nominatim client configuration.
+    Loaded from environment variables with NOMINATIM_ prefix.
+    """
+
+    model_config = SettingsConfigDict(
+        env_prefix="NOMINATIM_",
+        case_sensitive=False,
+    )
+
+    url: str = Field(
+        default="https://nominatim.openstreetmap.org",
+        description="Base URL of the Nominatim service",
+    )
+    user_agent: str = Field(
+        default="hd-chart-generator",
+        description="User agent required by the Nominatim usage policy",
+    )
+    rate_per_second: float = Field(
+        default=1.0,
+        gt=0,
+        description="Sustained request rate (the public service allows 1 request per second)",
+    )
+    burst: int = Field(
+        default=1,
+        ge=1,
+        description="Requests that may be sent back-to-back before throttling applies",
+    )
+    timeout_seconds: float = Field(
+        default=10.0,
+        gt=0,
+        description="Deadline for a lookup, including time spent queued for the rate limit",
+    )
+    max_connections: int = Field(
+        default=4,
+        ge=1,
+        description="Size of the pooled HTTP connection pool",
+    )
+
+
+class TimezoneConfig(BaseSettings):
+    """
+    Timezone resolver configuration.
+    Loaded from environment variables with TIMEZONE_ prefix.
+    """
+
+    model_config = SettingsConfigDict(
+        env_prefix="TIMEZONE_",
+        case_sensitive=False,
+    )
+
+    in_memory: bool = Field(
+        default=True,
+        description="Load TimezoneFinder polygon data into memory (~60 MB) instead of reading it from disk",
+    )
+    cell_degrees: float = Field(
+        default=0.1,
+        gt=0,
+        le=0.25,
+        description="Grid cell size of the memoized timezone table",
+    )
+    precompute_bounds: Optional[str] = Field(
+        default="45.5,55.5,5.5,17.5",
+        description="Region classified at startup as 'lat_min,lat_max,lng_min,lng_max' (empty to skip)",
+    )
+    exact_cache_size: int = Field(
+        default=4096,
+        ge=0,
+        description="Number of exact lookups near zone boundaries to remember",
+    )
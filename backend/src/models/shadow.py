@@ -0,0 +1,53 @@
+"""
+Shadow validation configuration models.
+
+Defines how sampled chart requests are recomputed with a second ephemeris
+source to detect chart changes before a source switch.
+"""
+
+from typing import Optional
+from pydantic_settings import BaseSettings, SettingsConfigDict
+from pydantic import Field
+
+from src.models.ephemeris import SourceName
+
+
+class ShadowValidationConfig(BaseSettings):
+    """
+    Shadow validation configuration.
+    Loaded from environment variables with CHART_SHADOW_ prefix.
+    """
+
+    model_config = SettingsConfigDict(
+        env_prefix="CHART_SHADOW_",
+        case_sensitive=False,
+    )
+
+    enabled: bool = Field(
+        default=False,
+        description="Recompute sampled /api/hd-chart requests with a secondary source after the response is sent",
+    )
+    source: SourceName = Field(
+        default="openastro_api",
+        description="Secondary ephemeris source the primary charts are compared against",
+    )
+    sample_rate: float = Field(
+        default=0.01,
+        ge=0,
+        le=1,
+        description="Share of chart requests that are shadow-validated",
+    )
+    max_pending: int = Field(
+        default=32,
+        ge=1,
+        description="Comparisons that may wait for the shadow worker before new samples are dropped",
+    )
+    history: int = Field(
+        default=100,
+        ge=1,
+        description="Most recent mismatching comparisons kept in memory for the admin endpoint",
+    )
+    log_path: Optional[str] = Field(
+        default=None,
+        description="Optional JSON Lines file every comparison is appended to",
+    )
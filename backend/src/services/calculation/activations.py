@@ -0,0 +1,141 @@
+"""
+Compact activation records.
+
+The chart pipeline only needs body, longitude, gate and line per
+activation. ActivationSet keeps them in one structured NumPy array per
+chart side instead of 13 validated PlanetaryPosition models; pydantic
+models are built with to_positions() only where positions are returned by
+an API.
+"""
+
+from datetime import datetime
+from typing import List, Optional, Sequence
+
+import numpy as np
+
+from src.models.celestial import CelestialBody
+from src.models.chart import PlanetaryPosition
+from src.services.calculation.gate_line_mapper import ecliptic_to_gate_line
+
+# Body codes index into this tuple
+BODIES = tuple(CelestialBody)
+_BODY_CODES = {body: code for code, body in enumerate(BODIES)}
+
+ACTIVATION_DTYPE = np.dtype(
+    [("body", "u1"), ("longitude", "<f8"), ("gate", "u1"), ("line", "u1")]
+)
+
+
+class ActivationSet:
+    """Activations of one chart side (personality or design), in body order."""
+
+    __slots__ = ("records", "julian_day", "source")
+
+    def __init__(self, records: np.ndarray, julian_day: float, source: str):
+        """
+        Wrap activation records.
+
+        Args:
+            records: Array of ACTIVATION_DTYPE
+            julian_day: Julian Day the longitudes were calculated for
+            source: Ephemeris source name
+        """
+        self.records = records
+        self.julian_day = julian_day
+        self.source = source
+
+    @classmethod
+    def from_longitudes(
+        cls,
+        bodies: Sequence[CelestialBody],
+        longitudes: Sequence[float],
+        julian_day: float,
+        source: str,
+    ) -> "ActivationSet":
+        """
+        Map longitudes to gates and lines.
+
+        Args:
+            bodies: Celestial bodies
+            longitudes: Ecliptic longitudes in the order of bodies
+            julian_day: Julian Day of the longitudes
+            source: Ephemeris source name
+
+        Returns:
+            ActivationSet
+        """
+        # For 13 values the scalar mapper beats map_longitudes' array overhead
+        records = np.array(
+            [
+                (_BODY_CODES[body], longitude) + ecliptic_to_gate_line(longitude)
+                for body, longitude in zip(bodies, longitudes)
+            ],
+            dtype=ACTIVATION_DTYPE,
+        )
+        return cls(records, julian_day, source)
+
+    @classmethod
+    def from_positions(cls, positions: Sequence[PlanetaryPosition]) -> "ActivationSet":
+        """
+        Build records from existing PlanetaryPosition models (gates and lines are kept as given).
+
+        Args:
+            positions: Planetary positions
+
+        Returns:
+            ActivationSet
+        """
+        records = np.empty(len(positions), dtype=ACTIVATION_DTYPE)
+        for i, position in enumerate(positions):
+            records[i] = (_BODY_CODES[position.body], position.ecliptic_longitude, position.gate, position.line)
+        julian_day = positions[0].julian_day if positions else 0.0
+        source = positions[0].source if positions else ""
+        return cls(records, julian_day, source)
+
+    def __len__(self) -> int:
+        return len(self.records)
+
+    @property
+    def bodies(self) -> List[CelestialBody]:
+        """Bodies in record order."""
+        return [BODIES[code] for code in self.records["body"].tolist()]
+
+    def find(self, body: CelestialBody) -> Optional[int]:
+        """
+        Get the record index of a body.
+
+        Args:
+            body: Celestial body
+
+        Returns:
+            Index, or None if the body is missing
+        """
+        matches = np.flatnonzero(self.records["body"] == _BODY_CODES[body])
+        return int(matches[0]) if len(matches) else None
+
+    def to_positions(self, calculated_at: Optional[datetime] = None) -> List[PlanetaryPosition]:
+        """
+        Convert to validated PlanetaryPosition models for API responses.
+
+        Args:
+            calculated_at: Timestamp for all positions (now if omitted)
+
+        Returns:
+            PlanetaryPosition list in record order
+        """
+        calculated_at = calculated_at or datetime.utcnow()
+        positions = []
+        for code, longitude, gate, line in self.records.tolist():
+            positions.append(
+                PlanetaryPosition(
+                    body=BODIES[code],
+                    ecliptic_longitude=longitude,
+                    gate=gate,
+                    line=line,
+                    gate_line=f"{gate}.{line}",
+                    calculation_timestamp=calculated_at,
+                    julian_day=self.julian_day,
+                    source=self.source,
+                )
+            )
+        return positions
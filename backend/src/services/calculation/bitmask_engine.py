@@ -0,0 +1,441 @@
+"""
+Bitmask bodygraph engine.
+
+Gates, channels and centers are resolved with integer masks instead of
+sets: active gates are one 64-bit integer (bit gate - 1), each channel is
+a precomputed two-gate mask and defined centers are a 9-bit mask. A chart's
+structure is then a pass of AND/OR operations over the channel table.
+
+Type, authority, motor-to-throat connectivity and definition split depend
+only on which center-to-center links are defined, so they are precomputed
+for every link combination in CenterLinkTable and resolved by one index.
+"""
+
+from functools import lru_cache
+from typing import Iterable, List, NamedTuple, Optional, Sequence, Tuple
+
+import numpy as np
+
+MOTOR_CENTERS = ("heart", "solar", "root", "sacral")
+
+# GATE_BITS[gate] is the mask bit of a gate (index 0 unused)
+GATE_BITS = (0,) + tuple(1 << (gate - 1) for gate in range(1, 65))
+
+
+# Codes in table order; an entry stores indices into these tuples
+TYPE_CODES = ("1", "2", "3", "4", "5")
+AUTHORITY_CODES = (
+    "lunar", "emotional", "sacral", "spleen", "ego_manifested",
+    "ego_projected", "self_projected", "mental",
+)
+SPLIT_NAMES = ("none", "single", "split", "triple", "quadruple")
+
+# Packed entry layout: center mask | type | authority | motor-to-throat | split
+_CENTERS_BITS = 9
+_TYPE_SHIFT = 9
+_AUTHORITY_SHIFT = 12
+_MOTOR_SHIFT = 16
+_SPLIT_SHIFT = 17
+
+
+class CenterLinkEntry(NamedTuple):
+    """Type and authority facts for one combination of defined center links"""
+
+    center_mask: int
+    type_code: str
+    authority_code: str
+    motor_to_throat: bool
+    split: str
+
+
+class CenterLinkColumns(NamedTuple):
+    """Decoded table entries of many charts, one array per field"""
+
+    center_mask: np.ndarray
+    type_index: np.ndarray
+    authority_index: np.ndarray
+    motor_to_throat: np.ndarray
+    split_index: np.ndarray
+
+
+class ChannelMask(NamedTuple):
+    """A channel prepared for mask tests"""
+
+    gates: int
+    centers: int
+    code: str
+
+
+class BodygraphMasks(NamedTuple):
+    """Structure of a chart resolved from its active gates"""
+
+    channel_codes: List[str]
+    center_mask: int
+    # Center links ("c1-c2" pairs) of the defined channels, one bit per distinct pair
+    link_mask: int
+
+
+def gate_mask(gates: Iterable[int]) -> int:
+    """
+    Build the active-gate mask.
+
+    Args:
+        gates: Gate numbers (1-64)
+
+    Returns:
+        Integer with bit (gate - 1) set for every gate
+    """
+    mask = 0
+    for gate in gates:
+        mask |= GATE_BITS[gate]
+    return mask
+
+
+def gate_masks(gates: np.ndarray) -> np.ndarray:
+    """
+    Build active-gate masks for many charts at once.
+
+    Args:
+        gates: Integer array of gate numbers (1-64); the last axis holds one chart's gates
+
+    Returns:
+        uint64 array of masks with the last axis reduced
+    """
+    bits = np.left_shift(np.uint64(1), np.asarray(gates, dtype=np.uint64) - np.uint64(1))
+    return np.bitwise_or.reduce(bits, axis=-1)
+
+
+def popcount(mask: int) -> int:
+    """Count set bits."""
+    return bin(mask).count("1")
+
+
+class BitmaskBodygraph:
+    """
+    Channel, center and link tables compiled from a channel map.
+    """
+
+    def __init__(
+        self,
+        channels_map: Sequence[Tuple[int, int, str, str]],
+        center_order: Sequence[str],
+    ):
+        """
+        Compile masks.
+
+        Reversed duplicates in the channel map (e.g. 30-41 and 41-30) are
+        dropped, keeping the first occurrence's orientation and order so the
+        output matches the set-based calculation.
+
+        Args:
+            channels_map: (gate_a, gate_b, center_a, center_b) tuples
+            center_order: Center codes; their index is the center bit
+        """
+        self.center_order = tuple(center_order)
+        self.center_bits = {code: 1 << i for i, code in enumerate(self.center_order)}
+
+        seen = set()
+        channels = []
+        for g1, g2, c1, c2 in channels_map:
+            pair = (min(g1, g2), max(g1, g2))
+            if pair in seen:
+                continue
+            seen.add(pair)
+            channels.append(
+                ChannelMask(
+                    gates=gate_mask((g1, g2)),
+                    centers=self.center_bits[c1] | self.center_bits[c2],
+                    code=f"{g1}-{g2}",
+                )
+            )
+        self.channels: Tuple[ChannelMask, ...] = tuple(channels)
+
+        # Distinct center pairs that a channel can connect, in first-seen order
+        links = []
+        for channel in self.channels:
+            if channel.centers not in links:
+                links.append(channel.centers)
+        self.links: Tuple[int, ...] = tuple(links)
+        self._link_bit = {centers: 1 << i for i, centers in enumerate(self.links)}
+        self.channel_links: Tuple[int, ...] = tuple(
+            self._link_bit[channel.centers] for channel in self.channels
+        )
+
+        self.throat_bit = self.center_bits["throat"]
+        self.motor_mask = 0
+        for code in MOTOR_CENTERS:
+            self.motor_mask |= self.center_bits.get(code, 0)
+
+        self._table: Optional["CenterLinkTable"] = None
+
+    def resolve(self, active_gates: int) -> BodygraphMasks:
+        """
+        Find defined channels, centers and center links.
+
+        Args:
+            active_gates: Active-gate mask from gate_mask()
+
+        Returns:
+            BodygraphMasks
+        """
+        codes = []
+        center_mask = 0
+        link_mask = 0
+        for channel, link in zip(self.channels, self.channel_links):
+            if active_gates & channel.gates == channel.gates:
+                codes.append(channel.code)
+                center_mask |= channel.centers
+                link_mask |= link
+        return BodygraphMasks(codes, center_mask, link_mask)
+
+    def resolve_many(self, active_gates: np.ndarray) -> np.ndarray:
+        """
+        Find the center-link masks of many charts at once.
+
+        Args:
+            active_gates: uint64 array of active-gate masks from gate_masks()
+
+        Returns:
+            int64 array of link masks (index into CenterLinkTable.entries)
+        """
+        active_gates = np.asarray(active_gates, dtype=np.uint64)[:, None]
+        channel_gates = np.asarray([channel.gates for channel in self.channels], dtype=np.uint64)
+        channel_links = np.asarray(self.channel_links, dtype=np.int64)
+        defined = (active_gates & channel_gates) == channel_gates
+        return np.bitwise_or.reduce(np.where(defined, channel_links, 0), axis=1)
+
+    def centers_of_links(self, link_mask: int) -> int:
+        """
+        Get the centers touched by a set of links.
+
+        Args:
+            link_mask: Link mask
+
+        Returns:
+            Center mask
+        """
+        centers = 0
+        for i, link in enumerate(self.links):
+            if link_mask >> i & 1:
+                centers |= link
+        return centers
+
+    def throat_component(self, link_mask: int) -> int:
+        """
+        Get the centers connected to the Throat through defined links.
+
+        Args:
+            link_mask: Link mask of the defined channels
+
+        Returns:
+            Center mask of the Throat's connected component (0 if the Throat is undefined)
+        """
+        active = [link for i, link in enumerate(self.links) if link_mask >> i & 1]
+        reach = self.throat_bit
+        if not any(link & reach for link in active):
+            return 0
+
+        # Grow the component until no link adds a center (at most 9 rounds)
+        while True:
+            grown = reach
+            for link in active:
+                if link & grown:
+                    grown |= link
+            if grown == reach:
+                return reach
+            reach = grown
+
+    def motor_to_throat(self, link_mask: int) -> bool:
+        """
+        Check if a motor center is connected to the Throat.
+
+        Args:
+            link_mask: Link mask of the defined channels
+
+        Returns:
+            True if a motor is in the Throat's connected component
+        """
+        return bool(self.throat_component(link_mask) & self.motor_mask)
+
+    def build_table(self) -> "CenterLinkTable":
+        """
+        Build the type/authority table unless it already exists.
+
+        Returns:
+            Type/authority table for these links
+        """
+        if self._table is None:
+            self._table = CenterLinkTable(self)
+        return self._table
+
+    @property
+    def table(self) -> "CenterLinkTable":
+        """Type/authority table for these links (built on first use)."""
+        return self.build_table()
+
+
+class CenterLinkTable:
+    """
+    Precomputed chart facts for every combination of defined center links.
+    """
+
+    def __init__(self, masks: BitmaskBodygraph):
+        """
+        Enumerate all 2**len(links) link combinations.
+
+        Connected components are grown for all combinations at once with
+        numpy (one pass per center and link, repeated until stable).
+
+        Args:
+            masks: Compiled bodygraph masks
+        """
+        n_links = len(masks.links)
+        combos = np.arange(1 << n_links, dtype=np.uint32)
+        links = np.asarray(masks.links, dtype=np.uint32)
+        active = [(combos >> i) & 1 == 1 for i in range(n_links)]
+
+        centers = np.zeros_like(combos)
+        for i in range(n_links):
+            centers[active[i]] |= links[i]
+
+        # Component of each center, grown over the active links
+        components = []
+        for bit in (1 << i for i in range(len(masks.center_order))):
+            reach = np.full_like(combos, bit)
+            while True:
+                grown = reach.copy()
+                for i in range(n_links):
+                    touches = active[i] & ((grown & links[i]) != 0)
+                    grown[touches] |= links[i]
+                if np.array_equal(grown, reach):
+                    break
+                reach = grown
+            components.append((bit, reach))
+
+        # A defined center starts a new component if it is its component's lowest bit
+        split = np.zeros_like(combos)
+        throat = np.zeros_like(combos)
+        for bit, reach in components:
+            lowest = reach & (~reach + np.uint32(1))
+            split += ((centers & bit) != 0) & (lowest == bit)
+            if bit == masks.throat_bit:
+                throat = np.where((centers & bit) != 0, reach, 0).astype(np.uint32)
+        motor = (throat & masks.motor_mask) != 0
+
+        bits = masks.center_bits
+        sacral = (centers & bits["sacral"]) != 0
+        type_index = np.select(
+            [sacral & motor, sacral, motor, centers != 0],
+            [TYPE_CODES.index("2"), TYPE_CODES.index("1"), TYPE_CODES.index("4"), TYPE_CODES.index("3")],
+            default=TYPE_CODES.index("5"),
+        )
+        is_manifestor = type_index == TYPE_CODES.index("4")
+        authority_index = np.select(
+            [
+                type_index == TYPE_CODES.index("5"),
+                (centers & bits["solar"]) != 0,
+                sacral,
+                (centers & bits["spleen"]) != 0,
+                ((centers & bits["heart"]) != 0) & is_manifestor,
+                (centers & bits["heart"]) != 0,
+                (centers & bits["g"]) != 0,
+            ],
+            [AUTHORITY_CODES.index(code) for code in (
+                "lunar", "emotional", "sacral", "spleen",
+                "ego_manifested", "ego_projected", "self_projected",
+            )],
+            default=AUTHORITY_CODES.index("mental"),
+        )
+
+        self.masks = masks
+        self.entries = (
+            centers
+            | (type_index.astype(np.uint32) << _TYPE_SHIFT)
+            | (authority_index.astype(np.uint32) << _AUTHORITY_SHIFT)
+            | (motor.astype(np.uint32) << _MOTOR_SHIFT)
+            | (np.minimum(split, len(SPLIT_NAMES) - 1) << _SPLIT_SHIFT)
+        ).astype(np.uint32)
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    @staticmethod
+    def decode(packed: int) -> CenterLinkEntry:
+        """
+        Unpack a table entry.
+
+        Args:
+            packed: Entry value
+
+        Returns:
+            CenterLinkEntry
+        """
+        return CenterLinkEntry(
+            center_mask=packed & ((1 << _CENTERS_BITS) - 1),
+            type_code=TYPE_CODES[(packed >> _TYPE_SHIFT) & 0x7],
+            authority_code=AUTHORITY_CODES[(packed >> _AUTHORITY_SHIFT) & 0xF],
+            motor_to_throat=bool((packed >> _MOTOR_SHIFT) & 1),
+            split=SPLIT_NAMES[(packed >> _SPLIT_SHIFT) & 0x7],
+        )
+
+    def lookup(self, link_mask: int) -> CenterLinkEntry:
+        """
+        Get type, authority, connectivity and split for defined links.
+
+        Args:
+            link_mask: Link mask from BitmaskBodygraph.resolve()
+
+        Returns:
+            CenterLinkEntry
+        """
+        return self.decode(int(self.entries[link_mask]))
+
+    def lookup_many(self, link_masks: np.ndarray) -> np.ndarray:
+        """
+        Get packed entries for many charts at once (for bulk jobs).
+
+        Args:
+            link_masks: Integer array of link masks
+
+        Returns:
+            uint32 array of packed entries (see decode())
+        """
+        return self.entries[np.asarray(link_masks, dtype=np.int64)]
+
+    @staticmethod
+    def decode_many(packed: np.ndarray) -> CenterLinkColumns:
+        """
+        Unpack many table entries at once.
+
+        Args:
+            packed: uint32 array from lookup_many()
+
+        Returns:
+            CenterLinkColumns; indices refer to TYPE_CODES, AUTHORITY_CODES and SPLIT_NAMES
+        """
+        packed = np.asarray(packed, dtype=np.uint32)
+        return CenterLinkColumns(
+            center_mask=(packed & ((1 << _CENTERS_BITS) - 1)).astype(np.uint16),
+            type_index=((packed >> _TYPE_SHIFT) & 0x7).astype(np.uint8),
+            authority_index=((packed >> _AUTHORITY_SHIFT) & 0xF).astype(np.uint8),
+            motor_to_throat=((packed >> _MOTOR_SHIFT) & 1).astype(bool),
+            split_index=((packed >> _SPLIT_SHIFT) & 0x7).astype(np.uint8),
+        )
+
+
+@lru_cache(maxsize=None)
+def get_bitmask_bodygraph(
+    channels_map: Tuple[Tuple[int, int, str, str], ...],
+    center_order: Tuple[str, ...],
+) -> BitmaskBodygraph:
+    """
+    Get compiled masks shared by all calculators using the same definitions.
+
+    Args:
+        channels_map: (gate_a, gate_b, center_a, center_b) tuples
+        center_order: Center codes
+
+    Returns:
+        Shared BitmaskBodygraph
+    """
+    return BitmaskBodygraph(channels_map, center_order)
@@ -4,7 +4,10 @@ Bodygraph calculation service.
 Determines chart properties (Type, Authority, Centers, etc.) from planetary positions.
 """
 
-from typing import List, Dict, Set, Tuple
+from typing import List, Dict, NamedTuple, Optional, Set, Tuple, Union
+
+import numpy as np
+
 from src.models.chart import (
     ChartResponse,
     TypeInfo,
@@ -16,7 +19,111 @@ from src.models.chart import (
     PlanetaryPosition,
 )
 from src.models.celestial import CelestialBody
-from src.services.calculation.gate_line_mapper import ecliptic_to_gate_line
+from src.services.calculation.activations import ActivationSet
+from src.services.calculation.gate_line_mapper import ecliptic_to_gate_line, map_longitudes
+from src.services.content_registry import ContentRegistry, get_content_registry
+from src.services.calculation.bitmask_engine import (
+    AUTHORITY_CODES,
+    TYPE_CODES,
+    CenterLinkTable,
+    gate_mask,
+    gate_masks,
+    get_bitmask_bodygraph,
+)
+
+BODYGRAPH_ENGINES = ("sets", "bitmask")
+
+# Type texts by code
+TYPES: Dict[str, Dict[str, str]] = {
+    "1": {
+        "label": "Generator",
+        "shortDescription": "Als Generator hast du eine konstante Lebensenergie und ziehst das Leben an.",
+    },
+    "2": {
+        "label": "Manifestierender Generator",
+        "shortDescription": "Als Manifestierender Generator hast du eine konstante Lebensenergie und kannst schnell initiieren.",
+    },
+    "3": {
+        "label": "Projektor",
+        "shortDescription": "Als Projektor bist du hier, um andere zu leiten und Systeme zu verstehen.",
+    },
+    "4": {
+        "label": "Manifestor",
+        "shortDescription": "Als Manifestor hast du die Gabe, Dinge zu initiieren und in Bewegung zu bringen.",
+    },
+    "5": {
+        "label": "Reflektor",
+        "shortDescription": "Als Reflektor bist du ein Spiegel für deine Umgebung und nimmst tief wahr.",
+    },
+}
+
+# Authority texts by code
+AUTHORITIES: Dict[str, Dict[str, str]] = {
+    "lunar": {
+        "label": "Lunar",
+        "decisionHint": "Warte einen Mondzyklus (28 Tage) für wichtige Entscheidungen.",
+    },
+    "emotional": {
+        "label": "Emotional",
+        "decisionHint": "Warte auf emotionale Klarheit über die Zeit.",
+    },
+    "sacral": {
+        "label": "Sakral",
+        "decisionHint": "Höre auf deine Bauchstimme (Mmh-hmm oder Uh-uh) im Moment.",
+    },
+    "spleen": {
+        "label": "Milz",
+        "decisionHint": "Vertraue deiner spontanen Intuition im Jetzt.",
+    },
+    "ego_manifested": {
+        "label": "Ego-Manifestiert",
+        "decisionHint": "Informiere und folge deinem Willen.",
+    },
+    "ego_projected": {
+        "label": "Ego-Projektiert",
+        "decisionHint": "Warte auf Einladung und folge deinem Willen.",
+    },
+    "self_projected": {
+        "label": "Selbst-Projektiert",
+        "decisionHint": "Sprich mit anderen und höre dir selbst zu.",
+    },
+    "mental": {
+        "label": "Mental / Keine",
+        "decisionHint": "Besprich Entscheidungen mit anderen, um Klarheit zu gewinnen.",
+    },
+}
+
+# Authority precedence by defined center (Reflectors are always lunar)
+AUTHORITY_CENTERS = (
+    ("solar", "emotional"),
+    ("sacral", "sacral"),
+    ("spleen", "spleen"),
+    ("heart", "ego"),
+    ("g", "self_projected"),
+)
+
+
+class ChartColumns(NamedTuple):
+    """Chart facts for many charts, one column per field (see calculate_columns)"""
+
+    personality_gates: np.ndarray
+    design_gates: np.ndarray
+    defined_centers: np.ndarray
+    type_code: List[str]
+    authority_code: List[str]
+    profile: List[str]
+    cross_code: List[str]
+    cross_name: List[str]
+
+
+def build_type_info(code: str) -> TypeInfo:
+    """Build TypeInfo for a type code."""
+    return TypeInfo(code=code, **TYPES[code])
+
+
+def build_authority_info(code: str) -> AuthorityInfo:
+    """Build AuthorityInfo for an authority code."""
+    return AuthorityInfo(code=code, **AUTHORITIES[code])
 
 
 class BodygraphCalculator:
@@ -90,35 +197,82 @@ class BodygraphCalculator:
         (58, 18, "root", "spleen"),
     ]
 
+    CENTER_NAMES = {
+        "head": "Kopf",
+        "ajna": "Ajna",
+        "throat": "Kehlzentrum",
+        "g": "G-Zentrum",
+        "heart": "Herz/Ego",
+        "sacral": "Sakral",
+        "spleen": "Milz",
+        "solar": "Solarplexus",
+        "root": "Wurzel",
+    }
+
+    def __init__(
+        self,
+        content: Optional[ContentRegistry] = None,
+        engine: str = "bitmask",
+    ):
+        """
+        Initialize bodygraph calculator.
+
+        Args:
+            content: Content registry for cross, profile and impulse texts (shared one if omitted)
+            engine: "bitmask" (default) or "sets"; both give identical charts
+        """
+        if engine not in BODYGRAPH_ENGINES:
+            raise ValueError(f"Unknown bodygraph engine: {engine}")
+        self.content = content or get_content_registry()
+        self.engine = engine
+        self.masks = get_bitmask_bodygraph(tuple(self.CHANNELS_MAP), tuple(self.CENTER_NAMES))
+        if engine == "bitmask":
+            # Build the type/authority table now rather than on the first chart
+            self.masks.build_table()
+
     def calculate_chart(
         self,
-        personality_positions: List[PlanetaryPosition],
-        design_positions: List[PlanetaryPosition],
+        personality_positions: Union[ActivationSet, List[PlanetaryPosition]],
+        design_positions: Union[ActivationSet, List[PlanetaryPosition]],
         first_name: str,
         calculation_source: str = "SwissEphemeris",
     ) -> ChartResponse:
         """
         Calculate complete chart data.
 
+        Positions are normally ActivationSets from
+        PositionCalculator.calculate_activations; PlanetaryPosition lists
+        are accepted as well.
+
         Raises:
             ValueError: If required planetary positions are missing
         """
+        personality = self._as_activations(personality_positions)
+        design = self._as_activations(design_positions)
+
         # Validate that we have all required planetary positions
-        self._validate_planetary_positions(personality_positions, design_positions)
+        self._validate_planetary_positions(personality, design)
+
+        # (body, longitude, gate, line) tuples as plain Python values
+        personality_records = personality.records.tolist()
+        design_records = design.records.tolist()
 
         # 1. Extract Active Gates
-        conscious_gates = {p.gate for p in personality_positions}
-        unconscious_gates = {p.gate for p in design_positions}
+        conscious_gates = {gate for _, _, gate, _ in personality_records}
+        unconscious_gates = {gate for _, _, gate, _ in design_records}
 
         # Add Earth gates (Sun + 180)
-        p_sun = next((p for p in personality_positions if p.body == CelestialBody.SUN), None)
-        d_sun = next((p for p in design_positions if p.body == CelestialBody.SUN), None)
+        p_sun_index = personality.find(CelestialBody.SUN)
+        d_sun_index = design.find(CelestialBody.SUN)
 
-        if p_sun is None or d_sun is None:
+        if p_sun_index is None or d_sun_index is None:
             raise ValueError("Sun position required for bodygraph calculation")
 
-        p_earth_long = (p_sun.ecliptic_longitude + 180.0) % 360.0
-        d_earth_long = (d_sun.ecliptic_longitude + 180.0) % 360.0
+        _, p_sun_long, p_sun_gate, p_sun_line = personality_records[p_sun_index]
+        _, d_sun_long, d_sun_gate, d_sun_line = design_records[d_sun_index]
+
+        p_earth_long = (p_sun_long + 180.0) % 360.0
+        d_earth_long = (d_sun_long + 180.0) % 360.0
 
         p_earth_gate, p_earth_line = ecliptic_to_gate_line(p_earth_long)
         d_earth_gate, d_earth_line = ecliptic_to_gate_line(d_earth_long)
@@ -128,67 +282,35 @@ class BodygraphCalculator:
 
         all_active_gates = conscious_gates.union(unconscious_gates)
 
-        # 2. Determine Defined Channels
-        defined_channels = []
-        defined_centers_set = set()
-
-        # Helper to check if channel is defined
-        active_channels_map = {}  # Store defined channels for type calc
-
-        # Deduplicate channels map for processing
-        unique_channels = set()
-        for g1, g2, c1, c2 in self.CHANNELS_MAP:
-            # Sort gates to ensure uniqueness
-            gate_pair = tuple(sorted((g1, g2)))
-            if gate_pair not in unique_channels:
-                unique_channels.add(gate_pair)
-
-                if g1 in all_active_gates and g2 in all_active_gates:
-                    code = f"{g1}-{g2}"
-                    defined_channels.append(Channel(code=code))
-                    defined_centers_set.add(c1)
-                    defined_centers_set.add(c2)
-
-                    # Store for type calculation
-                    active_channels_map[gate_pair] = (c1, c2)
-
-        # 3. Determine Defined Centers
-        centers = []
-        center_names = {
-            "head": "Kopf",
-            "ajna": "Ajna",
-            "throat": "Kehlzentrum",
-            "g": "G-Zentrum",
-            "heart": "Herz/Ego",
-            "sacral": "Sakral",
-            "spleen": "Milz",
-            "solar": "Solarplexus",
-            "root": "Wurzel",
-        }
-
-        for code, name in center_names.items():
-            centers.append(
-                Center(name=name, code=code, defined=code in defined_centers_set)
+        # 2-4. Channels, centers, type and authority
+        if self.engine == "bitmask":
+            defined_channels, defined_centers_set, type_info, authority_info = (
+                self._resolve_bitmask(all_active_gates)
+            )
+        else:
+            defined_channels, defined_centers_set, type_info, authority_info = (
+                self._resolve_sets(all_active_gates)
             )
 
-        # 4. Determine Type & Authority
-        type_info = self._determine_type(defined_centers_set, active_channels_map)  # type: ignore
-        authority_info = self._determine_authority(defined_centers_set, type_info.code)
+        centers = [
+            Center(name=name, code=code, defined=code in defined_centers_set)
+            for code, name in self.CENTER_NAMES.items()
+        ]
 
         # 5. Determine Profile
         # Profile is based on Personality Sun Line / Design Sun Line
         # (Standard HD Profile is P-Sun / D-Sun)
-        profile_info = self._determine_profile(p_sun.line, d_sun.line)
+        profile_info = self._determine_profile(p_sun_line, d_sun_line)
 
         # 6. Incarnation Cross
-        cross_name = self._determine_incarnation_cross(p_sun.gate, profile_info.code)
+        cross_name = self._determine_incarnation_cross(p_sun_gate, profile_info.code)
         incarnation_cross = IncarnationCross(
-            code=f"{p_sun.gate}-{p_earth_gate}-{d_sun.gate}-{d_earth_gate}",
+            code=f"{p_sun_gate}-{p_earth_gate}-{d_sun_gate}-{d_earth_gate}",
             name=cross_name,
             gates=[
-                str(p_sun.gate),
+                str(p_sun_gate),
                 str(p_earth_gate),
-                str(d_sun.gate),
+                str(d_sun_gate),
                 str(d_earth_gate),
             ],
         )
@@ -198,10 +320,10 @@ class BodygraphCalculator:
         # Usually gates list is just a list of active gates, or grouped by planet.
         # The ChartResponse expects dict with "conscious" and "unconscious" lists of strings "gate.line"
 
-        c_gates_list = [f"{p.gate}.{p.line}" for p in personality_positions]
+        c_gates_list = [f"{gate}.{line}" for _, _, gate, line in personality_records]
         c_gates_list.append(f"{p_earth_gate}.{p_earth_line}")  # Add Earth
 
-        u_gates_list = [f"{p.gate}.{p.line}" for p in design_positions]
+        u_gates_list = [f"{gate}.{line}" for _, _, gate, line in design_records]
         u_gates_list.append(f"{d_earth_gate}.{d_earth_line}")  # Add Earth
 
         gates = {"conscious": c_gates_list, "unconscious": u_gates_list}
@@ -222,10 +344,121 @@ class BodygraphCalculator:
             calculationSource=calculation_source,
         )
 
+    def calculate_columns(
+        self,
+        personality_longitudes: np.ndarray,
+        design_longitudes: np.ndarray,
+    ) -> ChartColumns:
+        """
+        Calculate the structural facts of many charts at once.
+
+        Gates, channels, type and authority are resolved with array
+        operations over the bitmask tables; the results match
+        calculate_chart() for the same positions.
+
+        Args:
+            personality_longitudes: (n, 13) longitudes in CelestialBody order
+            design_longitudes: (n, 13) longitudes in CelestialBody order
+
+        Returns:
+            ChartColumns; gate columns are uint64 masks with bit (gate - 1) set
+            and defined_centers is a mask over CENTER_NAMES order
+        """
+        sun = list(CelestialBody).index(CelestialBody.SUN)
+        personality = np.atleast_2d(np.asarray(personality_longitudes, dtype=np.float64))
+        design = np.atleast_2d(np.asarray(design_longitudes, dtype=np.float64))
+
+        # Earth (Sun + 180) is added explicitly, as in calculate_chart
+        p_sun = map_longitudes(personality[:, sun])
+        d_sun = map_longitudes(design[:, sun])
+        p_earth = map_longitudes(np.mod(personality[:, sun] + 180.0, 360.0)).gate
+        d_earth = map_longitudes(np.mod(design[:, sun] + 180.0, 360.0)).gate
+
+        personality_gates = gate_masks(map_longitudes(personality).gate) | gate_masks(p_earth[:, None])
+        design_gates = gate_masks(map_longitudes(design).gate) | gate_masks(d_earth[:, None])
+
+        table = self.masks.table
+        entries = CenterLinkTable.decode_many(
+            table.lookup_many(self.masks.resolve_many(personality_gates | design_gates))
+        )
+
+        profiles = [f"{p}/{d}" for p, d in zip(p_sun.line.tolist(), d_sun.line.tolist())]
+        crosses = list(zip(p_sun.gate.tolist(), p_earth.tolist(), d_sun.gate.tolist(), d_earth.tolist()))
+        cross_names: Dict[Tuple[int, str], str] = {}
+        for gates, profile in zip(crosses, profiles):
+            if (gates[0], profile) not in cross_names:
+                cross_names[(gates[0], profile)] = self._determine_incarnation_cross(gates[0], profile)
+
+        return ChartColumns(
+            personality_gates=personality_gates,
+            design_gates=design_gates,
+            defined_centers=entries.center_mask,
+            type_code=[TYPE_CODES[i] for i in entries.type_index.tolist()],
+            authority_code=[AUTHORITY_CODES[i] for i in entries.authority_index.tolist()],
+            profile=profiles,
+            cross_code=["-".join(str(g) for g in gates) for gates in crosses],
+            cross_name=[cross_names[(gates[0], profile)] for gates, profile in zip(crosses, profiles)],
+        )
+
+    def _resolve_sets(
+        self, active_gates: Set[int]
+    ) -> Tuple[List[Channel], Set[str], TypeInfo, AuthorityInfo]:
+        """Resolve channels, centers, type and authority with Python sets."""
+        defined_channels = []
+        defined_centers_set = set()
+        active_channels_map = {}  # Store defined channels for type calc
+
+        # Deduplicate channels map for processing
+        unique_channels = set()
+        for g1, g2, c1, c2 in self.CHANNELS_MAP:
+            # Sort gates to ensure uniqueness
+            gate_pair = tuple(sorted((g1, g2)))
+            if gate_pair not in unique_channels:
+                unique_channels.add(gate_pair)
+
+                if g1 in active_gates and g2 in active_gates:
+                    code = f"{g1}-{g2}"
+                    defined_channels.append(Channel(code=code))
+                    defined_centers_set.add(c1)
+                    defined_centers_set.add(c2)
+
+                    # Store for type calculation
+                    active_channels_map[gate_pair] = (c1, c2)
+
+        type_info = self._determine_type(defined_centers_set, active_channels_map)  # type: ignore
+        authority_info = self._determine_authority(defined_centers_set, type_info.code)
+        return defined_channels, defined_centers_set, type_info, authority_info
+
+    def _resolve_bitmask(
+        self, active_gates: Set[int]
+    ) -> Tuple[List[Channel], Set[str], TypeInfo, AuthorityInfo]:
+        """Resolve channels, centers, type and authority with integer masks."""
+        resolved = self.masks.resolve(gate_mask(active_gates))
+        entry = self.masks.table.lookup(resolved.link_mask)
+
+        defined_centers_set = {
+            code for code, bit in self.masks.center_bits.items() if entry.center_mask & bit
+        }
+        return (
+            [Channel(code=code) for code in resolved.channel_codes],
+            defined_centers_set,
+            build_type_info(entry.type_code),
+            build_authority_info(entry.authority_code),
+        )
+
+    @staticmethod
+    def _as_activations(
+        positions: Union[ActivationSet, List[PlanetaryPosition]]
+    ) -> ActivationSet:
+        """Accept PlanetaryPosition lists wherever ActivationSets are expected."""
+        if isinstance(positions, ActivationSet):
+            return positions
+        return ActivationSet.from_positions(positions)
+
     def _validate_planetary_positions(
         self,
-        personality_positions: List[PlanetaryPosition],
-        design_positions: List[PlanetaryPosition],
+        personality_positions: ActivationSet,
+        design_positions: ActivationSet,
     ) -> None:
         """
         Validate that all required planetary positions are present.
@@ -253,8 +486,8 @@ class BodygraphCalculator:
             CelestialBody.NORTH_NODE,
         }
 
-        personality_bodies = {p.body for p in personality_positions}
-        design_bodies = {p.body for p in design_positions}
+        personality_bodies = set(personality_positions.bodies)
+        design_bodies = set(design_positions.bodies)
 
         missing_personality = required_bodies - personality_bodies
         missing_design = required_bodies - design_bodies
@@ -285,38 +518,15 @@ class BodygraphCalculator:
 
         if "sacral" in defined_centers:
             # Generator or Manifesting Generator
-            if has_motor_to_throat:
-                return TypeInfo(
-                    code="2",
-                    label="Manifestierender Generator",
-                    shortDescription="Als Manifestierender Generator hast du eine konstante Lebensenergie und kannst schnell initiieren.",
-                )
-            else:
-                return TypeInfo(
-                    code="1",
-                    label="Generator",
-                    shortDescription="Als Generator hast du eine konstante Lebensenergie und ziehst das Leben an.",
-                )
+            return build_type_info("2" if has_motor_to_throat else "1")
 
         if has_motor_to_throat:
-            return TypeInfo(
-                code="4",
-                label="Manifestor",
-                shortDescription="Als Manifestor hast du die Gabe, Dinge zu initiieren und in Bewegung zu bringen.",
-            )
+            return build_type_info("4")  # Manifestor
 
         if len(defined_centers) > 0:
-            return TypeInfo(
-                code="3",
-                label="Projektor",
-                shortDescription="Als Projektor bist du hier, um andere zu leiten und Systeme zu verstehen.",
-            )
+            return build_type_info("3")  # Projector
 
-        return TypeInfo(
-            code="5",
-            label="Reflektor",
-            shortDescription="Als Reflektor bist du ein Spiegel für deine Umgebung und nimmst tief wahr.",
-        )
+        return build_type_info("5")  # Reflector
 
     def _check_motor_to_throat(
         self,
@@ -354,110 +564,33 @@ class BodygraphCalculator:
     ) -> AuthorityInfo:
         """Determine Inner Authority."""
         if type_code == "5":  # Reflector
-            return AuthorityInfo(
-                code="lunar",
-                label="Lunar",
-                decisionHint="Warte einen Mondzyklus (28 Tage) für wichtige Entscheidungen.",
-            )
-
-        if "solar" in defined_centers:
-            return AuthorityInfo(
-                code="emotional",
-                label="Emotional",
-                decisionHint="Warte auf emotionale Klarheit über die Zeit.",
-            )
-
-        if "sacral" in defined_centers:
-            return AuthorityInfo(
-                code="sacral",
-                label="Sakral",
-                decisionHint="Höre auf deine Bauchstimme (Mmh-hmm oder Uh-uh) im Moment.",
-            )
-
-        if "spleen" in defined_centers:
-            return AuthorityInfo(
-                code="spleen",
-                label="Milz",
-                decisionHint="Vertraue deiner spontanen Intuition im Jetzt.",
-            )
+            return build_authority_info("lunar")
 
-        if "heart" in defined_centers:
-            # Ego Manifested or Projected
-            if type_code == "4":  # Manifestor
-                return AuthorityInfo(
-                    code="ego_manifested",
-                    label="Ego-Manifestiert",
-                    decisionHint="Informiere und folge deinem Willen.",
-                )
-            else:  # Projector
-                return AuthorityInfo(
-                    code="ego_projected",
-                    label="Ego-Projektiert",
-                    decisionHint="Warte auf Einladung und folge deinem Willen.",
-                )
-
-        if "g" in defined_centers:
-            return AuthorityInfo(
-                code="self_projected",
-                label="Selbst-Projektiert",
-                decisionHint="Sprich mit anderen und höre dir selbst zu.",
-            )
+        for center, code in AUTHORITY_CENTERS:
+            if center in defined_centers:
+                if code == "ego":
+                    # Ego Manifested (Manifestor) or Projected (Projector)
+                    code = "ego_manifested" if type_code == "4" else "ego_projected"
+                return build_authority_info(code)
 
         # Mental Projector (Head/Ajna defined, no centers below throat)
-        return AuthorityInfo(
-            code="mental",
-            label="Mental / Keine",
-            decisionHint="Besprich Entscheidungen mit anderen, um Klarheit zu gewinnen.",
-        )
+        return build_authority_info("mental")
 
     def _determine_profile(self, p_line: int, d_line: int) -> ProfileInfo:
         """Determine Profile from Sun lines."""
         code = f"{p_line}/{d_line}"
-
-        descriptions = {
-            "1/3": "Investigator / Märtyrer - Forschen und Ausprobieren.",
-            "1/4": "Investigator / Opportunist - Forschen und Netzwerken.",
-            "2/4": "Einsiedler / Opportunist - Naturtalent und Netzwerken.",
-            "2/5": "Einsiedler / Ketzer - Naturtalent und Problemlöser.",
-            "3/5": "Märtyrer / Ketzer - Ausprobieren und Problemlöser.",
-            "3/6": "Märtyrer / Rollenvorbild - Ausprobieren und Vorbild sein.",
-            "4/6": "Opportunist / Rollenvorbild - Netzwerken und Vorbild sein.",
-            "4/1": "Opportunist / Investigator - Netzwerken und Forschen.",
-            "5/1": "Ketzer / Investigator - Problemlöser und Forschen.",
-            "5/2": "Ketzer / Einsiedler - Problemlöser und Naturtalent.",
-            "6/2": "Rollenvorbild / Einsiedler - Vorbild sein und Naturtalent.",
-            "6/3": "Rollenvorbild / Märtyrer - Vorbild sein und Ausprobieren.",
-        }
+        description = self.content.profile_description(code)
 
         return ProfileInfo(
             code=code,
-            shortDescription=descriptions.get(code, "Dein einzigartiges Profil."),
+            shortDescription=description or "Dein einzigartiges Profil.",
         )
 
     def _determine_incarnation_cross(self, sun_gate: int, profile_code: str) -> str:
         """Determine the name of the Incarnation Cross."""
-        import json
-        import os
-
-        # Load cross data (in production, cache this)
-        try:
-            base_path = os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
-            data_path = os.path.join(
-                base_path, "config", "data", "incarnation_crosses.json"
-            )
-
-            with open(data_path, "r", encoding="utf-8") as f:
-                cross_data = json.load(f)
-
-            gate_str = str(sun_gate)
-            if gate_str in cross_data:
-                angle = self._get_profile_angle(profile_code)
-                return cross_data[gate_str].get(angle, f"Kreuz von Tor {sun_gate}")
-
-        except Exception as e:
-            print(f"Error loading incarnation crosses: {e}")
-
-        return f"Kreuz von Tor {sun_gate}"
+        angle = self._get_profile_angle(profile_code)
+        name = self.content.incarnation_cross_name(sun_gate, angle)
+        return name or f"Kreuz von Tor {sun_gate}"
 
     def _get_profile_angle(self, profile_code: str) -> str:
         """Determine angle (right, juxtaposition, left) from profile."""
@@ -474,23 +607,5 @@ class BodygraphCalculator:
 
     def _generate_impulse(self, type_code: str, authority_code: str) -> str:
         """Generate personalized impulse."""
-        import json
-        import os
-
-        try:
-            base_path = os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
-            data_path = os.path.join(base_path, "config", "data", "impulses.json")
-
-            with open(data_path, "r", encoding="utf-8") as f:
-                impulses_data = json.load(f)
-
-            if (
-                type_code in impulses_data
-                and authority_code in impulses_data[type_code]
-            ):
-                return impulses_data[type_code][authority_code]
-
-        except Exception as e:
-            print(f"Error loading impulses: {e}")
-
-        return "Vertraue deiner inneren Autorität - sie kennt deinen Weg."
+        impulse = self.content.impulse(type_code, authority_code)
+        return impulse or "Vertraue deiner inneren Autorität - sie kennt deinen Weg."
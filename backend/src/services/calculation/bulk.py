@@ -0,0 +1,427 @@
+"""
+Bulk chart calculation.
+
+Computes the structural facts of many charts (gate masks, type, authority,
+profile, cross) as columns instead of ChartResponse objects. Input rows are
+streamed from CSV or Parquet in fixed-size chunks; each chunk is calculated
+by a warm BulkChartWorker in a process pool and written to its own part
+file, so an interrupted run resumes at the first missing part.
+"""
+
+import csv
+import json
+import multiprocessing
+import os
+import time
+from collections import deque
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Dict, Iterator, List, Mapping, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from src.models.celestial import CelestialBody
+from src.services.calculation.bodygraph_calculator import BodygraphCalculator
+from src.services.calculation.design_time import calculate_design_datetime
+from src.services.calculation.sun_table import SunLongitudeTable, get_sun_table
+from src.services.chart_batch import localize_birth_datetime
+from src.services.ephemeris.base import EphemerisSource
+from src.services.gazetteer import Gazetteer, get_gazetteer
+from src.services.validation_service import ValidationError
+
+# Output columns in file order
+BULK_COLUMNS = (
+    "id",
+    "birth_utc",
+    "personality_gates",
+    "design_gates",
+    "defined_centers",
+    "type",
+    "authority",
+    "profile",
+    "cross_code",
+    "cross_name",
+    "error",
+)
+
+# Input columns (same names as the chart API); timezone, if present, skips place lookup
+DATE_COLUMN = "birthDate"
+TIME_COLUMN = "birthTime"
+PLACE_COLUMN = "birthPlace"
+TIMEZONE_COLUMN = "timezone"
+
+CHECKPOINT_FILE = "_checkpoint.json"
+OUTPUT_FORMATS = ("csv", "parquet")
+
+
+class BulkChartWorker:
+    """
+    Warm per-process state for bulk chart calculation.
+    """
+
+    def __init__(
+        self,
+        ephemeris_source=None,
+        calculator: Optional[BodygraphCalculator] = None,
+        sun_table: Optional[SunLongitudeTable] = None,
+        gazetteer: Optional[Gazetteer] = None,
+    ):
+        """
+        Initialize worker.
+
+        Args:
+            ephemeris_source: Ephemeris source (Swiss Ephemeris if omitted)
+            calculator: Bodygraph calculator (bitmask engine if omitted)
+            sun_table: Sun table for design times (the configured one if omitted)
+            gazetteer: Place index for rows without a timezone (the configured one if omitted)
+        """
+        if ephemeris_source is None:
+            from src.services.ephemeris.source_factory import get_ephemeris_source
+
+            ephemeris_source = get_ephemeris_source()
+        self.ephemeris_source = ephemeris_source
+        self.calculator = calculator or BodygraphCalculator()
+        self.sun_table = sun_table if sun_table is not None else get_sun_table()
+        self.gazetteer = gazetteer if gazetteer is not None else get_gazetteer()
+        self._bodies = list(CelestialBody)
+        self._timezones: Dict[str, Optional[str]] = {}
+
+    def warm(self) -> None:
+        """Load ephemeris files and lookup tables by calculating one chart."""
+        jd = 2451545.0
+        self.ephemeris_source.calculate_positions(self._bodies, jd)
+        self.calculator.calculate_columns(np.zeros((1, len(self._bodies))), np.zeros((1, len(self._bodies))))
+
+    def _timezone(self, row: Mapping[str, str]) -> str:
+        """Get a row's timezone from its timezone column or its place."""
+        timezone = (row.get(TIMEZONE_COLUMN) or "").strip()
+        if timezone:
+            return timezone
+
+        place = (row.get(PLACE_COLUMN) or "").strip()
+        if place not in self._timezones:
+            entry = self.gazetteer.lookup(place) if (self.gazetteer is not None and place) else None
+            self._timezones[place] = entry.timezone if entry is not None else None
+        cached = self._timezones[place]
+        if cached is None:
+            raise ValueError(f"place not found: {place!r}")
+        return cached
+
+    def birth_instant(self, row: Mapping[str, str]) -> datetime:
+        """
+        Resolve a row to its UTC birth instant.
+
+        Args:
+            row: Input row with birthDate, birthTime and timezone or birthPlace
+
+        Returns:
+            Timezone-aware UTC datetime
+
+        Raises:
+            ValueError: If the row cannot be resolved
+        """
+        birth_time = (row.get(TIME_COLUMN) or "").strip() or "12:00"
+        try:
+            return localize_birth_datetime(
+                (row.get(DATE_COLUMN) or "").strip(), birth_time, self._timezone(row)
+            )
+        except ValidationError as e:
+            raise ValueError(f"{e.field}: {e.message}")
+
+    def _longitudes(self, birth_dt_utc: datetime) -> Tuple[List[float], List[float]]:
+        """Calculate personality and design longitudes, as PositionCalculator does."""
+
+        def calculate(source: EphemerisSource) -> Tuple[List[float], List[float]]:
+            personality = source.calculate_positions(self._bodies, source.datetime_to_julian_day(birth_dt_utc))
+            design_dt = calculate_design_datetime(
+                birth_dt_utc, source, target_arc=88.0, sun_table=self.sun_table
+            )
+            design = source.calculate_positions(self._bodies, source.datetime_to_julian_day(design_dt))
+            return personality, design
+
+        # With failover configured, one member serves the whole row
+        return self.ephemeris_source.run_pinned(calculate)
+
+    def compute(self, rows: Sequence[Mapping[str, str]], ids: Sequence[str]) -> Dict[str, list]:
+        """
+        Calculate a chunk of rows.
+
+        Rows that cannot be resolved keep their id and get an error message;
+        their chart columns are None.
+
+        Args:
+            rows: Input rows
+            ids: Identifier for each row
+
+        Returns:
+            Dict of BULK_COLUMNS to equally long lists
+        """
+        columns: Dict[str, list] = {name: [None] * len(rows) for name in BULK_COLUMNS}
+        columns["id"] = list(ids)
+
+        ok: List[int] = []
+        personality: List[List[float]] = []
+        design: List[List[float]] = []
+        for i, row in enumerate(rows):
+            try:
+                birth_dt_utc = self.birth_instant(row)
+                p_longitudes, d_longitudes = self._longitudes(birth_dt_utc)
+            except Exception as e:
+                columns["error"][i] = str(e)
+                continue
+            columns["birth_utc"][i] = birth_dt_utc.strftime("%Y-%m-%dT%H:%MZ")
+            ok.append(i)
+            personality.append(p_longitudes)
+            design.append(d_longitudes)
+
+        if not ok:
+            return columns
+
+        charts = self.calculator.calculate_columns(np.asarray(personality), np.asarray(design))
+        values = {
+            "personality_gates": charts.personality_gates.tolist(),
+            "design_gates": charts.design_gates.tolist(),
+            "defined_centers": charts.defined_centers.tolist(),
+            "type": charts.type_code,
+            "authority": charts.authority_code,
+            "profile": charts.profile,
+            "cross_code": charts.cross_code,
+            "cross_name": charts.cross_name,
+        }
+        for name, column in values.items():
+            target = columns[name]
+            for i, value in zip(ok, column):
+                target[i] = value
+        return columns
+
+
+def _require_pyarrow():
+    """Import pyarrow.parquet, which is only needed for Parquet input or output."""
+    try:
+        import pyarrow.parquet as pq
+    except ImportError:
+        raise RuntimeError("Parquet support requires pyarrow (pip install pyarrow)")
+    return pq
+
+
+def iter_row_chunks(path: Union[str, Path], chunk_size: int) -> Iterator[List[Dict[str, str]]]:
+    """
+    Stream input rows in chunks.
+
+    Args:
+        path: .csv or .parquet file
+        chunk_size: Rows per chunk
+
+    Yields:
+        Lists of row dicts (values as strings)
+    """
+    path = Path(path)
+    if path.suffix.lower() == ".parquet":
+        parquet_file = _require_pyarrow().ParquetFile(path)
+        for batch in parquet_file.iter_batches(batch_size=chunk_size):
+            yield [
+                {key: ("" if value is None else str(value)) for key, value in row.items()}
+                for row in batch.to_pylist()
+            ]
+        return
+
+    with open(path, "r", encoding="utf-8", newline="") as f:
+        chunk: List[Dict[str, str]] = []
+        for row in csv.DictReader(f):
+            chunk.append(row)
+            if len(chunk) == chunk_size:
+                yield chunk
+                chunk = []
+        if chunk:
+            yield chunk
+
+
+def part_path(output_dir: Path, chunk_index: int, output_format: str) -> Path:
+    """Get the part file of a chunk."""
+    return output_dir / f"part-{chunk_index:06d}.{output_format}"
+
+
+def write_part(columns: Dict[str, list], path: Path, output_format: str) -> None:
+    """
+    Write one chunk's columns, replacing the part file atomically.
+
+    Args:
+        columns: Output of BulkChartWorker.compute
+        path: Part file path
+        output_format: "csv" or "parquet"
+    """
+    tmp_path = path.with_name(path.name + ".tmp")
+    if output_format == "parquet":
+        import pyarrow as pa
+
+        pq = _require_pyarrow()
+        schema = pa.schema([
+            ("id", pa.string()),
+            ("birth_utc", pa.string()),
+            ("personality_gates", pa.uint64()),
+            ("design_gates", pa.uint64()),
+            ("defined_centers", pa.uint16()),
+            ("type", pa.string()),
+            ("authority", pa.string()),
+            ("profile", pa.string()),
+            ("cross_code", pa.string()),
+            ("cross_name", pa.string()),
+            ("error", pa.string()),
+        ])
+        pq.write_table(pa.table(columns, schema=schema), tmp_path)
+    else:
+        with open(tmp_path, "w", encoding="utf-8", newline="") as f:
+            writer = csv.writer(f)
+            writer.writerow(BULK_COLUMNS)
+            writer.writerows(zip(*(columns[name] for name in BULK_COLUMNS)))
+    os.replace(tmp_path, path)
+
+
+def _check_checkpoint(output_dir: Path, state: dict, restart: bool) -> None:
+    """Create the checkpoint, or verify that an existing one belongs to the same job."""
+    checkpoint = output_dir / CHECKPOINT_FILE
+    if checkpoint.exists() and not restart:
+        with open(checkpoint, "r", encoding="utf-8") as f:
+            previous = json.load(f)
+        if previous != state:
+            raise ValueError(
+                f"{output_dir} holds results of a different input or chunk size; "
+                "use a new output directory or restart"
+            )
+        return
+
+    for stale in output_dir.glob("part-*"):
+        stale.unlink()
+    with open(checkpoint, "w", encoding="utf-8") as f:
+        json.dump(state, f, indent=2)
+
+
+# Per-process worker, created by the pool initializer
+_worker: Optional[BulkChartWorker] = None
+
+
+def _init_worker(ephemeris_dir: Optional[str]) -> None:
+    """Pool initializer: set up and warm this process's ephemeris and calculator."""
+    global _worker
+    if ephemeris_dir and Path(ephemeris_dir).is_dir():
+        from src.services.ephemeris.initializer import apply_ephemeris_path
+
+        apply_ephemeris_path(ephemeris_dir)
+    _worker = BulkChartWorker()
+    _worker.warm()
+
+
+def _process_chunk(
+    chunk_index: int,
+    first_row: int,
+    rows: List[Dict[str, str]],
+    id_column: str,
+    output_dir: str,
+    output_format: str,
+) -> Tuple[int, int, int]:
+    """Calculate and write one chunk; returns (chunk_index, rows, errors)."""
+    ids = [row.get(id_column) or str(first_row + i) for i, row in enumerate(rows)]
+    if _worker is None:
+        raise RuntimeError("bulk worker not initialised in this process")
+    columns = _worker.compute(rows, ids)
+    write_part(columns, part_path(Path(output_dir), chunk_index, output_format), output_format)
+    errors = sum(1 for error in columns["error"] if error is not None)
+    return chunk_index, len(rows), errors
+
+
+def run_bulk(
+    input_path: Union[str, Path],
+    output_dir: Union[str, Path],
+    output_format: str = "csv",
+    chunk_size: int = 10000,
+    workers: int = 0,
+    id_column: str = "id",
+    ephemeris_dir: Optional[str] = None,
+    restart: bool = False,
+    progress: Optional[Callable[[dict], None]] = None,
+) -> dict:
+    """
+    Calculate charts for every input row.
+
+    Chunks whose part file already exists are skipped, so re-running the
+    same job after an interruption only calculates the missing chunks.
+
+    Args:
+        input_path: .csv or .parquet input
+        output_dir: Directory for part files and the checkpoint
+        output_format: "csv" or "parquet"
+        chunk_size: Rows per chunk (must stay the same when resuming)
+        workers: Worker processes (0 calculates in this process)
+        id_column: Input column copied to the output id (row number if empty)
+        ephemeris_dir: Swiss Ephemeris data directory for the workers
+        restart: Discard existing results instead of resuming
+        progress: Called with running totals after each chunk
+
+    Returns:
+        Dict with row, error and chunk counts, elapsed seconds and rows/s
+
+    Raises:
+        ValueError: If output_dir belongs to a different job
+    """
+    if output_format not in OUTPUT_FORMATS:
+        raise ValueError(f"Unknown output format: {output_format}")
+
+    input_path = Path(input_path)
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    input_stat = input_path.stat()
+    _check_checkpoint(
+        output_dir,
+        {
+            "input": str(input_path.resolve()),
+            "input_size": input_stat.st_size,
+            "input_mtime": input_stat.st_mtime,
+            "chunk_size": chunk_size,
+            "format": output_format,
+            "id_column": id_column,
+        },
+        restart,
+    )
+
+    totals = {"rows": 0, "errors": 0, "chunks": 0, "skipped_chunks": 0, "seconds": 0.0, "rows_per_second": 0.0}
+    start = time.perf_counter()
+
+    def record(result: Tuple[int, int, int]) -> None:
+        _, rows, errors = result
+        totals["rows"] += rows
+        totals["errors"] += errors
+        totals["chunks"] += 1
+        totals["seconds"] = time.perf_counter() - start
+        totals["rows_per_second"] = totals["rows"] / totals["seconds"] if totals["seconds"] else 0.0
+        if progress is not None:
+            progress(dict(totals))
+
+    def tasks() -> Iterator[tuple]:
+        first_row = 0
+        for chunk_index, rows in enumerate(iter_row_chunks(input_path, chunk_size)):
+            if part_path(output_dir, chunk_index, output_format).exists():
+                totals["skipped_chunks"] += 1
+            else:
+                yield chunk_index, first_row, rows, id_column, str(output_dir), output_format
+            first_row += len(rows)
+
+    if workers <= 0:
+        _init_worker(ephemeris_dir)
+        for task in tasks():
+            record(_process_chunk(*task))
+    else:
+        # spawn avoids forking a parent that may already hold swisseph state;
+        # at most two chunks per worker are read ahead, so memory stays flat
+        context = multiprocessing.get_context("spawn")
+        with context.Pool(workers, initializer=_init_worker, initargs=(ephemeris_dir,)) as pool:
+            pending: deque = deque()
+            for task in tasks():
+                pending.append(pool.apply_async(_process_chunk, task))
+                while len(pending) >= 2 * workers:
+                    record(pending.popleft().get())
+            while pending:
+                record(pending.popleft().get())
+
+    totals["seconds"] = time.perf_counter() - start
+    totals["rows_per_second"] = totals["rows"] / totals["seconds"] if totals["seconds"] else 0.0
+    return totals
@@ -1,12 +1,189 @@
 """Design time calculation for Human Design charts"""
 
+import threading
 from datetime import datetime, timedelta
+from typing import TYPE_CHECKING, NamedTuple, Optional
+
+from src.models.celestial import CelestialBody
+
+if TYPE_CHECKING:
+    from src.services.calculation.sun_table import SunLongitudeTable
+
+# Mean daily motion of the Sun in degrees, used for the initial guess
+MEAN_SUN_SPEED = 0.9856473
+
+# The Sun's geocentric speed stays within these bounds (degrees/day), so the
+# design moment for a given arc is always inside a known bracket
+MIN_SUN_SPEED = 0.95
+MAX_SUN_SPEED = 1.02
+
+# Days an ephemeris must reach back before the first supported birth: the
+# 88° design arc takes at most 88 / MIN_SUN_SPEED (~93) days
+DESIGN_MARGIN_DAYS = 100.0
+
+# Convergence tolerance in degrees (~0.036 arc-seconds)
+DEFAULT_TOLERANCE = 1e-5
+
+
+class DesignTimeSolution(NamedTuple):
+    """Result of the design-time search"""
+
+    julian_day: float  # Design moment as Julian Day (UT)
+    iterations: int  # Ephemeris evaluations spent on the search
+    residual: float  # Remaining arc error in degrees (signed)
+    converged: bool
+
+
+class DesignTimeStats:
+    """Thread-safe convergence counters for monitoring the solver in production."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._zero()
+
+    def _zero(self) -> None:
+        """Clear all counters (caller holds the lock)."""
+        self.solves = 0
+        self.total_iterations = 0
+        self.max_iterations = 0
+        self.max_abs_residual = 0.0
+        self.not_converged = 0
+
+    def reset(self) -> None:
+        """Clear all counters."""
+        with self._lock:
+            self._zero()
+
+    def record(self, solution: DesignTimeSolution) -> None:
+        """Add one solver run to the counters."""
+        with self._lock:
+            self.solves += 1
+            self.total_iterations += solution.iterations
+            self.max_iterations = max(self.max_iterations, solution.iterations)
+            self.max_abs_residual = max(self.max_abs_residual, abs(solution.residual))
+            if not solution.converged:
+                self.not_converged += 1
+
+    def drain(self) -> dict:
+        """
+        Get the raw counters and reset them, e.g. to ship them out of a worker process.
+
+        Returns:
+            Dict of raw counters accepted by merge()
+        """
+        with self._lock:
+            counters = {
+                "solves": self.solves,
+                "total_iterations": self.total_iterations,
+                "max_iterations": self.max_iterations,
+                "max_abs_residual": self.max_abs_residual,
+                "not_converged": self.not_converged,
+            }
+            self._zero()
+        return counters
+
+    def merge(self, counters: dict) -> None:
+        """Add raw counters drained from another process."""
+        with self._lock:
+            self.solves += counters["solves"]
+            self.total_iterations += counters["total_iterations"]
+            self.max_iterations = max(self.max_iterations, counters["max_iterations"])
+            self.max_abs_residual = max(self.max_abs_residual, counters["max_abs_residual"])
+            self.not_converged += counters["not_converged"]
+
+    def snapshot(self) -> dict:
+        """
+        Get current counters.
+
+        Returns:
+            Dict with solve count, iteration and residual statistics
+        """
+        with self._lock:
+            return {
+                "solves": self.solves,
+                "mean_iterations": (self.total_iterations / self.solves) if self.solves else 0.0,
+                "max_iterations": self.max_iterations,
+                "max_abs_residual_deg": self.max_abs_residual,
+                "not_converged": self.not_converged,
+            }
+
+
+design_time_stats = DesignTimeStats()
+
+
+def _wrap_degrees(delta: float) -> float:
+    """Wrap an angle difference into [-180, 180)."""
+    return (delta + 180.0) % 360.0 - 180.0
+
+
+def solve_design_julian_day(
+    birth_jd: float,
+    ephemeris_source,
+    target_arc: float = 88.0,
+    tolerance: float = DEFAULT_TOLERANCE,
+    max_iterations: int = 12,
+) -> DesignTimeSolution:
+    """
+    Find the Julian Day at which the Sun was target_arc degrees before its birth position.
+
+    Uses Newton steps with the Sun's actual daily motion from the ephemeris.
+    The root is kept inside a bracket derived from the Sun's speed bounds;
+    whenever a Newton step would leave the bracket, a secant step between
+    the bracket ends (or bisection) is used instead.
+
+    Args:
+        birth_jd: Birth moment as Julian Day (UT)
+        ephemeris_source: Ephemeris source providing calculate_position_with_speed
+        target_arc: Target arc in degrees (default 88.0)
+        tolerance: Convergence tolerance in degrees
+        max_iterations: Maximum number of design-side ephemeris evaluations
+
+    Returns:
+        DesignTimeSolution with the design Julian Day and convergence details
+    """
+    birth_sun_lon, _ = ephemeris_source.calculate_position_with_speed(
+        CelestialBody.SUN, birth_jd
+    )
+    target_lon = (birth_sun_lon - target_arc) % 360.0
+    evaluations = 1
+
+    # The Sun's longitude increases monotonically, so f(jd) = lon(jd) - target
+    # is negative before the root and positive after it
+    lo, hi = birth_jd - target_arc / MIN_SUN_SPEED, birth_jd - target_arc / MAX_SUN_SPEED
+    f_lo = f_hi = None
+
+    jd = birth_jd - target_arc / MEAN_SUN_SPEED
+    residual = float("inf")
+
+    for _ in range(max_iterations):
+        lon, speed = ephemeris_source.calculate_position_with_speed(CelestialBody.SUN, jd)
+        evaluations += 1
+        residual = _wrap_degrees(lon - target_lon)
+
+        if abs(residual) < tolerance:
+            return DesignTimeSolution(jd, evaluations, residual, True)
+
+        if residual < 0:
+            lo, f_lo = jd, residual
+        else:
+            hi, f_hi = jd, residual
+
+        next_jd = jd - residual / speed if speed > 0 else None
+        if next_jd is None or not (lo < next_jd < hi):
+            if f_lo is not None and f_hi is not None:
+                next_jd = lo - f_lo * (hi - lo) / (f_hi - f_lo)
+            else:
+                next_jd = (lo + hi) / 2.0
+        jd = next_jd
+
+    return DesignTimeSolution(jd, evaluations, residual, False)
 
 
 def calculate_design_datetime(
     birth_dt_utc: datetime,
     ephemeris_source,
-    target_arc: float = 88.0
+    target_arc: float = 88.0,
+    sun_table: Optional["SunLongitudeTable"] = None,
 ) -> datetime:
     """
     Calculate the design moment (approximately 88 degrees of Sun movement before birth).
@@ -18,35 +195,26 @@ def calculate_design_datetime(
         birth_dt_utc: Birth datetime in UTC
         ephemeris_source: Ephemeris source for Sun position calculations
         target_arc: Target arc in degrees (default 88.0)
+        sun_table: Optional precomputed Sun table; used instead of the
+            ephemeris when it covers the birth moment
 
     Returns:
         datetime: Design moment in UTC
     """
-    # Start with approximate 88 days before birth
-    design_dt = birth_dt_utc - timedelta(days=88)
-
-    # Get Sun position at birth
     birth_jd = ephemeris_source.datetime_to_julian_day(birth_dt_utc)
-    birth_sun_lon = ephemeris_source.get_ecliptic_longitude("Sun", birth_jd)
-
-    # Iteratively refine to find exact 88° arc
-    max_iterations = 10
-    tolerance = 0.01  # 0.01 degrees tolerance
-
-    for _ in range(max_iterations):
-        design_jd = ephemeris_source.datetime_to_julian_day(design_dt)
-        design_sun_lon = ephemeris_source.get_ecliptic_longitude("Sun", design_jd)
 
-        # Calculate arc (handle wrap-around at 360°)
-        arc = (birth_sun_lon - design_sun_lon) % 360.0
+    earliest_design_jd = birth_jd - target_arc / MIN_SUN_SPEED
+    if sun_table is not None and sun_table.covers(birth_jd) and sun_table.covers(earliest_design_jd):
+        design_jd = sun_table.design_julian_day(birth_jd, target_arc)
+        return birth_dt_utc - timedelta(days=birth_jd - design_jd)
 
-        # Check if we're close enough
-        if abs(arc - target_arc) < tolerance:
-            break
+    solution = solve_design_julian_day(birth_jd, ephemeris_source, target_arc)
+    design_time_stats.record(solution)
 
-        # Adjust design time based on arc difference
-        # Sun moves approximately 1° per day
-        days_adjustment = (arc - target_arc)
-        design_dt = design_dt + timedelta(days=days_adjustment)
+    if not solution.converged:
+        print(
+            f"Design time did not converge for JD {birth_jd}: "
+            f"residual {solution.residual:.3e}° after {solution.iterations} evaluations"
+        )
 
-    return design_dt
+    return birth_dt_utc - timedelta(days=birth_jd - solution.julian_day)
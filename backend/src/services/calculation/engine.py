@@ -0,0 +1,314 @@
+"""
+Chart calculation engine.
+
+Runs the synchronous ephemeris and bodygraph work on a bounded worker pool so
+the event loop keeps serving other requests while charts are being computed.
+"""
+
+import asyncio
+import multiprocessing
+import threading
+from concurrent.futures import Executor, Future, ThreadPoolExecutor, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from datetime import datetime
+from typing import Any, Callable, Optional, Tuple
+
+from src.models.chart import ChartResponse
+from src.models.engine import CalculationEngineConfig
+from src.models.error import ERROR_EPHEMERIS_UNAVAILABLE
+from src.services.calculation.design_time import design_time_stats
+
+
+class EngineOverloadedError(RuntimeError):
+    """Raised when the calculation queue is full and a request is rejected."""
+
+
+class CalculationTimeoutError(TimeoutError):
+    """Raised when a calculation does not finish within its deadline."""
+
+
+# Per-process calculator, created lazily inside each worker
+_bodygraph_calculator = None
+
+
+def calculate_chart_for_instant(birth_dt_utc: datetime, first_name: str) -> ChartResponse:
+    """
+    Calculate a complete chart for a UTC birth instant.
+
+    This is the unit of work submitted to the engine. It is a module-level
+    function so it can be pickled for process pools.
+
+    Args:
+        birth_dt_utc: Birth datetime in UTC
+        first_name: Sanitized first name for the response
+
+    Returns:
+        ChartResponse with complete HD chart data
+    """
+    global _bodygraph_calculator
+
+    # Imported here so process workers only pay for swisseph on first use
+    from src.services.ephemeris.base import EphemerisSource
+    from src.services.ephemeris.source_factory import get_ephemeris_source
+    from src.services.calculation.position_calculator import PositionCalculator
+    from src.services.calculation.design_time import calculate_design_datetime
+    from src.services.calculation.sun_table import get_sun_table
+    from src.services.calculation.bodygraph_calculator import BodygraphCalculator
+
+    if _bodygraph_calculator is None:
+        _bodygraph_calculator = BodygraphCalculator()
+    bodygraph_calculator = _bodygraph_calculator
+
+    def calculate(ephemeris_source: EphemerisSource) -> ChartResponse:
+        pos_calculator = PositionCalculator(ephemeris_source)
+
+        personality_positions = pos_calculator.calculate_activations(birth_dt_utc)
+
+        design_dt_utc = calculate_design_datetime(
+            birth_dt_utc, ephemeris_source, target_arc=88.0, sun_table=get_sun_table()
+        )
+        design_positions = pos_calculator.calculate_activations(design_dt_utc)
+
+        return bodygraph_calculator.calculate_chart(
+            personality_positions,
+            design_positions,
+            first_name,
+            calculation_source=ephemeris_source.get_source_name(),
+        )
+
+    # With failover configured, one member serves the whole chart
+    return get_ephemeris_source().run_pinned(calculate)
+
+
+def chart_source_name() -> str:
+    """
+    Get the name of the ephemeris source that would calculate a chart now.
+
+    Used for chart cache lookups. Charts are stored under their actual
+    calculationSource, which differs from this name after a failover.
+
+    Returns:
+        Source identifier, as reported in calculationSource
+    """
+    from src.services.ephemeris.source_factory import get_ephemeris_source
+
+    return get_ephemeris_source().serving_source_name()
+
+
+def _run_with_design_time_stats(fn: Callable[..., Any], *args: Any) -> Tuple[Any, dict]:
+    """
+    Run fn in a worker process and ship that process's design-time counters back.
+
+    Counters recorded in process workers would otherwise never reach the
+    parent, where /api/admin/design-time reads them.
+    """
+    result = fn(*args)
+    return result, design_time_stats.drain()
+
+
+class CalculationEngine:
+    """
+    Bounded executor for CPU-bound chart calculations.
+
+    At most ``max_workers`` calculations run at once and at most ``max_queue``
+    more wait for a slot. Further submissions are rejected immediately with
+    EngineOverloadedError so callers can answer 503 instead of piling up work.
+    A slot is only released when the underlying work has actually finished,
+    so timed-out calculations that are still running keep counting against
+    the bound.
+    """
+
+    def __init__(
+        self,
+        mode: str = "thread",
+        max_workers: int = 4,
+        max_queue: int = 16,
+        timeout_seconds: float = 60.0,
+    ):
+        """
+        Initialize calculation engine.
+
+        Args:
+            mode: "thread" or "process" worker pool
+            max_workers: Number of concurrent calculations
+            max_queue: Number of calculations allowed to wait for a worker
+            timeout_seconds: Default deadline per calculation
+        """
+        if mode not in ("thread", "process"):
+            raise ValueError(f"Unknown calculation engine mode: {mode}")
+
+        self.mode = mode
+        self.max_workers = max_workers
+        self.max_queue = max_queue
+        self.timeout_seconds = timeout_seconds
+        self.capacity = max_workers + max_queue
+
+        self._executor: Optional[Executor] = None
+        self._lock = threading.Lock()
+        self._in_flight = 0
+        self._completed = 0
+        self._rejected = 0
+        self._timed_out = 0
+        self._failed = 0
+
+    @classmethod
+    def from_config(cls, config: Optional[CalculationEngineConfig] = None) -> "CalculationEngine":
+        """
+        Create engine from environment configuration.
+
+        Args:
+            config: Optional explicit configuration (loaded from env if omitted)
+
+        Returns:
+            CalculationEngine instance
+        """
+        config = config or CalculationEngineConfig()
+        return cls(
+            mode=config.mode,
+            max_workers=config.max_workers,
+            max_queue=config.max_queue,
+            timeout_seconds=config.timeout_seconds,
+        )
+
+    def _get_executor(self) -> Executor:
+        """
+        Get or create the worker pool.
+
+        Returns:
+            Executor for the configured mode
+        """
+        with self._lock:
+            if self._executor is None:
+                if self.mode == "process":
+                    # spawn avoids forking a parent that already runs threads
+                    self._executor = ProcessPoolExecutor(
+                        max_workers=self.max_workers,
+                        mp_context=multiprocessing.get_context("spawn"),
+                    )
+                else:
+                    self._executor = ThreadPoolExecutor(
+                        max_workers=self.max_workers,
+                        thread_name_prefix="chart-calc",
+                    )
+            return self._executor
+
+    def _reserve_slot(self) -> None:
+        """Reserve a queue slot or reject the submission."""
+        with self._lock:
+            if self._in_flight >= self.capacity:
+                self._rejected += 1
+                raise EngineOverloadedError(
+                    f"{ERROR_EPHEMERIS_UNAVAILABLE}: calculation queue is full "
+                    f"({self._in_flight}/{self.capacity})"
+                )
+            self._in_flight += 1
+
+    def _release_slot(self, future: Future) -> None:
+        """Release the slot held by a finished or cancelled calculation."""
+        with self._lock:
+            self._in_flight -= 1
+            if not future.cancelled() and future.exception() is None:
+                self._completed += 1
+
+    def _reset_broken_executor(self, executor: Executor) -> None:
+        """Drop a process pool whose worker died so the next call starts a fresh one."""
+        with self._lock:
+            if self._executor is executor:
+                self._executor = None
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    async def run(
+        self,
+        fn: Callable[..., Any],
+        *args: Any,
+        timeout: Optional[float] = None,
+    ) -> Any:
+        """
+        Run a calculation on the worker pool and await its result.
+
+        Args:
+            fn: Picklable callable doing the synchronous work
+            *args: Arguments for fn
+            timeout: Deadline in seconds (defaults to engine timeout)
+
+        Returns:
+            Result of fn(*args)
+
+        Raises:
+            EngineOverloadedError: If the queue is full
+            CalculationTimeoutError: If the deadline is exceeded
+            RuntimeError: If the worker pool broke during the calculation
+        """
+        self._reserve_slot()
+        executor = self._get_executor()
+        in_process = self.mode == "process"
+        try:
+            if in_process:
+                future = executor.submit(_run_with_design_time_stats, fn, *args)
+            else:
+                future = executor.submit(fn, *args)
+        except Exception:
+            with self._lock:
+                self._in_flight -= 1
+            raise
+        future.add_done_callback(self._release_slot)
+
+        deadline = timeout if timeout is not None else self.timeout_seconds
+        try:
+            # wait_for cancels the wrapped future on timeout or client disconnect,
+            # which removes queued work from the executor before it starts
+            result = await asyncio.wait_for(asyncio.wrap_future(future), timeout=deadline)
+        except asyncio.TimeoutError:
+            with self._lock:
+                self._timed_out += 1
+            raise CalculationTimeoutError(
+                f"Calculation exceeded maximum time limit ({deadline} seconds)"
+            )
+        except BrokenProcessPool as e:
+            with self._lock:
+                self._failed += 1
+            self._reset_broken_executor(executor)
+            raise RuntimeError(f"{ERROR_EPHEMERIS_UNAVAILABLE}: calculation worker crashed: {e}")
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception:
+            with self._lock:
+                self._failed += 1
+            raise
+
+        if in_process:
+            result, counters = result
+            design_time_stats.merge(counters)
+        return result
+
+    def stats(self) -> dict:
+        """
+        Get current engine counters.
+
+        Returns:
+            Dict with capacity, in-flight and outcome counters
+        """
+        with self._lock:
+            return {
+                "mode": self.mode,
+                "max_workers": self.max_workers,
+                "capacity": self.capacity,
+                "in_flight": self._in_flight,
+                "completed": self._completed,
+                "rejected": self._rejected,
+                "timed_out": self._timed_out,
+                "failed": self._failed,
+            }
+
+    def shutdown(self, wait: bool = False) -> None:
+        """
+        Shut down the worker pool, cancelling queued calculations.
+
+        Args:
+            wait: Block until running calculations have finished
+        """
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=wait, cancel_futures=True)
@@ -1,65 +1,131 @@
 """
 Gate and Line mapping from ecliptic longitude.
 
-Converts astronomical ecliptic positions to Human Design gate/line activations.
+Converts astronomical ecliptic positions to Human Design activations
+(gate, line, color, tone, base). map_longitudes() maps whole NumPy arrays
+in one pass; ecliptic_to_gate_line() and ecliptic_to_activation() are the
+scalar forms and give identical results.
 """
 
+from typing import NamedTuple, Union
 
-def ecliptic_to_gate_line(longitude: float) -> tuple[int, int]:
+import numpy as np
+
+# HD wheel starts at 58° in tropical zodiac
+WHEEL_START = 58.0
+
+# Subdivision widths in degrees
+GATE_WIDTH = 360.0 / 64  # 5.625
+LINE_WIDTH = GATE_WIDTH / 6  # 0.9375
+COLOR_WIDTH = LINE_WIDTH / 6  # 0.15625
+TONE_WIDTH = COLOR_WIDTH / 6
+BASE_WIDTH = TONE_WIDTH / 5
+
+# HD gate wheel order starting from 58° tropical
+GATE_WHEEL = (
+    41, 19, 13, 49, 30, 55, 37, 63, 22, 36, 25, 17, 21, 51, 42, 3,
+    27, 24, 2, 23, 8, 20, 16, 35, 45, 12, 15, 52, 39, 53, 62, 56,
+    31, 33, 7, 4, 29, 59, 40, 64, 47, 6, 46, 18, 48, 57, 32, 50,
+    28, 44, 1, 43, 14, 34, 9, 5, 26, 11, 10, 58, 38, 54, 61, 60,
+)
+_GATE_WHEEL_ARRAY = np.asarray(GATE_WHEEL, dtype=np.int8)
+
+
+class Activation(NamedTuple):
+    """Gate, line, color, tone and base of one longitude"""
+
+    gate: int
+    line: int
+    color: int
+    tone: int
+    base: int
+
+
+class ActivationArrays(NamedTuple):
+    """Activations of an array of longitudes, one int8 array per level"""
+
+    gate: np.ndarray
+    line: np.ndarray
+    color: np.ndarray
+    tone: np.ndarray
+    base: np.ndarray
+
+
+def map_longitudes(longitudes: Union[np.ndarray, list]) -> ActivationArrays:
     """
-    Convert ecliptic longitude to HD gate and line.
+    Map ecliptic longitudes to activations.
 
-    The 64 hexagrams are mapped to the 360° zodiac wheel.
-    Each gate covers 5.625° (360/64).
-    Each line covers 0.9375° (5.625/6).
+    Each level is the floor of the remaining offset divided by its width,
+    clamped to its range, so float rounding at a boundary can never yield
+    gate position 65 or line/color/tone 7.
 
     Args:
-        longitude: Ecliptic longitude in degrees (0-360)
+        longitudes: Ecliptic longitudes in degrees (any range)
 
     Returns:
-        Tuple of (gate, line) where gate is 1-64 and line is 1-6
+        ActivationArrays with the input's shape
     """
-    # HD wheel starts at 58° in tropical zodiac
-    # Adjust longitude to HD wheel starting point
-    adjusted = (longitude - 58.0) % 360.0
-
-    # Each gate is 5.625 degrees
-    gate_number = int(adjusted / 5.625) + 1
-
-    # Position within the gate
-    position_in_gate = adjusted % 5.625
+    adjusted = np.mod(np.asarray(longitudes, dtype=np.float64) - WHEEL_START, 360.0)
+
+    position = np.minimum(np.floor(adjusted / GATE_WIDTH), 63)
+    in_gate = np.mod(adjusted, GATE_WIDTH)
+    line = np.minimum(np.floor(in_gate / LINE_WIDTH), 5)
+    in_line = in_gate - line * LINE_WIDTH
+    color = np.clip(np.floor(in_line / COLOR_WIDTH), 0, 5)
+    in_color = in_line - color * COLOR_WIDTH
+    tone = np.clip(np.floor(in_color / TONE_WIDTH), 0, 5)
+    in_tone = in_color - tone * TONE_WIDTH
+    base = np.clip(np.floor(in_tone / BASE_WIDTH), 0, 4)
+
+    return ActivationArrays(
+        gate=_GATE_WHEEL_ARRAY[position.astype(np.intp)],
+        line=line.astype(np.int8) + 1,
+        color=color.astype(np.int8) + 1,
+        tone=tone.astype(np.int8) + 1,
+        base=base.astype(np.int8) + 1,
+    )
+
+
+def ecliptic_to_activation(longitude: float) -> Activation:
+    """
+    Convert ecliptic longitude to a full HD activation.
 
-    # Each line is 0.9375 degrees
-    line_number = int(position_in_gate / 0.9375) + 1
+    Args:
+        longitude: Ecliptic longitude in degrees
 
-    # Ensure line is in valid range
-    if line_number > 6:
-        line_number = 6
+    Returns:
+        Activation with gate 1-64, line/color/tone 1-6 and base 1-5
+    """
+    adjusted = (longitude - WHEEL_START) % 360.0
 
-    # Map to actual HD gate sequence (wheel order)
-    gate = _map_to_hd_gate(gate_number)
+    position = min(int(adjusted / GATE_WIDTH), 63)
+    in_gate = adjusted % GATE_WIDTH
+    line = min(int(in_gate / LINE_WIDTH), 5)
+    in_line = in_gate - line * LINE_WIDTH
+    color = min(max(int(in_line / COLOR_WIDTH), 0), 5)
+    in_color = in_line - color * COLOR_WIDTH
+    tone = min(max(int(in_color / TONE_WIDTH), 0), 5)
+    in_tone = in_color - tone * TONE_WIDTH
+    base = min(max(int(in_tone / BASE_WIDTH), 0), 4)
 
-    return gate, line_number
+    return Activation(GATE_WHEEL[position], line + 1, color + 1, tone + 1, base + 1)
 
 
-def _map_to_hd_gate(position: int) -> int:
+def ecliptic_to_gate_line(longitude: float) -> tuple[int, int]:
     """
-    Map wheel position to actual HD gate number.
+    Convert ecliptic longitude to HD gate and line.
+
+    The 64 hexagrams are mapped to the 360° zodiac wheel.
+    Each gate covers 5.625° (360/64).
+    Each line covers 0.9375° (5.625/6).
 
     Args:
-        position: Position on wheel (1-64)
+        longitude: Ecliptic longitude in degrees (0-360)
 
     Returns:
-        HD gate number (1-64)
+        Tuple of (gate, line) where gate is 1-64 and line is 1-6
     """
-    # HD gate wheel order starting from 58° tropical
-    gate_wheel = [
-        41, 19, 13, 49, 30, 55, 37, 63, 22, 36, 25, 17, 21, 51, 42, 3,
-        27, 24, 2, 23, 8, 20, 16, 35, 45, 12, 15, 52, 39, 53, 62, 56,
-        31, 33, 7, 4, 29, 59, 40, 64, 47, 6, 46, 18, 48, 57, 32, 50,
-        28, 44, 1, 43, 14, 34, 9, 5, 26, 11, 10, 58, 38, 54, 61, 60
-    ]
-
-    if 1 <= position <= 64:
-        return gate_wheel[position - 1]
-    return 1  # Fallback
+    adjusted = (longitude - WHEEL_START) % 360.0
+    position = min(int(adjusted / GATE_WIDTH), 63)
+    line = min(int((adjusted % GATE_WIDTH) / LINE_WIDTH), 5)
+    return GATE_WHEEL[position], line + 1
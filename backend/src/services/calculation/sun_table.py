@@ -0,0 +1,330 @@
+"""
+Precomputed Sun-longitude table for design-time lookup.
+
+Stores the Sun's unwrapped ecliptic longitude and daily motion at fixed
+Julian Day steps. Positions between samples come from cubic Hermite
+interpolation, and because the Sun's geocentric longitude only ever
+increases, the design moment for any birth moment can be found by a sorted
+search plus a few Newton steps on the interpolant - no swisseph calls.
+
+File layout (little-endian):
+    header: magic (8s), version (u32), count (u32), jd_start (f64), step (f64)
+    body:   count x [unwrapped longitude (f64), speed (f64)]
+"""
+
+import struct
+import threading
+from pathlib import Path
+from typing import Optional, Union
+
+import numpy as np
+
+from src.models.celestial import CelestialBody
+from src.services.calculation.design_time import DESIGN_MARGIN_DAYS
+
+MAGIC = b"HDSUNTB\x00"
+FORMAT_VERSION = 1
+HEADER = struct.Struct("<8sIIdd")
+
+# Supported birth dates (1850-2100) plus the design offset before the first one
+DEFAULT_JD_START = 2396758.5 - DESIGN_MARGIN_DAYS  # 1849-09-23
+DEFAULT_JD_END = 2488434.5  # 2101-01-01
+
+ArrayLike = Union[float, np.ndarray]
+
+
+class SunLongitudeTable:
+    """
+    Interpolated Sun longitude and its inverse.
+
+    Args:
+        jd_start: Julian Day of the first sample
+        step: Sample spacing in days
+        samples: Array of shape (count, 2) with unwrapped longitude and speed
+    """
+
+    def __init__(self, jd_start: float, step: float, samples: np.ndarray):
+        if samples.ndim != 2 or samples.shape[1] != 2 or samples.shape[0] < 2:
+            raise ValueError("Sun table samples must have shape (count >= 2, 2)")
+
+        self.jd_start = float(jd_start)
+        self.step = float(step)
+        self.samples = samples
+        self.longitudes = samples[:, 0]
+        self.speeds = samples[:, 1]
+        self.jd_end = self.jd_start + self.step * (len(samples) - 1)
+
+    @classmethod
+    def build(
+        cls,
+        ephemeris_source,
+        jd_start: float = DEFAULT_JD_START,
+        jd_end: float = DEFAULT_JD_END,
+        step: float = 1.0,
+    ) -> "SunLongitudeTable":
+        """
+        Sample the Sun from an ephemeris source.
+
+        Args:
+            ephemeris_source: Source providing calculate_position_with_speed
+            jd_start: First Julian Day to cover
+            jd_end: Last Julian Day to cover
+            step: Sample spacing in days
+
+        Returns:
+            SunLongitudeTable covering [jd_start, jd_end]
+        """
+        count = int(np.ceil((jd_end - jd_start) / step)) + 1
+        samples = np.empty((count, 2), dtype=np.float64)
+        for i in range(count):
+            lon, speed = ephemeris_source.calculate_position_with_speed(
+                CelestialBody.SUN, jd_start + i * step
+            )
+            samples[i, 0] = lon
+            samples[i, 1] = speed
+
+        # Unwrap 360° -> 0° crossings so longitudes are strictly increasing
+        samples[:, 0] = np.degrees(np.unwrap(np.radians(samples[:, 0])))
+        return cls(jd_start, step, samples)
+
+    def save(self, path: Union[str, Path]) -> None:
+        """
+        Write the table to disk.
+
+        Args:
+            path: Output file path
+        """
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "wb") as f:
+            f.write(HEADER.pack(MAGIC, FORMAT_VERSION, len(self.samples), self.jd_start, self.step))
+            f.write(np.ascontiguousarray(self.samples, dtype="<f8").tobytes())
+
+    @classmethod
+    def load(cls, path: Union[str, Path]) -> "SunLongitudeTable":
+        """
+        Memory-map a table written by save().
+
+        Args:
+            path: Table file path
+
+        Returns:
+            SunLongitudeTable backed by a read-only memory map
+
+        Raises:
+            ValueError: If the file is not a supported Sun table
+        """
+        with open(path, "rb") as f:
+            header = f.read(HEADER.size)
+        if len(header) != HEADER.size:
+            raise ValueError(f"Sun table {path} is truncated")
+
+        magic, version, count, jd_start, step = HEADER.unpack(header)
+        if magic != MAGIC or version != FORMAT_VERSION:
+            raise ValueError(f"Unsupported Sun table format in {path}")
+
+        samples = np.memmap(path, dtype="<f8", mode="r", offset=HEADER.size, shape=(count, 2))
+        # Plain ndarray view over the map: same pages, without np.memmap's per-slice overhead
+        return cls(jd_start, step, np.asarray(samples))
+
+    def covers(self, julian_day: float) -> bool:
+        """Check whether a Julian Day lies inside the table."""
+        return self.jd_start <= julian_day <= self.jd_end
+
+    def _locate(self, julian_day: np.ndarray):
+        """Get interval index and normalized position for each Julian Day."""
+        x = (julian_day - self.jd_start) / self.step
+        index = np.clip(np.floor(x).astype(np.int64), 0, len(self.samples) - 2)
+        return index, x - index
+
+    @staticmethod
+    def _hermite_basis(p0, p1, m0, m1, t, step):
+        """Cubic Hermite value and derivative; works on floats and arrays alike."""
+        t2 = t * t
+        t3 = t2 * t
+        value = (
+            (2 * t3 - 3 * t2 + 1) * p0
+            + (t3 - 2 * t2 + t) * m0
+            + (-2 * t3 + 3 * t2) * p1
+            + (t3 - t2) * m1
+        )
+        derivative = (
+            (6 * t2 - 6 * t) * p0
+            + (3 * t2 - 4 * t + 1) * m0
+            + (-6 * t2 + 6 * t) * p1
+            + (3 * t2 - 2 * t) * m1
+        ) / step
+        return value, derivative
+
+    def _hermite(self, index, t):
+        """Evaluate unwrapped longitude and speed on interval index at t in [0, 1]."""
+        return self._hermite_basis(
+            self.longitudes[index],
+            self.longitudes[index + 1],
+            self.speeds[index] * self.step,
+            self.speeds[index + 1] * self.step,
+            t,
+            self.step,
+        )
+
+    def _hermite_scalar(self, index: int, t: float):
+        """Scalar variant of _hermite using plain floats (avoids NumPy call overhead)."""
+        p0, m0 = self.samples[index].tolist()
+        p1, m1 = self.samples[index + 1].tolist()
+        return self._hermite_basis(p0, p1, m0 * self.step, m1 * self.step, t, self.step)
+
+    def unwrapped_longitude(self, julian_day: ArrayLike) -> ArrayLike:
+        """
+        Interpolate the Sun's unwrapped longitude.
+
+        Args:
+            julian_day: Julian Day(s) inside the table range
+
+        Returns:
+            Unwrapped longitude(s) in degrees
+        """
+        jd = np.asarray(julian_day, dtype=np.float64)
+        index, t = self._locate(jd)
+        value, _ = self._hermite(index, t)
+        return float(value) if value.ndim == 0 else value
+
+    def longitude(self, julian_day: ArrayLike) -> ArrayLike:
+        """
+        Interpolate the Sun's ecliptic longitude.
+
+        Args:
+            julian_day: Julian Day(s) inside the table range
+
+        Returns:
+            Longitude(s) in degrees (0-360)
+        """
+        return np.mod(self.unwrapped_longitude(julian_day), 360.0)
+
+    def design_julian_day(
+        self, birth_jd: ArrayLike, target_arc: float = 88.0, newton_steps: int = 3
+    ) -> ArrayLike:
+        """
+        Find the Julian Day when the Sun was target_arc degrees before its birth position.
+
+        Args:
+            birth_jd: Birth Julian Day(s) (UT)
+            target_arc: Target arc in degrees
+            newton_steps: Newton refinements on the interpolant
+
+        Returns:
+            Design Julian Day(s)
+
+        Raises:
+            ValueError: If a birth or design moment falls outside the table
+        """
+        if np.ndim(birth_jd) == 0:
+            return self._design_julian_day_scalar(float(birth_jd), target_arc, newton_steps)
+
+        birth = np.asarray(birth_jd, dtype=np.float64)
+        target = self.unwrapped_longitude(birth) - target_arc
+
+        index = np.searchsorted(self.longitudes, target, side="right") - 1
+        if np.any(index < 0) or np.any(index >= len(self.samples) - 1) or not np.all(
+            (birth >= self.jd_start) & (birth <= self.jd_end)
+        ):
+            raise ValueError("Birth moment outside Sun table range")
+
+        # Linear start inside the bracketing interval, then Newton on the Hermite cubic
+        span = self.longitudes[index + 1] - self.longitudes[index]
+        t = (target - self.longitudes[index]) / span
+        for _ in range(newton_steps):
+            value, derivative = self._hermite(index, t)
+            t = np.clip(t - (value - target) / (derivative * self.step), 0.0, 1.0)
+
+        return self.jd_start + (index + t) * self.step
+
+    def _design_julian_day_scalar(self, birth_jd: float, target_arc: float, newton_steps: int) -> float:
+        """Single-moment inverse used on the request path."""
+        if not self.covers(birth_jd):
+            raise ValueError("Birth moment outside Sun table range")
+
+        x = (birth_jd - self.jd_start) / self.step
+        birth_index = min(int(x), len(self.samples) - 2)
+        target = self._hermite_scalar(birth_index, x - birth_index)[0] - target_arc
+
+        index = int(np.searchsorted(self.longitudes, target, side="right")) - 1
+        if index < 0 or index >= len(self.samples) - 1:
+            raise ValueError("Design moment outside Sun table range")
+
+        p0, p1 = float(self.longitudes[index]), float(self.longitudes[index + 1])
+        t = (target - p0) / (p1 - p0)
+        for _ in range(newton_steps):
+            value, derivative = self._hermite_scalar(index, t)
+            t = min(max(t - (value - target) / (derivative * self.step), 0.0), 1.0)
+
+        return self.jd_start + (index + t) * self.step
+
+    def verify_against(
+        self,
+        ephemeris_source,
+        birth_jds: np.ndarray,
+        tolerance_seconds: float = 1.0,
+        target_arc: float = 88.0,
+    ) -> dict:
+        """
+        Compare table design moments with the ephemeris solver.
+
+        Args:
+            ephemeris_source: Reference ephemeris source
+            birth_jds: Birth Julian Days to check
+            tolerance_seconds: Maximum allowed design-time difference
+            target_arc: Target arc in degrees
+
+        Returns:
+            Dict with sample count, max error in seconds and pass flag
+        """
+        from src.services.calculation.design_time import solve_design_julian_day
+
+        birth_jds = np.asarray(birth_jds, dtype=np.float64)
+        table_jds = self.design_julian_day(birth_jds, target_arc)
+        # Solve the reference tighter than the production tolerance so the
+        # comparison measures table error, not solver slack
+        reference = np.array(
+            [
+                solve_design_julian_day(jd, ephemeris_source, target_arc, tolerance=1e-9).julian_day
+                for jd in birth_jds
+            ]
+        )
+        errors = np.abs(table_jds - reference) * 86400.0
+        max_error = float(errors.max()) if len(errors) else 0.0
+        return {
+            "samples": int(len(birth_jds)),
+            "max_error_seconds": max_error,
+            "tolerance_seconds": tolerance_seconds,
+            "passed": max_error <= tolerance_seconds,
+        }
+
+
+_table: Optional[SunLongitudeTable] = None
+_table_loaded = False
+_table_lock = threading.Lock()
+
+
+def get_sun_table() -> Optional[SunLongitudeTable]:
+    """
+    Get the configured Sun table, loading it on first use.
+
+    The table is optional: it is read from EPHEMERIS_SUN_TABLE_PATH and None
+    is returned when the variable is unset or the file cannot be loaded.
+
+    Returns:
+        Shared SunLongitudeTable or None
+    """
+    global _table, _table_loaded
+    with _table_lock:
+        if not _table_loaded:
+            _table_loaded = True
+            from src.services.ephemeris import load_config
+
+            path = load_config().sun_table_path
+            if path:
+                try:
+                    _table = SunLongitudeTable.load(path)
+                except (OSError, ValueError) as e:
+                    print(f"Sun table unavailable, using ephemeris solver: {e}")
+        return _table
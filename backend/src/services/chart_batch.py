@@ -0,0 +1,371 @@
+"""
+Batch chart processing.
+
+Charts for a batch of birth records are streamed as NDJSON, one line per
+record as soon as its chart is ready. Identical birth places are geocoded
+once and identical UTC birth minutes are calculated once; records that
+share an instant get copies of the same chart with their own name.
+"""
+
+import asyncio
+import html
+import json
+import re
+from collections import deque
+from datetime import datetime
+from typing import AsyncIterator, Callable, Deque, Dict, List, Optional, Sequence, Tuple
+
+import pytz
+
+from src.models.chart import ChartRequest, ChartResponse
+from src.models.engine import ChartBatchConfig
+from src.services.calculation.engine import (
+    CalculationEngine,
+    EngineOverloadedError,
+    calculate_chart_for_instant,
+)
+from src.services.chart_cache import CacheKey, ChartCache
+from src.services.geocoding_service import GeocodingService
+from src.services.validation_service import ValidationError, ValidationService
+
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+
+_NAME_PATTERN = re.compile(r'^[a-zA-ZäöüßÄÖÜ\s\-\.\']+$')
+
+PLACE_NOT_FOUND = "Ort nicht gefunden. Bitte prüfen Sie die Eingabe."
+PLACE_TIMEOUT = "Die Ortssuche hat zu lange gedauert. Bitte versuchen Sie es später noch einmal."
+TIMEZONE_ERROR = "Fehler bei der Zeitzonenverarbeitung. Bitte prüfen Sie den Ort."
+CALCULATION_OVERLOADED = "Der Berechnungsdienst ist ausgelastet. Bitte versuchen Sie es in Kürze noch einmal."
+CALCULATION_TIMEOUT = "Die Berechnung hat zu lange gedauert. Bitte versuchen Sie es später noch einmal."
+CALCULATION_UNAVAILABLE = "Ephemeris-Berechnungsdienst nicht verfügbar. Bitte versuchen Sie es später noch einmal."
+CALCULATION_FAILED = "Fehler bei der Chart-Berechnung. Bitte versuchen Sie es später noch einmal."
+
+
+class BatchItemError(Exception):
+    """Failure of a single batch record, reported on its result line."""
+
+    def __init__(self, status: int, field: str, message: str):
+        self.status = status
+        self.field = field
+        self.message = message
+        super().__init__(message)
+
+
+def prepare_birth_input(
+    chart_request: ChartRequest, validation_service: ValidationService
+) -> Tuple[str, str]:
+    """
+    Sanitize and validate the name, date and time of a chart request.
+
+    Args:
+        chart_request: Incoming birth data
+        validation_service: Validator for name, date and time
+
+    Returns:
+        Tuple of (sanitized_name, birth_time), with 12:00 for approximate times
+
+    Raises:
+        ValidationError: If a field is invalid
+    """
+    # Only allow German characters, spaces, hyphens, and apostrophes
+    name = chart_request.firstName.strip()
+    if not _NAME_PATTERN.match(name):
+        raise ValidationError(
+            "firstName",
+            "Name darf nur Buchstaben, Leerzeichen, Bindestriche und Apostrophe enthalten."
+        )
+    if len(name) < 2 or len(name) > 100:
+        raise ValidationError("firstName", "Name muss zwischen 2 und 100 Zeichen lang sein.")
+
+    # HTML escape for safe output rendering
+    sanitized_name = html.escape(name)
+
+    is_valid, error_msg = validation_service.validate_name(sanitized_name)
+    if not is_valid:
+        raise ValidationError("firstName", error_msg)
+
+    is_valid, error_msg = validation_service.validate_birth_date(chart_request.birthDate)
+    if not is_valid:
+        raise ValidationError("birthDate", error_msg)
+
+    birth_time = chart_request.birthTime or "12:00"
+    is_valid, error_msg = validation_service.validate_birth_time(birth_time)
+    if not is_valid:
+        raise ValidationError("birthTime", error_msg)
+
+    return sanitized_name, birth_time
+
+
+def localize_birth_datetime(birth_date: str, birth_time: str, tz_str: str) -> datetime:
+    """
+    Convert local birth date and time to UTC.
+
+    Args:
+        birth_date: Date in TT.MM.JJJJ format
+        birth_time: Time in HH:MM format
+        tz_str: IANA timezone of the birth place
+
+    Returns:
+        Timezone-aware UTC datetime
+
+    Raises:
+        ValidationError: If the date cannot be parsed or the timezone is unusable
+    """
+    try:
+        birth_dt = datetime.strptime(f"{birth_date} {birth_time}", "%d.%m.%Y %H:%M")
+    except ValueError:
+        raise ValidationError("birthDate", "Ungültiges Datumsformat")
+
+    try:
+        return pytz.timezone(tz_str).localize(birth_dt).astimezone(pytz.UTC)
+    except Exception as e:
+        print(f"Timezone error: {e}")
+        raise ValidationError("birthPlace", TIMEZONE_ERROR)
+
+
+def calculation_failure(error: Exception) -> BatchItemError:
+    """
+    Map a calculation exception to the status and message of the single-chart endpoint.
+
+    Args:
+        error: Exception raised by CalculationEngine.run
+
+    Returns:
+        BatchItemError for the calculation field
+    """
+    if isinstance(error, EngineOverloadedError):
+        return BatchItemError(503, "calculation", CALCULATION_OVERLOADED)
+    if isinstance(error, TimeoutError):
+        return BatchItemError(504, "calculation", CALCULATION_TIMEOUT)
+    if isinstance(error, RuntimeError):
+        text = str(error).lower()
+        if "timeout" in text or "timed out" in text:
+            return BatchItemError(504, "calculation", CALCULATION_TIMEOUT)
+        return BatchItemError(503, "calculation", CALCULATION_UNAVAILABLE)
+    return BatchItemError(500, "calculation", CALCULATION_FAILED)
+
+
+def chart_line(index: int, chart: ChartResponse) -> str:
+    """Format a successful record as one NDJSON line."""
+    return f'{{"index":{index},"chart":{chart.model_dump_json()}}}\n'
+
+
+def error_line(index: int, error: BatchItemError) -> str:
+    """Format a failed record as one NDJSON line."""
+    payload = {
+        "index": index,
+        "error": {"status": error.status, "field": error.field, "error": error.message},
+    }
+    return json.dumps(payload, ensure_ascii=False, separators=(",", ":")) + "\n"
+
+
+class ChartBatchProcessor:
+    """
+    Streams charts for a batch of birth records.
+
+    Every record is validated first (errors are emitted immediately).
+    Distinct places are then geocoded with bounded concurrency, and the
+    records of each place are queued for calculation as soon as it resolves,
+    so a slow lookup does not hold back charts whose places are known.
+    Distinct UTC instants are calculated on the shared CalculationEngine, at
+    most ``max_concurrency`` of a batch at once, so a batch never takes the
+    engine's queue away from interactive requests. Finished charts are
+    written out and dropped, so memory does not grow with the number of
+    charts.
+
+    Calculations only use several cores with CALC_ENGINE_MODE=process; in
+    the default thread mode they share one interpreter.
+    """
+
+    def __init__(
+        self,
+        geocoding: GeocodingService,
+        engine: CalculationEngine,
+        cache: ChartCache,
+        source_name: Callable[[], str],
+        validation_service: Optional[ValidationService] = None,
+        max_concurrency: int = 4,
+        place_concurrency: int = 8,
+        calculate: Callable[[datetime, str], ChartResponse] = calculate_chart_for_instant,
+    ):
+        """
+        Initialize batch processor.
+
+        Args:
+            geocoding: Place resolver
+            engine: Calculation engine shared with the single-chart endpoint
+            cache: Chart cache shared with the single-chart endpoint
+            source_name: Name of the source that would calculate a chart now, for cache lookups
+            validation_service: Input validator (a new one if omitted)
+            max_concurrency: Calculations in flight per batch (capped at engine workers)
+            place_concurrency: Place lookups in flight per batch
+            calculate: Picklable chart function run on the engine
+        """
+        self.geocoding = geocoding
+        self.engine = engine
+        self.cache = cache
+        self.source_name = source_name
+        self.validation_service = validation_service or ValidationService()
+        self.max_concurrency = max(1, min(max_concurrency, engine.max_workers))
+        self.place_concurrency = place_concurrency
+        self.calculate = calculate
+
+    @classmethod
+    def from_config(
+        cls,
+        geocoding: GeocodingService,
+        engine: CalculationEngine,
+        cache: ChartCache,
+        source_name: Callable[[], str],
+        config: Optional[ChartBatchConfig] = None,
+    ) -> "ChartBatchProcessor":
+        """
+        Create processor from environment configuration.
+
+        Args:
+            geocoding: Place resolver
+            engine: Calculation engine
+            cache: Chart cache
+            source_name: Name of the source that would calculate a chart now
+            config: Optional explicit configuration (loaded from env if omitted)
+
+        Returns:
+            ChartBatchProcessor instance
+        """
+        config = config or ChartBatchConfig()
+        return cls(
+            geocoding,
+            engine,
+            cache,
+            source_name,
+            max_concurrency=config.max_concurrency,
+            place_concurrency=config.place_concurrency,
+        )
+
+    async def _resolve_place(self, place: str) -> Tuple[float, float, str]:
+        """Geocode a place, raising BatchItemError instead of returning empty results."""
+        try:
+            lat, lng, tz_str = await self.geocoding.get_location_data_async(place)
+        except TimeoutError as e:
+            print(f"Geocoding timeout: {e}")
+            raise BatchItemError(504, "birthPlace", PLACE_TIMEOUT)
+        if not lat or not lng or not tz_str:
+            raise BatchItemError(400, "birthPlace", PLACE_NOT_FOUND)
+        return lat, lng, tz_str
+
+    async def _calculate(self, key: CacheKey, birth_dt_utc: datetime, first_name: str) -> ChartResponse:
+        """Calculate one instant, serving it from the chart cache when possible."""
+        cached = self.cache.get(key, first_name)
+        if cached is not None:
+            return cached
+        chart = await self.engine.run(self.calculate, birth_dt_utc, first_name)
+        # Stored under the source that served it, which differs after a failover
+        self.cache.put(self.cache.make_key(birth_dt_utc, chart.calculationSource or key[1]), chart)
+        return chart
+
+    async def stream(self, records: Sequence[ChartRequest]) -> AsyncIterator[str]:
+        """
+        Process a batch and yield NDJSON result lines.
+
+        Each record produces exactly one line, ``{"index": i, "chart": {...}}``
+        or ``{"index": i, "error": {"status", "field", "error"}}``, in
+        completion order. A final ``{"summary": {...}}`` line marks the end of
+        the batch.
+
+        Args:
+            records: Birth records (ChartBatchRequest enforces CHART_BATCH_MAX_RECORDS)
+
+        Yields:
+            NDJSON lines
+        """
+        charts = errors = calculated = 0
+
+        # 1. Validate; group the surviving records by birth place
+        by_place: Dict[str, List[Tuple[int, str, str, str]]] = {}
+        for index, record in enumerate(records):
+            try:
+                name, birth_time = prepare_birth_input(record, self.validation_service)
+            except ValidationError as e:
+                errors += 1
+                yield error_line(index, BatchItemError(400, e.field, e.message))
+                continue
+            by_place.setdefault(record.birthPlace.strip(), []).append(
+                (index, name, record.birthDate, birth_time)
+            )
+
+        # 2. Geocode each distinct place once. As soon as a place resolves,
+        # its records join the calculation queue, one entry per UTC instant;
+        # at most max_concurrency calculations are in flight
+        place_slots = asyncio.Semaphore(self.place_concurrency)
+
+        async def resolve(place: str):
+            async with place_slots:
+                try:
+                    return place, await self._resolve_place(place), None
+                except BatchItemError as e:
+                    return place, None, e
+
+        # Instants waiting or calculating, with the records that share them;
+        # records resolved while their instant is calculating join it
+        instants: Dict[CacheKey, Tuple[datetime, List[Tuple[int, str]]]] = {}
+        queued: Deque[CacheKey] = deque()
+        places = {asyncio.create_task(resolve(place)) for place in by_place}
+        running: Dict[asyncio.Task, CacheKey] = {}
+
+        try:
+            while places or running:
+                done, _ = await asyncio.wait({*places, *running}, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task in places:
+                        places.discard(task)
+                        place, location, failure = task.result()
+                        for index, name, birth_date, birth_time in by_place.pop(place):
+                            if failure is not None:
+                                errors += 1
+                                yield error_line(index, failure)
+                                continue
+                            try:
+                                birth_dt_utc = localize_birth_datetime(birth_date, birth_time, location[2])
+                            except ValidationError as e:
+                                errors += 1
+                                yield error_line(index, BatchItemError(400, e.field, e.message))
+                                continue
+                            key = self.cache.make_key(birth_dt_utc, self.source_name())
+                            if key not in instants:
+                                instants[key] = (birth_dt_utc, [])
+                                queued.append(key)
+                            instants[key][1].append((index, name))
+                        continue
+
+                    _, members = instants.pop(running.pop(task))
+                    try:
+                        chart = task.result()
+                    except Exception as e:
+                        print(f"Batch calculation error: {e}")
+                        failure = calculation_failure(e)
+                        errors += len(members)
+                        for index, _ in members:
+                            yield error_line(index, failure)
+                    else:
+                        calculated += 1
+                        charts += len(members)
+                        for index, name in members:
+                            if name != chart.firstName:
+                                chart = chart.model_copy(update={"firstName": name})
+                            yield chart_line(index, chart)
+
+                while queued and len(running) < self.max_concurrency:
+                    key = queued.popleft()
+                    birth_dt_utc, members = instants[key]
+                    running[asyncio.create_task(self._calculate(key, birth_dt_utc, members[0][1]))] = key
+        finally:
+            for task in (*places, *running):
+                task.cancel()
+
+        summary = {
+            "records": len(records),
+            "charts": charts,
+            "errors": errors,
+            "instants": calculated,
+        }
+        yield json.dumps({"summary": summary}, separators=(",", ":")) + "\n"
@@ -0,0 +1,211 @@
+"""
+In-process chart result cache.
+
+A chart is fully determined by the UTC birth minute and the ephemeris
+source; the first name only appears in the response. Cached charts are
+stored once per (instant, source) and the requester's name is injected on
+every hit.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime
+from typing import Callable, Dict, Optional, Tuple
+
+import pytz
+
+from src.models.cache import ChartCacheConfig
+from src.models.chart import ChartResponse
+
+CacheKey = Tuple[str, str]
+
+
+class ChartCache:
+    """
+    LRU cache with TTL, bounded by entry count and estimated bytes.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 2048,
+        max_bytes: int = 8 * 1024 * 1024,
+        ttl_seconds: float = 24 * 3600.0,
+        enabled: bool = True,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Initialize chart cache.
+
+        Args:
+            max_entries: Maximum number of cached charts
+            max_bytes: Maximum estimated size of all cached charts
+            ttl_seconds: Lifetime of a cached chart
+            enabled: Disable to turn every lookup into a miss
+            clock: Monotonic time source (injectable for tests)
+        """
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl_seconds = ttl_seconds
+        self.enabled = enabled
+        self._clock = clock
+
+        # key -> (chart, size_bytes, expires_at)
+        self._entries: "OrderedDict[CacheKey, Tuple[ChartResponse, int, float]]" = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self._counters: Dict[str, int] = {
+            "hits": 0,
+            "misses": 0,
+            "evictions": 0,
+            "expirations": 0,
+        }
+
+    @classmethod
+    def from_config(cls, config: Optional[ChartCacheConfig] = None) -> "ChartCache":
+        """
+        Create cache from environment configuration.
+
+        Args:
+            config: Optional explicit configuration (loaded from env if omitted)
+
+        Returns:
+            ChartCache instance
+        """
+        config = config or ChartCacheConfig()
+        return cls(
+            max_entries=config.max_entries,
+            max_bytes=config.max_bytes,
+            ttl_seconds=config.ttl_seconds,
+            enabled=config.enabled,
+        )
+
+    @staticmethod
+    def make_key(birth_dt_utc: datetime, source_name: str) -> CacheKey:
+        """
+        Build the cache key for a birth instant.
+
+        Args:
+            birth_dt_utc: Birth datetime (timezone-aware)
+            source_name: Ephemeris source identifier
+
+        Returns:
+            Tuple of (UTC minute in ISO format, source name)
+        """
+        instant = birth_dt_utc.astimezone(pytz.UTC).strftime("%Y-%m-%dT%H:%MZ")
+        return instant, source_name
+
+    def get(self, key: CacheKey, first_name: str) -> Optional[ChartResponse]:
+        """
+        Look up a chart and personalize it.
+
+        Args:
+            key: Cache key from make_key
+            first_name: Name to put into the returned chart
+
+        Returns:
+            ChartResponse copy with firstName set, or None on miss
+        """
+        if not self.enabled:
+            return None
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._counters["misses"] += 1
+                return None
+
+            chart, size, expires_at = entry
+            if self._clock() >= expires_at:
+                self._remove(key)
+                self._counters["expirations"] += 1
+                self._counters["misses"] += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self._counters["hits"] += 1
+
+        return chart.model_copy(update={"firstName": first_name})
+
+    def put(self, key: CacheKey, chart: ChartResponse) -> None:
+        """
+        Store a chart, evicting least recently used entries to stay within bounds.
+
+        Args:
+            key: Cache key from make_key
+            chart: Computed chart
+        """
+        if not self.enabled:
+            return
+
+        size = len(chart.model_dump_json())
+        if size > self.max_bytes:
+            return
+
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+
+            self._entries[key] = (chart, size, self._clock() + self.ttl_seconds)
+            self._bytes += size
+
+            while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+                oldest = next(iter(self._entries))
+                self._remove(oldest)
+                self._counters["evictions"] += 1
+
+    def _remove(self, key: CacheKey) -> None:
+        """Remove an entry (caller holds the lock)."""
+        _, size, _ = self._entries.pop(key)
+        self._bytes -= size
+
+    def clear(self) -> int:
+        """
+        Drop all cached charts.
+
+        Returns:
+            Number of entries removed
+        """
+        with self._lock:
+            removed = len(self._entries)
+            self._entries.clear()
+            self._bytes = 0
+            return removed
+
+    def stats(self) -> dict:
+        """
+        Get cache counters and usage.
+
+        Returns:
+            Dict with size, limits and hit/miss/eviction counters
+        """
+        with self._lock:
+            lookups = self._counters["hits"] + self._counters["misses"]
+            return {
+                "enabled": self.enabled,
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "max_entries": self.max_entries,
+                "max_bytes": self.max_bytes,
+                "ttl_seconds": self.ttl_seconds,
+                **self._counters,
+                "hit_ratio": (self._counters["hits"] / lookups) if lookups else 0.0,
+            }
+
+
+_cache: Optional[ChartCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_chart_cache() -> ChartCache:
+    """
+    Get the process-wide chart cache, creating it from configuration on first use.
+
+    Returns:
+        Shared ChartCache instance
+    """
+    global _cache
+    with _cache_lock:
+        if _cache is None:
+            _cache = ChartCache.from_config()
+        return _cache
@@ -0,0 +1,207 @@
+"""
+Content registry for chart texts.
+
+Incarnation cross names, impulses and profile descriptions are loaded once
+from src/config/data into immutable lookup tables shared by every
+calculator and normalizer. Files are re-read only when their mtime
+changes, checked at most once per reload interval.
+"""
+
+import json
+import os
+import threading
+import time
+from pathlib import Path
+from types import MappingProxyType
+from typing import Callable, Dict, Mapping, Optional, Tuple, Union
+
+DEFAULT_DATA_DIR = Path(__file__).resolve().parent.parent / "config" / "data"
+
+CROSSES_FILE = "incarnation_crosses.json"
+IMPULSES_FILE = "impulses.json"
+PROFILES_FILE = "profiles.json"
+CONTENT_FILES = (CROSSES_FILE, IMPULSES_FILE, PROFILES_FILE)
+
+
+class ContentSnapshot:
+    """Immutable set of lookup tables built from one version of the data files."""
+
+    __slots__ = ("crosses", "impulses", "profiles", "mtimes")
+
+    def __init__(
+        self,
+        crosses: Mapping[int, Mapping[str, str]],
+        impulses: Mapping[Tuple[str, str], str],
+        profiles: Mapping[str, str],
+        mtimes: Mapping[str, float],
+    ):
+        self.crosses = crosses
+        self.impulses = impulses
+        self.profiles = profiles
+        self.mtimes = mtimes
+
+    @classmethod
+    def load(cls, data_dir: Path, strict: bool = False) -> "ContentSnapshot":
+        """
+        Read and index the data files.
+
+        Unless strict, a missing or invalid file yields an empty table
+        (callers fall back to their default texts).
+
+        Args:
+            data_dir: Directory containing the JSON files
+            strict: Raise instead of substituting empty tables
+
+        Returns:
+            ContentSnapshot
+
+        Raises:
+            OSError, ValueError: If strict and a file cannot be read or parsed
+        """
+        raw: Dict[str, dict] = {}
+        mtimes: Dict[str, float] = {}
+        for name in CONTENT_FILES:
+            path = data_dir / name
+            try:
+                mtimes[name] = path.stat().st_mtime
+                with open(path, "r", encoding="utf-8") as f:
+                    raw[name] = json.load(f)
+            except (OSError, ValueError) as e:
+                if strict:
+                    raise
+                print(f"Error loading {name}: {e}")
+                mtimes.setdefault(name, 0.0)
+                raw[name] = {}
+
+        crosses = {
+            int(gate): MappingProxyType(dict(names))
+            for gate, names in raw[CROSSES_FILE].items()
+        }
+        impulses = {
+            (type_code, authority_code): text
+            for type_code, by_authority in raw[IMPULSES_FILE].items()
+            for authority_code, text in by_authority.items()
+        }
+        return cls(
+            crosses=MappingProxyType(crosses),
+            impulses=MappingProxyType(impulses),
+            profiles=MappingProxyType(dict(raw[PROFILES_FILE])),
+            mtimes=MappingProxyType(mtimes),
+        )
+
+
+class ContentRegistry:
+    """
+    Shared, hot-reloadable access to chart content.
+    """
+
+    def __init__(
+        self,
+        data_dir: Union[str, Path] = DEFAULT_DATA_DIR,
+        reload_interval: float = 5.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Initialize registry and load the data files.
+
+        Args:
+            data_dir: Directory containing the JSON files
+            reload_interval: Minimum seconds between mtime checks (0 checks on every access)
+            clock: Monotonic time source (injectable for tests)
+        """
+        self.data_dir = Path(data_dir)
+        self.reload_interval = reload_interval
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._snapshot = ContentSnapshot.load(self.data_dir)
+        self._checked_at = clock()
+        self.reloads = 0
+
+    def _current_mtimes(self) -> Dict[str, float]:
+        mtimes = {}
+        for name in CONTENT_FILES:
+            try:
+                mtimes[name] = (self.data_dir / name).stat().st_mtime
+            except OSError:
+                mtimes[name] = 0.0
+        return mtimes
+
+    @property
+    def snapshot(self) -> ContentSnapshot:
+        """Current tables, reloaded first if a data file changed since the last check."""
+        now = self._clock()
+        if now - self._checked_at < self.reload_interval:
+            return self._snapshot
+
+        with self._lock:
+            if now - self._checked_at >= self.reload_interval:
+                self._checked_at = now
+                if self._current_mtimes() != dict(self._snapshot.mtimes):
+                    try:
+                        self._snapshot = ContentSnapshot.load(self.data_dir, strict=True)
+                        self.reloads += 1
+                    except (OSError, ValueError) as e:
+                        # Keep serving the last good content; retried on the next check
+                        print(f"Content reload failed, keeping previous content: {e}")
+        return self._snapshot
+
+    def incarnation_cross_name(self, sun_gate: int, angle: str) -> Optional[str]:
+        """
+        Get the cross name for a Personality Sun gate and angle.
+
+        Args:
+            sun_gate: Personality Sun gate
+            angle: "right_angle", "juxtaposition" or "left_angle"
+
+        Returns:
+            Cross name or None
+        """
+        names = self.snapshot.crosses.get(sun_gate)
+        if names is None:
+            return None
+        return names.get(angle)
+
+    def impulse(self, type_code: str, authority_code: str) -> Optional[str]:
+        """
+        Get the impulse text for a Type and Authority.
+
+        Args:
+            type_code: Type code ("1"-"5")
+            authority_code: Authority code (e.g. "sacral")
+
+        Returns:
+            Impulse text or None
+        """
+        return self.snapshot.impulses.get((type_code, authority_code))
+
+    def profile_description(self, profile_code: str) -> Optional[str]:
+        """
+        Get the description of a profile.
+
+        Args:
+            profile_code: Profile code (e.g. "1/3")
+
+        Returns:
+            Description or None
+        """
+        return self.snapshot.profiles.get(profile_code)
+
+
+_registry: Optional[ContentRegistry] = None
+_registry_lock = threading.Lock()
+
+
+def get_content_registry() -> ContentRegistry:
+    """
+    Get the process-wide content registry, loading it on first use.
+
+    CONTENT_DATA_DIR overrides the data directory.
+
+    Returns:
+        Shared ContentRegistry instance
+    """
+    global _registry
+    with _registry_lock:
+        if _registry is None:
+            _registry = ContentRegistry(os.getenv("CONTENT_DATA_DIR", str(DEFAULT_DATA_DIR)))
+        return _registry
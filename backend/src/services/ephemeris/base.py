@@ -5,8 +5,59 @@ Defines the interface that all ephemeris sources must implement.
 """
 
 from abc import ABC, abstractmethod
+from datetime import datetime
+from typing import Callable, Dict, List, Sequence, Tuple, TypeVar
 from src.models.celestial import CelestialBody
 
+T = TypeVar("T")
+
+# Points that are always exactly opposite a physical body and never need
+# their own ephemeris call
+OPPOSITE_POINTS: Dict[CelestialBody, CelestialBody] = {
+    CelestialBody.EARTH: CelestialBody.SUN,
+    CelestialBody.SOUTH_NODE: CelestialBody.NORTH_NODE,
+}
+
+
+def physical_bodies(bodies: Sequence[CelestialBody]) -> List[CelestialBody]:
+    """
+    Get the distinct bodies that must actually be computed for a request.
+
+    Opposite points are replaced by the body they mirror.
+
+    Args:
+        bodies: Requested celestial bodies
+
+    Returns:
+        Distinct physical bodies in first-seen order
+    """
+    seen: Dict[CelestialBody, None] = {}
+    for body in bodies:
+        seen.setdefault(OPPOSITE_POINTS.get(body, body), None)
+    return list(seen)
+
+
+def expand_positions(
+    bodies: Sequence[CelestialBody], computed: Dict[CelestialBody, float]
+) -> List[float]:
+    """
+    Map computed physical longitudes back onto the requested bodies.
+
+    Args:
+        bodies: Requested celestial bodies
+        computed: Longitudes of the physical bodies
+
+    Returns:
+        Longitudes in the order of bodies, opposite points derived as +180°
+    """
+    longitudes = []
+    for body in bodies:
+        if body in OPPOSITE_POINTS:
+            longitudes.append((computed[OPPOSITE_POINTS[body]] + 180.0) % 360.0)
+        else:
+            longitudes.append(computed[body])
+    return longitudes
+
 
 class EphemerisSource(ABC):
     """
@@ -35,6 +86,105 @@ class EphemerisSource(ABC):
         """
         pass
 
+    def calculate_positions(
+        self, bodies: Sequence[CelestialBody], julian_day: float
+    ) -> List[float]:
+        """
+        Calculate ecliptic longitudes for several bodies at one Julian Day.
+
+        Every physical body is computed once; Earth and South Node are derived
+        from Sun and North Node. Sources override this when they can fetch
+        several bodies in a single call.
+
+        Args:
+            bodies: Celestial bodies to calculate
+            julian_day: Julian Day Number (JD) for the calculation
+
+        Returns:
+            Ecliptic longitudes in degrees (0-360), in the order of bodies
+
+        Raises:
+            CalculationError: If calculation fails
+        """
+        computed = {
+            body: self.calculate_position(body, julian_day)
+            for body in physical_bodies(bodies)
+        }
+        return expand_positions(bodies, computed)
+
+    def calculate_position_with_speed(
+        self, body: CelestialBody, julian_day: float
+    ) -> Tuple[float, float]:
+        """
+        Calculate ecliptic longitude and daily motion for a celestial body.
+
+        The default estimates speed with a central difference over one hour;
+        sources that get speed from the ephemeris directly override this.
+
+        Args:
+            body: The celestial body to calculate position for
+            julian_day: Julian Day Number (JD) for the calculation
+
+        Returns:
+            Tuple of (longitude in degrees 0-360, speed in degrees per day)
+
+        Raises:
+            CalculationError: If calculation fails
+        """
+        step = 1.0 / 24.0
+        longitude = self.calculate_position(body, julian_day)
+        before = self.calculate_position(body, julian_day - step)
+        after = self.calculate_position(body, julian_day + step)
+        delta = (after - before + 180.0) % 360.0 - 180.0
+        return longitude, delta / (2.0 * step)
+
+    def datetime_to_julian_day(self, dt: datetime) -> float:
+        """
+        Convert a UTC datetime to a Julian Day number (UT).
+
+        The conversion does not depend on the ephemeris, so every source
+        shares swisseph's calendar routine.
+
+        Args:
+            dt: datetime object (should be in UTC)
+
+        Returns:
+            Julian Day number
+        """
+        import swisseph as swe
+
+        return swe.julday(
+            dt.year,
+            dt.month,
+            dt.day,
+            dt.hour + dt.minute / 60.0 + dt.second / 3600.0 + dt.microsecond / 3.6e9
+        )
+
+    def run_pinned(self, call: Callable[["EphemerisSource"], T]) -> T:
+        """
+        Run a calculation that makes several position calls on a single source.
+
+        A chart's personality, design-time solve and design positions must
+        all come from the same ephemeris. Plain sources run the call on
+        themselves; the composite source picks one member for the whole call.
+
+        Args:
+            call: Function receiving the source to calculate with
+
+        Returns:
+            Result of call
+        """
+        return call(self)
+
+    def serving_source_name(self) -> str:
+        """
+        Get the name of the source run_pinned() would use now.
+
+        Returns:
+            Source identifier, as reported by get_source_name()
+        """
+        return self.get_source_name()
+
     @abstractmethod
     def get_source_name(self) -> str:
         """
@@ -54,3 +204,11 @@ class EphemerisSource(ABC):
             True if source can perform calculations, False otherwise
         """
         pass
+
+    def close(self) -> None:
+        """
+        Release pooled resources such as HTTP clients.
+
+        Called by the source registry at shutdown; the default does nothing.
+        """
+        pass
@@ -0,0 +1,622 @@
+"""
+Chebyshev-compressed ephemeris artifact and the source reading it.
+
+The artifact stores every physical body's ecliptic longitude as piecewise
+Chebyshev polynomials over fixed intervals, fitted to Swiss Ephemeris at
+Chebyshev nodes; the polynomial's derivative is the body's speed.
+Longitudes are fitted without nutation, and nutation in longitude (the same
+for every body, with terms down to a 5.5 day period) is stored once as its
+own series and added back on evaluation. That keeps the planets smooth
+enough for long intervals.
+
+Evaluating a position is a Clenshaw recurrence over a dozen coefficients
+read from a memory-mapped file: no swisseph call, no worker process.
+Scalar lookups use plain floats, many Julian days are evaluated with NumPy.
+
+File layout (little-endian):
+    header:    magic (8s), version (u32), series count (u32), jd_start (f64), jd_end (f64)
+    directory: per series [series id (u32), degree (u32), intervals (u32),
+               reserved (u32), interval days (f64), data offset (u64)]
+    data:      per series, intervals x (degree + 1) coefficients (f64) of the
+               unwrapped longitude in degrees over s in [-1, 1]
+
+Series ids are indices into CelestialBody declaration order, NUTATION_ID is
+nutation in longitude.
+"""
+
+import struct
+import threading
+from functools import partial
+from pathlib import Path
+from typing import Callable, Dict, List, NamedTuple, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from src.models.celestial import CelestialBody
+from src.models.ephemeris import EphemerisConfig
+from src.models.error import ERROR_CALCULATION_FAILED, ERROR_EPHEMERIS_UNAVAILABLE
+from src.services.calculation.design_time import DESIGN_MARGIN_DAYS
+from src.services.ephemeris.base import EphemerisSource, OPPOSITE_POINTS, expand_positions, physical_bodies
+
+MAGIC = b"HDCHEBY\x00"
+FORMAT_VERSION = 1
+HEADER = struct.Struct("<8sIIdd")
+DIRECTORY_ENTRY = struct.Struct("<IIIIdQ")
+
+BODIES = tuple(CelestialBody)
+NUTATION_ID = 255
+NUTATION = "nutation"
+
+SeriesKey = Union[CelestialBody, str]
+
+# Supported birth dates (1850-2100) plus the design offset before the first one
+DEFAULT_JD_START = 2396758.5 - DESIGN_MARGIN_DAYS  # 1849-09-23
+DEFAULT_JD_END = 2488434.5  # 2101-01-01
+
+# Width of one line (1/6 of a 5.625° gate) in arcseconds
+LINE_WIDTH_ARCSEC = 5.625 / 6.0 * 3600.0
+
+
+class SeriesSpec(NamedTuple):
+    """Interval length and polynomial degree of one series."""
+
+    interval_days: float
+    degree: int
+
+
+# Planets need intervals of at most ~32 days to resolve the Earth's monthly
+# wobble around the Earth-Moon barycenter. The remaining error (under 5",
+# about 1/700 of a line) sits at solar conjunctions, where swisseph's light
+# deflection has a kink.
+DEFAULT_SPECS: Dict[SeriesKey, SeriesSpec] = {
+    NUTATION: SeriesSpec(8.0, 13),
+    CelestialBody.SUN: SeriesSpec(16.0, 11),
+    CelestialBody.MOON: SeriesSpec(8.0, 15),
+    CelestialBody.NORTH_NODE: SeriesSpec(4.0, 13),
+    CelestialBody.MERCURY: SeriesSpec(16.0, 15),
+    CelestialBody.VENUS: SeriesSpec(16.0, 11),
+    CelestialBody.MARS: SeriesSpec(32.0, 11),
+    CelestialBody.JUPITER: SeriesSpec(32.0, 11),
+    CelestialBody.SATURN: SeriesSpec(32.0, 11),
+    CelestialBody.URANUS: SeriesSpec(32.0, 11),
+    CelestialBody.NEPTUNE: SeriesSpec(32.0, 11),
+    CelestialBody.PLUTO: SeriesSpec(32.0, 11),
+}
+
+
+class ChebyshevSeries:
+    """Piecewise Chebyshev series of one unwrapped longitude."""
+
+    def __init__(self, jd_start: float, interval_days: float, coefficients: np.ndarray):
+        """
+        Wrap coefficients.
+
+        Args:
+            jd_start: Julian Day (UT) where the first interval starts
+            interval_days: Interval length in days
+            coefficients: Array of shape (intervals, degree + 1)
+        """
+        self.jd_start = float(jd_start)
+        self.interval_days = float(interval_days)
+        self.coefficients = coefficients
+        self.count, size = coefficients.shape
+        self.degree = size - 1
+        self.jd_end = self.jd_start + self.interval_days * self.count
+
+    def _locate(self, julian_day: float) -> Tuple[int, float]:
+        """Interval index and normalized time in [-1, 1] of one Julian Day."""
+        x = (julian_day - self.jd_start) / self.interval_days
+        index = int(x)
+        if index >= self.count:
+            index = self.count - 1
+        elif index < 0:
+            index = 0
+        return index, 2.0 * (x - index) - 1.0
+
+    def longitude(self, julian_day: float) -> float:
+        """
+        Evaluate the unwrapped longitude of one Julian Day (Clenshaw, plain floats).
+
+        Args:
+            julian_day: Julian Day (UT) inside the series
+
+        Returns:
+            Longitude in degrees, not reduced to 0-360
+        """
+        index, s = self._locate(julian_day)
+        coefficients = self.coefficients[index].tolist()
+        two_s = 2.0 * s
+        b1 = b2 = 0.0
+        for c in reversed(coefficients[1:]):
+            b1, b2 = c + two_s * b1 - b2, b1
+        return coefficients[0] + s * b1 - b2
+
+    def longitude_with_speed(self, julian_day: float) -> Tuple[float, float]:
+        """
+        Evaluate longitude and its time derivative of one Julian Day.
+
+        Args:
+            julian_day: Julian Day (UT) inside the series
+
+        Returns:
+            (unwrapped longitude in degrees, speed in degrees per day)
+        """
+        index, s = self._locate(julian_day)
+        coefficients = self.coefficients[index].tolist()
+
+        # Recurrence for T_k(s) and T_k'(s) in one pass
+        t_prev, t_curr = 1.0, s
+        d_prev, d_curr = 0.0, 1.0
+        value = coefficients[0] + coefficients[1] * s
+        slope = coefficients[1]
+        two_s = 2.0 * s
+        for c in coefficients[2:]:
+            t_prev, t_curr = t_curr, two_s * t_curr - t_prev
+            d_prev, d_curr = d_curr, 2.0 * t_prev + two_s * d_curr - d_prev
+            value += c * t_curr
+            slope += c * d_curr
+        return value, slope * 2.0 / self.interval_days
+
+    def evaluate_many(self, julian_days: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Evaluate many Julian Days at once.
+
+        Args:
+            julian_days: Julian Days (UT) inside the series, shape (n,)
+
+        Returns:
+            (unwrapped longitudes in degrees, speeds in degrees per day), each of shape (n,)
+        """
+        x = (np.asarray(julian_days, dtype=np.float64) - self.jd_start) / self.interval_days
+        index = np.minimum(np.maximum(np.floor(x), 0), self.count - 1).astype(np.intp)
+        s = 2.0 * (x - index) - 1.0
+        two_s = 2.0 * s
+        coefficients = self.coefficients[index]
+
+        t_prev, t_curr = np.ones_like(s), s
+        d_prev, d_curr = np.zeros_like(s), np.ones_like(s)
+        value = coefficients[:, 0] + coefficients[:, 1] * s
+        slope = coefficients[:, 1].copy()
+        for k in range(2, self.degree + 1):
+            t_prev, t_curr = t_curr, two_s * t_curr - t_prev
+            d_prev, d_curr = d_curr, 2.0 * t_prev + two_s * d_curr - d_prev
+            value += coefficients[:, k] * t_curr
+            slope += coefficients[:, k] * d_curr
+        return value, slope * 2.0 / self.interval_days
+
+
+def fit_series(
+    function: Callable[[float], float], jd_start: float, jd_end: float, spec: SeriesSpec
+) -> ChebyshevSeries:
+    """
+    Fit a longitude function over [jd_start, jd_end].
+
+    Args:
+        function: Longitude in degrees as a function of Julian Day (UT)
+        jd_start: First Julian Day to cover
+        jd_end: Last Julian Day to cover
+        spec: Interval length and degree
+
+    Returns:
+        ChebyshevSeries interpolating the function at Chebyshev nodes
+    """
+    from numpy.polynomial import chebyshev
+
+    count = int(np.ceil((jd_end - jd_start) / spec.interval_days))
+    # Chebyshev nodes of the first kind, ascending so np.unwrap runs forward in time
+    nodes = -np.cos(np.pi * (np.arange(spec.degree + 1) + 0.5) / (spec.degree + 1))
+    radius = spec.interval_days / 2.0
+    coefficients = np.empty((count, spec.degree + 1), dtype=np.float64)
+    for i in range(count):
+        mid = jd_start + (i + 0.5) * spec.interval_days
+        longitudes = np.array([function(mid + s * radius) for s in nodes])
+        unwrapped = np.degrees(np.unwrap(np.radians(longitudes)))
+        coefficients[i] = chebyshev.chebfit(nodes, unwrapped, spec.degree)
+    return ChebyshevSeries(jd_start, spec.interval_days, coefficients)
+
+
+class ChebyshevEphemeris:
+    """
+    Chebyshev series of every physical body plus nutation over a Julian Day range.
+
+    Args:
+        jd_start: First Julian Day (UT) covered
+        jd_end: Last Julian Day (UT) covered
+        series: Series per physical body and NUTATION
+    """
+
+    def __init__(self, jd_start: float, jd_end: float, series: Dict[SeriesKey, ChebyshevSeries]):
+        self.jd_start = float(jd_start)
+        self.jd_end = float(jd_end)
+        self.series = series
+
+    @classmethod
+    def build(
+        cls,
+        jd_start: float = DEFAULT_JD_START,
+        jd_end: float = DEFAULT_JD_END,
+        specs: Optional[Dict[SeriesKey, SeriesSpec]] = None,
+        progress: Optional[Callable[[SeriesKey, ChebyshevSeries], None]] = None,
+    ) -> "ChebyshevEphemeris":
+        """
+        Fit every series to Swiss Ephemeris.
+
+        Uses swisseph with the ephemeris path already applied (see
+        initializer.apply_ephemeris_path).
+
+        Args:
+            jd_start: First Julian Day to cover
+            jd_end: Last Julian Day to cover
+            specs: Interval and degree per series (DEFAULT_SPECS if omitted)
+            progress: Optional callable(key, series) called after each series
+
+        Returns:
+            ChebyshevEphemeris covering [jd_start, jd_end]
+        """
+        import swisseph as swe
+
+        from src.services.ephemeris.swiss_ephemeris import SwissEphemerisSource
+
+        flags = swe.FLG_SWIEPH | swe.FLG_NONUT
+
+        def nutation(jd: float) -> float:
+            return swe.calc_ut(jd, swe.ECL_NUT, 0)[0][2]
+
+        def longitude(jd: float, swe_body: int) -> float:
+            return swe.calc_ut(jd, swe_body, flags)[0][0]
+
+        series = {}
+        for key, spec in (specs or DEFAULT_SPECS).items():
+            function: Callable[[float], float]
+            if isinstance(key, CelestialBody):
+                function = partial(longitude, swe_body=SwissEphemerisSource.BODY_MAP[key])
+            else:
+                function = nutation
+            series[key] = fit_series(function, jd_start, jd_end, spec)
+            if progress is not None:
+                progress(key, series[key])
+        return cls(jd_start, jd_end, series)
+
+    def save(self, path: Union[str, Path]) -> None:
+        """
+        Write the artifact to disk.
+
+        Args:
+            path: Output file path
+        """
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        offset = HEADER.size + DIRECTORY_ENTRY.size * len(self.series)
+        entries, blobs = [], []
+        for key, series in self.series.items():
+            series_id = NUTATION_ID if key == NUTATION else BODIES.index(key)
+            blob = np.ascontiguousarray(series.coefficients, dtype="<f8").tobytes()
+            entries.append(DIRECTORY_ENTRY.pack(
+                series_id, series.degree, series.count, 0, series.interval_days, offset
+            ))
+            blobs.append(blob)
+            offset += len(blob)
+
+        with open(path, "wb") as f:
+            f.write(HEADER.pack(MAGIC, FORMAT_VERSION, len(self.series), self.jd_start, self.jd_end))
+            for entry in entries:
+                f.write(entry)
+            for blob in blobs:
+                f.write(blob)
+
+    @classmethod
+    def load(cls, path: Union[str, Path]) -> "ChebyshevEphemeris":
+        """
+        Memory-map an artifact written by save().
+
+        Args:
+            path: Artifact file path
+
+        Returns:
+            ChebyshevEphemeris backed by a read-only memory map
+
+        Raises:
+            ValueError: If the file is not a supported or complete artifact
+        """
+        with open(path, "rb") as f:
+            header = f.read(HEADER.size)
+            if len(header) != HEADER.size:
+                raise ValueError(f"Chebyshev ephemeris {path} is truncated")
+            magic, version, count, jd_start, jd_end = HEADER.unpack(header)
+            if magic != MAGIC or version != FORMAT_VERSION:
+                raise ValueError(f"Unsupported Chebyshev ephemeris format in {path}")
+            directory = f.read(DIRECTORY_ENTRY.size * count)
+        if len(directory) != DIRECTORY_ENTRY.size * count:
+            raise ValueError(f"Chebyshev ephemeris {path} is truncated")
+
+        data = np.memmap(path, dtype=np.uint8, mode="r")
+        series = {}
+        for i in range(count):
+            series_id, degree, intervals, _, interval_days, offset = DIRECTORY_ENTRY.unpack_from(
+                directory, i * DIRECTORY_ENTRY.size
+            )
+            if series_id == NUTATION_ID:
+                key = NUTATION
+            elif series_id < len(BODIES):
+                key = BODIES[series_id]
+            else:
+                raise ValueError(f"Chebyshev ephemeris {path} has an unknown series id {series_id}")
+            size = intervals * (degree + 1) * 8
+            if offset + size > len(data):
+                raise ValueError(f"Chebyshev ephemeris {path} is truncated")
+            # Plain ndarray over the map: same pages, without np.memmap's per-slice overhead
+            coefficients = np.asarray(data[offset:offset + size]).view("<f8").reshape(intervals, degree + 1)
+            series[key] = ChebyshevSeries(jd_start, interval_days, coefficients)
+
+        if NUTATION not in series:
+            raise ValueError(f"Chebyshev ephemeris {path} has no nutation series")
+        return cls(jd_start, jd_end, series)
+
+    def covers(self, julian_day: float) -> bool:
+        """Check whether a Julian Day lies inside the artifact."""
+        return self.jd_start <= julian_day <= self.jd_end
+
+    def longitudes(
+        self, bodies: Sequence[CelestialBody], julian_days: np.ndarray
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Evaluate physical bodies over many Julian Days.
+
+        Args:
+            bodies: Physical bodies with a series
+            julian_days: Julian Days (UT), shape (n,)
+
+        Returns:
+            (longitudes in degrees 0-360, speeds in degrees per day), each of shape (len(bodies), n)
+        """
+        nutation, nutation_speed = self.series[NUTATION].evaluate_many(julian_days)
+        longitudes = np.empty((len(bodies), len(julian_days)))
+        speeds = np.empty((len(bodies), len(julian_days)))
+        for i, body in enumerate(bodies):
+            longitude, speed = self.series[body].evaluate_many(julian_days)
+            longitudes[i] = np.mod(longitude + nutation, 360.0)
+            speeds[i] = speed + nutation_speed
+        return longitudes, speeds
+
+    def verify_against(
+        self,
+        ephemeris_source: EphemerisSource,
+        julian_days: np.ndarray,
+        tolerance_arcsec: float = 5.0,
+    ) -> dict:
+        """
+        Compare longitudes and speeds with a reference source.
+
+        Args:
+            ephemeris_source: Reference source providing calculate_position_with_speed
+            julian_days: Julian Days to check
+            tolerance_arcsec: Maximum allowed longitude error
+
+        Returns:
+            Dict with sample count, per-body maximum errors, the worst error
+            in arcseconds and as a fraction of one line, and pass flag
+        """
+        julian_days = np.asarray(julian_days, dtype=np.float64)
+        bodies = [key for key in self.series if isinstance(key, CelestialBody)]
+        longitudes, speeds = self.longitudes(bodies, julian_days)
+
+        report = {}
+        for i, body in enumerate(bodies):
+            reference = np.array(
+                [ephemeris_source.calculate_position_with_speed(body, jd) for jd in julian_days]
+            ).reshape(-1, 2)
+            errors = np.abs((longitudes[i] - reference[:, 0] + 180.0) % 360.0 - 180.0) * 3600.0
+            speed_errors = np.abs(speeds[i] - reference[:, 1]) * 3600.0
+            report[body.value] = {
+                "max_error_arcsec": float(errors.max()) if len(errors) else 0.0,
+                "max_speed_error_arcsec_per_day": float(speed_errors.max()) if len(errors) else 0.0,
+            }
+
+        max_error = max((entry["max_error_arcsec"] for entry in report.values()), default=0.0)
+        return {
+            "samples": int(len(julian_days)),
+            "bodies": report,
+            "max_error_arcsec": max_error,
+            "max_error_line_fraction": max_error / LINE_WIDTH_ARCSEC,
+            "tolerance_arcsec": tolerance_arcsec,
+            "passed": max_error <= tolerance_arcsec,
+        }
+
+
+class ChebyshevEphemerisSource(EphemerisSource):
+    """
+    Ephemeris source evaluating a memory-mapped Chebyshev artifact.
+    """
+
+    def __init__(
+        self,
+        path: Optional[str] = None,
+        start_year: Optional[int] = None,
+        end_year: Optional[int] = None,
+    ):
+        """
+        Initialize Chebyshev source.
+
+        Args:
+            path: Artifact written by scripts/build_chebyshev_ephemeris.py (mapped on first use)
+            start_year: First supported birth year the artifact must cover, design dates
+                included (coverage is not checked unless both years are given)
+            end_year: Last supported birth year the artifact must cover
+        """
+        self.path = path
+        self.start_year = start_year
+        self.end_year = end_year
+        self._ephemeris: Optional[ChebyshevEphemeris] = None
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_config(cls, config: Optional[EphemerisConfig] = None) -> "ChebyshevEphemerisSource":
+        """
+        Create source from environment configuration.
+
+        Args:
+            config: Optional explicit configuration (loaded from env if omitted)
+
+        Returns:
+            ChebyshevEphemerisSource instance
+        """
+        config = config or EphemerisConfig()
+        return cls(
+            path=config.chebyshev_path,
+            start_year=config.supported_start_year,
+            end_year=config.supported_end_year,
+        )
+
+    def _get_ephemeris(self) -> ChebyshevEphemeris:
+        """
+        Map the artifact on first use.
+
+        Raises:
+            RuntimeError: If no artifact is configured or it cannot be read
+        """
+        ephemeris = self._ephemeris
+        if ephemeris is not None:
+            return ephemeris
+        with self._lock:
+            if self._ephemeris is None:
+                if not self.path:
+                    raise RuntimeError(f"{ERROR_EPHEMERIS_UNAVAILABLE}: EPHEMERIS_CHEBYSHEV_PATH is not set")
+                try:
+                    self._ephemeris = ChebyshevEphemeris.load(self.path)
+                except (OSError, ValueError) as e:
+                    raise RuntimeError(f"{ERROR_EPHEMERIS_UNAVAILABLE}: cannot read Chebyshev ephemeris: {e}")
+            return self._ephemeris
+
+    def _covered(self, julian_day: float) -> ChebyshevEphemeris:
+        """Get the artifact, checking that it covers a Julian Day."""
+        ephemeris = self._get_ephemeris()
+        if not ephemeris.covers(julian_day):
+            raise RuntimeError(
+                f"{ERROR_CALCULATION_FAILED}: JD {julian_day} is outside the Chebyshev ephemeris "
+                f"({ephemeris.jd_start}-{ephemeris.jd_end})"
+            )
+        return ephemeris
+
+    @staticmethod
+    def _series(ephemeris: ChebyshevEphemeris, body: CelestialBody) -> ChebyshevSeries:
+        """Get the series of a physical body."""
+        series = ephemeris.series.get(body) if body != NUTATION else None
+        if series is None:
+            raise ValueError(f"Unknown celestial body: {body}")
+        return series
+
+    def calculate_position(self, body: CelestialBody, julian_day: float) -> float:
+        """
+        Calculate ecliptic longitude from the artifact.
+
+        Args:
+            body: Celestial body to calculate
+            julian_day: Julian Day Number
+
+        Returns:
+            Ecliptic longitude in degrees (0-360)
+        """
+        return self.calculate_positions([body], julian_day)[0]
+
+    def calculate_positions(
+        self, bodies: Sequence[CelestialBody], julian_day: float
+    ) -> List[float]:
+        """
+        Calculate ecliptic longitudes of several bodies, nutation evaluated once.
+
+        Args:
+            bodies: Celestial bodies to calculate
+            julian_day: Julian Day number
+
+        Returns:
+            Ecliptic longitudes in degrees (0-360), in the order of bodies
+        """
+        ephemeris = self._covered(julian_day)
+        nutation = ephemeris.series[NUTATION].longitude(julian_day)
+        computed = {
+            body: (self._series(ephemeris, body).longitude(julian_day) + nutation) % 360.0
+            for body in physical_bodies(bodies)
+        }
+        return expand_positions(bodies, computed)
+
+    def calculate_position_with_speed(
+        self, body: CelestialBody, julian_day: float
+    ) -> Tuple[float, float]:
+        """
+        Calculate longitude and speed from one series evaluation.
+
+        Args:
+            body: Celestial body (physical bodies and opposite points)
+            julian_day: Julian Day number
+
+        Returns:
+            Tuple of (longitude in degrees 0-360, speed in degrees per day)
+        """
+        ephemeris = self._covered(julian_day)
+        physical = OPPOSITE_POINTS.get(body, body)
+        longitude, speed = self._series(ephemeris, physical).longitude_with_speed(julian_day)
+        nutation, nutation_speed = ephemeris.series[NUTATION].longitude_with_speed(julian_day)
+        longitude += nutation
+        if physical is not body:
+            longitude += 180.0
+        return longitude % 360.0, speed + nutation_speed
+
+    def calculate_longitudes(
+        self, bodies: Sequence[CelestialBody], julian_days: Sequence[float]
+    ) -> np.ndarray:
+        """
+        Calculate longitudes vectorized over Julian days.
+
+        Args:
+            bodies: Celestial bodies (Earth and South Node are derived)
+            julian_days: Julian Day numbers (UT)
+
+        Returns:
+            Longitudes in degrees (0-360), shape (len(bodies), len(julian_days))
+
+        Raises:
+            RuntimeError: If the artifact is unavailable or does not cover an epoch
+        """
+        jd_ut = np.atleast_1d(np.asarray(julian_days, dtype=np.float64))
+        ephemeris = self._get_ephemeris()
+        if len(jd_ut):
+            self._covered(float(jd_ut.min()))
+            self._covered(float(jd_ut.max()))
+
+        physical = physical_bodies(bodies)
+        for body in physical:
+            self._series(ephemeris, body)
+        computed, _ = ephemeris.longitudes(physical, jd_ut)
+        return np.array(expand_positions(bodies, dict(zip(physical, computed))), dtype=np.float64).reshape(
+            len(bodies), len(jd_ut)
+        )
+
+    def get_source_name(self) -> str:
+        """Return source identifier."""
+        return "ChebyshevEphemeris"
+
+    def is_available(self) -> bool:
+        """
+        Check if a usable artifact is configured.
+
+        Returns:
+            True if the artifact maps, has a series for every physical body
+            and covers the supported years (artifacts built before the range
+            was extended to the end of 2100 do not)
+        """
+        try:
+            ephemeris = self._get_ephemeris()
+        except Exception:
+            return False
+        if self.start_year is not None and self.end_year is not None:
+            import swisseph as swe
+
+            first_jd = swe.julday(self.start_year, 1, 1, 0.0) - DESIGN_MARGIN_DAYS
+            if not (ephemeris.covers(first_jd) and ephemeris.covers(swe.julday(self.end_year + 1, 1, 1, 0.0))):
+                return False
+        return all(body in ephemeris.series for body in physical_bodies(list(CelestialBody)))
+
+    def close(self) -> None:
+        """Drop the mapped artifact; it is mapped again on next use."""
+        with self._lock:
+            self._ephemeris = None
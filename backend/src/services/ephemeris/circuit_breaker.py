@@ -0,0 +1,119 @@
+"""
+Circuit breaker for remote ephemeris sources.
+
+After `failure_threshold` consecutive failures the circuit opens and calls
+are rejected without touching the network. Once `reset_timeout` has passed a
+single trial call is let through (half-open); its success closes the
+circuit, its failure opens it again for another `reset_timeout`. Callers must
+report every call let through by allow() with record_success() or
+record_failure(), also when it ends in an unexpected exception, or the
+circuit stays half-open with the trial slot taken.
+"""
+
+import threading
+import time
+from typing import Callable
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    """Thread-safe consecutive-failure circuit breaker."""
+
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        reset_timeout: float = 30.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Initialize breaker in the closed state.
+
+        Args:
+            failure_threshold: Consecutive failures that open the circuit
+            reset_timeout: Seconds the circuit stays open before a trial call
+            clock: Monotonic time function (injectable for tests)
+        """
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._state = CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._trial_in_flight = False
+        self._rejected = 0
+        self._opened = 0
+
+    @property
+    def state(self) -> str:
+        """Current state, moving from open to half-open once the timeout has passed."""
+        with self._lock:
+            if self._state == OPEN and self._clock() - self._opened_at >= self.reset_timeout:
+                self._state = HALF_OPEN
+                self._trial_in_flight = False
+            return self._state
+
+    def can_attempt(self) -> bool:
+        """
+        Check whether allow() would let a call through, without taking the trial slot.
+
+        Returns:
+            False while open, or half-open with the trial call still in flight
+        """
+        state = self.state
+        with self._lock:
+            return state == CLOSED or (state == HALF_OPEN and not self._trial_in_flight)
+
+    def allow(self) -> bool:
+        """
+        Check whether a call may go out now.
+
+        Returns:
+            True if the call may proceed (closed, or the single half-open trial)
+        """
+        state = self.state
+        with self._lock:
+            if state == CLOSED:
+                return True
+            if state == HALF_OPEN and not self._trial_in_flight:
+                self._trial_in_flight = True
+                return True
+            self._rejected += 1
+            return False
+
+    def record_success(self) -> None:
+        """Close the circuit and reset the failure count."""
+        with self._lock:
+            self._state = CLOSED
+            self._failures = 0
+            self._trial_in_flight = False
+
+    def record_failure(self) -> None:
+        """Count a failure, opening the circuit at the threshold or after a failed trial."""
+        with self._lock:
+            self._failures += 1
+            if self._state == HALF_OPEN or self._failures >= self.failure_threshold:
+                if self._state != OPEN:
+                    self._opened += 1
+                self._state = OPEN
+                self._opened_at = self._clock()
+                self._trial_in_flight = False
+
+    def stats(self) -> dict:
+        """
+        Get breaker counters.
+
+        Returns:
+            Dict with state, consecutive failures and open/reject counters
+        """
+        state = self.state
+        with self._lock:
+            return {
+                "state": state,
+                "consecutive_failures": self._failures,
+                "opened": self._opened,
+                "rejected": self._rejected,
+            }
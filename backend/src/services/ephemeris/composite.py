@@ -0,0 +1,326 @@
+"""
+Failover ephemeris source with optional hedged calls.
+
+CompositeEphemerisSource chains sources in priority order: a call goes to the
+first available source and moves on to the next one when it raises. With
+hedging enabled, once the current source has taken longer than its observed
+latency quantile (p95 by default) the same call is also sent to the next
+source and whichever succeeds first is used. Per-source latency and error
+metrics, plus the composite's own end-to-end latency, show what failover and
+hedging do to the tail.
+"""
+
+import math
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from typing import Any, Callable, Deque, List, Optional, Sequence, Tuple, TypeVar
+
+from src.models.celestial import CelestialBody
+from src.models.error import ERROR_EPHEMERIS_UNAVAILABLE
+from src.services.ephemeris.base import EphemerisSource
+
+T = TypeVar("T")
+
+
+class SourceMetrics:
+    """Latency window and outcome counters of one source."""
+
+    def __init__(self, window: int = 512):
+        """
+        Initialize empty metrics.
+
+        Args:
+            window: Recent successful calls kept for latency quantiles
+        """
+        self._latencies: Deque[float] = deque(maxlen=window)
+        self._lock = threading.Lock()
+        self.calls = 0
+        self.errors = 0
+        self.skipped = 0
+        self.hedges = 0
+        self.hedge_wins = 0
+
+    def record(self, seconds: float, ok: bool) -> None:
+        """Record one finished call."""
+        with self._lock:
+            self.calls += 1
+            if ok:
+                self._latencies.append(seconds)
+            else:
+                self.errors += 1
+
+    def count(self, counter: str) -> None:
+        """Increment skipped, hedges or hedge_wins."""
+        with self._lock:
+            setattr(self, counter, getattr(self, counter) + 1)
+
+    @property
+    def samples(self) -> int:
+        return len(self._latencies)
+
+    def quantile(self, q: float) -> Optional[float]:
+        """
+        Get a latency quantile of the recent successful calls.
+
+        Args:
+            q: Quantile between 0 and 1
+
+        Returns:
+            Latency in seconds, or None without samples
+        """
+        with self._lock:
+            latencies = sorted(self._latencies)
+        if not latencies:
+            return None
+        return latencies[min(len(latencies) - 1, math.ceil(q * len(latencies)) - 1)]
+
+    def stats(self) -> dict:
+        """
+        Get counters and latency quantiles.
+
+        Returns:
+            Dict with call/error/skip/hedge counters and p50/p95/p99 in milliseconds
+        """
+        quantiles = {}
+        for q in (0.5, 0.95, 0.99):
+            value = self.quantile(q)
+            quantiles[f"p{round(q * 100)}_ms"] = None if value is None else round(value * 1000, 3)
+        with self._lock:
+            return {
+                "calls": self.calls,
+                "errors": self.errors,
+                "skipped": self.skipped,
+                "hedges": self.hedges,
+                "hedge_wins": self.hedge_wins,
+                "samples": len(self._latencies),
+                **quantiles,
+            }
+
+
+class CompositeEphemerisSource(EphemerisSource):
+    """Tries member sources in priority order, optionally hedging slow calls."""
+
+    def __init__(
+        self,
+        sources: Sequence[Tuple[str, EphemerisSource]],
+        is_available: Optional[Callable[[str], bool]] = None,
+        hedge: bool = False,
+        hedge_quantile: float = 0.95,
+        hedge_min_samples: int = 20,
+        hedge_workers: int = 8,
+        latency_window: int = 512,
+    ):
+        """
+        Initialize composite source.
+
+        Args:
+            sources: (name, source) pairs in priority order
+            is_available: Cached availability lookup by name (member's own check if omitted)
+            hedge: Send slow calls to the next source as well
+            hedge_quantile: Latency quantile after which a call is hedged
+            hedge_min_samples: Samples a source needs before its calls are hedged
+            hedge_workers: Threads running hedged calls
+            latency_window: Recent calls per source kept for quantiles
+        """
+        if not sources:
+            raise ValueError("CompositeEphemerisSource needs at least one source")
+
+        self.sources = list(sources)
+        self._is_available = is_available or (lambda name: dict(self.sources)[name].is_available())
+        self.hedge = hedge
+        self.hedge_quantile = hedge_quantile
+        self.hedge_min_samples = hedge_min_samples
+        self.metrics = {name: SourceMetrics(latency_window) for name, _ in self.sources}
+        self.overall = SourceMetrics(latency_window)
+        self._served = threading.local()
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._hedge_workers = hedge_workers
+        self._lock = threading.Lock()
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """Get or create the hedging thread pool."""
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self._hedge_workers, thread_name_prefix="ephemeris-hedge"
+                )
+            return self._executor
+
+    def _candidates(self, count_skips: bool = True) -> List[Tuple[str, EphemerisSource]]:
+        """Members in priority order, unavailable ones left out (all of them if none is available)."""
+        available = []
+        for name, source in self.sources:
+            try:
+                ok = self._is_available(name)
+            except Exception:
+                ok = False
+            if ok:
+                available.append((name, source))
+            elif count_skips:
+                self.metrics[name].count("skipped")
+        return available or list(self.sources)
+
+    def _timed(self, name: str, source: EphemerisSource, call: Callable[[EphemerisSource], Any]) -> Any:
+        """Run a call on one source and record its latency and outcome."""
+        started = time.perf_counter()
+        try:
+            result = call(source)
+        except Exception:
+            self.metrics[name].record(time.perf_counter() - started, ok=False)
+            raise
+        self.metrics[name].record(time.perf_counter() - started, ok=True)
+        return result
+
+    def _hedge_delay(self, name: str) -> Optional[float]:
+        """Seconds after which a call to this source is hedged, or None if it is not."""
+        if not self.hedge or self.metrics[name].samples < self.hedge_min_samples:
+            return None
+        return self.metrics[name].quantile(self.hedge_quantile)
+
+    def _hedged(
+        self,
+        primary: Tuple[str, EphemerisSource],
+        backup: Tuple[str, EphemerisSource],
+        delay: float,
+        call: Callable[[EphemerisSource], Any],
+        errors: List[str],
+    ) -> Optional[Tuple[Any, str]]:
+        """
+        Run a call on primary, adding backup once primary is slower than delay.
+
+        Returns:
+            (result, serving source name), or None if both failed (errors appended)
+        """
+        executor = self._get_executor()
+        futures = {executor.submit(self._timed, primary[0], primary[1], call): primary}
+        try:
+            return next(iter(futures)).result(timeout=delay), primary[0]
+        except FutureTimeoutError:
+            self.metrics[backup[0]].count("hedges")
+            futures[executor.submit(self._timed, backup[0], backup[1], call)] = backup
+        except Exception as e:
+            errors.append(f"{primary[1].get_source_name()}: {e}")
+            try:
+                return self._timed(backup[0], backup[1], call), backup[0]
+            except Exception as backup_error:
+                errors.append(f"{backup[1].get_source_name()}: {backup_error}")
+                return None
+
+        # The losing call keeps running and still records its latency
+        pending = set(futures)
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                name, source = futures[future]
+                try:
+                    result = future.result()
+                except Exception as e:
+                    errors.append(f"{source.get_source_name()}: {e}")
+                    continue
+                if name == backup[0]:
+                    self.metrics[name].count("hedge_wins")
+                return result, name
+        return None
+
+    def _dispatch(self, call: Callable[[EphemerisSource], Any]) -> Any:
+        """
+        Run a call with failover (and hedging) across the members.
+
+        Raises:
+            RuntimeError: If every source failed
+        """
+        started = time.perf_counter()
+        candidates = self._candidates()
+        errors: List[str] = []
+        i = 0
+        while i < len(candidates):
+            name, source = candidates[i]
+            backup = candidates[i + 1] if i + 1 < len(candidates) else None
+            delay = self._hedge_delay(name) if backup is not None else None
+
+            outcome: Optional[Tuple[Any, str]]
+            if backup is None or delay is None:
+                try:
+                    result = self._timed(name, source, call)
+                except Exception as e:
+                    errors.append(f"{source.get_source_name()}: {e}")
+                    i += 1
+                    continue
+                outcome = (result, name)
+            else:
+                outcome = self._hedged((name, source), backup, delay, call, errors)
+                if outcome is None:
+                    i += 2
+                    continue
+
+            result, served = outcome
+            self._served.name = dict(self.sources)[served].get_source_name()
+            self.overall.record(time.perf_counter() - started, ok=True)
+            return result
+
+        self.overall.record(time.perf_counter() - started, ok=False)
+        raise RuntimeError(
+            f"{ERROR_EPHEMERIS_UNAVAILABLE}: all ephemeris sources failed ({'; '.join(errors)})"
+        )
+
+    def run_pinned(self, call: Callable[[EphemerisSource], T]) -> T:
+        """
+        Run a multi-call calculation on one member, failing over (and hedging) as a whole.
+
+        Every position of the calculation comes from the member that serves
+        it; if that member fails midway, the calculation restarts on the next.
+        """
+        return self._dispatch(call)
+
+    def serving_source_name(self) -> str:
+        """Name of the first available member, which run_pinned() tries first."""
+        return self._candidates(count_skips=False)[0][1].get_source_name()
+
+    def calculate_position(self, body: CelestialBody, julian_day: float) -> float:
+        """Calculate one longitude on the first source that succeeds."""
+        return self._dispatch(lambda source: source.calculate_position(body, julian_day))
+
+    def calculate_positions(
+        self, bodies: Sequence[CelestialBody], julian_day: float
+    ) -> List[float]:
+        """Calculate a batch of longitudes on the first source that succeeds (hedged as a whole)."""
+        return self._dispatch(lambda source: source.calculate_positions(bodies, julian_day))
+
+    def calculate_position_with_speed(
+        self, body: CelestialBody, julian_day: float
+    ) -> Tuple[float, float]:
+        """Calculate longitude and speed on the first source that succeeds."""
+        return self._dispatch(lambda source: source.calculate_position_with_speed(body, julian_day))
+
+    def get_source_name(self) -> str:
+        """Name of the source that served this thread's last call (first member before any call)."""
+        return getattr(self._served, "name", None) or self.sources[0][1].get_source_name()
+
+    def is_available(self) -> bool:
+        """True if any member is available."""
+        return any(self._is_available(name) for name, _ in self.sources)
+
+    def stats(self) -> dict:
+        """
+        Get failover and hedging metrics.
+
+        Returns:
+            Dict with member order, hedging settings, end-to-end latency and per-source metrics
+        """
+        return {
+            "order": [name for name, _ in self.sources],
+            "hedge": self.hedge,
+            "hedge_quantile": self.hedge_quantile,
+            "overall": self.overall.stats(),
+            "sources": {name: metrics.stats() for name, metrics in self.metrics.items()},
+        }
+
+    def close(self) -> None:
+        """Stop the hedging threads; members are closed by their owner (the registry)."""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
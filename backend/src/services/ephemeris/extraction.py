@@ -0,0 +1,259 @@
+"""
+Streaming extraction of stored ephemeris files.
+
+The ephemeris_files table holds each .se1 file as one blob of up to tens of
+MB. Instead of loading every row at once, the manifest (id, name, size,
+hash) is read through a server-side cursor and each blob is fetched in
+fixed-size substr() slices, hashed while it is written to a temp file in the
+target directory and renamed into place only if its SHA-256 matches. Files
+already on disk with the stored hash are skipped; the rest are extracted by
+a small thread pool, one database connection per file.
+"""
+
+import hashlib
+import os
+import tempfile
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from pathlib import Path
+from typing import Callable, Dict, List, NamedTuple, Optional
+
+from sqlalchemy import func, select
+from sqlalchemy.engine import Engine
+
+from src.models.ephemeris_storage import EphemerisFile
+
+DEFAULT_CHUNK_SIZE = 4 * 1024 * 1024
+DEFAULT_WORKERS = 4
+
+EXTRACTED = "extracted"
+SKIPPED = "skipped"
+FAILED = "failed"
+
+
+class EphemerisIntegrityError(Exception):
+    """Raised when streamed file data does not match its stored size or hash"""
+    pass
+
+
+class StoredEphemerisFile(NamedTuple):
+    """Manifest entry of a stored ephemeris file (without its data)."""
+
+    id: int
+    filename: str
+    file_size: int
+    sha256_hash: str
+
+
+class ExtractionResult(NamedTuple):
+    """Outcome of extracting one file."""
+
+    filename: str
+    status: str
+    file_size: int
+    error: Optional[str] = None
+
+
+def sha256_file(path: Path, chunk_size: int = DEFAULT_CHUNK_SIZE) -> str:
+    """
+    Calculate the SHA-256 of a file without reading it into memory.
+
+    Args:
+        path: File to hash
+        chunk_size: Read size in bytes
+
+    Returns:
+        Hex digest
+    """
+    sha256 = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            sha256.update(chunk)
+    return sha256.hexdigest()
+
+
+def list_stored_files(engine: Engine) -> List[StoredEphemerisFile]:
+    """
+    Read the manifest of stored files, largest first.
+
+    Only metadata columns are selected; blobs are never loaded here.
+
+    Args:
+        engine: SQLAlchemy engine
+
+    Returns:
+        Manifest entries
+    """
+    query = select(
+        EphemerisFile.id, EphemerisFile.filename, EphemerisFile.file_size, EphemerisFile.sha256_hash
+    ).order_by(EphemerisFile.file_size.desc())
+    with engine.connect() as conn:
+        result = conn.execution_options(stream_results=True, yield_per=100).execute(query)
+        return [StoredEphemerisFile(*row) for row in result]
+
+
+def iter_file_chunks(engine: Engine, file_id: int, file_size: int, chunk_size: int = DEFAULT_CHUNK_SIZE):
+    """
+    Yield a stored blob in slices of at most chunk_size bytes.
+
+    Uses substr(), which works on Postgres bytea and SQLite blobs alike, so
+    no more than one slice is held in memory.
+
+    Args:
+        engine: SQLAlchemy engine
+        file_id: EphemerisFile.id
+        file_size: Expected size in bytes
+        chunk_size: Slice size in bytes
+
+    Yields:
+        bytes-like slices
+    """
+    with engine.connect() as conn:
+        offset = 0
+        while offset < file_size:
+            query = select(func.substr(EphemerisFile.file_data, offset + 1, chunk_size)).where(
+                EphemerisFile.id == file_id
+            )
+            chunk = conn.execute(query).scalar()
+            if not chunk:
+                return
+            yield chunk
+            offset += len(chunk)
+
+
+def is_current(path: Path, stored: StoredEphemerisFile, chunk_size: int = DEFAULT_CHUNK_SIZE) -> bool:
+    """
+    Check whether a file on disk already has the stored size and hash.
+
+    Args:
+        path: File on disk
+        stored: Manifest entry
+        chunk_size: Read size for hashing
+
+    Returns:
+        True if the file can be kept
+    """
+    try:
+        if path.stat().st_size != stored.file_size:
+            return False
+    except FileNotFoundError:
+        return False
+    return sha256_file(path, chunk_size) == stored.sha256_hash
+
+
+def extract_file(
+    engine: Engine,
+    stored: StoredEphemerisFile,
+    output_dir: Path,
+    force: bool = False,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> ExtractionResult:
+    """
+    Stream one stored file to disk, verifying size and hash before the rename.
+
+    Args:
+        engine: SQLAlchemy engine
+        stored: Manifest entry
+        output_dir: Target directory
+        force: Extract even if the file on disk is current
+        chunk_size: Slice size in bytes
+
+    Returns:
+        ExtractionResult with status EXTRACTED or SKIPPED
+
+    Raises:
+        EphemerisIntegrityError: If the streamed data does not match the manifest
+        ValueError: If the stored filename is not a plain file name
+    """
+    if Path(stored.filename).name != stored.filename or stored.filename in ("", ".", ".."):
+        raise ValueError(f"Invalid ephemeris filename: {stored.filename!r}")
+
+    dest_path = output_dir / stored.filename
+    if not force and is_current(dest_path, stored, chunk_size):
+        return ExtractionResult(stored.filename, SKIPPED, stored.file_size)
+
+    sha256 = hashlib.sha256()
+    written = 0
+    fd, tmp_name = tempfile.mkstemp(prefix=f".{stored.filename}.", suffix=".tmp", dir=output_dir)
+    try:
+        with os.fdopen(fd, "wb") as f:
+            for chunk in iter_file_chunks(engine, stored.id, stored.file_size, chunk_size):
+                sha256.update(chunk)
+                f.write(chunk)
+                written += len(chunk)
+            f.flush()
+            os.fsync(f.fileno())
+
+        if written != stored.file_size:
+            raise EphemerisIntegrityError(
+                f"{stored.filename}: expected {stored.file_size} bytes, got {written}"
+            )
+        digest = sha256.hexdigest()
+        if digest != stored.sha256_hash:
+            raise EphemerisIntegrityError(
+                f"{stored.filename}: SHA256 mismatch (expected {stored.sha256_hash[:16]}..., got {digest[:16]}...)"
+            )
+
+        os.replace(tmp_name, dest_path)
+    except BaseException:
+        try:
+            os.unlink(tmp_name)
+        except FileNotFoundError:
+            pass
+        raise
+
+    return ExtractionResult(stored.filename, EXTRACTED, stored.file_size)
+
+
+def extract_ephemeris_files(
+    engine: Engine,
+    output_dir: str,
+    force: bool = False,
+    workers: int = DEFAULT_WORKERS,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    progress: Optional[Callable[[ExtractionResult], None]] = None,
+) -> Dict[str, object]:
+    """
+    Extract all stored ephemeris files concurrently.
+
+    A file that fails (database error, size or hash mismatch) is reported
+    and left untouched on disk; the other files are still extracted.
+
+    Args:
+        engine: SQLAlchemy engine (its pool should allow `workers` connections)
+        output_dir: Target directory (created if missing)
+        force: Re-extract files that are already current
+        workers: Concurrent extractions
+        chunk_size: Slice size in bytes
+        progress: Called with each ExtractionResult as it finishes
+
+    Returns:
+        Totals: files, extracted, skipped, failed, bytes (extracted) and results
+    """
+    output_path = Path(output_dir)
+    output_path.mkdir(parents=True, exist_ok=True)
+    manifest = list_stored_files(engine)
+
+    results: List[ExtractionResult] = []
+    with ThreadPoolExecutor(max_workers=max(1, workers), thread_name_prefix="ephemeris-extract") as pool:
+        futures = {
+            pool.submit(extract_file, engine, stored, output_path, force, chunk_size): stored
+            for stored in manifest
+        }
+        for future in as_completed(futures):
+            stored = futures[future]
+            try:
+                result = future.result()
+            except Exception as e:
+                result = ExtractionResult(stored.filename, FAILED, stored.file_size, f"{type(e).__name__}: {e}")
+            results.append(result)
+            if progress is not None:
+                progress(result)
+
+    return {
+        "files": len(manifest),
+        "extracted": sum(1 for result in results if result.status == EXTRACTED),
+        "skipped": sum(1 for result in results if result.status == SKIPPED),
+        "failed": sum(1 for result in results if result.status == FAILED),
+        "bytes": sum(result.file_size for result in results if result.status == EXTRACTED),
+        "results": results,
+    }
@@ -0,0 +1,147 @@
+"""
+Reference frame conversions for ephemeris vectors.
+
+Rotates ICRF (J2000 equatorial) vectors into the ecliptic and equinox of
+date, which is what chart longitudes are measured in. Precession uses the
+IAU 2006 (P03) ecliptic precession angles; nutation in longitude uses the
+largest terms of the IAU 1980 series (about 0.1" accuracy). Nutation only
+moves the equinox along the ecliptic, so it is applied as a longitude
+offset. All functions are vectorized over arrays of epochs.
+"""
+
+from typing import Tuple
+
+import numpy as np
+
+J2000 = 2451545.0
+DAYS_PER_CENTURY = 36525.0
+ARCSEC = np.pi / (180.0 * 3600.0)
+
+# Mean obliquity of the ecliptic at J2000 (IAU 2006), arcseconds
+OBLIQUITY_J2000 = 84381.406
+
+# IAU 1980 nutation in longitude: multipliers of (D, M, M', F, Omega),
+# constant and T coefficient in 0.0001"
+_NUTATION_TERMS = np.array([
+    (0, 0, 0, 0, 1, -171996.0, -174.2),
+    (-2, 0, 0, 2, 2, -13187.0, -1.6),
+    (0, 0, 0, 2, 2, -2274.0, -0.2),
+    (0, 0, 0, 0, 2, 2062.0, 0.2),
+    (0, 1, 0, 0, 0, 1426.0, -3.4),
+    (0, 0, 1, 0, 0, 712.0, 0.1),
+    (-2, 1, 0, 2, 2, -517.0, 1.2),
+    (0, 0, 0, 2, 1, -386.0, -0.4),
+    (0, 0, 1, 2, 2, -301.0, 0.0),
+    (-2, -1, 0, 2, 2, 217.0, -0.5),
+])
+
+
+def julian_centuries(jd_tt: np.ndarray) -> np.ndarray:
+    """Julian centuries of TT since J2000."""
+    return (np.asarray(jd_tt, dtype=float) - J2000) / DAYS_PER_CENTURY
+
+
+def _rot_x(angle: np.ndarray) -> np.ndarray:
+    """Frame rotations about x, shape (n, 3, 3)."""
+    c, s = np.cos(angle), np.sin(angle)
+    m = np.zeros(angle.shape + (3, 3))
+    m[..., 0, 0] = 1.0
+    m[..., 1, 1], m[..., 1, 2] = c, s
+    m[..., 2, 1], m[..., 2, 2] = -s, c
+    return m
+
+
+def _rot_z(angle: np.ndarray) -> np.ndarray:
+    """Frame rotations about z, shape (n, 3, 3)."""
+    c, s = np.cos(angle), np.sin(angle)
+    m = np.zeros(angle.shape + (3, 3))
+    m[..., 0, 0], m[..., 0, 1] = c, s
+    m[..., 1, 0], m[..., 1, 1] = -s, c
+    m[..., 2, 2] = 1.0
+    return m
+
+
+def ecliptic_of_date_matrices(t: np.ndarray) -> np.ndarray:
+    """
+    Rotations from the ICRF to the mean ecliptic and equinox of date.
+
+    Args:
+        t: Julian centuries TT since J2000, shape (n,)
+
+    Returns:
+        Rotation matrices, shape (n, 3, 3)
+    """
+    t = np.asarray(t, dtype=float)
+    # Inclination and node of the ecliptic of date on the J2000 ecliptic,
+    # and general precession in longitude (Capitaine et al. 2003)
+    pi_a = (46.998973 + (-0.0334926 + (-0.00012559 + (0.000000113 - 0.0000000022 * t) * t) * t) * t) * t
+    big_pi_a = 629546.7936 + (-867.95758 + (0.157992 + (-0.0005371 + (-0.00004797 + 0.000000072 * t) * t) * t) * t) * t
+    p_a = (5028.796195 + (1.1054348 + (0.00007964 + (-0.000023857 - 0.0000000383 * t) * t) * t) * t) * t
+
+    to_ecliptic = _rot_x(np.full(t.shape, OBLIQUITY_J2000 * ARCSEC))
+    precession = _rot_z(-(big_pi_a + p_a) * ARCSEC) @ _rot_x(pi_a * ARCSEC) @ _rot_z(big_pi_a * ARCSEC)
+    return precession @ to_ecliptic
+
+
+def nutation_in_longitude(t: np.ndarray) -> np.ndarray:
+    """
+    Nutation in longitude.
+
+    Args:
+        t: Julian centuries TT since J2000, shape (n,)
+
+    Returns:
+        Delta psi in degrees, shape (n,)
+    """
+    t = np.asarray(t, dtype=float)
+    arguments = np.radians(np.stack([
+        297.85036 + 445267.111480 * t,  # D: mean elongation of the Moon
+        357.52772 + 35999.050340 * t,   # M: mean anomaly of the Sun
+        134.96298 + 477198.867398 * t,  # M': mean anomaly of the Moon
+        93.27191 + 483202.017538 * t,   # F: Moon's argument of latitude
+        125.04452 - 1934.136261 * t,    # Omega: mean lunar node
+    ], axis=-1))
+    phases = arguments @ _NUTATION_TERMS[:, :5].T
+    amplitudes = _NUTATION_TERMS[:, 5] + _NUTATION_TERMS[:, 6] * t[..., None]
+    return (amplitudes * np.sin(phases)).sum(axis=-1) * 0.0001 / 3600.0
+
+
+def ecliptic_longitudes(vectors: np.ndarray, matrices: np.ndarray, nutation: np.ndarray) -> np.ndarray:
+    """
+    Ecliptic longitudes of date of ICRF vectors.
+
+    Args:
+        vectors: ICRF vectors, shape (n, 3)
+        matrices: ecliptic_of_date_matrices for the same epochs
+        nutation: nutation_in_longitude for the same epochs, degrees
+
+    Returns:
+        Longitudes in degrees (0-360), shape (n,)
+    """
+    ecliptic = np.einsum("nij,nj->ni", matrices, vectors)
+    return (np.degrees(np.arctan2(ecliptic[:, 1], ecliptic[:, 0])) + nutation) % 360.0
+
+
+def osculating_node_longitudes(
+    positions: np.ndarray, velocities: np.ndarray, matrices: np.ndarray, nutation: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Longitude of the ascending node of an orbit on the ecliptic of date.
+
+    The node of the instantaneous (osculating) orbit lies where the orbital
+    plane, normal to r x v, crosses the ecliptic. For the geocentric Moon
+    this is the true lunar node.
+
+    Args:
+        positions: ICRF position vectors, shape (n, 3)
+        velocities: ICRF velocity vectors, shape (n, 3)
+        matrices: ecliptic_of_date_matrices for the same epochs
+        nutation: nutation_in_longitude for the same epochs, degrees
+
+    Returns:
+        (ascending node longitudes in degrees 0-360, orbital inclinations in degrees)
+    """
+    momentum = np.einsum("nij,nj->ni", matrices, np.cross(positions, velocities))
+    node = (np.degrees(np.arctan2(momentum[:, 0], -momentum[:, 1])) + nutation) % 360.0
+    inclination = np.degrees(np.arctan2(np.hypot(momentum[:, 0], momentum[:, 1]), momentum[:, 2]))
+    return node, inclination
@@ -0,0 +1,268 @@
+"""
+Swiss Ephemeris initialization and readiness.
+
+swisseph silently falls back to the built-in Moshier theory when it cannot
+find its .se1 files, which is slower and less precise. The initializer
+applies EphemerisConfig.ephemeris_path once per process, checks that the
+planet and moon files for every year of the supported range are present,
+then warms the OS page cache (reading each file once) and swisseph's file
+buffers (probe positions inside each file's span, which must come back
+flagged as Swiss Ephemeris data). /ready reports its state.
+"""
+
+import math
+import threading
+import time
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+import swisseph as swe
+
+from src.models.ephemeris import EphemerisConfig
+
+# Planets (sepl) and Moon incl. lunar node (semo); asteroid files are not used
+FILE_PREFIXES = ("sepl", "semo")
+YEARS_PER_FILE = 600
+
+STATUS_PENDING = "pending"
+STATUS_INITIALIZING = "initializing"
+STATUS_READY = "ready"
+STATUS_FAILED = "failed"
+
+_applied_path: Optional[str] = None
+_path_lock = threading.Lock()
+
+
+def apply_ephemeris_path(path: str) -> None:
+    """
+    Point swisseph at a data directory (process-wide, applied once per path).
+
+    Args:
+        path: Directory containing .se1 files
+    """
+    global _applied_path
+    with _path_lock:
+        if _applied_path != path:
+            swe.set_ephe_path(path)
+            _applied_path = path
+
+
+def ensure_ephemeris_path() -> None:
+    """Apply the configured ephemeris path if this process has not applied one yet."""
+    if _applied_path is None:
+        from src.services.ephemeris import load_config
+
+        apply_ephemeris_path(load_config().ephemeris_path)
+
+
+def file_block(year: int) -> int:
+    """Index of the 600-year file block containing a year (negative before year 0)."""
+    return year // YEARS_PER_FILE
+
+
+def block_file_names(block: int) -> List[str]:
+    """
+    Get the file names covering a block, e.g. sepl_18.se1 for 1800-2399.
+
+    Args:
+        block: Block index from file_block()
+
+    Returns:
+        One file name per prefix
+    """
+    century = abs(block) * YEARS_PER_FILE // 100
+    suffix = f"_{century:02d}" if block >= 0 else f"m{century:02d}"
+    return [f"{prefix}{suffix}.se1" for prefix in FILE_PREFIXES]
+
+
+class EphemerisInitializer:
+    """Applies, checks and warms the Swiss Ephemeris data files for one process."""
+
+    def __init__(self, ephemeris_path: str, start_year: int, end_year: int):
+        """
+        Initialize the initializer.
+
+        Args:
+            ephemeris_path: Directory containing .se1 files
+            start_year: First supported year
+            end_year: Last supported year
+        """
+        if end_year < start_year:
+            raise ValueError(f"Invalid supported range: {start_year}-{end_year}")
+
+        self.ephemeris_path = ephemeris_path
+        self.start_year = start_year
+        self.end_year = end_year
+
+        self._lock = threading.Lock()
+        self._status = STATUS_PENDING
+        self._missing: List[str] = []
+        self._warmed_bytes = 0
+        self._probes = 0
+        self._seconds = 0.0
+        self._error: Optional[str] = None
+
+    @classmethod
+    def from_config(cls, config: Optional[EphemerisConfig] = None) -> "EphemerisInitializer":
+        """
+        Create initializer from environment configuration.
+
+        Args:
+            config: Optional explicit configuration (loaded from env if omitted)
+
+        Returns:
+            EphemerisInitializer instance
+        """
+        config = config or EphemerisConfig()
+        return cls(
+            ephemeris_path=config.ephemeris_path,
+            start_year=config.supported_start_year,
+            end_year=config.supported_end_year,
+        )
+
+    def blocks(self) -> List[Tuple[int, int, int]]:
+        """
+        Get the file blocks needed for the supported range.
+
+        Returns:
+            (block, first year, last year) per block, clipped to the supported range
+        """
+        result = []
+        for block in range(file_block(self.start_year), file_block(self.end_year) + 1):
+            first = max(self.start_year, block * YEARS_PER_FILE)
+            last = min(self.end_year, (block + 1) * YEARS_PER_FILE - 1)
+            result.append((block, first, last))
+        return result
+
+    def required_files(self) -> List[str]:
+        """File names that must exist for the supported range."""
+        return [name for block, _, _ in self.blocks() for name in block_file_names(block)]
+
+    def missing_files(self) -> List[str]:
+        """Required files that are not present in the ephemeris directory."""
+        directory = Path(self.ephemeris_path)
+        return [name for name in self.required_files() if not (directory / name).is_file()]
+
+    def _warm_page_cache(self) -> int:
+        """Read every required file once so later swisseph reads hit the page cache."""
+        total = 0
+        directory = Path(self.ephemeris_path)
+        for name in self.required_files():
+            with open(directory / name, "rb") as f:
+                for chunk in iter(lambda: f.read(1024 * 1024), b""):
+                    total += len(chunk)
+        return total
+
+    def _probe(self) -> int:
+        """
+        Calculate every body at the start, middle and end of each block.
+
+        Returns:
+            Number of positions calculated
+
+        Raises:
+            RuntimeError: If a position was not calculated from the data files
+        """
+        from src.services.ephemeris.swiss_ephemeris import SwissEphemerisSource
+
+        flags = swe.FLG_SWIEPH | swe.FLG_SPEED
+        probes = 0
+        for block, first, last in self.blocks():
+            for year in sorted({first, (first + last) // 2, last}):
+                jd = swe.julday(year, 7, 1, 12.0)
+                for body, swe_body in SwissEphemerisSource.BODY_MAP.items():
+                    position, retflags = swe.calc_ut(jd, swe_body, flags)
+                    if not retflags & swe.FLG_SWIEPH or not math.isfinite(position[0]):
+                        raise RuntimeError(
+                            f"{body.value} in {year} was not calculated from {', '.join(block_file_names(block))} "
+                            f"(swisseph fell back to Moshier)"
+                        )
+                    probes += 1
+        return probes
+
+    def initialize(self) -> bool:
+        """
+        Apply the path, check coverage and warm the files.
+
+        Safe to call again (e.g. after files were extracted); a ready
+        initializer returns immediately.
+
+        Returns:
+            True if the ephemeris is ready
+        """
+        with self._lock:
+            if self._status in (STATUS_READY, STATUS_INITIALIZING):
+                return self._status == STATUS_READY
+            self._status = STATUS_INITIALIZING
+            self._error = None
+
+        started = time.perf_counter()
+        missing: List[str] = []
+        warmed_bytes = 0
+        probes = 0
+        error = None
+        try:
+            apply_ephemeris_path(self.ephemeris_path)
+            missing = self.missing_files()
+            if missing:
+                raise FileNotFoundError(
+                    f"Missing ephemeris files for {self.start_year}-{self.end_year} "
+                    f"in {self.ephemeris_path}: {', '.join(missing)}"
+                )
+            warmed_bytes = self._warm_page_cache()
+            probes = self._probe()
+        except Exception as e:
+            error = f"{type(e).__name__}: {e}"
+            print(f"Ephemeris initialization failed: {error}")
+
+        with self._lock:
+            self._missing = missing
+            self._warmed_bytes = warmed_bytes
+            self._probes = probes
+            self._seconds = time.perf_counter() - started
+            self._error = error
+            self._status = STATUS_FAILED if error else STATUS_READY
+            return self._status == STATUS_READY
+
+    @property
+    def ready(self) -> bool:
+        """True once the ephemeris files are applied, complete and warm."""
+        return self._status == STATUS_READY
+
+    def status(self) -> Dict[str, object]:
+        """
+        Get the initialization state.
+
+        Returns:
+            Dict with status, path, supported range, missing files and warm-up counters
+        """
+        with self._lock:
+            return {
+                "status": self._status,
+                "ephemeris_path": self.ephemeris_path,
+                "supported_range": [self.start_year, self.end_year],
+                "required_files": self.required_files(),
+                "missing_files": list(self._missing),
+                "warmed_bytes": self._warmed_bytes,
+                "probes": self._probes,
+                "seconds": round(self._seconds, 3),
+                "error": self._error,
+            }
+
+
+_initializer: Optional[EphemerisInitializer] = None
+_initializer_lock = threading.Lock()
+
+
+def get_ephemeris_initializer() -> EphemerisInitializer:
+    """
+    Get the process-wide ephemeris initializer, creating it on first use.
+
+    Returns:
+        Shared EphemerisInitializer instance
+    """
+    global _initializer
+    with _initializer_lock:
+        if _initializer is None:
+            _initializer = EphemerisInitializer.from_config()
+        return _initializer
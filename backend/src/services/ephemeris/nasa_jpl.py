@@ -1,35 +1,271 @@
 """
-NASA JPL Horizons API client for ephemeris calculations.
+Local NASA JPL ephemeris source reading DE kernels.
 
-TODO: Integrate with NASA Horizons API for alternative ephemeris calculations.
-TODO: Add authentication and request handling for JPL Horizons API.
-TODO: Implement position calculation from API response parsing.
+Positions come from a JPL Development Ephemeris kernel (SPK/.bsp, e.g.
+de440s.bsp) that is memory-mapped by SPKKernel; no network is involved.
+Longitudes are apparent geocentric positions in the ecliptic and true
+equinox of date, matching Swiss Ephemeris' default output: light-time
+corrected, with annual aberration, precession and nutation applied. The
+North Node is the osculating (true) node of the geocentric lunar orbit.
+Every step is vectorized, so many Julian days can be evaluated at once.
 """
 
-from src.services.ephemeris.base import EphemerisSource
+import os
+import threading
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+
 from src.models.celestial import CelestialBody
+from src.models.ephemeris import EphemerisConfig
+from src.models.error import ERROR_CALCULATION_FAILED, ERROR_EPHEMERIS_UNAVAILABLE
+from src.services.ephemeris.base import EphemerisSource, expand_positions, physical_bodies
+from src.services.ephemeris.frames import (
+    ecliptic_longitudes,
+    ecliptic_of_date_matrices,
+    julian_centuries,
+    nutation_in_longitude,
+    osculating_node_longitudes,
+)
+from src.services.ephemeris.spk import (
+    EARTH,
+    J2000,
+    MOON,
+    SECONDS_PER_DAY,
+    SOLAR_SYSTEM_BARYCENTER,
+    SUN,
+    SPKError,
+    SPKKernel,
+)
+
+# Speed of light in km/s
+LIGHT_SPEED = 299792.458
+
+# Light-time iterations; a third would move positions by under 0.01"
+LIGHT_TIME_ITERATIONS = 2
 
 
 class NASAJPLSource(EphemerisSource):
     """
-    NASA JPL Horizons API ephemeris source.
-
-    TODO: This is a placeholder for future NASA Horizons API integration.
-    TODO: Will provide alternative high-precision ephemeris calculations.
+    JPL DE kernel ephemeris source.
     """
 
-    def __init__(self):
+    # NAIF codes per body, most precise first: planet centers when the
+    # kernel has them, otherwise the planet system barycenters (DE kernels
+    # carry barycenters for Mars through Pluto)
+    BODY_TARGETS: Dict[CelestialBody, tuple] = {
+        CelestialBody.SUN: (SUN,),
+        CelestialBody.MOON: (MOON,),
+        CelestialBody.MERCURY: (199, 1),
+        CelestialBody.VENUS: (299, 2),
+        CelestialBody.MARS: (499, 4),
+        CelestialBody.JUPITER: (599, 5),
+        CelestialBody.SATURN: (699, 6),
+        CelestialBody.URANUS: (799, 7),
+        CelestialBody.NEPTUNE: (899, 8),
+        CelestialBody.PLUTO: (999, 9),
+    }
+
+    def __init__(
+        self,
+        kernel_path: Optional[str] = None,
+        start_year: Optional[int] = None,
+        end_year: Optional[int] = None,
+    ):
         """
         Initialize NASA JPL source.
 
-        TODO: Add API endpoint configuration.
-        TODO: Add authentication credentials setup.
+        Args:
+            kernel_path: Path to a JPL DE .bsp kernel (opened on first use)
+            start_year: First supported birth year the kernel must cover, design dates
+                included (coverage is not checked unless both years are given)
+            end_year: Last supported birth year the kernel must cover
+        """
+        self.kernel_path = kernel_path
+        self.start_year = start_year
+        self.end_year = end_year
+        self._kernel: Optional[SPKKernel] = None
+        self._targets: Dict[CelestialBody, int] = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_config(cls, config: Optional[EphemerisConfig] = None) -> "NASAJPLSource":
+        """
+        Create source from environment configuration.
+
+        Args:
+            config: Optional explicit configuration (loaded from env if omitted)
+
+        Returns:
+            NASAJPLSource instance
+        """
+        config = config or EphemerisConfig()
+        return cls(
+            kernel_path=config.jpl_kernel_path,
+            start_year=config.supported_start_year,
+            end_year=config.supported_end_year,
+        )
+
+    def _get_kernel(self) -> SPKKernel:
+        """
+        Map the kernel on first use and resolve the NAIF code of every body.
+
+        Raises:
+            RuntimeError: If no kernel is configured or it lacks a required body
+        """
+        with self._lock:
+            if self._kernel is not None:
+                return self._kernel
+            if not self.kernel_path:
+                raise RuntimeError(f"{ERROR_EPHEMERIS_UNAVAILABLE}: EPHEMERIS_JPL_KERNEL_PATH is not set")
+            if not os.path.isfile(self.kernel_path):
+                raise RuntimeError(f"{ERROR_EPHEMERIS_UNAVAILABLE}: JPL kernel not found: {self.kernel_path}")
+
+            try:
+                kernel = SPKKernel(self.kernel_path)
+            except (OSError, SPKError) as e:
+                raise RuntimeError(f"{ERROR_EPHEMERIS_UNAVAILABLE}: cannot read JPL kernel: {e}")
+
+            available = set(kernel.targets)
+            targets = {}
+            for body, candidates in self.BODY_TARGETS.items():
+                found = [code for code in candidates if code in available]
+                if not found:
+                    kernel.close()
+                    raise RuntimeError(
+                        f"{ERROR_EPHEMERIS_UNAVAILABLE}: JPL kernel has no segment for {body.value}"
+                    )
+                targets[body] = found[0]
+            if EARTH not in available:
+                kernel.close()
+                raise RuntimeError(f"{ERROR_EPHEMERIS_UNAVAILABLE}: JPL kernel has no segment for Earth")
+
+            try:
+                self._check_coverage(kernel, [EARTH, *targets.values()])
+            except (RuntimeError, SPKError):
+                kernel.close()
+                raise
+
+            self._kernel, self._targets = kernel, targets
+            return kernel
+
+    def _check_coverage(self, kernel: SPKKernel, targets: Sequence[int]) -> None:
+        """
+        Check that the bodies and their center chains cover the supported years.
+
+        The range starts DESIGN_MARGIN_DAYS before January 1 of start_year so
+        design dates of the earliest births are included (de440s.bsp, which
+        starts 1849-12-26, does not cover 1850 births).
+
+        Raises:
+            RuntimeError: If a body's segments start too late or end too early
+        """
+        if self.start_year is None or self.end_year is None:
+            return
+
+        import swisseph as swe
+
+        from src.services.calculation.design_time import DESIGN_MARGIN_DAYS
+
+        first_jd = swe.julday(self.start_year, 1, 1, 0.0) - DESIGN_MARGIN_DAYS
+        last_jd = swe.julday(self.end_year + 1, 1, 1, 0.0)
+        codes = set()
+        for target in targets:
+            while target != SOLAR_SYSTEM_BARYCENTER and target not in codes:
+                codes.add(target)
+                target = kernel.center_of(target)
+
+        for code in sorted(codes):
+            start, end = (second / SECONDS_PER_DAY + J2000 for second in kernel.coverage(code))
+            if start > first_jd or end < last_jd:
+                raise RuntimeError(
+                    f"{ERROR_EPHEMERIS_UNAVAILABLE}: JPL kernel covers body {code} from JD {start:.1f} "
+                    f"to {end:.1f}, but supported years {self.start_year}-{self.end_year} need "
+                    f"{first_jd:.1f} to {last_jd:.1f}"
+                )
+
+    @staticmethod
+    def delta_t(julian_days_ut: np.ndarray) -> np.ndarray:
+        """
+        Delta T (TT - UT) in days.
+
+        Uses swisseph's Delta T model so both sources share the same time
+        scale; TDB - TT (under 2 ms) is neglected.
+        """
+        import swisseph as swe
+
+        return np.fromiter((swe.deltat(jd) for jd in julian_days_ut), dtype=float, count=len(julian_days_ut))
+
+    def calculate_longitudes(
+        self, bodies: Sequence[CelestialBody], julian_days: Sequence[float]
+    ) -> np.ndarray:
         """
-        pass
+        Calculate apparent ecliptic longitudes of date, vectorized over Julian days.
+
+        Args:
+            bodies: Celestial bodies (Earth and South Node are derived)
+            julian_days: Julian Day numbers (UT)
+
+        Returns:
+            Longitudes in degrees (0-360), shape (len(bodies), len(julian_days))
+
+        Raises:
+            RuntimeError: If the kernel is unavailable or does not cover an epoch
+        """
+        kernel = self._get_kernel()
+        jd_ut = np.atleast_1d(np.asarray(julian_days, dtype=float))
+        physical = physical_bodies(bodies)
+        unknown = [body for body in physical if body not in self.BODY_TARGETS and body != CelestialBody.NORTH_NODE]
+        if unknown:
+            raise ValueError(f"Unknown celestial body: {unknown[0]}")
+
+        jd_tt = jd_ut + self.delta_t(jd_ut)
+        seconds = (jd_tt - J2000) * SECONDS_PER_DAY
+        t = julian_centuries(jd_tt)
+        matrices = ecliptic_of_date_matrices(t)
+        nutation = nutation_in_longitude(t)
+
+        try:
+            earth_position, earth_velocity = kernel.barycentric_state(EARTH, seconds)
+            assert earth_velocity is not None
+            computed: Dict[CelestialBody, np.ndarray] = {}
+            for body in physical:
+                if body == CelestialBody.NORTH_NODE:
+                    moon_position, moon_velocity = kernel.barycentric_state(MOON, seconds)
+                    assert moon_velocity is not None
+                    computed[body], _ = osculating_node_longitudes(
+                        moon_position - earth_position, moon_velocity - earth_velocity, matrices, nutation
+                    )
+                    continue
+
+                target = self._targets[body]
+                light_time = np.zeros(len(seconds))
+                for _ in range(LIGHT_TIME_ITERATIONS):
+                    position, _ = kernel.barycentric_state(target, seconds - light_time, velocity=False)
+                    geocentric = position - earth_position
+                    distance = np.sqrt(np.einsum("ni,ni->n", geocentric, geocentric))
+                    light_time = distance / LIGHT_SPEED
+
+                # Annual aberration (first order in v/c)
+                direction = geocentric / distance[:, None]
+                apparent = direction + earth_velocity / LIGHT_SPEED
+                computed[body] = ecliptic_longitudes(apparent, matrices, nutation)
+        except SPKError as e:
+            raise RuntimeError(f"{ERROR_CALCULATION_FAILED}: {e}")
+
+        longitudes = np.empty((len(bodies), len(jd_ut)))
+        for i, body in enumerate(bodies):
+            if body == CelestialBody.EARTH:
+                longitudes[i] = (computed[CelestialBody.SUN] + 180.0) % 360.0
+            elif body == CelestialBody.SOUTH_NODE:
+                longitudes[i] = (computed[CelestialBody.NORTH_NODE] + 180.0) % 360.0
+            else:
+                longitudes[i] = computed[body]
+        return longitudes
 
     def calculate_position(self, body: CelestialBody, julian_day: float) -> float:
         """
-        Calculate ecliptic longitude using NASA JPL Horizons API.
+        Calculate ecliptic longitude from the JPL kernel.
 
         Args:
             body: Celestial body to calculate
@@ -37,14 +273,25 @@ class NASAJPLSource(EphemerisSource):
 
         Returns:
             Ecliptic longitude in degrees (0-360)
+        """
+        return self.calculate_positions([body], julian_day)[0]
 
-        Raises:
-            NotImplementedError: NASA JPL integration not yet implemented
+    def calculate_positions(
+        self, bodies: Sequence[CelestialBody], julian_day: float
+    ) -> List[float]:
         """
-        raise NotImplementedError(
-            "NASA JPL Horizons API integration is not yet implemented. "
-            "Use SwissEphemerisSource for ephemeris calculations."
-        )
+        Calculate ecliptic longitudes of several bodies in one vectorized pass.
+
+        Args:
+            bodies: Celestial bodies to calculate
+            julian_day: Julian Day number
+
+        Returns:
+            Ecliptic longitudes in degrees (0-360), in the order of bodies
+        """
+        physical = physical_bodies(bodies)
+        longitudes = self.calculate_longitudes(physical, [julian_day])[:, 0].tolist()
+        return expand_positions(bodies, dict(zip(physical, longitudes)))
 
     def get_source_name(self) -> str:
         """Return source identifier."""
@@ -52,9 +299,21 @@ class NASAJPLSource(EphemerisSource):
 
     def is_available(self) -> bool:
         """
-        Check if NASA JPL source is available.
+        Check if a usable JPL kernel is configured.
 
         Returns:
-            False - NASA JPL integration not yet implemented
+            True if the kernel opens, has a segment for every body and covers
+            the supported years
         """
-        return False
+        try:
+            self._get_kernel()
+            return True
+        except Exception:
+            return False
+
+    def close(self) -> None:
+        """Unmap the kernel; it is mapped again on next use."""
+        with self._lock:
+            kernel, self._kernel = self._kernel, None
+        if kernel is not None:
+            kernel.close()
@@ -3,15 +3,31 @@ OpenAstro API implementation.
 
 Alternative ephemeris source using the OpenAstro API.
 Provides a fallback option for ephemeris calculations when local files are unavailable.
-This is a stub implementation for future API integration.
+
+All bodies of one moment are fetched with a single request:
+
+    GET {api_url}/positions?jd=2451545.0&bodies=0,1,2
+    -> {"jd": 2451545.0, "positions": {"0": 280.37, "1": 223.32, "2": 271.89}}
+
+Requests share one pooled (HTTP/2 when h2 is installed) client, are retried
+with jittered exponential backoff on connection errors, 429 and 5xx, and go
+through a circuit breaker that fails fast while the upstream is down.
 """
 
-from typing import Optional
+import random
+import threading
+import time
+from typing import Callable, Dict, List, Optional, Sequence
+
 import httpx
-from src.services.ephemeris.base import EphemerisSource
+
 from src.models.celestial import CelestialBody
+from src.models.ephemeris import OpenAstroConfig
 from src.models.error import ERROR_EPHEMERIS_UNAVAILABLE, ERROR_CALCULATION_FAILED
+from src.services.ephemeris.base import EphemerisSource, physical_bodies, expand_positions
+from src.services.ephemeris.circuit_breaker import CircuitBreaker
 
+DEFAULT_API_URL = "https://api.openastro.org/v1"
 
 # Mapping of CelestialBody enum to OpenAstro API body identifiers
 BODY_TO_OPENASTRO = {
@@ -29,6 +45,18 @@ BODY_TO_OPENASTRO = {
     CelestialBody.SOUTH_NODE: 10,  # Calculated as North Node + 180°
 }
 
+# Responses worth retrying; other 4xx are answered the same way again
+RETRY_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+
+
+def _h2_installed() -> bool:
+    """Check for the optional h2 package httpx needs for HTTP/2."""
+    try:
+        import h2  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
 
 class OpenAstroAPISource(EphemerisSource):
     """
@@ -40,9 +68,16 @@ class OpenAstroAPISource(EphemerisSource):
 
     def __init__(
         self,
-        api_url: str = "https://api.openastro.org/v1",
-        timeout: int = 10,
+        api_url: str = DEFAULT_API_URL,
+        timeout: float = 10,
         max_retries: int = 3,
+        backoff_base: float = 0.2,
+        backoff_max: float = 2.0,
+        breaker: Optional[CircuitBreaker] = None,
+        max_connections: int = 20,
+        http2: bool = True,
+        sleep: Callable[[float], None] = time.sleep,
+        rng: Optional[random.Random] = None,
     ):
         """
         Initialize OpenAstro API source.
@@ -51,22 +86,80 @@ class OpenAstroAPISource(EphemerisSource):
             api_url: Base URL for OpenAstro API
             timeout: Request timeout in seconds
             max_retries: Maximum number of retry attempts for failed requests
+            backoff_base: Backoff before the first retry in seconds (doubled per retry)
+            backoff_max: Upper bound of a single backoff in seconds
+            breaker: Circuit breaker (a default one is created if omitted)
+            max_connections: Connection pool size
+            http2: Use HTTP/2 if the h2 package is installed
+            sleep: Sleep function used between retries (injectable for tests)
+            rng: Random generator for backoff jitter
         """
-        self.api_url = api_url
+        self.api_url = api_url.rstrip("/")
         self.timeout = timeout
         self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.breaker = breaker or CircuitBreaker()
+        self.max_connections = max_connections
+        self.http2 = http2 and _h2_installed()
+        self._sleep = sleep
+        self._rng = rng or random.Random()
         self._client: Optional[httpx.Client] = None
+        self._client_lock = threading.Lock()
+        self._requests = 0
+        self._retries = 0
+
+    @classmethod
+    def from_config(
+        cls, config: Optional[OpenAstroConfig] = None, api_url: Optional[str] = None
+    ) -> "OpenAstroAPISource":
+        """
+        Create source from environment configuration.
+
+        Args:
+            config: Optional explicit configuration (loaded from env if omitted)
+            api_url: API base URL (EphemerisConfig.openastro_api_url); default URL if omitted
+
+        Returns:
+            OpenAstroAPISource instance
+        """
+        config = config or OpenAstroConfig()
+        return cls(
+            api_url=api_url or DEFAULT_API_URL,
+            timeout=config.timeout_seconds,
+            max_retries=config.max_retries,
+            backoff_base=config.backoff_base_seconds,
+            backoff_max=config.backoff_max_seconds,
+            breaker=CircuitBreaker(
+                failure_threshold=config.breaker_failure_threshold,
+                reset_timeout=config.breaker_reset_seconds,
+            ),
+            max_connections=config.max_connections,
+            http2=config.http2,
+        )
 
     def _get_client(self) -> httpx.Client:
         """
-        Get or create HTTP client instance.
+        Get or create the pooled HTTP client shared by all requests of this source.
 
         Returns:
             httpx.Client configured for API requests
         """
-        if self._client is None:
-            self._client = httpx.Client(timeout=self.timeout)
-        return self._client
+        with self._client_lock:
+            if self._client is None:
+                self._client = httpx.Client(
+                    timeout=self.timeout,
+                    http2=self.http2,
+                    limits=httpx.Limits(
+                        max_connections=self.max_connections,
+                        max_keepalive_connections=self.max_connections,
+                    ),
+                )
+            return self._client
+
+    def _backoff(self, retry: int) -> float:
+        """Full-jitter exponential backoff before the given retry (1-based)."""
+        return self._rng.uniform(0.0, min(self.backoff_max, self.backoff_base * 2 ** (retry - 1)))
 
     def calculate_position(self, body: CelestialBody, julian_day: float) -> float:
         """
@@ -82,44 +175,128 @@ class OpenAstroAPISource(EphemerisSource):
         Raises:
             RuntimeError: If calculation fails or API unavailable
         """
-        if not self.is_available():
+        return self.calculate_positions([body], julian_day)[0]
+
+    def calculate_positions(
+        self, bodies: Sequence[CelestialBody], julian_day: float
+    ) -> List[float]:
+        """
+        Calculate ecliptic longitudes for several bodies with one API request.
+
+        Earth and South Node are derived locally. Availability is not probed
+        here: the source registry caches it, and a failing request reports
+        the API as unavailable.
+
+        Args:
+            bodies: Celestial bodies to calculate
+            julian_day: Julian Day Number
+
+        Returns:
+            Ecliptic longitudes in degrees (0-360), in the order of bodies
+
+        Raises:
+            RuntimeError: If calculation fails or API unavailable
+        """
+        physical = physical_bodies(bodies)
+        unknown = [body for body in physical if body not in BODY_TO_OPENASTRO]
+        if unknown:
+            raise ValueError(f"Unknown celestial body: {unknown[0]}")
+
+        body_ids = [BODY_TO_OPENASTRO[body] for body in physical]
+        longitudes = self._fetch_positions(body_ids, julian_day)
+        return expand_positions(
+            bodies, {body: longitudes[body_id] for body, body_id in zip(physical, body_ids)}
+        )
+
+    def _send(self, params: Dict[str, str]) -> httpx.Response:
+        """
+        Send one positions request, retrying transient failures.
+
+        Args:
+            params: Query parameters
+
+        Returns:
+            Final response (may be a non-retryable 4xx)
+
+        Raises:
+            RuntimeError: If the circuit is open or all attempts failed
+        """
+        if not self.breaker.allow():
             raise RuntimeError(
-                f"{ERROR_EPHEMERIS_UNAVAILABLE}: OpenAstro API is not available"
+                f"{ERROR_EPHEMERIS_UNAVAILABLE}: OpenAstro API circuit is open"
             )
 
         try:
-            body_id = BODY_TO_OPENASTRO[body]
+            response = self._send_with_retries(params)
+        except BaseException:
+            # Any exit without an answer counts, so a half-open trial never stays in flight
+            self.breaker.record_failure()
+            raise
+        # The upstream answered; client errors do not count against the circuit
+        self.breaker.record_success()
+        return response
 
-            # Construct API request
-            endpoint = f"{self.api_url}/position"
-            params = {"body": body_id, "jd": julian_day}
+    def _send_with_retries(self, params: Dict[str, str]) -> httpx.Response:
+        """
+        Send one positions request, retrying transient failures.
 
-            # Make request with retries
-            client = self._get_client()
-            response = client.get(endpoint, params=params)
-            response.raise_for_status()
+        Args:
+            params: Query parameters
+
+        Returns:
+            First non-retryable response
 
-            # Parse response
-            data = response.json()
-            longitude = float(data.get("longitude", 0.0))
+        Raises:
+            RuntimeError: If all attempts failed
+        """
+        client = self._get_client()
+        last_error = ""
+        for attempt in range(self.max_retries + 1):
+            if attempt:
+                self._retries += 1
+                self._sleep(self._backoff(attempt))
+            self._requests += 1
+            try:
+                response = client.get(f"{self.api_url}/positions", params=params)
+            except httpx.TransportError as e:
+                last_error = f"{type(e).__name__}: {e}"
+                continue
+            if response.status_code in RETRY_STATUS_CODES:
+                last_error = f"HTTP {response.status_code}"
+                continue
+            return response
 
-            # Handle South Node (opposite of North Node)
-            if body == CelestialBody.SOUTH_NODE:
-                longitude = (longitude + 180.0) % 360.0
+        raise RuntimeError(
+            f"{ERROR_EPHEMERIS_UNAVAILABLE}: OpenAstro API is not available "
+            f"after {self.max_retries + 1} attempts ({last_error})"
+        )
 
-            return longitude
+    def _fetch_positions(self, body_ids: Sequence[int], julian_day: float) -> Dict[int, float]:
+        """
+        Request the positions of several bodies at one moment.
 
-        except httpx.HTTPError as e:
+        Args:
+            body_ids: OpenAstro body identifiers
+            julian_day: Julian Day Number
+
+        Returns:
+            Body identifier to ecliptic longitude in degrees (0-360)
+
+        Raises:
+            RuntimeError: If the request or response parsing fails
+        """
+        response = self._send({"jd": repr(julian_day), "bodies": ",".join(str(i) for i in body_ids)})
+        if response.is_error:
             raise RuntimeError(
-                f"{ERROR_CALCULATION_FAILED}: OpenAstro API request failed: {str(e)}"
+                f"{ERROR_CALCULATION_FAILED}: OpenAstro API request failed: HTTP {response.status_code}"
             )
+
+        try:
+            positions = response.json()["positions"]
+            return {body_id: float(positions[str(body_id)]) % 360.0 for body_id in body_ids}
         except (KeyError, ValueError, TypeError) as e:
             raise RuntimeError(
-                f"{ERROR_CALCULATION_FAILED}: OpenAstro API response parsing failed for {body.value}: {str(e)}"
-            )
-        except Exception as e:
-            raise RuntimeError(
-                f"{ERROR_CALCULATION_FAILED}: OpenAstro API calculation failed for {body.value}: {str(e)}"
+                f"{ERROR_CALCULATION_FAILED}: OpenAstro API response parsing failed: {type(e).__name__}: {e}"
             )
 
     def get_source_name(self) -> str:
@@ -130,19 +307,39 @@ class OpenAstroAPISource(EphemerisSource):
         """
         Check if OpenAstro API is available and reachable.
 
-        Performs a simple health check by attempting to reach the API.
+        Returns False without a request while the circuit is open or a
+        half-open trial request is still in flight; otherwise performs a
+        simple health check by attempting to reach the API.
 
         Returns:
             True if API is reachable, False otherwise
         """
+        if not self.breaker.can_attempt():
+            return False
         try:
             client = self._get_client()
             response = client.head(self.api_url, timeout=5.0)
             return response.status_code < 500
-        except (httpx.RequestError, httpx.TimeoutException, Exception):
+        except Exception:
             return False
 
-    def __del__(self):
-        """Clean up HTTP client on deletion."""
-        if self._client is not None:
-            self._client.close()
+    def stats(self) -> dict:
+        """
+        Get request counters.
+
+        Returns:
+            Dict with HTTP version, request and retry counts and breaker state
+        """
+        return {
+            "http2": self.http2,
+            "requests": self._requests,
+            "retries": self._retries,
+            "breaker": self.breaker.stats(),
+        }
+
+    def close(self) -> None:
+        """Close the pooled HTTP client (a later request opens a new one)."""
+        with self._client_lock:
+            client, self._client = self._client, None
+        if client is not None:
+            client.close()
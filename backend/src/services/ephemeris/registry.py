@@ -0,0 +1,256 @@
+"""
+Process-wide ephemeris source registry.
+
+Sources are built once per process from EphemerisConfig and shared by all
+requests. When EPHEMERIS_FAILOVER lists further sources, the default source
+is a CompositeEphemerisSource over `source` followed by those sources.
+is_available() results are cached for a TTL and, once the application has
+started the registry, refreshed by a background thread so request paths never
+wait for a health probe. shutdown() closes pooled clients explicitly instead
+of relying on __del__.
+"""
+
+import threading
+import time
+from typing import Callable, Dict, Optional, Tuple
+
+from src.models.ephemeris import EphemerisConfig
+from src.services.ephemeris.base import EphemerisSource
+
+# Older callers pass the short name
+SOURCE_ALIASES = {"swiss": "swiss_ephemeris"}
+
+# Registry name of the failover chain built from EPHEMERIS_FAILOVER
+FAILOVER_SOURCE = "failover"
+
+
+def _build_swiss_ephemeris(config: EphemerisConfig) -> EphemerisSource:
+    from src.services.ephemeris.swiss_ephemeris import SwissEphemerisSource
+
+    return SwissEphemerisSource()
+
+
+def _build_openastro_api(config: EphemerisConfig) -> EphemerisSource:
+    from src.services.ephemeris.openastro_api import OpenAstroAPISource
+
+    return OpenAstroAPISource.from_config(api_url=config.openastro_api_url)
+
+
+def _build_nasa_jpl(config: EphemerisConfig) -> EphemerisSource:
+    from src.services.ephemeris.nasa_jpl import NASAJPLSource
+
+    return NASAJPLSource.from_config(config)
+
+
+def _build_chebyshev(config: EphemerisConfig) -> EphemerisSource:
+    from src.services.ephemeris.chebyshev import ChebyshevEphemerisSource
+
+    return ChebyshevEphemerisSource.from_config(config)
+
+
+SOURCE_BUILDERS: Dict[str, Callable[[EphemerisConfig], EphemerisSource]] = {
+    "swiss_ephemeris": _build_swiss_ephemeris,
+    "openastro_api": _build_openastro_api,
+    "nasa_jpl": _build_nasa_jpl,
+    "chebyshev": _build_chebyshev,
+}
+
+
+class EphemerisSourceRegistry:
+    """Builds each ephemeris source once and caches its availability."""
+
+    def __init__(
+        self,
+        config: Optional[EphemerisConfig] = None,
+        builders: Optional[Dict[str, Callable[[EphemerisConfig], EphemerisSource]]] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Initialize registry.
+
+        Args:
+            config: Ephemeris configuration (loaded from env if omitted)
+            builders: Source name to factory function
+            clock: Monotonic time function (injectable for tests)
+        """
+        self.config = config or EphemerisConfig()
+        self.builders = builders or SOURCE_BUILDERS
+        self.chain = list(dict.fromkeys([self.config.source, *self.config.failover]))
+        self.default_source = FAILOVER_SOURCE if len(self.chain) > 1 else self.config.source
+        self.availability_ttl = self.config.availability_ttl_seconds
+        self.refresh_interval = self.config.availability_refresh_seconds
+        self._clock = clock
+
+        self._sources: Dict[str, EphemerisSource] = {}
+        self._availability: Dict[str, Tuple[bool, float]] = {}
+        self._lock = threading.RLock()
+        self._checks = 0
+        self._refresher: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+
+    def _resolve(self, name: Optional[str]) -> str:
+        """Map None and aliases to a registered source name."""
+        name = SOURCE_ALIASES.get(name, name) if name else self.default_source
+        if name not in self.builders and name != self.default_source:
+            raise ValueError(f"Unknown ephemeris source type: {name}")
+        return name
+
+    def get(self, name: Optional[str] = None) -> EphemerisSource:
+        """
+        Get a source, building it on first use.
+
+        Args:
+            name: Source name or alias (configured source if omitted)
+
+        Returns:
+            Shared EphemerisSource instance
+
+        Raises:
+            ValueError: If the source name is unknown
+        """
+        name = self._resolve(name)
+        source = self._sources.get(name)
+        if source is None:
+            with self._lock:
+                source = self._sources.get(name)
+                if source is None:
+                    if name == FAILOVER_SOURCE:
+                        source = self._build_failover()
+                    else:
+                        source = self.builders[name](self.config)
+                    self._sources[name] = source
+        return source
+
+    def _build_failover(self) -> EphemerisSource:
+        """Build the composite over the configured chain (called with the lock held)."""
+        from src.services.ephemeris.composite import CompositeEphemerisSource
+
+        return CompositeEphemerisSource(
+            [(name, self.get(name)) for name in self.chain],
+            is_available=self.is_available,
+            hedge=self.config.hedge_requests,
+            hedge_quantile=self.config.hedge_quantile,
+            hedge_min_samples=self.config.hedge_min_samples,
+            hedge_workers=self.config.hedge_workers,
+            latency_window=self.config.latency_window,
+        )
+
+    def _check(self, name: str) -> bool:
+        """Run a live availability check and cache the result."""
+        try:
+            available = bool(self.get(name).is_available())
+        except Exception:
+            available = False
+        with self._lock:
+            self._availability[name] = (available, self._clock())
+            self._checks += 1
+        return available
+
+    def is_available(self, name: Optional[str] = None) -> bool:
+        """
+        Get the availability of a source, checking live only when the cached result expired.
+
+        Args:
+            name: Source name or alias (configured source if omitted)
+
+        Returns:
+            True if the source can perform calculations
+        """
+        name = self._resolve(name)
+        cached = self._availability.get(name)
+        if cached is not None and self._clock() - cached[1] < self.availability_ttl:
+            return cached[0]
+        return self._check(name)
+
+    def refresh(self) -> Dict[str, bool]:
+        """
+        Re-check every built source now.
+
+        Returns:
+            Source name to availability
+        """
+        return {name: self._check(name) for name in list(self._sources)}
+
+    def _refresh_loop(self) -> None:
+        """Background thread body: refresh until shutdown() is called."""
+        while not self._stop.wait(self.refresh_interval):
+            self.refresh()
+
+    def startup(self) -> None:
+        """
+        Build the configured source, check it once and start the background refresh.
+
+        Intended for the FastAPI lifespan startup; calling it again is a no-op.
+        """
+        with self._lock:
+            if self._refresher is not None:
+                return
+            self._stop.clear()
+            self._refresher = threading.Thread(
+                target=self._refresh_loop, name="ephemeris-availability", daemon=True
+            )
+        self._check(self.default_source)
+        self._refresher.start()
+
+    def shutdown(self) -> None:
+        """
+        Stop the background refresh and close all built sources.
+
+        Intended for the FastAPI lifespan shutdown. Sources are rebuilt on the
+        next get().
+        """
+        with self._lock:
+            refresher, self._refresher = self._refresher, None
+            sources, self._sources = self._sources, {}
+            self._availability.clear()
+        self._stop.set()
+        if refresher is not None:
+            refresher.join(timeout=5.0)
+        for source in sources.values():
+            try:
+                source.close()
+            except Exception as e:
+                print(f"Error closing ephemeris source {source.get_source_name()}: {e}")
+
+    def stats(self) -> dict:
+        """
+        Get registry state.
+
+        Returns:
+            Dict with the default source, built sources, cached availability, check
+            count and the metrics of sources that report them
+        """
+        now = self._clock()
+        with self._lock:
+            return {
+                "default_source": self.default_source,
+                "sources": sorted(self._sources),
+                "availability": {
+                    name: {"available": available, "age_seconds": round(now - checked_at, 1)}
+                    for name, (available, checked_at) in self._availability.items()
+                },
+                "availability_ttl_seconds": self.availability_ttl,
+                "refreshing": self._refresher is not None,
+                "checks": self._checks,
+                "source_stats": {
+                    name: source.stats() for name, source in self._sources.items() if hasattr(source, "stats")
+                },
+            }
+
+
+_registry: Optional[EphemerisSourceRegistry] = None
+_registry_lock = threading.Lock()
+
+
+def get_source_registry() -> EphemerisSourceRegistry:
+    """
+    Get the process-wide source registry, creating it on first use.
+
+    Returns:
+        Shared EphemerisSourceRegistry instance
+    """
+    global _registry
+    with _registry_lock:
+        if _registry is None:
+            _registry = EphemerisSourceRegistry()
+        return _registry
@@ -1,19 +1,24 @@
 """Factory for creating ephemeris data sources"""
 
-from src.services.ephemeris.swiss_ephemeris import SwissEphemerisSource
+from typing import Optional
 
+from src.services.ephemeris.registry import get_source_registry
 
-def get_ephemeris_source(source_type: str = "swiss"):
+
+def get_ephemeris_source(source_type: Optional[str] = None):
     """
     Get ephemeris data source.
 
+    Sources are built once per process by the source registry and shared.
+
     Args:
-        source_type: Type of ephemeris source ("swiss" for Swiss Ephemeris)
+        source_type: Source name ("swiss_ephemeris", "openastro_api", "nasa_jpl",
+            "chebyshev" or "swiss"); the configured EPHEMERIS_SOURCE if omitted
 
     Returns:
         EphemerisSource instance
+
+    Raises:
+        ValueError: If the source type is unknown
     """
-    if source_type == "swiss":
-        return SwissEphemerisSource()
-    else:
-        raise ValueError(f"Unknown ephemeris source type: {source_type}")
+    return get_source_registry().get(source_type)
@@ -0,0 +1,331 @@
+"""
+Memory-mapped reader for JPL SPK (.bsp) ephemeris kernels.
+
+SPK kernels are NAIF DAF files: a file record, a chain of summary records
+describing segments, and the segment data as IEEE doubles. JPL DE kernels
+(de440, de440s, ...) store every body as type 2 segments: fixed-length
+intervals, each with a Chebyshev expansion of x, y and z in km relative to
+a center body, in the ICRF, over TDB seconds past J2000.
+
+The file is mapped once and segment coefficients are NumPy views into the
+mapping, so opening a kernel reads only the summaries and evaluation
+touches only the pages of the intervals that are actually used. States
+are evaluated vectorized over arrays of epochs.
+"""
+
+import mmap
+import os
+import struct
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+import numpy as np
+
+RECORD_BYTES = 1024
+DOUBLE_BYTES = 8
+SECONDS_PER_DAY = 86400.0
+J2000 = 2451545.0
+
+# NAIF integer codes
+SOLAR_SYSTEM_BARYCENTER = 0
+EARTH_MOON_BARYCENTER = 3
+SUN = 10
+MOON = 301
+EARTH = 399
+
+CHEBYSHEV_POSITION = 2
+
+
+class SPKSegment(NamedTuple):
+    """One SPK segment summary."""
+
+    target: int
+    center: int
+    frame: int
+    data_type: int
+    start_second: float
+    end_second: float
+    start_address: int
+    end_address: int
+
+
+class SPKError(ValueError):
+    """Raised for malformed kernels, unsupported segments and epochs outside coverage."""
+
+
+def _chebyshev(s: np.ndarray, orders: np.ndarray, derivatives: bool) -> Tuple[np.ndarray, Optional[np.ndarray]]:
+    """
+    Chebyshev polynomials T_k(s) and optionally their derivatives.
+
+    Uses T_k(cos t) = cos(k t) and T_k'(cos t) = k sin(k t) / sin t, which
+    evaluates all orders in a few array operations instead of a per-order
+    recurrence.
+
+    Args:
+        s: Normalized times in [-1, 1], shape (n,)
+        orders: Polynomial orders 0..degree
+        derivatives: Also return d/ds
+
+    Returns:
+        (values, derivatives or None), each of shape (n, degree + 1)
+    """
+    s = np.minimum(np.maximum(s, -1.0), 1.0)
+    theta = np.arccos(s)
+    angles = theta[:, None] * orders
+    values = np.cos(angles)
+    if not derivatives:
+        return values, None
+
+    sin_theta = np.sin(theta)
+    at_end = sin_theta < 1e-9
+    with np.errstate(divide="ignore", invalid="ignore"):
+        slopes = orders * np.sin(angles) / sin_theta[:, None]
+    if at_end.any():
+        # Limits at s = +-1: T_k'(1) = k^2, T_k'(-1) = (-1)^(k+1) k^2
+        signs = np.where(s[at_end] > 0, 1.0, -1.0)[:, None]
+        slopes[at_end] = orders ** 2 * signs ** (orders + 1)
+    return values, slopes
+
+
+class ChebyshevSegment:
+    """Type 2 segment data: a view of the coefficient records in the mapped file."""
+
+    def __init__(self, summary: SPKSegment, data: np.ndarray):
+        """
+        Wrap the doubles of one segment.
+
+        Args:
+            summary: Segment summary
+            data: Segment doubles (start_address..end_address, inclusive)
+
+        Raises:
+            SPKError: If the directory at the end of the segment is inconsistent
+        """
+        init, interval, record_size, count = data[-4:].tolist()
+        record_size, count = int(record_size), int(count)
+        if record_size < 5 or (record_size - 2) % 3 or record_size * count + 4 != len(data):
+            raise SPKError(f"Malformed type 2 segment for body {summary.target}")
+
+        self.summary = summary
+        self.init = init
+        self.interval = interval
+        self.count = count
+        self.degree = (record_size - 2) // 3 - 1
+        self.orders = np.arange(self.degree + 1, dtype=float)
+        self.records = data[:-4].reshape(count, record_size)
+
+    def state(self, seconds: np.ndarray, velocity: bool = True) -> Tuple[np.ndarray, Optional[np.ndarray]]:
+        """
+        Evaluate position and optionally velocity.
+
+        Args:
+            seconds: TDB seconds past J2000, shape (n,), inside the segment
+            velocity: Also evaluate the velocity
+
+        Returns:
+            (positions in km, velocities in km/s or None), each of shape (n, 3)
+        """
+        index = np.minimum(np.maximum((seconds - self.init) // self.interval, 0), self.count - 1).astype(np.intp)
+        records = self.records[index]
+        s = (seconds - records[:, 0]) / records[:, 1]
+        values, slopes = _chebyshev(s, self.orders, velocity)
+        coefficients = records[:, 2:].reshape(len(seconds), 3, self.degree + 1)
+        positions = np.einsum("nck,nk->nc", coefficients, values)
+        if slopes is None:
+            return positions, None
+        return positions, np.einsum("nck,nk->nc", coefficients, slopes) / records[:, 1:2]
+
+
+class SPKKernel:
+    """
+    Read-only, memory-mapped SPK kernel with type 2 segments.
+    """
+
+    def __init__(self, path: str):
+        """
+        Map a kernel and read its segment summaries.
+
+        Args:
+            path: Path to the .bsp file
+
+        Raises:
+            SPKError: If the file is not a readable SPK kernel
+            OSError: If the file cannot be opened
+        """
+        self.path = path
+        with open(path, "rb") as handle:
+            self._map = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+
+        try:
+            self._byte_order, self.segments = self._read_summaries()
+        except Exception:
+            self._map.close()
+            raise
+        self._doubles = np.frombuffer(self._map, dtype=np.dtype(self._byte_order + "f8"))
+        self._loaded: Dict[int, ChebyshevSegment] = {}
+
+        # Later segments take precedence for overlapping coverage (SPK rule)
+        self._by_target: Dict[int, List[int]] = {}
+        for i, segment in enumerate(self.segments):
+            self._by_target.setdefault(segment.target, []).append(i)
+
+    def _read_summaries(self) -> Tuple[str, List[SPKSegment]]:
+        """Parse the file record and walk the summary record chain."""
+        if len(self._map) < RECORD_BYTES or self._map[:7] != b"DAF/SPK":
+            raise SPKError(f"{self.path} is not an SPK kernel")
+
+        byte_format = self._map[88:96]
+        if byte_format == b"LTL-IEEE":
+            order = "<"
+        elif byte_format == b"BIG-IEEE":
+            order = ">"
+        else:
+            # Pre-N0050 kernels have no format string; ND must be 2
+            order = "<" if struct.unpack("<i", self._map[8:12])[0] == 2 else ">"
+
+        nd, ni = struct.unpack(order + "ii", self._map[8:16])
+        forward = struct.unpack(order + "i", self._map[76:80])[0]
+        if (nd, ni) != (2, 6):
+            raise SPKError(f"{self.path}: unexpected summary format ND={nd}, NI={ni}")
+
+        summary_doubles = nd + (ni + 1) // 2
+        segments = []
+        record = forward
+        while record > 0:
+            offset = (record - 1) * RECORD_BYTES
+            if offset + RECORD_BYTES > len(self._map):
+                raise SPKError(f"{self.path}: summary record {record} is past the end of the file")
+            next_record, _, count = struct.unpack(order + "3d", self._map[offset:offset + 24])
+            for i in range(int(count)):
+                start = offset + 24 + i * summary_doubles * DOUBLE_BYTES
+                start_second, end_second = struct.unpack(order + "2d", self._map[start:start + 16])
+                ints = struct.unpack(order + "6i", self._map[start + 16:start + 40])
+                segments.append(SPKSegment(ints[0], ints[1], ints[2], ints[3], start_second, end_second, ints[4], ints[5]))
+            record = int(next_record)
+        return order, segments
+
+    def _segment(self, i: int) -> ChebyshevSegment:
+        """Get the evaluator of segment i (views are created on first use)."""
+        loaded = self._loaded.get(i)
+        if loaded is None:
+            summary = self.segments[i]
+            if summary.data_type != CHEBYSHEV_POSITION:
+                raise SPKError(
+                    f"SPK segment type {summary.data_type} for body {summary.target} is not supported"
+                )
+            data = self._doubles[summary.start_address - 1:summary.end_address]
+            loaded = self._loaded[i] = ChebyshevSegment(summary, data)
+        return loaded
+
+    @property
+    def targets(self) -> List[int]:
+        """NAIF codes of all bodies with at least one segment."""
+        return sorted(self._by_target)
+
+    def coverage(self, target: int) -> Tuple[float, float]:
+        """
+        Get the time span covered for a body.
+
+        Args:
+            target: NAIF body code
+
+        Returns:
+            (first, last) TDB seconds past J2000 of the union of its segments
+        """
+        indices = self._by_target.get(target)
+        if not indices:
+            raise SPKError(f"Body {target} is not in {os.path.basename(self.path)}")
+        return (
+            min(self.segments[i].start_second for i in indices),
+            max(self.segments[i].end_second for i in indices),
+        )
+
+    def center_of(self, target: int) -> int:
+        """NAIF code of the body the target's segments are relative to."""
+        indices = self._by_target.get(target)
+        if not indices:
+            raise SPKError(f"Body {target} is not in {os.path.basename(self.path)}")
+        return self.segments[indices[-1]].center
+
+    def relative_state(
+        self, target: int, seconds: np.ndarray, velocity: bool = True
+    ) -> Tuple[np.ndarray, Optional[np.ndarray]]:
+        """
+        Evaluate a body relative to its segment center.
+
+        Args:
+            target: NAIF body code
+            seconds: TDB seconds past J2000, shape (n,)
+            velocity: Also evaluate the velocity
+
+        Returns:
+            (positions in km, velocities in km/s or None), each of shape (n, 3)
+
+        Raises:
+            SPKError: If the body is missing or an epoch is not covered
+        """
+        indices = self._by_target.get(target)
+        if not indices:
+            raise SPKError(f"Body {target} is not in {os.path.basename(self.path)}")
+
+        first, last = seconds.min(), seconds.max()
+        for i in reversed(indices):
+            summary = self.segments[i]
+            if summary.start_second <= last and first <= summary.end_second:
+                if summary.start_second <= first and last <= summary.end_second:
+                    # Common case: the newest overlapping segment covers all epochs
+                    return self._segment(i).state(seconds, velocity)
+                break
+
+        positions = np.empty((len(seconds), 3))
+        velocities = np.empty((len(seconds), 3)) if velocity else None
+        assigned = np.zeros(len(seconds), dtype=bool)
+        for i in reversed(indices):
+            summary = self.segments[i]
+            mask = ~assigned & (seconds >= summary.start_second) & (seconds <= summary.end_second)
+            if mask.any():
+                position, speed = self._segment(i).state(seconds[mask], velocity)
+                positions[mask] = position
+                if velocities is not None and speed is not None:
+                    velocities[mask] = speed
+                assigned |= mask
+        if not assigned.all():
+            missing = seconds[~assigned][0] / SECONDS_PER_DAY + J2000
+            raise SPKError(f"JD {missing:.5f} is outside the coverage of body {target}")
+        return positions, velocities
+
+    def barycentric_state(
+        self, target: int, seconds: np.ndarray, velocity: bool = True
+    ) -> Tuple[np.ndarray, Optional[np.ndarray]]:
+        """
+        Evaluate a body relative to the solar system barycenter by chaining segment centers.
+
+        Args:
+            target: NAIF body code
+            seconds: TDB seconds past J2000, shape (n,)
+            velocity: Also evaluate the velocity
+
+        Returns:
+            (positions in km, velocities in km/s or None), each of shape (n, 3)
+        """
+        positions = np.zeros((len(seconds), 3))
+        velocities = np.zeros((len(seconds), 3)) if velocity else None
+        body = target
+        for _ in range(len(self.segments) + 1):
+            if body == SOLAR_SYSTEM_BARYCENTER:
+                return positions, velocities
+            position, speed = self.relative_state(body, seconds, velocity)
+            positions += position
+            if velocities is not None and speed is not None:
+                velocities += speed
+            body = self.center_of(body)
+        raise SPKError(f"Body {target} has a cyclic center chain")
+
+    def close(self) -> None:
+        """Unmap the file (views handed out earlier become invalid)."""
+        self._loaded.clear()
+        self._doubles = np.empty(0)
+        try:
+            self._map.close()
+        except BufferError:
+            # A NumPy view is still alive; the mapping is released with it
+            pass
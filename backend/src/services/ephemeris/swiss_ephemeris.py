@@ -1,13 +1,20 @@
 """Swiss Ephemeris implementation for planetary calculations"""
 
 import swisseph as swe
-import multiprocessing
-import traceback
 from datetime import datetime
+from typing import List, Sequence, Tuple
 from src.models.celestial import CelestialBody
+from src.services.ephemeris.base import (
+    EphemerisSource,
+    OPPOSITE_POINTS,
+    physical_bodies,
+    expand_positions,
+)
+from src.services.ephemeris.initializer import ensure_ephemeris_path
+from src.services.ephemeris.worker_pool import check_worker_pool, get_worker_pool, worker_pool_stats
 
 
-class SwissEphemerisSource:
+class SwissEphemerisSource(EphemerisSource):
     """Swiss Ephemeris data source for planetary positions"""
 
     # Mapping of CelestialBody to Swiss Ephemeris constants
@@ -29,9 +36,8 @@ class SwissEphemerisSource:
 
     def __init__(self):
         """Initialize Swiss Ephemeris source"""
-        # Set ephemeris path (optional, uses built-in data by default)
-        # swe.set_ephe_path('/path/to/ephemeris/data')
-        pass
+        # Applies EPHEMERIS_PATH on first use in this process
+        ensure_ephemeris_path()
 
     def get_source_name(self) -> str:
         """Get the name of this ephemeris source"""
@@ -41,6 +47,10 @@ class SwissEphemerisSource:
         """
         Check if Swiss Ephemeris is available and usable.
 
+        Also health-checks the worker pool when it is running, so the
+        registry's periodic refresh replaces hung or crashed workers before a
+        request needs them.
+
         Returns:
             True if swisseph can perform calculations, False otherwise
         """
@@ -48,10 +58,25 @@ class SwissEphemerisSource:
             # Simple test: calculate Sun position at J2000 epoch
             jd = swe.julday(2000, 1, 1, 12.0)
             swe.calc_ut(jd, swe.SUN)
-            return True
         except Exception:
             return False
 
+        try:
+            if check_worker_pool() is False:
+                print("swisseph worker pool health check replaced unresponsive workers")
+        except Exception as e:
+            print(f"swisseph worker pool health check failed: {e}")
+        return True
+
+    def stats(self) -> dict:
+        """
+        Get source metrics.
+
+        Returns:
+            Dict with the worker pool state (None until the pool is first used)
+        """
+        return {"worker_pool": worker_pool_stats()}
+
     def datetime_to_julian_day(self, dt: datetime) -> float:
         """
         Convert datetime to Julian Day number.
@@ -66,7 +91,7 @@ class SwissEphemerisSource:
             dt.year,
             dt.month,
             dt.day,
-            dt.hour + dt.minute / 60.0 + dt.second / 3600.0
+            dt.hour + dt.minute / 60.0 + dt.second / 3600.0 + dt.microsecond / 3.6e9
         )
 
     def get_ecliptic_longitude(self, body: CelestialBody, jd: float) -> float:
@@ -91,6 +116,86 @@ class SwissEphemerisSource:
         else:
             return self._calculate_position(body, jd)
 
+    def calculate_position(self, body: CelestialBody, julian_day: float) -> float:
+        """
+        Calculate ecliptic longitude for a celestial body (EphemerisSource interface).
+
+        Args:
+            body: Celestial body
+            julian_day: Julian Day number
+
+        Returns:
+            Ecliptic longitude in degrees (0-360)
+        """
+        return self.get_ecliptic_longitude(body, julian_day)
+
+    def calculate_positions(
+        self, bodies: Sequence[CelestialBody], julian_day: float
+    ) -> List[float]:
+        """
+        Calculate ecliptic longitudes for several bodies with one swisseph call per physical body.
+
+        Earth and South Node are derived from Sun and North Node instead of
+        being recomputed. If swisseph cannot run in this thread, all bodies
+        go to the worker pool in a single round trip.
+
+        Args:
+            bodies: Celestial bodies to calculate
+            julian_day: Julian Day number
+
+        Returns:
+            Ecliptic longitudes in degrees (0-360), in the order of bodies
+        """
+        physical = physical_bodies(bodies)
+        unknown = [body for body in physical if body not in self.BODY_MAP]
+        if unknown:
+            raise ValueError(f"Unknown celestial body: {unknown[0]}")
+
+        swe_bodies = [self.BODY_MAP[body] for body in physical]
+        flags = swe.FLG_SWIEPH | swe.FLG_SPEED
+
+        try:
+            longitudes = [swe.calc_ut(julian_day, b, flags)[0][0] for b in swe_bodies]
+        except Exception as exc:
+            exc_str = str(exc).lower()
+            if "signal only works" not in exc_str:
+                raise
+            longitudes = [lon for lon, _speed in get_worker_pool().calculate(julian_day, swe_bodies, flags)]
+
+        return expand_positions(bodies, dict(zip(physical, longitudes)))
+
+    def calculate_position_with_speed(
+        self, body: CelestialBody, julian_day: float
+    ) -> Tuple[float, float]:
+        """
+        Calculate ecliptic longitude and daily motion in one swisseph call.
+
+        Args:
+            body: Celestial body (physical bodies and opposite points)
+            julian_day: Julian Day number
+
+        Returns:
+            Tuple of (longitude in degrees 0-360, speed in degrees per day)
+        """
+        physical = OPPOSITE_POINTS.get(body, body)
+        if physical not in self.BODY_MAP:
+            raise ValueError(f"Unknown celestial body: {body}")
+
+        swe_body = self.BODY_MAP[physical]
+        flags = swe.FLG_SWIEPH | swe.FLG_SPEED
+
+        try:
+            result = swe.calc_ut(julian_day, swe_body, flags)
+            longitude, speed = result[0][0], result[0][3]
+        except Exception as exc:
+            if "signal only works" not in str(exc).lower():
+                raise
+            longitude, speed = get_worker_pool().calculate(julian_day, [swe_body], flags)[0]
+
+        if physical is not body:
+            longitude = (longitude + 180.0) % 360.0
+        return longitude, speed
+
     def _calculate_position(self, body: CelestialBody, jd: float) -> float:
         """
         Calculate position using Swiss Ephemeris.
@@ -126,7 +231,7 @@ class SwissEphemerisSource:
 
     def _calc_in_subprocess(self, swe_body: int, jd: float) -> float:
         """
-        Run swisseph calculation in a separate process to avoid signal/threading errors.
+        Run swisseph calculation in the persistent worker pool to avoid signal/threading errors.
 
         Args:
             swe_body: Swiss Ephemeris body constant
@@ -138,28 +243,7 @@ class SwissEphemerisSource:
         Raises:
             RuntimeError: If calculation fails or times out
         """
-        def worker(q, swe_body_arg, jd_arg):
-            """Worker function to run in subprocess"""
-            try:
-                import swisseph as swe_local
-                res = swe_local.calc_ut(jd_arg, swe_body_arg, swe_local.FLG_SWIEPH | swe_local.FLG_SPEED)
-                q.put(("ok", res[0][0]))
-            except Exception as e:
-                q.put(("err", f"{type(e).__name__}: {e}\n{traceback.format_exc()}"))
-
-        ctx = multiprocessing.get_context("spawn")
-        q = ctx.Queue()
-        p = ctx.Process(target=worker, args=(q, swe_body, jd))
-        p.start()
-        p.join(timeout=15)  # 15 second timeout per calculation
-
-        if not q.empty():
-            status, payload = q.get()
-            if status == "ok":
-                return payload
-            else:
-                raise RuntimeError(f"swisseph subprocess error: {payload}")
-        else:
-            # Timeout
-            p.terminate()
-            raise RuntimeError("swisseph calculation timed out in subprocess")
+        longitude, _speed = get_worker_pool().calculate(
+            jd, [swe_body], swe.FLG_SWIEPH | swe.FLG_SPEED
+        )[0]
+        return longitude
@@ -0,0 +1,317 @@
+"""
+Persistent Swiss Ephemeris worker processes.
+
+Used by SwissEphemerisSource when swisseph cannot run in the calling thread
+("signal only works in main thread"). Workers are spawned once, import
+swisseph up front and answer whole (JD, bodies) requests over a pipe, so the
+fallback costs one IPC round trip instead of one interpreter start per body.
+"""
+
+import atexit
+import multiprocessing
+import os
+import queue
+import threading
+import traceback
+from typing import List, Optional, Sequence, Tuple
+
+from src.models.error import ERROR_EPHEMERIS_UNAVAILABLE, ERROR_CALCULATION_FAILED
+
+
+def _worker_main(conn, ephemeris_path: Optional[str]) -> None:
+    """
+    Worker process loop.
+
+    Protocol (tuples over a duplex pipe):
+        ("calc", jd, bodies, flags) -> ("ok", [(longitude, speed), ...]) | ("err", message)
+        ("ping",)                   -> ("pong", pid)
+        None                        -> worker exits
+    """
+    import swisseph as swe_local
+
+    if ephemeris_path:
+        swe_local.set_ephe_path(ephemeris_path)
+
+    while True:
+        try:
+            message = conn.recv()
+        except (EOFError, OSError):
+            break
+        if message is None:
+            break
+
+        if message[0] == "ping":
+            conn.send(("pong", os.getpid()))
+            continue
+
+        _, jd, bodies, flags = message
+        try:
+            results = []
+            for body in bodies:
+                res = swe_local.calc_ut(jd, body, flags)
+                results.append((res[0][0], res[0][3]))
+            conn.send(("ok", results))
+        except Exception as e:
+            conn.send(("err", f"{type(e).__name__}: {e}\n{traceback.format_exc()}"))
+
+    conn.close()
+
+
+class _Worker:
+    """A single worker process and the parent end of its pipe."""
+
+    def __init__(self, ctx, ephemeris_path: Optional[str]):
+        self.conn, child_conn = ctx.Pipe(duplex=True)
+        self.process = ctx.Process(
+            target=_worker_main,
+            args=(child_conn, ephemeris_path),
+            daemon=True,
+        )
+        self.process.start()
+        child_conn.close()
+
+    def is_alive(self) -> bool:
+        return self.process.is_alive()
+
+    def kill(self) -> None:
+        try:
+            self.conn.close()
+        finally:
+            if self.process.is_alive():
+                self.process.kill()
+            self.process.join(timeout=1)
+
+    def stop(self) -> None:
+        try:
+            self.conn.send(None)
+        except (OSError, BrokenPipeError):
+            pass
+        self.process.join(timeout=1)
+        if self.process.is_alive():
+            self.process.kill()
+        self.conn.close()
+
+
+class SwissWorkerPool:
+    """
+    Long-lived pool of swisseph worker processes.
+
+    Workers are checked out one request at a time. A worker that crashes,
+    stops answering or misses its deadline is killed and replaced so the pool
+    always returns to its configured size.
+    """
+
+    def __init__(
+        self,
+        size: int = 2,
+        ephemeris_path: Optional[str] = None,
+        request_timeout: float = 15.0,
+    ):
+        """
+        Initialize worker pool.
+
+        Args:
+            size: Number of worker processes
+            ephemeris_path: Swiss Ephemeris data directory applied in each worker
+            request_timeout: Seconds to wait for a worker to answer a request
+        """
+        if size < 1:
+            raise ValueError("Worker pool size must be at least 1")
+
+        self.size = size
+        self.ephemeris_path = ephemeris_path
+        self.request_timeout = request_timeout
+
+        self._ctx = multiprocessing.get_context("spawn")
+        self._idle: "queue.Queue[_Worker]" = queue.Queue()
+        self._lock = threading.Lock()
+        self._started = False
+        self._closed = False
+        self.respawns = 0
+        self.health_checks = 0
+        self.failed_health_checks = 0
+
+    @property
+    def started(self) -> bool:
+        """True once workers were spawned and the pool is not shut down."""
+        return self._started and not self._closed
+
+    def start(self) -> None:
+        """Spawn all workers (idempotent)."""
+        with self._lock:
+            if self._started:
+                return
+            if self._closed:
+                raise RuntimeError(f"{ERROR_EPHEMERIS_UNAVAILABLE}: swisseph worker pool is shut down")
+            for _ in range(self.size):
+                self._idle.put(_Worker(self._ctx, self.ephemeris_path))
+            self._started = True
+
+    def _respawn(self, worker: _Worker) -> _Worker:
+        """Kill a broken worker and start its replacement."""
+        worker.kill()
+        with self._lock:
+            self.respawns += 1
+        return _Worker(self._ctx, self.ephemeris_path)
+
+    def _request(self, message: tuple) -> tuple:
+        """
+        Send one message to an idle worker and wait for its reply.
+
+        Raises:
+            RuntimeError: If no worker is free, or the worker crashed or timed out
+        """
+        self.start()
+        try:
+            worker = self._idle.get(timeout=self.request_timeout)
+        except queue.Empty:
+            raise RuntimeError("swisseph worker pool timed out waiting for a free worker")
+
+        if not worker.is_alive():
+            worker = self._respawn(worker)
+
+        try:
+            worker.conn.send(message)
+            if not worker.conn.poll(self.request_timeout):
+                worker = self._respawn(worker)
+                raise RuntimeError("swisseph calculation timed out in worker process")
+            return worker.conn.recv()
+        except (EOFError, OSError, BrokenPipeError) as e:
+            worker = self._respawn(worker)
+            raise RuntimeError(f"{ERROR_CALCULATION_FAILED}: swisseph worker crashed: {e}")
+        finally:
+            if self._closed:
+                worker.stop()
+            else:
+                self._idle.put(worker)
+
+    def calculate(
+        self, julian_day: float, swe_bodies: Sequence[int], flags: int
+    ) -> List[Tuple[float, float]]:
+        """
+        Calculate several bodies for one Julian Day in a single round trip.
+
+        Args:
+            julian_day: Julian Day number (UT)
+            swe_bodies: Swiss Ephemeris body constants
+            flags: swisseph calculation flags
+
+        Returns:
+            List of (longitude, speed) tuples in the order of swe_bodies
+
+        Raises:
+            RuntimeError: If the calculation fails or times out
+        """
+        status, payload = self._request(("calc", julian_day, list(swe_bodies), flags))
+        if status != "ok":
+            raise RuntimeError(f"swisseph subprocess error: {payload}")
+        return payload
+
+    def health_check(self) -> bool:
+        """
+        Ping every idle worker and replace the ones that do not answer.
+
+        Returns:
+            True if all checked workers are healthy (after respawning broken ones)
+        """
+        self.start()
+        healthy = True
+        checked = []
+        while True:
+            try:
+                checked.append(self._idle.get_nowait())
+            except queue.Empty:
+                break
+
+        for i, worker in enumerate(checked):
+            try:
+                worker.conn.send(("ping",))
+                if worker.conn.poll(self.request_timeout) and worker.conn.recv()[0] == "pong":
+                    continue
+            except (EOFError, OSError, BrokenPipeError):
+                pass
+            healthy = False
+            checked[i] = self._respawn(worker)
+
+        for worker in checked:
+            self._idle.put(worker)
+        with self._lock:
+            self.health_checks += 1
+            if not healthy:
+                self.failed_health_checks += 1
+        return healthy
+
+    def stats(self) -> dict:
+        """
+        Get pool state.
+
+        Returns:
+            Dict with size, started flag, idle workers, respawns and health check counts
+        """
+        return {
+            "size": self.size,
+            "started": self.started,
+            "idle": self._idle.qsize(),
+            "respawns": self.respawns,
+            "health_checks": self.health_checks,
+            "failed_health_checks": self.failed_health_checks,
+        }
+
+    def shutdown(self) -> None:
+        """Stop all idle workers; busy workers stop when they are returned."""
+        with self._lock:
+            self._closed = True
+            self._started = False
+        while True:
+            try:
+                self._idle.get_nowait().stop()
+            except queue.Empty:
+                break
+
+
+_pool: Optional[SwissWorkerPool] = None
+_pool_lock = threading.Lock()
+
+
+def get_worker_pool() -> SwissWorkerPool:
+    """
+    Get the process-wide swisseph worker pool, creating it on first use.
+
+    Pool size is read from EPHEMERIS_WORKER_POOL_SIZE; workers use EPHEMERIS_PATH.
+
+    Returns:
+        Shared SwissWorkerPool instance
+    """
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            from src.services.ephemeris import load_config
+
+            config = load_config()
+            _pool = SwissWorkerPool(size=config.worker_pool_size, ephemeris_path=config.ephemeris_path)
+            atexit.register(_pool.shutdown)
+        return _pool
+
+
+def check_worker_pool() -> Optional[bool]:
+    """
+    Health-check the shared pool if it is running, replacing unresponsive workers.
+
+    The pool is only started by the first calculation that needs it, so an
+    unused pool is not spawned just to be checked.
+
+    Returns:
+        Result of health_check(), or None if the pool has not been started
+    """
+    with _pool_lock:
+        pool = _pool
+    if pool is None or not pool.started:
+        return None
+    return pool.health_check()
+
+
+def worker_pool_stats() -> Optional[dict]:
+    """Get the shared pool's stats, or None if it was never created."""
+    with _pool_lock:
+        pool = _pool
+    return pool.stats() if pool is not None else None
@@ -0,0 +1,359 @@
+"""
+Offline gazetteer for place resolution.
+
+Place names from a GeoNames-style dump are normalized and stored in a
+sorted, memory-mapped index so lookups are a binary search over the file
+instead of a Nominatim request.
+
+File layout (little-endian):
+    header:      magic (8s), version, n_keys, n_places, n_tz, key_blob_len, tz_blob_len (u32 each)
+    key offsets: u32 x (n_keys + 1) into the key blob
+    key places:  u32 x n_keys, place index for each key
+    places:      n_places x PLACE_DTYPE
+    tz offsets:  u32 x (n_tz + 1) into the tz blob
+    key blob:    UTF-8 normalized names, sorted
+    tz blob:     UTF-8 IANA timezone names
+"""
+
+import bisect
+import csv
+import mmap
+import os
+import re
+import struct
+import sys
+import threading
+import unicodedata
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, NamedTuple, Optional, Sequence, Union
+
+import numpy as np
+
+MAGIC = b"HDGAZ\x00\x00\x00"
+FORMAT_VERSION = 1
+HEADER = struct.Struct("<8sIIIIII")
+
+PLACE_DTYPE = np.dtype(
+    [("lat", "<f4"), ("lng", "<f4"), ("population", "<u4"), ("tz", "<u2"), ("country", "S2")]
+)
+
+# Common country names (German and English) accepted as ", <country>" qualifiers
+COUNTRY_ALIASES: Dict[str, str] = {
+    "deutschland": "DE", "germany": "DE",
+    "osterreich": "AT", "austria": "AT",
+    "schweiz": "CH", "switzerland": "CH",
+    "uk": "GB", "united kingdom": "GB", "england": "GB", "grossbritannien": "GB",
+    "usa": "US", "united states": "US", "vereinigte staaten": "US",
+    "frankreich": "FR", "france": "FR",
+    "italien": "IT", "italy": "IT",
+    "spanien": "ES", "spain": "ES",
+    "niederlande": "NL", "netherlands": "NL",
+    "belgien": "BE", "belgium": "BE",
+    "polen": "PL", "poland": "PL",
+    "tschechien": "CZ", "czech republic": "CZ", "czechia": "CZ",
+    "danemark": "DK", "denmark": "DK",
+    "schweden": "SE", "sweden": "SE",
+    "norwegen": "NO", "norway": "NO",
+    "turkei": "TR", "turkey": "TR",
+    "russland": "RU", "russia": "RU",
+    "kanada": "CA", "canada": "CA",
+    "australien": "AU", "australia": "AU",
+}
+
+_DIGRAPHS = re.compile(r"([aou])e")
+_NON_ALNUM = re.compile(r"[^0-9a-z]+")
+
+
+def normalize_place_name(name: str) -> str:
+    """
+    Normalize a place name for matching.
+
+    Case and diacritics are dropped and the German transliterations ae/oe/ue
+    are folded onto their base vowel, so "München", "Muenchen" and
+    "MUNCHEN" all become "munchen". The same folding is applied when the
+    index is built, so occasional over-folding of other words is harmless.
+
+    Args:
+        name: Raw place name
+
+    Returns:
+        Normalized name (lowercase ASCII letters, digits and single spaces)
+    """
+    text = unicodedata.normalize("NFKD", name.casefold())
+    text = "".join(ch for ch in text if not unicodedata.combining(ch))
+    text = _DIGRAPHS.sub(r"\1", text)
+    return _NON_ALNUM.sub(" ", text).strip()
+
+
+class GazetteerEntry(NamedTuple):
+    """A resolved place"""
+
+    latitude: float
+    longitude: float
+    timezone: str
+    country_code: str
+    population: int
+
+
+class GazetteerPlace(NamedTuple):
+    """A place record used while building the index"""
+
+    names: List[str]
+    latitude: float
+    longitude: float
+    timezone: str
+    country_code: str
+    population: int
+
+
+class _KeyView:
+    """Sequence view over the sorted key blob, usable with bisect."""
+
+    def __init__(self, offsets: Sequence[int], blob: memoryview):
+        self._offsets = offsets
+        self._blob = blob
+
+    def __len__(self) -> int:
+        return len(self._offsets) - 1
+
+    def __getitem__(self, index: int) -> bytes:
+        start, end = self._offsets[index], self._offsets[index + 1]
+        return bytes(self._blob[start:end])
+
+
+class Gazetteer:
+    """Memory-mapped place index with normalized, diacritic-insensitive lookups."""
+
+    def __init__(self, path: Union[str, Path]):
+        """
+        Open a gazetteer file.
+
+        Args:
+            path: File written by build_gazetteer()
+
+        Raises:
+            ValueError: If the file is not a supported gazetteer
+        """
+        self.path = str(path)
+        with open(path, "rb") as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        if len(self._mmap) < HEADER.size:
+            raise ValueError(f"Gazetteer {path} is truncated")
+        magic, version, n_keys, n_places, n_tz, key_blob_len, tz_blob_len = HEADER.unpack_from(self._mmap, 0)
+        if magic != MAGIC or version != FORMAT_VERSION:
+            raise ValueError(f"Unsupported gazetteer format in {path}")
+
+        buffer = memoryview(self._mmap)
+        offset = HEADER.size
+        key_offsets = np.frombuffer(buffer, dtype="<u4", count=n_keys + 1, offset=offset)
+        offset += key_offsets.nbytes
+        self._key_places = np.frombuffer(buffer, dtype="<u4", count=n_keys, offset=offset)
+        offset += self._key_places.nbytes
+        self._places = np.frombuffer(buffer, dtype=PLACE_DTYPE, count=n_places, offset=offset)
+        offset += self._places.nbytes
+        tz_offsets = np.frombuffer(buffer, dtype="<u4", count=n_tz + 1, offset=offset)
+        offset += tz_offsets.nbytes
+        key_blob = buffer[offset:offset + key_blob_len]
+        offset += key_blob_len
+        tz_blob = bytes(buffer[offset:offset + tz_blob_len])
+
+        # Converting offsets to Python ints keeps bisect comparisons cheap
+        self._keys = _KeyView(key_offsets.tolist(), key_blob)
+        self._timezones = [
+            tz_blob[tz_offsets[i]:tz_offsets[i + 1]].decode("utf-8") for i in range(n_tz)
+        ]
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def _entry(self, place_index: int) -> GazetteerEntry:
+        place = self._places[place_index]
+        return GazetteerEntry(
+            latitude=float(place["lat"]),
+            longitude=float(place["lng"]),
+            timezone=self._timezones[int(place["tz"])],
+            country_code=place["country"].decode("ascii"),
+            population=int(place["population"]),
+        )
+
+    def _candidates(self, key: str) -> List[int]:
+        """Get place indices for an exact normalized key, most populous first."""
+        encoded = key.encode("utf-8")
+        index = bisect.bisect_left(self._keys, encoded)
+        places = []
+        while index < len(self._keys) and self._keys[index] == encoded:
+            places.append(int(self._key_places[index]))
+            index += 1
+        return places
+
+    def lookup(self, place_name: str) -> Optional[GazetteerEntry]:
+        """
+        Resolve a place name such as "München, Deutschland".
+
+        The part before the first comma is the place; every later part must
+        name a known country or ISO code, and the candidate must lie in it.
+        The index stores no regions, so a region qualifier cannot be
+        matched: "Paris, Texas", "Frankfurt, Oder" and "Portland, Maine,
+        USA" return None rather than the most populous Paris, Frankfurt or
+        Portland, so the caller can ask Nominatim instead of using a wrong
+        timezone.
+
+        Args:
+            place_name: Free-text place name
+
+        Returns:
+            GazetteerEntry, or None if the place is not in the index or a
+            qualifier matches none of its candidates
+        """
+        parts = [normalize_place_name(p) for p in place_name.split(",")]
+        parts = [p for p in parts if p]
+        if not parts:
+            return None
+
+        candidates = self._candidates(parts[0])
+        if not candidates:
+            return None
+
+        if len(parts) == 1:
+            return self._entry(candidates[0])
+
+        countries = set()
+        for qualifier in parts[1:]:
+            if qualifier in COUNTRY_ALIASES:
+                countries.add(COUNTRY_ALIASES[qualifier])
+            elif len(qualifier) == 2:
+                countries.add(qualifier.upper())
+            else:
+                return None
+
+        # Qualifiers naming different countries cannot all match one place
+        if len(countries) != 1:
+            return None
+        country = countries.pop()
+
+        for place_index in candidates:
+            if self._places[place_index]["country"].decode("ascii") == country:
+                return self._entry(place_index)
+        return None
+
+    def close(self) -> None:
+        """Release the memory map."""
+        self._keys = _KeyView([0], memoryview(b""))
+        self._key_places = np.empty(0, dtype="<u4")
+        self._places = np.empty(0, dtype=PLACE_DTYPE)
+        self._mmap.close()
+
+
+def iter_geonames(path: Union[str, Path], min_population: int = 0) -> Iterator[GazetteerPlace]:
+    """
+    Read places from a GeoNames dump (e.g. cities15000.txt).
+
+    Args:
+        path: Tab-separated GeoNames file
+        min_population: Skip places with a smaller population
+
+    Yields:
+        GazetteerPlace for each row with a timezone
+    """
+    csv.field_size_limit(sys.maxsize)
+    with open(path, "r", encoding="utf-8", newline="") as f:
+        for row in csv.reader(f, delimiter="\t", quoting=csv.QUOTE_NONE):
+            if len(row) < 18 or not row[17]:
+                continue
+            population = int(row[14] or 0)
+            if population < min_population:
+                continue
+            names = [row[1], row[2]] + (row[3].split(",") if row[3] else [])
+            yield GazetteerPlace(
+                names=names,
+                latitude=float(row[4]),
+                longitude=float(row[5]),
+                timezone=row[17],
+                country_code=row[8][:2].upper(),
+                population=population,
+            )
+
+
+def build_gazetteer(places: Iterable[GazetteerPlace], output: Union[str, Path]) -> dict:
+    """
+    Write a gazetteer index.
+
+    Args:
+        places: Place records (names are normalized here)
+        output: Output file path
+
+    Returns:
+        Dict with key, place and timezone counts
+    """
+    records: List[tuple] = []
+    timezones: Dict[str, int] = {}
+    keyed: List[tuple] = []
+
+    for place in places:
+        place_index = len(records)
+        tz_index = timezones.setdefault(place.timezone, len(timezones))
+        records.append(
+            (place.latitude, place.longitude, min(place.population, 2**32 - 1), tz_index,
+             place.country_code.encode("ascii")[:2])
+        )
+        for key in {normalize_place_name(n) for n in place.names}:
+            if len(key) >= 2:
+                keyed.append((key.encode("utf-8"), -place.population, place_index))
+
+    keyed.sort()
+
+    key_offsets = [0]
+    for key, _, _ in keyed:
+        key_offsets.append(key_offsets[-1] + len(key))
+    key_blob = b"".join(key for key, _, _ in keyed)
+
+    tz_names = sorted(timezones, key=lambda name: timezones[name])
+    tz_offsets = [0]
+    for name in tz_names:
+        tz_offsets.append(tz_offsets[-1] + len(name.encode("utf-8")))
+    tz_blob = "".join(tz_names).encode("utf-8")
+
+    output = Path(output)
+    output.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = output.with_suffix(output.suffix + ".tmp")
+    with open(tmp_path, "wb") as f:
+        f.write(HEADER.pack(MAGIC, FORMAT_VERSION, len(keyed), len(records), len(tz_names),
+                            len(key_blob), len(tz_blob)))
+        f.write(np.asarray(key_offsets, dtype="<u4").tobytes())
+        f.write(np.asarray([p for _, _, p in keyed], dtype="<u4").tobytes())
+        f.write(np.array(records, dtype=PLACE_DTYPE).tobytes())
+        f.write(np.asarray(tz_offsets, dtype="<u4").tobytes())
+        f.write(key_blob)
+        f.write(tz_blob)
+    os.replace(tmp_path, output)
+
+    return {"keys": len(keyed), "places": len(records), "timezones": len(tz_names)}
+
+
+_gazetteer: Optional[Gazetteer] = None
+_gazetteer_loaded = False
+_gazetteer_lock = threading.Lock()
+
+
+def get_gazetteer() -> Optional[Gazetteer]:
+    """
+    Get the configured gazetteer, opening it on first use.
+
+    Read from GAZETTEER_PATH (default /app/data/gazetteer/gazetteer.bin);
+    None is returned when the file does not exist.
+
+    Returns:
+        Shared Gazetteer or None
+    """
+    global _gazetteer, _gazetteer_loaded
+    with _gazetteer_lock:
+        if not _gazetteer_loaded:
+            _gazetteer_loaded = True
+            path = os.getenv("GAZETTEER_PATH", "/app/data/gazetteer/gazetteer.bin")
+            if os.path.exists(path):
+                try:
+                    _gazetteer = Gazetteer(path)
+                except (OSError, ValueError) as e:
+                    print(f"Gazetteer unavailable, using Nominatim only: {e}")
+        return _gazetteer
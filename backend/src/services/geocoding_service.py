@@ -5,19 +5,35 @@ Resolves place names to coordinates and timezones.
 """
 
 from geopy.geocoders import Nominatim
-from timezonefinder import TimezoneFinder
 from typing import Tuple, Optional
 import os
 
+from src.services.gazetteer import Gazetteer, get_gazetteer
+from src.services.nominatim_client import NominatimClient
+from src.services.timezone_resolver import TimezoneResolver, get_timezone_resolver
+
 
 class GeocodingService:
     """Service for geocoding and timezone lookup."""
 
-    def __init__(self):
+    def __init__(
+        self,
+        gazetteer: Optional[Gazetteer] = None,
+        nominatim: Optional[NominatimClient] = None,
+        timezones: Optional[TimezoneResolver] = None,
+    ):
+        """
+        Initialize geocoding service.
+
+        Args:
+            gazetteer: Offline place index (defaults to the one at GAZETTEER_PATH, if present)
+            nominatim: Async Nominatim client (configured from NOMINATIM_* if omitted)
+            timezones: Timezone resolver (shared, configured from TIMEZONE_* if omitted)
+        """
         # User agent is required by Nominatim usage policy (moved to environment variable)
         user_agent = os.getenv("NOMINATIM_USER_AGENT", "hd-chart-generator")
         self.geolocator = Nominatim(user_agent=user_agent)
-        self.tf = TimezoneFinder()
+        self.timezones = timezones or get_timezone_resolver()
 
         # Fallback/Cache for common test locations to avoid rate limits
         self.known_locations = {
@@ -28,6 +44,24 @@ class GeocodingService:
             "Hamburg, Deutschland": (53.5511, 9.9937, "Europe/Berlin"),
         }
 
+        # Offline gazetteer answers most lookups; Nominatim is only used for misses
+        self.gazetteer = gazetteer if gazetteer is not None else get_gazetteer()
+        self.nominatim = nominatim or NominatimClient.from_config()
+
+    def _lookup_offline(
+        self, place_name: str
+    ) -> Optional[Tuple[float, float, str]]:
+        """Resolve a place from known locations or the gazetteer."""
+        if place_name in self.known_locations:
+            return self.known_locations[place_name]
+
+        if self.gazetteer is not None:
+            entry = self.gazetteer.lookup(place_name)
+            if entry is not None:
+                return entry.latitude, entry.longitude, entry.timezone
+
+        return None
+
     def get_location_data(
         self, place_name: str
     ) -> Tuple[Optional[float], Optional[float], Optional[str]]:
@@ -41,9 +75,10 @@ class GeocodingService:
             Tuple of (latitude, longitude, timezone_str)
             Returns (None, None, None) if location not found
         """
-        # Check known locations first
-        if place_name in self.known_locations:
-            return self.known_locations[place_name]
+        # Check known locations and the gazetteer first
+        offline = self._lookup_offline(place_name)
+        if offline is not None:
+            return offline
 
         try:
             location = self.geolocator.geocode(place_name)
@@ -51,9 +86,49 @@ class GeocodingService:
                 return None, None, None
 
             lat, lng = location.latitude, location.longitude
-            timezone_str = self.tf.timezone_at(lng=lng, lat=lat)
+            timezone_str = self.timezones.timezone_at(lat, lng)
 
             return lat, lng, timezone_str
         except Exception as e:
             print(f"Geocoding error: {e}")
             return None, None, None
+
+    async def get_location_data_async(
+        self, place_name: str, timeout: Optional[float] = None
+    ) -> Tuple[Optional[float], Optional[float], Optional[str]]:
+        """
+        Resolve place name to lat, long, timezone without blocking the event loop.
+
+        Args:
+            place_name: Name of the place (e.g., "Berlin, Germany")
+            timeout: Deadline for the Nominatim fallback in seconds
+
+        Returns:
+            Tuple of (latitude, longitude, timezone_str)
+            Returns (None, None, None) if location not found
+
+        Raises:
+            TimeoutError: If the Nominatim fallback did not answer within the deadline
+        """
+        offline = self._lookup_offline(place_name)
+        if offline is not None:
+            return offline
+
+        try:
+            coordinates = await self.nominatim.geocode(place_name, timeout=timeout)
+        except TimeoutError:
+            raise
+        except Exception as e:
+            print(f"Geocoding error: {e}")
+            return None, None, None
+
+        if coordinates is None:
+            return None, None, None
+
+        lat, lng = coordinates
+        timezone_str = self.timezones.timezone_at(lat, lng)
+        return lat, lng, timezone_str
+
+    async def aclose(self) -> None:
+        """Close the Nominatim client."""
+        await self.nominatim.aclose()
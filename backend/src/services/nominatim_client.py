@@ -0,0 +1,262 @@
+"""
+Async Nominatim client.
+
+Lookups share one pooled httpx.AsyncClient, concurrent lookups of the same
+place collapse into a single request, and a token bucket keeps the request
+rate within the Nominatim usage policy by queueing callers rather than
+failing them. Every lookup has a deadline covering queueing and the request.
+"""
+
+import asyncio
+import time
+from typing import Callable, Dict, Optional, Tuple
+
+import httpx
+
+from src.models.geocoding import NominatimConfig
+
+Coordinates = Tuple[float, float]
+
+
+class TokenBucket:
+    """
+    Async token bucket that queues callers in arrival order.
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        capacity: int = 1,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Initialize token bucket.
+
+        Args:
+            rate: Tokens added per second
+            capacity: Maximum number of stored tokens (burst size)
+            clock: Monotonic time source (injectable for tests)
+        """
+        self.rate = rate
+        self.capacity = capacity
+        self._clock = clock
+        self._tokens = float(capacity)
+        self._updated = clock()
+        self._lock: Optional[asyncio.Lock] = None
+
+    def _refill(self) -> None:
+        now = self._clock()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    async def acquire(self, deadline: Optional[float] = None) -> None:
+        """
+        Take one token, waiting for it if necessary.
+
+        Args:
+            deadline: Clock value by which the token must be available
+
+        Raises:
+            TimeoutError: If the token would not be available before the deadline
+        """
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+
+        # Holding the lock while sleeping makes waiters queue in FIFO order
+        async with self._lock:
+            self._refill()
+            if self._tokens < 1.0:
+                wait = (1.0 - self._tokens) / self.rate
+                if deadline is not None and self._clock() + wait > deadline:
+                    raise TimeoutError("Rate limit queue exceeds the lookup deadline")
+                await asyncio.sleep(wait)
+                self._refill()
+            self._tokens -= 1.0
+
+
+class NominatimClient:
+    """
+    Rate-limited, coalescing Nominatim search client.
+    """
+
+    def __init__(
+        self,
+        base_url: str = "https://nominatim.openstreetmap.org",
+        user_agent: str = "hd-chart-generator",
+        rate_per_second: float = 1.0,
+        burst: int = 1,
+        timeout_seconds: float = 10.0,
+        max_connections: int = 4,
+    ):
+        """
+        Initialize Nominatim client.
+
+        Args:
+            base_url: Base URL of the Nominatim service
+            user_agent: User agent sent with every request
+            rate_per_second: Sustained request rate
+            burst: Requests allowed back-to-back
+            timeout_seconds: Default per-lookup deadline
+            max_connections: HTTP connection pool size
+        """
+        self.base_url = base_url.rstrip("/")
+        self.user_agent = user_agent
+        self.timeout_seconds = timeout_seconds
+        self.max_connections = max_connections
+        self._bucket = TokenBucket(rate_per_second, burst)
+
+        # The HTTP client and in-flight tasks belong to one event loop
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._client: Optional[httpx.AsyncClient] = None
+        self._in_flight: Dict[str, "asyncio.Task[Optional[Coordinates]]"] = {}
+        self.requests_sent = 0
+        self.coalesced = 0
+
+    @classmethod
+    def from_config(cls, config: Optional[NominatimConfig] = None) -> "NominatimClient":
+        """
+        Create client from environment configuration.
+
+        Args:
+            config: Optional explicit configuration (loaded from env if omitted)
+
+        Returns:
+            NominatimClient instance
+        """
+        config = config or NominatimConfig()
+        return cls(
+            base_url=config.url,
+            user_agent=config.user_agent,
+            rate_per_second=config.rate_per_second,
+            burst=config.burst,
+            timeout_seconds=config.timeout_seconds,
+            max_connections=config.max_connections,
+        )
+
+    async def _bind_loop(self) -> None:
+        """Create loop-bound state for the running event loop, closing the previous loop's client."""
+        loop = asyncio.get_running_loop()
+        if self._loop is loop:
+            return
+        stale_client, stale_loop = self._client, self._loop
+        self._loop = loop
+        self._in_flight = {}
+        self._bucket._lock = None
+        self._client = httpx.AsyncClient(
+            base_url=self.base_url,
+            headers={"User-Agent": self.user_agent},
+            timeout=self.timeout_seconds,
+            limits=httpx.Limits(
+                max_connections=self.max_connections,
+                max_keepalive_connections=self.max_connections,
+            ),
+        )
+        if stale_client is not None:
+            await self._close_stale_client(stale_client, stale_loop)
+
+    @staticmethod
+    async def _close_stale_client(
+        client: httpx.AsyncClient, loop: Optional[asyncio.AbstractEventLoop]
+    ) -> None:
+        """Close the HTTP client of another event loop so its connection pool is released."""
+        if loop is not None and loop.is_running():
+            # Still running in another thread: close the client there
+            asyncio.run_coroutine_threadsafe(client.aclose(), loop)
+            return
+        try:
+            await client.aclose()
+        except RuntimeError as e:
+            print(f"Nominatim client of a previous event loop could not be closed: {e}")
+
+    async def _search(self, query: str, deadline: float) -> Optional[Coordinates]:
+        """Send one search request once the rate limit allows it."""
+        await self._bucket.acquire(deadline)
+        client = self._client
+        if client is None:
+            raise RuntimeError("Nominatim client is closed")
+        self.requests_sent += 1
+        response = await client.get(
+            "/search",
+            params={"q": query, "format": "json", "limit": 1},
+            timeout=max(deadline - time.monotonic(), 0.001),
+        )
+        response.raise_for_status()
+        results = response.json()
+        if not results:
+            return None
+        return float(results[0]["lat"]), float(results[0]["lon"])
+
+    async def geocode(
+        self, place_name: str, timeout: Optional[float] = None
+    ) -> Optional[Coordinates]:
+        """
+        Resolve a place name to coordinates.
+
+        Concurrent calls for the same name share one request; each caller
+        waits at most its own deadline.
+
+        Args:
+            place_name: Free-text place name
+            timeout: Deadline in seconds (defaults to the configured timeout)
+
+        Returns:
+            Tuple of (latitude, longitude), or None if Nominatim found nothing
+
+        Raises:
+            TimeoutError: If the lookup did not finish within the deadline
+            httpx.HTTPError: If the request failed
+        """
+        await self._bind_loop()
+        timeout = self.timeout_seconds if timeout is None else timeout
+        key = " ".join(place_name.split()).casefold()
+
+        task = self._in_flight.get(key)
+        if task is None:
+            task = asyncio.get_running_loop().create_task(
+                self._search(place_name, time.monotonic() + timeout)
+            )
+            self._in_flight[key] = task
+
+            def forget(done: "asyncio.Task[Optional[Coordinates]]") -> None:
+                self._forget(key, done)
+
+            task.add_done_callback(forget)
+        else:
+            self.coalesced += 1
+
+        try:
+            # Shielded so one caller's deadline does not cancel the shared request
+            return await asyncio.wait_for(asyncio.shield(task), timeout)
+        except asyncio.TimeoutError:
+            raise TimeoutError(f"Geocoding '{place_name}' exceeded {timeout:.1f}s") from None
+        except httpx.TimeoutException as e:
+            raise TimeoutError(f"Geocoding '{place_name}' timed out: {e}") from None
+
+    def _forget(self, key: str, task: "asyncio.Task") -> None:
+        """Drop a finished request from the in-flight table."""
+        if self._in_flight.get(key) is task:
+            del self._in_flight[key]
+        if not task.cancelled():
+            # Retrieve the exception so abandoned requests don't log warnings
+            task.exception()
+
+    def stats(self) -> dict:
+        """
+        Get client counters.
+
+        Returns:
+            Dict with requests sent, coalesced lookups and in-flight count
+        """
+        return {
+            "requests_sent": self.requests_sent,
+            "coalesced": self.coalesced,
+            "in_flight": len(self._in_flight),
+        }
+
+    async def aclose(self) -> None:
+        """Close the pooled HTTP client."""
+        if self._client is not None and self._loop is asyncio.get_running_loop():
+            await self._client.aclose()
+        self._client = None
+        self._loop = None
+        self._in_flight = {}
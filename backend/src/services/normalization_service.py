@@ -9,6 +9,16 @@ from src.models.chart import (
     Channel,
     IncarnationCross
 )
+from src.services.content_registry import get_content_registry
+
+# The external HD API uses German authority codes; the content files use ours
+AUTHORITY_CODE_ALIASES = {
+    "sakral": "sacral",
+    "milz": "spleen",
+    "ego_manifestiert": "ego_manifested",
+    "ego_projektiert": "ego_projected",
+    "selbst_projektiert": "self_projected",
+}
 
 
 class NormalizationService:
@@ -112,21 +122,6 @@ class NormalizationService:
         Returns:
             Personalized German sentence
         """
-        # Simple impulse mapping (can be expanded from config file)
-        impulses = {
-            ("1", "emotional"): "Wenn du deiner emotionalen Klarheit vertraust, kann deine Energie Wunder bewegen.",
-            ("1", "sakral"): "Deine sakrale Antwort zeigt dir den Weg zu echter Erfüllung.",
-            ("2", "emotional"): "Mit emotionaler Klarheit wird deine manifestierende Kraft unaufhaltsam.",
-            ("2", "sakral"): "Dein Sakral und deine Geduld sind deine größten Geschenke.",
-            ("3", "milz"): "Deine spontane Wahrnehmung führt dich zu den richtigen Entscheidungen.",
-            ("3", "selbst_projektiert"): "Wenn du auf Einladungen wartest, öffnen sich die richtigen Türen.",
-            ("4", "ego_manifestiert"): "Deine Willenskraft bringt Visionen in die Realität.",
-            ("4", "emotional"): "Mit emotionaler Klarheit manifestierst du kraftvoll und nachhaltig.",
-            ("5", "lunar"): "Im Rhythmus des Mondes findest du deine einzigartige Perspektive.",
-        }
-
-        key = (type_code, authority_code)
-        return impulses.get(
-            key,
-            "Vertraue deiner inneren Autorität - sie kennt deinen Weg."
-        )
+        authority_code = AUTHORITY_CODE_ALIASES.get(authority_code, authority_code)
+        impulse = get_content_registry().impulse(type_code, authority_code)
+        return impulse or "Vertraue deiner inneren Autorität - sie kennt deinen Weg."
@@ -0,0 +1,366 @@
+"""
+Shadow validation of charts against a secondary ephemeris source.
+
+For a sample of chart requests the chart is recomputed after the response
+has been sent: once with the primary source, exactly as the request was
+served, and once with the secondary source. Per-body longitude deltas,
+gate/line changes and changed chart fields (type, authority, profile,
+cross, channels, centers) are kept as in-process counters, the most recent
+mismatches are kept in memory and every comparison can be appended to a
+JSON Lines log. Comparisons run on a single background thread; when it
+falls behind new samples are dropped rather than queued without bound.
+"""
+
+import json
+import random
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from typing import TYPE_CHECKING, Callable, Deque, Dict, List, Optional, Tuple
+
+from src.models.chart import ChartResponse
+from src.models.shadow import ShadowValidationConfig
+from src.services.calculation.activations import BODIES, ActivationSet
+from src.services.ephemeris.base import EphemerisSource
+
+if TYPE_CHECKING:
+    from src.services.calculation.sun_table import SunLongitudeTable
+
+SIDES = ("personality", "design")
+
+# Chart fields compared between the two sources
+CHART_FIELDS = ("type", "authority", "profile", "incarnation_cross", "channels", "defined_centers")
+
+
+def _wrap_arcsec(delta_degrees: float) -> float:
+    """Signed longitude difference in arcseconds, wrapped to [-648000, 648000)."""
+    return ((delta_degrees + 180.0) % 360.0 - 180.0) * 3600.0
+
+
+def _chart_fields(chart: ChartResponse) -> Dict[str, object]:
+    """Chart properties that may change with the ephemeris source."""
+    return {
+        "type": chart.type.code,
+        "authority": chart.authority.code,
+        "profile": chart.profile.code,
+        "incarnation_cross": chart.incarnationCross.code,
+        "channels": sorted(channel.code for channel in chart.channels),
+        "defined_centers": sorted(center.code for center in chart.centers if center.defined),
+    }
+
+
+def _calculate(
+    source: EphemerisSource, birth_dt_utc: datetime, bodygraph, sun_table=None
+) -> Tuple[ActivationSet, ActivationSet, ChartResponse]:
+    """
+    Calculate both chart sides and the chart with one source.
+
+    With failover configured, one member serves both sides and the chart
+    names that member as its calculation source.
+
+    Returns:
+        (personality activations, design activations, chart)
+    """
+    from src.services.calculation.design_time import calculate_design_datetime
+    from src.services.calculation.position_calculator import PositionCalculator
+
+    def calculate(member: EphemerisSource) -> Tuple[ActivationSet, ActivationSet, ChartResponse]:
+        calculator = PositionCalculator(member)
+        personality = calculator.calculate_activations(birth_dt_utc)
+        design_dt_utc = calculate_design_datetime(birth_dt_utc, member, target_arc=88.0, sun_table=sun_table)
+        design = calculator.calculate_activations(design_dt_utc)
+        chart = bodygraph.calculate_chart(
+            personality, design, "", calculation_source=member.get_source_name()
+        )
+        return personality, design, chart
+
+    return source.run_pinned(calculate)
+
+
+def compare_sources(
+    primary: EphemerisSource,
+    secondary: EphemerisSource,
+    birth_dt_utc: datetime,
+    sun_table=None,
+) -> dict:
+    """
+    Recompute a chart with two sources and describe the differences.
+
+    The primary side uses the Sun table like the chart endpoint does; the
+    secondary side always solves the design time on its own ephemeris.
+
+    Args:
+        primary: Source the chart was served with
+        secondary: Source to compare against
+        birth_dt_utc: Birth datetime in UTC
+        sun_table: Optional Sun table used for the primary design time
+
+    Returns:
+        Comparison record (JSON-serializable)
+    """
+    from src.services.calculation.bodygraph_calculator import BodygraphCalculator
+
+    bodygraph = BodygraphCalculator()
+    primary_sides = _calculate(primary, birth_dt_utc, bodygraph, sun_table)
+    secondary_sides = _calculate(secondary, birth_dt_utc, bodygraph)
+
+    deltas: Dict[str, Dict[str, float]] = {}
+    activation_differences: List[dict] = []
+    for side, ours, theirs in zip(SIDES, primary_sides[:2], secondary_sides[:2]):
+        deltas[side] = {}
+        for (code, lon_a, gate_a, line_a), (_, lon_b, gate_b, line_b) in zip(
+            ours.records.tolist(), theirs.records.tolist()
+        ):
+            body = BODIES[code].value
+            deltas[side][body] = round(_wrap_arcsec(lon_b - lon_a), 3)
+            if (gate_a, line_a) != (gate_b, line_b):
+                activation_differences.append({
+                    "side": side,
+                    "body": body,
+                    "primary": f"{gate_a}.{line_a}",
+                    "secondary": f"{gate_b}.{line_b}",
+                })
+
+    primary_fields = _chart_fields(primary_sides[2])
+    secondary_fields = _chart_fields(secondary_sides[2])
+    chart_differences = {
+        field: {"primary": primary_fields[field], "secondary": secondary_fields[field]}
+        for field in CHART_FIELDS
+        if primary_fields[field] != secondary_fields[field]
+    }
+
+    design_offset_days = secondary_sides[1].julian_day - primary_sides[1].julian_day
+    return {
+        "birth_utc": birth_dt_utc.astimezone(timezone.utc).isoformat(),
+        "primary": primary_sides[2].calculationSource,
+        "secondary": secondary_sides[2].calculationSource,
+        "max_delta_arcsec": max(abs(delta) for side in deltas.values() for delta in side.values()),
+        "design_time_delta_seconds": round(design_offset_days * 86400.0, 3),
+        "deltas_arcsec": deltas,
+        "activation_differences": activation_differences,
+        "chart_differences": chart_differences,
+        "match": not activation_differences and not chart_differences,
+    }
+
+
+class ShadowValidator:
+    """
+    Samples chart requests and compares them against a secondary source in the background.
+    """
+
+    def __init__(
+        self,
+        secondary: str = "openastro_api",
+        sample_rate: float = 0.01,
+        enabled: bool = True,
+        max_pending: int = 32,
+        history: int = 100,
+        log_path: Optional[str] = None,
+        resolve: Optional[Callable[[Optional[str]], EphemerisSource]] = None,
+        sun_table: Optional[Callable[[], Optional["SunLongitudeTable"]]] = None,
+        rng: Optional[random.Random] = None,
+    ):
+        """
+        Initialize shadow validator.
+
+        Args:
+            secondary: Registry name of the source to compare against
+            sample_rate: Share of requests that are validated
+            enabled: Disable to never sample
+            max_pending: Comparisons that may wait before samples are dropped
+            history: Recent mismatches kept in memory
+            log_path: Optional JSON Lines file for every comparison
+            resolve: Source lookup by registry name, None for the default
+                source (the shared source registry if omitted)
+            sun_table: Sun table lookup matching the chart endpoint (the
+                shared table if omitted)
+            rng: Random generator for sampling (injectable for tests)
+        """
+        self.secondary = secondary
+        self.sample_rate = sample_rate
+        self.enabled = enabled
+        self.max_pending = max_pending
+        self.log_path = log_path
+        self._resolve = resolve
+        self._sun_table = sun_table
+        self._rng = rng or random.Random()
+        self._recent: Deque[dict] = deque(maxlen=history)
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._pending = 0
+        self._lock = threading.Lock()
+        self._log_lock = threading.Lock()
+        self._counters: Dict[str, int] = {
+            "sampled": 0,
+            "dropped": 0,
+            "compared": 0,
+            "mismatches": 0,
+            "errors": 0,
+        }
+        self._field_mismatches: Dict[str, int] = {field: 0 for field in CHART_FIELDS}
+        self._activation_mismatches: Dict[str, int] = {}
+        self._max_delta: Dict[str, float] = {}
+
+    @classmethod
+    def from_config(cls, config: Optional[ShadowValidationConfig] = None) -> "ShadowValidator":
+        """
+        Create validator from environment configuration.
+
+        Args:
+            config: Optional explicit configuration (loaded from env if omitted)
+
+        Returns:
+            ShadowValidator instance
+        """
+        config = config or ShadowValidationConfig()
+        return cls(
+            secondary=config.source,
+            sample_rate=config.sample_rate,
+            enabled=config.enabled,
+            max_pending=config.max_pending,
+            history=config.history,
+            log_path=config.log_path,
+        )
+
+    def should_sample(self) -> bool:
+        """Decide whether the current request is shadow-validated."""
+        return self.enabled and self.sample_rate > 0 and self._rng.random() < self.sample_rate
+
+    def submit(self, birth_dt_utc: datetime) -> bool:
+        """
+        Queue a comparison on the shadow worker.
+
+        Args:
+            birth_dt_utc: Birth datetime in UTC of the served chart
+
+        Returns:
+            False if the sample was dropped because the worker is behind
+        """
+        with self._lock:
+            if self._pending >= self.max_pending:
+                self._counters["dropped"] += 1
+                return False
+            self._pending += 1
+            self._counters["sampled"] += 1
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="chart-shadow")
+            executor = self._executor
+        executor.submit(self._run, birth_dt_utc)
+        return True
+
+    def _run(self, birth_dt_utc: datetime) -> None:
+        """Worker entry point: compare and record, never raising."""
+        try:
+            self.validate(birth_dt_utc)
+        except Exception as e:
+            with self._lock:
+                self._counters["errors"] += 1
+            print(f"Shadow validation failed for {birth_dt_utc.isoformat()}: {e}")
+        finally:
+            with self._lock:
+                self._pending -= 1
+
+    def _sources(self):
+        """Resolve the primary and secondary sources."""
+        resolve = self._resolve
+        if resolve is None:
+            from src.services.ephemeris.registry import get_source_registry
+
+            resolve = get_source_registry().get
+        return resolve(None), resolve(self.secondary)
+
+    def validate(self, birth_dt_utc: datetime) -> dict:
+        """
+        Compare a chart synchronously and record the result.
+
+        Args:
+            birth_dt_utc: Birth datetime in UTC
+
+        Returns:
+            Comparison record from compare_sources
+        """
+        if self._sun_table is None:
+            from src.services.calculation.sun_table import get_sun_table
+
+            sun_table = get_sun_table()
+        else:
+            sun_table = self._sun_table()
+
+        primary, secondary = self._sources()
+        record = compare_sources(primary, secondary, birth_dt_utc, sun_table=sun_table)
+        record["recorded_at"] = datetime.now(timezone.utc).isoformat()
+        self._record(record)
+        return record
+
+    def _record(self, record: dict) -> None:
+        """Update counters, keep mismatches and append to the log."""
+        with self._lock:
+            self._counters["compared"] += 1
+            if not record["match"]:
+                self._counters["mismatches"] += 1
+                self._recent.append(record)
+            for field in record["chart_differences"]:
+                self._field_mismatches[field] += 1
+            for difference in record["activation_differences"]:
+                key = f"{difference['side']}.{difference['body']}"
+                self._activation_mismatches[key] = self._activation_mismatches.get(key, 0) + 1
+            for deltas in record["deltas_arcsec"].values():
+                for body, delta in deltas.items():
+                    self._max_delta[body] = max(self._max_delta.get(body, 0.0), abs(delta))
+
+        if self.log_path:
+            line = json.dumps(record, sort_keys=True)
+            with self._log_lock:
+                with open(self.log_path, "a", encoding="utf-8") as log:
+                    log.write(line + "\n")
+
+    def stats(self) -> dict:
+        """
+        Get comparison counters and recent mismatches.
+
+        Returns:
+            Dict with settings, counters, per-field and per-activation
+            mismatch counts, maximum absolute delta per body and recent mismatches
+        """
+        with self._lock:
+            return {
+                "enabled": self.enabled,
+                "secondary": self.secondary,
+                "sample_rate": self.sample_rate,
+                "pending": self._pending,
+                **self._counters,
+                "field_mismatches": dict(self._field_mismatches),
+                "activation_mismatches": dict(self._activation_mismatches),
+                "max_delta_arcsec": dict(self._max_delta),
+                "recent_mismatches": list(self._recent),
+            }
+
+    def close(self, wait: bool = False) -> None:
+        """
+        Stop the shadow worker.
+
+        Args:
+            wait: Finish queued comparisons first
+        """
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=wait, cancel_futures=not wait)
+
+
+_validator: Optional[ShadowValidator] = None
+_validator_lock = threading.Lock()
+
+
+def get_shadow_validator() -> ShadowValidator:
+    """
+    Get the process-wide shadow validator, creating it from configuration on first use.
+
+    Returns:
+        Shared ShadowValidator instance
+    """
+    global _validator
+    with _validator_lock:
+        if _validator is None:
+            _validator = ShadowValidator.from_config()
+        return _validator
@@ -0,0 +1,315 @@
+"""
+Timezone resolution with a quantized grid cache.
+
+TimezoneFinder answers a point from its H3 "shortcut" hexagon: when all
+polygons in the hexagon belong to one zone it returns that zone without a
+polygon test. A grid cell is therefore "interior" when every hexagon that
+can touch it is single-zone with the same zone; such cells resolve from
+the cell table in O(1). Cells crossed by a zone boundary fall through to
+the exact TimezoneFinder lookup.
+"""
+
+import math
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, List, Optional, Tuple
+
+from h3.api import numpy_int as h3
+from timezonefinder import TimezoneFinder
+from timezonefinder.configs import SHORTCUT_H3_RES
+
+from src.models.geocoding import TimezoneConfig
+
+# Cell table marker for cells that need an exact lookup
+BOUNDARY = -1
+
+# Hexagons adjacent to the ones containing a cell's corners cover every
+# hexagon the cell can touch (cells are much smaller than a hexagon)
+_NEIGHBOR_RING = 1
+
+# Cells are widened by this much when testing hexagon overlap, covering the
+# difference between geodesic hexagon edges and straight lat/lng edges
+_OVERLAP_MARGIN = 0.01
+
+
+def _polygon_overlaps_box(
+    polygon: List[Tuple[float, float]], x0: float, x1: float, y0: float, y1: float
+) -> bool:
+    """Check whether a convex (x, y) polygon overlaps a box (Sutherland-Hodgman clip)."""
+    xs = [x for x, _ in polygon]
+    ys = [y for _, y in polygon]
+    if max(xs) < x0 or min(xs) > x1 or max(ys) < y0 or min(ys) > y1:
+        return False
+
+    points = polygon
+    for axis, bound, keep_above in ((0, x0, True), (0, x1, False), (1, y0, True), (1, y1, False)):
+        clipped = []
+        for i, b in enumerate(points):
+            a = points[i - 1]
+            a_in = (a[axis] >= bound) if keep_above else (a[axis] <= bound)
+            b_in = (b[axis] >= bound) if keep_above else (b[axis] <= bound)
+            if a_in != b_in:
+                t = (bound - a[axis]) / (b[axis] - a[axis])
+                clipped.append((a[0] + t * (b[0] - a[0]), a[1] + t * (b[1] - a[1])))
+            if b_in:
+                clipped.append(b)
+        points = clipped
+        if not points:
+            return False
+    return True
+
+
+def parse_bounds(value: Optional[str]) -> Optional[Tuple[float, float, float, float]]:
+    """
+    Parse 'lat_min,lat_max,lng_min,lng_max'.
+
+    Args:
+        value: Bounds string, or None/empty
+
+    Returns:
+        Tuple of bounds, or None
+    """
+    if not value or not value.strip():
+        return None
+    lat_min, lat_max, lng_min, lng_max = (float(part) for part in value.split(","))
+    return lat_min, lat_max, lng_min, lng_max
+
+
+class TimezoneResolver:
+    """
+    Resolves coordinates to IANA timezone names through a memoized cell table.
+    """
+
+    def __init__(
+        self,
+        in_memory: bool = True,
+        cell_degrees: float = 0.1,
+        exact_cache_size: int = 4096,
+        finder: Optional[TimezoneFinder] = None,
+    ):
+        """
+        Initialize resolver and load TimezoneFinder data.
+
+        Args:
+            in_memory: Load polygon data into memory instead of reading from disk
+            cell_degrees: Grid cell size in degrees
+            exact_cache_size: Number of exact boundary lookups to remember
+            finder: Existing TimezoneFinder to use (skips loading)
+        """
+        self.in_memory = in_memory
+        self.cell_degrees = cell_degrees
+        self.exact_cache_size = exact_cache_size
+        self._rows = math.ceil(180.0 / cell_degrees)
+        self._cols = math.ceil(360.0 / cell_degrees)
+
+        load_start = time.perf_counter()
+        self.finder = finder if finder is not None else TimezoneFinder(in_memory=in_memory)
+        self.load_seconds = time.perf_counter() - load_start
+
+        # cell index -> zone id, or BOUNDARY
+        self._cells: Dict[int, int] = {}
+        # H3 hexagon -> unique zone id, or BOUNDARY
+        self._hex_zones: Dict[int, int] = {}
+        self._exact: "OrderedDict[Tuple[float, float], Optional[str]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._counters = {
+            mode: {"count": 0, "seconds": 0.0} for mode in ("cell", "exact", "exact_cached", "classify")
+        }
+
+    @classmethod
+    def from_config(cls, config: Optional[TimezoneConfig] = None) -> "TimezoneResolver":
+        """
+        Create resolver from environment configuration and precompute the configured region.
+
+        Args:
+            config: Optional explicit configuration (loaded from env if omitted)
+
+        Returns:
+            TimezoneResolver instance
+        """
+        config = config or TimezoneConfig()
+        resolver = cls(
+            in_memory=config.in_memory,
+            cell_degrees=config.cell_degrees,
+            exact_cache_size=config.exact_cache_size,
+        )
+        bounds = parse_bounds(config.precompute_bounds)
+        if bounds is not None:
+            resolver.precompute(*bounds)
+        return resolver
+
+    def _cell_index(self, lat: float, lng: float) -> int:
+        row = min(int((lat + 90.0) / self.cell_degrees), self._rows - 1)
+        col = min(int((lng + 180.0) / self.cell_degrees), self._cols - 1)
+        return row * self._cols + col
+
+    def _hex_zone(self, hex_id: int) -> int:
+        """Get the unique zone id of a shortcut hexagon (memoized)."""
+        zone = self._hex_zones.get(hex_id)
+        if zone is None:
+            lat, lng = h3.h3_to_geo(hex_id)
+            unique = self.finder.unique_zone_id(lng=lng, lat=lat)
+            zone = BOUNDARY if unique is None else int(unique)
+            self._hex_zones[hex_id] = zone
+        return zone
+
+    def _classify(self, cell: int) -> int:
+        """Determine the zone of a cell, or BOUNDARY if more than one zone may touch it."""
+        row, col = divmod(cell, self._cols)
+        lat_lo = row * self.cell_degrees - 90.0
+        lng_lo = col * self.cell_degrees - 180.0
+        lat_hi = min(lat_lo + self.cell_degrees, 90.0)
+        lng_hi = min(lng_lo + self.cell_degrees, 180.0)
+
+        hexes = set()
+        for lat in (lat_lo, lat_hi):
+            for lng in (lng_lo, lng_hi):
+                hexes.update(h3.k_ring(h3.geo_to_h3(lat, lng, SHORTCUT_H3_RES), _NEIGHBOR_RING))
+
+        zone = None
+        for hex_id in hexes:
+            hex_id = int(hex_id)
+            outline = [(lng, lat) for lat, lng in h3.h3_to_geo_boundary(hex_id)]
+            lngs = [lng for lng, _ in outline]
+            # Hexagons crossing the antimeridian are kept (conservative)
+            if max(lngs) - min(lngs) < 180.0 and not _polygon_overlaps_box(
+                outline,
+                lng_lo - _OVERLAP_MARGIN, lng_hi + _OVERLAP_MARGIN,
+                lat_lo - _OVERLAP_MARGIN, lat_hi + _OVERLAP_MARGIN,
+            ):
+                continue
+            hex_zone = self._hex_zone(hex_id)
+            if hex_zone == BOUNDARY or (zone is not None and hex_zone != zone):
+                return BOUNDARY
+            zone = hex_zone
+        return BOUNDARY if zone is None else zone
+
+    def _record(self, mode: str, start: float) -> None:
+        counter = self._counters[mode]
+        counter["count"] += 1
+        counter["seconds"] += time.perf_counter() - start
+
+    def precompute(self, lat_min: float, lat_max: float, lng_min: float, lng_max: float) -> int:
+        """
+        Classify all cells in a region ahead of time.
+
+        Args:
+            lat_min: Southern edge
+            lat_max: Northern edge
+            lng_min: Western edge
+            lng_max: Eastern edge
+
+        Returns:
+            Number of interior cells in the region
+        """
+        interior = 0
+        half = self.cell_degrees / 2
+        lat = lat_min + half
+        while lat < lat_max:
+            lng = lng_min + half
+            while lng < lng_max:
+                cell = self._cell_index(lat, lng)
+                with self._lock:
+                    if cell not in self._cells:
+                        self._cells[cell] = self._classify(cell)
+                    if self._cells[cell] != BOUNDARY:
+                        interior += 1
+                lng += self.cell_degrees
+            lat += self.cell_degrees
+        return interior
+
+    def timezone_at(self, lat: float, lng: float) -> Optional[str]:
+        """
+        Resolve coordinates to a timezone name.
+
+        Returns the same result as TimezoneFinder.timezone_at.
+
+        Args:
+            lat: Latitude in degrees
+            lng: Longitude in degrees
+
+        Returns:
+            IANA timezone name, or None if the point is not covered
+        """
+        start = time.perf_counter()
+        cell = self._cell_index(lat, lng)
+
+        with self._lock:
+            zone = self._cells.get(cell)
+            if zone is None:
+                # First visit to this cell; the lookup itself is timed below
+                zone = self._classify(cell)
+                self._cells[cell] = zone
+                self._record("classify", start)
+                start = time.perf_counter()
+            if zone != BOUNDARY:
+                self._record("cell", start)
+                return self.finder.zone_name_from_id(zone)
+
+            key = (lat, lng)
+            if key in self._exact:
+                self._exact.move_to_end(key)
+                self._record("exact_cached", start)
+                return self._exact[key]
+
+            # File-backed finders share seekable handles, so this stays under the lock
+            timezone_str = self.finder.timezone_at(lng=lng, lat=lat)
+            if self.exact_cache_size:
+                self._exact[key] = timezone_str
+                while len(self._exact) > self.exact_cache_size:
+                    self._exact.popitem(last=False)
+            self._record("exact", start)
+        return timezone_str
+
+    def stats(self) -> dict:
+        """
+        Get load cost, table size and per-mode lookup latency.
+
+        Returns:
+            Dict with finder, cell table and lookup statistics
+        """
+        with self._lock:
+            boundary = sum(1 for zone in self._cells.values() if zone == BOUNDARY)
+            lookups = {
+                mode: {
+                    "count": counter["count"],
+                    "mean_us": (counter["seconds"] / counter["count"] * 1e6) if counter["count"] else 0.0,
+                }
+                for mode, counter in self._counters.items()
+            }
+            # Rough CPython dict footprint: ~100 bytes per int -> int entry
+            table_bytes = 100 * (len(self._cells) + len(self._hex_zones)) + 200 * len(self._exact)
+            return {
+                "finder": {
+                    "in_memory": self.in_memory,
+                    "load_seconds": round(self.load_seconds, 3),
+                },
+                "cells": {
+                    "cell_degrees": self.cell_degrees,
+                    "entries": len(self._cells),
+                    "interior": len(self._cells) - boundary,
+                    "boundary": boundary,
+                    "exact_cached": len(self._exact),
+                    "approx_bytes": table_bytes,
+                },
+                "lookups": lookups,
+            }
+
+
+_resolver: Optional[TimezoneResolver] = None
+_resolver_lock = threading.Lock()
+
+
+def get_timezone_resolver() -> TimezoneResolver:
+    """
+    Get the process-wide timezone resolver, loading it on first use.
+
+    Returns:
+        Shared TimezoneResolver instance
+    """
+    global _resolver
+    with _resolver_lock:
+        if _resolver is None:
+            _resolver = TimezoneResolver.from_config()
+        return _resolver
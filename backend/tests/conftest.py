@@ -7,3 +7,19 @@ from pathlib import Path
 # Add src directory to Python path
 backend_dir = Path(__file__).parent.parent
 sys.path.insert(0, str(backend_dir))
+
+
+class FakeClock:
+    """Manually advanced monotonic clock"""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    """Clock starting at 0.0 that tests advance by setting or adding to .now"""
+    return FakeClock()
@@ -0,0 +1,103 @@
+"""Local stub of the OpenAstro API for end-to-end tests of OpenAstroAPISource"""
+
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+import swisseph as swe
+
+# OpenAstro body identifiers to swisseph bodies
+STUB_BODIES = {
+    0: swe.SUN, 1: swe.MOON, 2: swe.MERCURY, 3: swe.VENUS, 4: swe.MARS, 5: swe.JUPITER,
+    6: swe.SATURN, 7: swe.URANUS, 8: swe.NEPTUNE, 9: swe.PLUTO, 10: swe.TRUE_NODE,
+}
+
+
+class OpenAstroStub:
+    """
+    Threaded HTTP server answering GET /v1/positions from swisseph.
+
+    fail_with holds status codes returned (one per request) before normal
+    answers resume; while down is set every request gets 503.
+    """
+
+    def __init__(self):
+        self.requests = []
+        self.fail_with = []
+        self.down = False
+        self._lock = threading.Lock()
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def log_message(self, format, *args):
+                pass
+
+            def _reply(self, status, payload=None):
+                body = json.dumps(payload).encode() if payload is not None else b""
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                if self.command != "HEAD":
+                    self.wfile.write(body)
+
+            def do_HEAD(self):
+                stub._record(self.command, self.path)
+                self._reply(503 if stub.down else 200)
+
+            def do_GET(self):
+                stub._record(self.command, self.path)
+                status = stub._next_failure()
+                if status:
+                    self._reply(status, {"error": "unavailable"})
+                    return
+
+                url = urlparse(self.path)
+                query = parse_qs(url.query)
+                if url.path != "/v1/positions" or "jd" not in query or "bodies" not in query:
+                    self._reply(400, {"error": "bad request"})
+                    return
+                try:
+                    jd = float(query["jd"][0])
+                    body_ids = [int(i) for i in query["bodies"][0].split(",")]
+                    positions = {
+                        str(i): swe.calc_ut(jd, STUB_BODIES[i], swe.FLG_SWIEPH | swe.FLG_SPEED)[0][0]
+                        for i in body_ids
+                    }
+                except (KeyError, ValueError):
+                    self._reply(400, {"error": "bad request"})
+                    return
+                self._reply(200, {"jd": jd, "positions": positions})
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.server.daemon_threads = True
+        self.url = f"http://127.0.0.1:{self.server.server_address[1]}/v1"
+        self._thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+
+    def _record(self, method, path):
+        with self._lock:
+            self.requests.append((method, path))
+
+    def _next_failure(self):
+        with self._lock:
+            if self.down:
+                return 503
+            if self.fail_with:
+                return self.fail_with.pop(0)
+            return None
+
+    def get_requests(self):
+        """Number of GET requests received"""
+        with self._lock:
+            return sum(1 for method, _ in self.requests if method == "GET")
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.server.shutdown()
+        self.server.server_close()
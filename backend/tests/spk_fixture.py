@@ -0,0 +1,124 @@
+"""
+Synthetic JPL SPK kernels for tests.
+
+write_spk writes a little-endian DAF/SPK file with type 2 (Chebyshev
+position) segments. build_kernel_from_swisseph fits such segments to
+swisseph's barycentric ICRF positions, laid out like a DE kernel: Earth
+and Moon relative to the Earth-Moon barycenter, everything else relative
+to the solar system barycenter.
+"""
+
+import struct
+from typing import List, NamedTuple
+
+import numpy as np
+import swisseph as swe
+from numpy.polynomial import chebyshev
+
+AU_KM = 149597870.7
+EARTH_MOON_MASS_RATIO = 81.3005682214972
+J2000 = 2451545.0
+SECONDS_PER_DAY = 86400.0
+
+FTPSTR = b"FTPSTR:\r:\n:\r\n:\r\x00:\x81:\x10\xce:ENDFTP"
+
+
+class Segment(NamedTuple):
+    """Type 2 segment to write"""
+
+    target: int
+    center: int
+    init: float  # TDB seconds past J2000 of the first interval start
+    interval: float  # interval length in seconds
+    coefficients: np.ndarray  # shape (intervals, 3, degree + 1), km
+
+
+def write_spk(path, segments: List[Segment], frame: int = 1) -> None:
+    """Write segments as a little-endian SPK kernel"""
+    doubles_per_summary = 5  # ND=2 doubles + NI=6 ints packed in 3 doubles
+    assert len(segments) <= (128 - 3) // doubles_per_summary
+
+    data = []
+    summaries = []
+    address = 3 * 128 + 1  # data starts in record 4
+    for segment in segments:
+        count, _, size = segment.coefficients.shape
+        radius = segment.interval / 2.0
+        mids = segment.init + radius + segment.interval * np.arange(count)
+        records = np.column_stack([mids, np.full(count, radius), segment.coefficients.reshape(count, 3 * size)])
+        words = np.concatenate([records.ravel(), [segment.init, segment.interval, 2 + 3 * size, count]])
+        start, end = address, address + len(words) - 1
+        summaries.append(
+            struct.pack("<2d6i", segment.init, segment.init + segment.interval * count,
+                        segment.target, segment.center, frame, 2, start, end)
+        )
+        data.append(words)
+        address = end + 1
+
+    file_record = bytearray(1024)
+    file_record[0:8] = b"DAF/SPK "
+    struct.pack_into("<ii", file_record, 8, 2, 6)
+    file_record[16:76] = b"synthetic test kernel".ljust(60)
+    struct.pack_into("<iii", file_record, 76, 2, 2, address)
+    file_record[88:96] = b"LTL-IEEE"
+    file_record[699:699 + len(FTPSTR)] = FTPSTR
+
+    summary_record = bytearray(1024)
+    struct.pack_into("<3d", summary_record, 0, 0.0, 0.0, float(len(segments)))
+    for i, summary in enumerate(summaries):
+        summary_record[24 + i * 40:24 + (i + 1) * 40] = summary
+
+    name_record = bytearray(b" " * 1024)
+    for i, segment in enumerate(segments):
+        name_record[i * 40:(i + 1) * 40] = f"TARGET {segment.target}".ljust(40).encode()
+
+    with open(path, "wb") as handle:
+        handle.write(file_record)
+        handle.write(summary_record)
+        handle.write(name_record)
+        handle.write(np.concatenate(data).astype("<f8").tobytes())
+
+
+def fit_segment(target, center, function, start_jd, end_jd, interval_days, degree) -> Segment:
+    """Fit Chebyshev coefficients to function(jd_tdb) -> km vector over [start_jd, end_jd)"""
+    count = int(np.ceil((end_jd - start_jd) / interval_days))
+    nodes = np.cos(np.pi * (np.arange(degree + 1) + 0.5) / (degree + 1))
+    coefficients = np.empty((count, 3, degree + 1))
+    for i in range(count):
+        mid = start_jd + (i + 0.5) * interval_days
+        samples = np.array([function(mid + s * interval_days / 2.0) for s in nodes])
+        for axis in range(3):
+            coefficients[i, axis] = chebyshev.chebfit(nodes, samples[:, axis], degree)
+    return Segment(target, center, (start_jd - J2000) * SECONDS_PER_DAY, interval_days * SECONDS_PER_DAY, coefficients)
+
+
+def _barycentric(body):
+    """swisseph barycentric ICRF position of a body in km, as a function of JD (TT)"""
+    flags = (swe.FLG_SWIEPH | swe.FLG_BARYCTR | swe.FLG_ICRS | swe.FLG_J2000 | swe.FLG_EQUATORIAL
+             | swe.FLG_XYZ | swe.FLG_TRUEPOS | swe.FLG_NOABERR | swe.FLG_NOGDEFL)
+    return lambda jd: np.array(swe.calc(jd, body, flags)[0][:3]) * AU_KM
+
+
+def build_kernel_from_swisseph(path, start_jd, end_jd, interval_days=4.0, degree=13) -> None:
+    """Write a DE-like kernel covering [start_jd, end_jd) from swisseph positions"""
+    earth, moon = _barycentric(swe.EARTH), _barycentric(swe.MOON)
+
+    def barycenter(jd):
+        return (earth(jd) * EARTH_MOON_MASS_RATIO + moon(jd)) / (EARTH_MOON_MASS_RATIO + 1.0)
+
+    def fit(target, center, function):
+        return fit_segment(target, center, function, start_jd, end_jd, interval_days, degree)
+
+    segments = [
+        fit(3, 0, barycenter),
+        fit(399, 3, lambda jd: earth(jd) - barycenter(jd)),
+        fit(301, 3, lambda jd: moon(jd) - barycenter(jd)),
+        fit(10, 0, _barycentric(swe.SUN)),
+    ]
+    for code, body in enumerate(
+        (swe.MERCURY, swe.VENUS, None, swe.MARS, swe.JUPITER, swe.SATURN, swe.URANUS, swe.NEPTUNE, swe.PLUTO),
+        start=1,
+    ):
+        if body is not None:
+            segments.append(fit(code, 0, _barycentric(body)))
+    write_spk(path, segments)
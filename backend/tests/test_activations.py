@@ -0,0 +1,89 @@
+"""Test compact activation records"""
+
+from datetime import datetime
+
+import numpy as np
+import pytest
+import pytz
+
+from src.models.celestial import CelestialBody
+from src.services.calculation.activations import ActivationSet
+from src.services.calculation.bodygraph_calculator import BodygraphCalculator
+from src.services.calculation.design_time import calculate_design_datetime
+from src.services.calculation.gate_line_mapper import ecliptic_to_gate_line
+from src.services.calculation.position_calculator import PositionCalculator
+from src.services.ephemeris.swiss_ephemeris import SwissEphemerisSource
+
+BODIES = list(CelestialBody)
+
+
+@pytest.fixture(scope="module")
+def positions():
+    """Create position calculator"""
+    return PositionCalculator(SwissEphemerisSource())
+
+
+class TestActivationSet:
+    """Test ActivationSet construction and conversion"""
+
+    def test_from_longitudes_maps_gates(self):
+        """Test that records carry the gate and line of each longitude"""
+        longitudes = np.linspace(0.0, 359.9, len(BODIES)).tolist()
+        activations = ActivationSet.from_longitudes(BODIES, longitudes, 2451545.0, "test")
+
+        assert len(activations) == len(BODIES)
+        assert activations.bodies == BODIES
+        for (code, longitude, gate, line), expected in zip(activations.records.tolist(), longitudes):
+            assert longitude == expected
+            assert (gate, line) == ecliptic_to_gate_line(expected)
+
+    def test_find(self):
+        """Test body lookup"""
+        activations = ActivationSet.from_longitudes(
+            [CelestialBody.MOON, CelestialBody.SUN], [10.0, 20.0], 0.0, "test"
+        )
+        assert activations.find(CelestialBody.SUN) == 1
+        assert activations.find(CelestialBody.PLUTO) is None
+
+    def test_positions_round_trip(self, positions):
+        """Test that conversion to PlanetaryPosition and back keeps every field"""
+        birth = datetime(1990, 6, 15, 12, 30, tzinfo=pytz.UTC)
+        activations = positions.calculate_activations(birth)
+        models = activations.to_positions()
+
+        assert [p.body for p in models] == BODIES
+        assert all(p.gate_line == f"{p.gate}.{p.line}" for p in models)
+        assert all(p.source == "SwissEphemeris" for p in models)
+        assert len({p.calculation_timestamp for p in models}) == 1
+        assert ActivationSet.from_positions(models).records.tolist() == activations.records.tolist()
+
+
+class TestChartFromActivations:
+    """Test that the chart pipeline gives the same result for records and models"""
+
+    def test_identical_to_position_models(self, positions):
+        """Test that charts from ActivationSets equal charts from PlanetaryPosition lists"""
+        calculator = BodygraphCalculator()
+        source = positions.ephemeris_source
+        for birth in (
+            datetime(1990, 6, 15, 12, 30, tzinfo=pytz.UTC),
+            datetime(1955, 2, 24, 3, 15, tzinfo=pytz.UTC),
+            datetime(2004, 11, 2, 23, 59, tzinfo=pytz.UTC),
+        ):
+            design = calculate_design_datetime(birth, source)
+            from_records = calculator.calculate_chart(
+                positions.calculate_activations(birth), positions.calculate_activations(design), "Anna"
+            )
+            from_models = calculator.calculate_chart(
+                positions.calculate_positions(birth), positions.calculate_positions(design), "Anna"
+            )
+            assert from_records.model_dump_json() == from_models.model_dump_json()
+
+    def test_missing_body_rejected(self):
+        """Test that incomplete activation sets raise ValueError"""
+        calculator = BodygraphCalculator()
+        complete = ActivationSet.from_longitudes(BODIES, [0.0] * len(BODIES), 0.0, "test")
+        partial = ActivationSet.from_longitudes(BODIES[:-1], [0.0] * (len(BODIES) - 1), 0.0, "test")
+
+        with pytest.raises(ValueError, match="Pluto"):
+            calculator.calculate_chart(complete, partial, "Anna")
@@ -0,0 +1,189 @@
+"""Test bitmask bodygraph engine against the set-based engine"""
+
+import random
+from datetime import datetime, timedelta
+
+import pytest
+import pytz
+
+import numpy as np
+
+from src.services.calculation.bitmask_engine import (
+    AUTHORITY_CODES,
+    TYPE_CODES,
+    BitmaskBodygraph,
+    CenterLinkTable,
+    gate_mask,
+    gate_masks,
+    popcount,
+)
+from src.services.calculation.bodygraph_calculator import BodygraphCalculator
+from src.services.calculation.design_time import calculate_design_datetime
+from src.services.calculation.position_calculator import PositionCalculator
+from src.services.ephemeris.swiss_ephemeris import SwissEphemerisSource
+
+
+@pytest.fixture(scope="module")
+def calculator():
+    """Create calculator (both engines are available on one instance)"""
+    return BodygraphCalculator()
+
+
+def random_gate_sets(count, seed=11):
+    """Random active-gate sets from empty to densely activated"""
+    rng = random.Random(seed)
+    for _ in range(count):
+        yield set(rng.sample(range(1, 65), rng.randint(0, 40)))
+
+
+class TestBitmaskBodygraph:
+    """Test mask compilation"""
+
+    def test_reversed_duplicates_removed(self, calculator):
+        """Test that reversed channel duplicates are compiled once, first orientation kept"""
+        codes = [channel.code for channel in calculator.masks.channels]
+        assert len(codes) == len(set(codes))
+        assert "30-41" in codes and "41-30" not in codes
+        assert "33-13" in codes and "13-33" not in codes
+        pairs = {tuple(sorted(map(int, code.split("-")))) for code in codes}
+        assert len(pairs) == len(codes)
+
+    def test_gate_mask(self):
+        """Test gate bits and popcount"""
+        assert gate_mask([1, 64]) == 1 | (1 << 63)
+        assert popcount(gate_mask(range(1, 65))) == 64
+
+    def test_gate_masks_match_scalar(self):
+        """Test that vectorized gate masks equal gate_mask per row"""
+        rng = np.random.default_rng(3)
+        gates = rng.integers(1, 65, size=(50, 13))
+        assert gate_masks(gates).tolist() == [gate_mask(row) for row in gates.tolist()]
+
+    def test_resolve_many_matches_resolve(self, calculator):
+        """Test that vectorized link masks equal resolve() per chart"""
+        masks = calculator.masks
+        gate_sets = list(random_gate_sets(200, seed=5))
+        active = np.asarray([gate_mask(gates) for gates in gate_sets], dtype=np.uint64)
+        expected = [masks.resolve(gate_mask(gates)).link_mask for gates in gate_sets]
+        assert masks.resolve_many(active).tolist() == expected
+
+    def test_throat_component(self):
+        """Test connectivity through an intermediate center"""
+        masks = BitmaskBodygraph(
+            [(1, 2, "throat", "g"), (3, 4, "g", "sacral"), (5, 6, "head", "ajna")],
+            ["head", "ajna", "throat", "g", "sacral"],
+        )
+        both = masks.resolve(gate_mask([1, 2, 3, 4]))
+        assert masks.motor_to_throat(both.link_mask)
+        only_g = masks.resolve(gate_mask([3, 4, 5, 6]))
+        assert not masks.motor_to_throat(only_g.link_mask)
+
+
+class TestEngineEquivalence:
+    """Test that both engines resolve identical structures"""
+
+    def test_random_gate_sets(self, calculator):
+        """Test channels, centers, type and authority on random gate sets"""
+        for gates in random_gate_sets(3000):
+            by_sets = calculator._resolve_sets(gates)
+            by_masks = calculator._resolve_bitmask(gates)
+            assert [c.model_dump() for c in by_masks[0]] == [c.model_dump() for c in by_sets[0]]
+            assert by_masks[1] == by_sets[1]
+            assert by_masks[2] == by_sets[2]
+            assert by_masks[3] == by_sets[3]
+
+    def test_full_charts_byte_identical(self):
+        """Test that complete chart JSON is identical for real birth moments"""
+        source = SwissEphemerisSource()
+        positions = PositionCalculator(source)
+        sets_engine = BodygraphCalculator(engine="sets")
+        mask_engine = BodygraphCalculator(engine="bitmask")
+
+        rng = random.Random(3)
+        base = datetime(1950, 1, 1, tzinfo=pytz.UTC)
+        for _ in range(25):
+            birth = base + timedelta(minutes=rng.randrange(0, 70 * 365 * 24 * 60))
+            design = calculate_design_datetime(birth, source)
+            personality = positions.calculate_positions(birth)
+            design_positions = positions.calculate_positions(design)
+
+            expected = sets_engine.calculate_chart(personality, design_positions, "Anna")
+            actual = mask_engine.calculate_chart(personality, design_positions, "Anna")
+            assert actual.model_dump_json() == expected.model_dump_json()
+
+    def test_unknown_engine_rejected(self):
+        """Test that unknown engine names are rejected"""
+        with pytest.raises(ValueError):
+            BodygraphCalculator(engine="graph")
+
+
+class TestCenterLinkTable:
+    """Test the precomputed type/authority table"""
+
+    def link_mask(self, masks, *pairs):
+        """Build a link mask from center pairs"""
+        mask = 0
+        for c1, c2 in pairs:
+            centers = masks.center_bits[c1] | masks.center_bits[c2]
+            mask |= 1 << masks.links.index(centers)
+        return mask
+
+    def test_covers_every_link_combination(self, calculator):
+        """Test table size"""
+        masks = calculator.masks
+        assert len(masks.table) == 2 ** len(masks.links)
+
+    def test_matches_branch_ladder(self, calculator):
+        """Test entries against BFS type and authority determination"""
+        masks = calculator.masks
+        names = {bit: code for code, bit in masks.center_bits.items()}
+        for link_mask in range(0, len(masks.table), 7):
+            active_channels = {}
+            for i, link in enumerate(masks.links):
+                if link_mask >> i & 1:
+                    pair = tuple(names[bit] for bit in names if link & bit)
+                    active_channels[(i, i)] = pair
+            defined = {center for pair in active_channels.values() for center in pair}
+
+            entry = masks.table.lookup(link_mask)
+            expected_type = calculator._determine_type(defined, active_channels)
+            expected_authority = calculator._determine_authority(defined, expected_type.code)
+            assert entry.type_code == expected_type.code
+            assert entry.authority_code == expected_authority.code
+            assert entry.motor_to_throat == calculator._check_motor_to_throat(defined, active_channels)
+            assert {names[bit] for bit in names if entry.center_mask & bit} == defined
+
+    def test_split(self, calculator):
+        """Test definition split counting"""
+        masks = calculator.masks
+        table = masks.table
+        assert table.lookup(0).split == "none"
+        assert table.lookup(self.link_mask(masks, ("head", "ajna"))).split == "single"
+        assert table.lookup(self.link_mask(
+            masks, ("head", "ajna"), ("ajna", "throat"), ("throat", "g")
+        )).split == "single"
+        assert table.lookup(self.link_mask(
+            masks, ("head", "ajna"), ("sacral", "root")
+        )).split == "split"
+        assert table.lookup(self.link_mask(
+            masks, ("head", "ajna"), ("sacral", "root"), ("throat", "g")
+        )).split == "triple"
+
+    def test_lookup_many(self, calculator):
+        """Test that bulk lookups return the same packed entries"""
+        table = calculator.masks.table
+        link_masks = [0, 1, 5, 1000, len(table) - 1]
+        packed = table.lookup_many(link_masks)
+        assert [table.decode(int(p)) for p in packed] == [table.lookup(m) for m in link_masks]
+
+    def test_decode_many(self, calculator):
+        """Test that vectorized decoding equals decode() per entry"""
+        table = calculator.masks.table
+        packed = table.lookup_many(np.arange(0, len(table), 997))
+        columns = CenterLinkTable.decode_many(packed)
+        for i, value in enumerate(packed.tolist()):
+            entry = table.decode(value)
+            assert columns.center_mask[i] == entry.center_mask
+            assert TYPE_CODES[columns.type_index[i]] == entry.type_code
+            assert AUTHORITY_CODES[columns.authority_index[i]] == entry.authority_code
+            assert bool(columns.motor_to_throat[i]) == entry.motor_to_throat
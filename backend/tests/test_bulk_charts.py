@@ -0,0 +1,210 @@
+"""Test columnar bulk chart calculation and resumable bulk runs"""
+
+import csv
+import random
+from datetime import datetime, timedelta
+
+import numpy as np
+import pytest
+
+from src.models.celestial import CelestialBody
+from src.services.calculation import bulk
+from src.services.calculation.bodygraph_calculator import BodygraphCalculator
+from src.services.calculation.bulk import BULK_COLUMNS, BulkChartWorker, iter_row_chunks, run_bulk
+from src.services.calculation.engine import calculate_chart_for_instant
+from src.services.calculation.gate_line_mapper import ecliptic_to_gate_line
+from src.services.ephemeris.composite import CompositeEphemerisSource
+from src.services.ephemeris.swiss_ephemeris import SwissEphemerisSource
+from src.models.chart import PlanetaryPosition
+
+
+class ShiftedSource(SwissEphemerisSource):
+    """Swiss Ephemeris shifted by a fixed angle, failing after a number of position calls"""
+
+    def __init__(self, name, shift=0.0, fail_after=None):
+        super().__init__()
+        self.name = name
+        self.shift = shift
+        self.fail_after = fail_after
+        self.calls = 0
+
+    def calculate_positions(self, bodies, julian_day):
+        self.calls += 1
+        if self.fail_after is not None and self.calls > self.fail_after:
+            raise RuntimeError(f"{self.name} exploded")
+        return [(lon + self.shift) % 360.0 for lon in super().calculate_positions(bodies, julian_day)]
+
+    def get_source_name(self):
+        return self.name
+
+
+@pytest.fixture(scope="module")
+def worker():
+    """Create a warm worker"""
+    worker = BulkChartWorker()
+    worker.warm()
+    return worker
+
+
+def _positions(longitudes):
+    """Build PlanetaryPositions in CelestialBody order"""
+    now = datetime.utcnow()
+    positions = []
+    for body, longitude in zip(CelestialBody, longitudes):
+        gate, line = ecliptic_to_gate_line(longitude)
+        positions.append(PlanetaryPosition(
+            body=body, ecliptic_longitude=longitude, gate=gate, line=line,
+            gate_line=f"{gate}.{line}", calculation_timestamp=now, julian_day=0.0, source="test",
+        ))
+    return positions
+
+
+def _write_csv(path, count, seed=4):
+    """Write an input CSV of random Berlin births"""
+    rng = random.Random(seed)
+    with open(path, "w", encoding="utf-8", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(["id", "birthDate", "birthTime", "timezone"])
+        for i in range(count):
+            moment = datetime(1950, 1, 1) + timedelta(minutes=rng.randrange(0, 60 * 365 * 24 * 60))
+            writer.writerow([f"row{i}", moment.strftime("%d.%m.%Y"), moment.strftime("%H:%M"), "Europe/Berlin"])
+
+
+def _read_parts(output_dir):
+    """Read all CSV part files in chunk order"""
+    rows = []
+    for part in sorted(output_dir.glob("part-*.csv")):
+        with open(part, "r", encoding="utf-8", newline="") as f:
+            rows.extend(csv.DictReader(f))
+    return rows
+
+
+class TestCalculateColumns:
+    """Test BodygraphCalculator.calculate_columns"""
+
+    def test_matches_calculate_chart(self):
+        """Test that columnar results equal full charts for random positions"""
+        calculator = BodygraphCalculator()
+        rng = np.random.default_rng(8)
+        personality = rng.uniform(0, 360, size=(100, len(CelestialBody)))
+        design = rng.uniform(0, 360, size=(100, len(CelestialBody)))
+        columns = calculator.calculate_columns(personality, design)
+
+        for i in range(100):
+            chart = calculator.calculate_chart(_positions(personality[i]), _positions(design[i]), "X")
+            conscious = {int(g.split(".")[0]) for g in chart.gates["conscious"]}
+            unconscious = {int(g.split(".")[0]) for g in chart.gates["unconscious"]}
+            assert int(columns.personality_gates[i]) == sum(1 << (g - 1) for g in conscious)
+            assert int(columns.design_gates[i]) == sum(1 << (g - 1) for g in unconscious)
+            defined = [c.code for c in chart.centers if c.defined]
+            assert [code for bit, code in enumerate(calculator.CENTER_NAMES)
+                    if int(columns.defined_centers[i]) >> bit & 1] == defined
+            assert columns.type_code[i] == chart.type.code
+            assert columns.authority_code[i] == chart.authority.code
+            assert columns.profile[i] == chart.profile.code
+            assert columns.cross_code[i] == chart.incarnationCross.code
+            assert columns.cross_name[i] == chart.incarnationCross.name
+
+
+class TestBulkChartWorker:
+    """Test per-row resolution and chunk calculation"""
+
+    def test_matches_single_chart_pipeline(self, worker):
+        """Test that bulk rows equal the charts served by the API pipeline"""
+        rows = [
+            {"birthDate": "15.06.1990", "birthTime": "14:30", "timezone": "Europe/Berlin"},
+            {"birthDate": "01.01.1975", "birthTime": "03:05", "timezone": "America/New_York"},
+        ]
+        columns = worker.compute(rows, ["a", "b"])
+
+        for i, row in enumerate(rows):
+            chart = calculate_chart_for_instant(worker.birth_instant(row), "X")
+            assert columns["type"][i] == chart.type.code
+            assert columns["authority"][i] == chart.authority.code
+            assert columns["profile"][i] == chart.profile.code
+            assert columns["cross_code"][i] == chart.incarnationCross.code
+            assert columns["error"][i] is None
+        assert columns["birth_utc"][0] == "1990-06-15T12:30Z"
+
+    def test_row_stays_on_one_failover_member(self):
+        """Test that a primary failing between personality and design recalculates the row on the secondary"""
+        primary = ShiftedSource("A", fail_after=1)
+        secondary = ShiftedSource("B", shift=7.0)
+        composite = CompositeEphemerisSource([("A", primary), ("B", secondary)])
+        rows = [{"birthDate": "15.06.1990", "birthTime": "14:30", "timezone": "Europe/Berlin"}]
+
+        columns = BulkChartWorker(ephemeris_source=composite).compute(rows, ["a"])
+        expected = BulkChartWorker(ephemeris_source=ShiftedSource("B", shift=7.0)).compute(rows, ["a"])
+
+        assert primary.calls == 2
+        assert columns["error"] == [None]
+        assert columns["personality_gates"] == expected["personality_gates"]
+        assert columns["design_gates"] == expected["design_gates"]
+
+    def test_bad_rows_get_errors(self, worker):
+        """Test that unresolvable rows keep their id and carry an error"""
+        rows = [
+            {"birthDate": "1990-06-15", "birthTime": "14:30", "timezone": "Europe/Berlin"},
+            {"birthDate": "15.06.1990", "birthTime": "14:30", "timezone": "Mars/Olympus"},
+            {"birthDate": "15.06.1990", "birthTime": "14:30", "birthPlace": ""},
+            {"birthDate": "15.06.1990", "birthTime": "", "timezone": "Europe/Berlin"},
+        ]
+        columns = worker.compute(rows, ["a", "b", "c", "d"])
+
+        assert columns["id"] == ["a", "b", "c", "d"]
+        assert columns["error"][0].startswith("birthDate")
+        assert columns["error"][1].startswith("birthPlace")
+        assert "place not found" in columns["error"][2]
+        assert columns["type"][:3] == [None, None, None]
+        # Empty time falls back to 12:00 like approximate times in the API
+        assert columns["birth_utc"][3] == "1990-06-15T10:00Z"
+
+
+class TestRunBulk:
+    """Test chunked, resumable bulk runs"""
+
+    def test_chunks_stream_in_order(self, tmp_path):
+        """Test that CSV input is read in fixed-size chunks"""
+        _write_csv(tmp_path / "in.csv", 7)
+        sizes = [len(chunk) for chunk in iter_row_chunks(tmp_path / "in.csv", 3)]
+        assert sizes == [3, 3, 1]
+
+    def test_writes_columnar_parts(self, tmp_path):
+        """Test that every row is written once with all output columns"""
+        _write_csv(tmp_path / "in.csv", 25)
+        totals = run_bulk(tmp_path / "in.csv", tmp_path / "out", chunk_size=10)
+
+        assert totals["rows"] == 25 and totals["errors"] == 0 and totals["chunks"] == 3
+        assert totals["rows_per_second"] > 0
+        rows = _read_parts(tmp_path / "out")
+        assert [row["id"] for row in rows] == [f"row{i}" for i in range(25)]
+        assert list(rows[0]) == list(BULK_COLUMNS)
+        assert all(int(row["personality_gates"]) > 0 for row in rows)
+
+    def test_resumes_missing_chunks(self, tmp_path, monkeypatch):
+        """Test that a re-run only calculates chunks without a part file"""
+        _write_csv(tmp_path / "in.csv", 25)
+        run_bulk(tmp_path / "in.csv", tmp_path / "out", chunk_size=10)
+        before = _read_parts(tmp_path / "out")
+        (tmp_path / "out" / "part-000001.csv").unlink()
+
+        calculated = []
+        original = bulk._process_chunk
+        monkeypatch.setattr(bulk, "_process_chunk", lambda *task: calculated.append(task[0]) or original(*task))
+        totals = run_bulk(tmp_path / "in.csv", tmp_path / "out", chunk_size=10)
+
+        assert calculated == [1]
+        assert totals["skipped_chunks"] == 2
+        assert _read_parts(tmp_path / "out") == before
+
+    def test_rejects_different_job(self, tmp_path):
+        """Test that resuming with another chunk size is refused unless restarted"""
+        _write_csv(tmp_path / "in.csv", 5)
+        run_bulk(tmp_path / "in.csv", tmp_path / "out", chunk_size=10)
+
+        with pytest.raises(ValueError):
+            run_bulk(tmp_path / "in.csv", tmp_path / "out", chunk_size=2)
+
+        totals = run_bulk(tmp_path / "in.csv", tmp_path / "out", chunk_size=2, restart=True)
+        assert totals["chunks"] == 3
+        assert len(list((tmp_path / "out").glob("part-*.csv"))) == 3
@@ -0,0 +1,123 @@
+"""Test bounded chart calculation engine"""
+
+import asyncio
+import threading
+import time
+
+import pytest
+from fastapi.testclient import TestClient
+
+import src.main
+from src.main import app
+from src.services.chart_cache import ChartCache
+from src.services.calculation.engine import (
+    CalculationEngine,
+    CalculationTimeoutError,
+    EngineOverloadedError,
+)
+
+
+def _blocking_work(event: threading.Event, value: int) -> int:
+    """Block a worker until the event is set."""
+    event.wait(timeout=5)
+    return value
+
+
+class TestCalculationEngine:
+    """Test CalculationEngine scheduling behaviour"""
+
+    def test_runs_work_and_returns_result(self):
+        """Test that submitted work runs on the pool and returns its result"""
+        engine = CalculationEngine(max_workers=1, max_queue=0)
+        try:
+            result = asyncio.run(engine.run(pow, 2, 10))
+            assert result == 1024
+            assert engine.stats()["completed"] == 1
+            assert engine.stats()["in_flight"] == 0
+        finally:
+            engine.shutdown()
+
+    def test_rejects_when_queue_full(self):
+        """Test that submissions beyond workers + queue are rejected immediately"""
+        engine = CalculationEngine(max_workers=1, max_queue=1)
+        release = threading.Event()
+
+        async def scenario():
+            running = asyncio.ensure_future(engine.run(_blocking_work, release, 1))
+            queued = asyncio.ensure_future(engine.run(_blocking_work, release, 2))
+            await asyncio.sleep(0.05)
+
+            with pytest.raises(EngineOverloadedError):
+                await engine.run(_blocking_work, release, 3)
+
+            release.set()
+            return await asyncio.gather(running, queued)
+
+        try:
+            assert asyncio.run(scenario()) == [1, 2]
+            assert engine.stats()["rejected"] == 1
+        finally:
+            release.set()
+            engine.shutdown()
+
+    def test_timeout_raises_and_cancels_queued_work(self):
+        """Test that the deadline fires and queued work never starts"""
+        engine = CalculationEngine(max_workers=1, max_queue=1)
+        release = threading.Event()
+
+        async def scenario():
+            running = asyncio.ensure_future(engine.run(_blocking_work, release, 1))
+            await asyncio.sleep(0.05)
+            with pytest.raises(CalculationTimeoutError):
+                await engine.run(_blocking_work, release, 2, timeout=0.05)
+            # The queued calculation was cancelled, only the running one holds a slot
+            assert engine.stats()["in_flight"] == 1
+            release.set()
+            return await running
+
+        try:
+            assert asyncio.run(scenario()) == 1
+            assert engine.stats()["timed_out"] == 1
+        finally:
+            release.set()
+            engine.shutdown()
+
+    def test_invalid_mode(self):
+        """Test that unknown modes are rejected"""
+        with pytest.raises(ValueError):
+            CalculationEngine(mode="fiber")
+
+
+class TestChartEndpointOverload:
+    """Test /api/hd-chart behaviour when the engine is saturated"""
+
+    def test_full_queue_returns_503(self, monkeypatch):
+        """Test that a saturated engine answers 503 while /health stays responsive"""
+        engine = CalculationEngine(max_workers=1, max_queue=0)
+        monkeypatch.setattr(src.main, "calculation_engine", engine)
+        monkeypatch.setattr(src.main, "chart_cache", ChartCache())
+        monkeypatch.setattr(app.state.limiter, "enabled", False)
+
+        # Occupy the only worker slot
+        engine._reserve_slot()
+        try:
+            client = TestClient(app)
+            start = time.monotonic()
+            response = client.post(
+                "/api/hd-chart",
+                json={
+                    "firstName": "TestUser",
+                    "birthDate": "15.06.1990",
+                    "birthTime": "14:30",
+                    "birthTimeApproximate": False,
+                    "birthPlace": "Berlin, Germany",
+                },
+            )
+            assert response.status_code == 503
+            assert response.headers["Retry-After"] == "5"
+            assert response.json()["detail"]["field"] == "calculation"
+            assert time.monotonic() - start < 1.0
+
+            assert client.get("/health").status_code == 200
+        finally:
+            engine.shutdown()
@@ -0,0 +1,260 @@
+"""Test batch chart processing and the NDJSON batch endpoint"""
+
+import asyncio
+import json
+import threading
+import time
+
+from fastapi.testclient import TestClient
+
+from src.main import app
+from src.models.chart import (
+    AuthorityInfo,
+    ChartRequest,
+    ChartResponse,
+    IncarnationCross,
+    ProfileInfo,
+    TypeInfo,
+)
+from src.services.calculation.engine import CalculationEngine
+from src.services.chart_batch import ChartBatchProcessor
+from src.services.chart_cache import ChartCache
+
+client = TestClient(app)
+
+LOCATIONS = {
+    "Berlin": (52.52, 13.405, "Europe/Berlin"),
+    "Berlin, Germany": (52.52, 13.405, "Europe/Berlin"),
+    "London, UK": (51.5074, -0.1278, "Europe/London"),
+}
+
+
+class FakeGeocoding:
+    """Geocoder answering from a fixed table and counting lookups"""
+
+    def __init__(self, delay: float = 0.0, slow_places=()):
+        self.calls = []
+        self.delay = delay
+        self.slow_places = slow_places
+
+    async def get_location_data_async(self, place_name, timeout=None):
+        self.calls.append(place_name)
+        if self.delay:
+            await asyncio.sleep(self.delay)
+        if place_name in self.slow_places:
+            await asyncio.sleep(0.3)
+        if place_name == "Slowtown":
+            raise TimeoutError("geocoding deadline exceeded")
+        return LOCATIONS.get(place_name, (None, None, None))
+
+
+class RecordingCalculator:
+    """Thread-safe chart function recording instants and concurrency"""
+
+    def __init__(self, delay: float = 0.0):
+        self.instants = []
+        self.delay = delay
+        self.active = 0
+        self.peak = 0
+        self._lock = threading.Lock()
+
+    def __call__(self, birth_dt_utc, first_name):
+        with self._lock:
+            self.instants.append(birth_dt_utc)
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+        time.sleep(self.delay)
+        with self._lock:
+            self.active -= 1
+        return ChartResponse(
+            firstName=first_name,
+            type=TypeInfo(code="1", label="Generator", shortDescription="..."),
+            authority=AuthorityInfo(code="sacral", label="Sakral", decisionHint="..."),
+            profile=ProfileInfo(code="1/3", shortDescription="..."),
+            centers=[],
+            channels=[],
+            gates={"conscious": [birth_dt_utc.isoformat()], "unconscious": []},
+            incarnationCross=IncarnationCross(code="1-2-3-4", name="Test", gates=["1", "2", "3", "4"]),
+            shortImpulse="...",
+            calculationSource="test",
+        )
+
+
+def _record(name="Anna", date="15.06.1990", time_="14:30", place="Berlin") -> ChartRequest:
+    """Build a birth record"""
+    return ChartRequest(firstName=name, birthDate=date, birthTime=time_, birthPlace=place)
+
+
+def _run(processor, records):
+    """Collect all parsed lines of a batch"""
+
+    async def collect():
+        return [json.loads(line) async for line in processor.stream(records)]
+
+    return asyncio.run(collect())
+
+
+def _processor(geocoding=None, calculator=None, max_concurrency=4, workers=4, cache=None):
+    """Build a processor on a thread engine with a fresh cache"""
+    engine = CalculationEngine(mode="thread", max_workers=workers, max_queue=0)
+    return ChartBatchProcessor(
+        geocoding or FakeGeocoding(),
+        engine,
+        cache or ChartCache(),
+        lambda: "test",
+        max_concurrency=max_concurrency,
+        calculate=calculator or RecordingCalculator(),
+    )
+
+
+class TestChartBatchProcessor:
+    """Test ChartBatchProcessor.stream"""
+
+    def test_one_line_per_record_and_summary(self):
+        """Test that every record gets exactly one line and the summary comes last"""
+        records = [_record(name="Anna"), _record(name="Bernd", time_="09:15"), _record(place="London, UK")]
+        lines = _run(_processor(), records)
+
+        assert lines[-1] == {"summary": {"records": 3, "charts": 3, "errors": 0, "instants": 3}}
+        results = {line["index"]: line for line in lines[:-1]}
+        assert sorted(results) == [0, 1, 2]
+        assert results[0]["chart"]["firstName"] == "Anna"
+        assert results[1]["chart"]["firstName"] == "Bernd"
+
+    def test_identical_instants_are_calculated_once(self):
+        """Test that records sharing a UTC minute share one calculation but keep their names"""
+        calculator = RecordingCalculator()
+        geocoding = FakeGeocoding()
+        records = [
+            _record(name="Anna", place="Berlin"),
+            _record(name="Bernd", place="Berlin, Germany"),
+            _record(name="Clara", place="Berlin"),
+        ]
+        lines = _run(_processor(geocoding, calculator), records)
+
+        assert len(calculator.instants) == 1
+        assert sorted(geocoding.calls) == ["Berlin", "Berlin, Germany"]
+        names = {line["index"]: line["chart"]["firstName"] for line in lines[:-1]}
+        assert names == {0: "Anna", 1: "Bernd", 2: "Clara"}
+        assert lines[-1]["summary"]["instants"] == 1
+
+    def test_identical_places_are_geocoded_once(self):
+        """Test that a place repeated across records is looked up once"""
+        geocoding = FakeGeocoding()
+        records = [_record(time_=f"{hour:02d}:00") for hour in range(10)]
+        _run(_processor(geocoding), records)
+        assert geocoding.calls == ["Berlin"]
+
+    def test_per_record_errors(self):
+        """Test that invalid records fail individually without stopping the batch"""
+        records = [
+            _record(date="1990-06-15"),
+            _record(place="Atlantis"),
+            _record(place="Slowtown"),
+            _record(name="Anna"),
+        ]
+        lines = _run(_processor(), records)
+        results = {line["index"]: line for line in lines[:-1]}
+
+        assert results[0]["error"]["status"] == 400
+        assert results[0]["error"]["field"] == "birthDate"
+        assert results[1]["error"] == {
+            "status": 400,
+            "field": "birthPlace",
+            "error": "Ort nicht gefunden. Bitte prüfen Sie die Eingabe.",
+        }
+        assert results[2]["error"]["status"] == 504
+        assert results[3]["chart"]["firstName"] == "Anna"
+        assert lines[-1]["summary"] == {"records": 4, "charts": 1, "errors": 3, "instants": 1}
+
+    def test_calculation_failure_is_reported_per_record(self):
+        """Test that a failing calculation yields an error line for each record of its instant"""
+
+        def failing(birth_dt_utc, first_name):
+            raise RuntimeError("swisseph exploded")
+
+        lines = _run(_processor(calculator=failing), [_record(name="Anna"), _record(name="Bernd")])
+        errors = [line["error"] for line in lines[:-1]]
+        assert len(errors) == 2
+        assert all(error["status"] == 503 and error["field"] == "calculation" for error in errors)
+
+    def test_concurrency_is_bounded(self):
+        """Test that a batch never has more calculations in flight than its window"""
+        calculator = RecordingCalculator(delay=0.02)
+        records = [_record(time_=f"{hour:02d}:{minute:02d}") for hour in range(4) for minute in (0, 30)]
+        lines = _run(_processor(calculator=calculator, max_concurrency=2, workers=4), records)
+
+        assert lines[-1]["summary"]["charts"] == 8
+        assert calculator.peak == 2
+
+    def test_calculation_starts_before_all_places_resolve(self):
+        """Test that records of a resolved place are calculated while a slow lookup is pending"""
+        processor = _processor(FakeGeocoding(slow_places=("London, UK",)))
+        records = [_record(name="Anna", place="London, UK"), _record(name="Bernd", place="Berlin")]
+
+        async def collect():
+            started = time.perf_counter()
+            return [(json.loads(line), time.perf_counter() - started) async for line in processor.stream(records)]
+
+        timed = asyncio.run(collect())
+        first, elapsed = timed[0]
+        assert first["chart"]["firstName"] == "Bernd"
+        assert elapsed < 0.2
+        assert timed[-1][0]["summary"]["charts"] == 2
+
+    def test_window_is_capped_at_engine_workers(self):
+        """Test that max_concurrency cannot exceed the engine's worker count"""
+        processor = _processor(max_concurrency=64, workers=3)
+        assert processor.max_concurrency == 3
+
+    def test_uses_chart_cache(self):
+        """Test that instants already in the chart cache are not recalculated"""
+        cache = ChartCache()
+        first = RecordingCalculator()
+        _run(_processor(calculator=first, cache=cache), [_record(name="Anna")])
+
+        second = RecordingCalculator()
+        lines = _run(_processor(calculator=second, cache=cache), [_record(name="Bernd")])
+        assert second.instants == []
+        assert lines[0]["chart"]["firstName"] == "Bernd"
+
+
+class TestChartBatchEndpoint:
+    """Test POST /api/hd-chart/batch"""
+
+    def test_streams_ndjson(self):
+        """Test that the endpoint streams one NDJSON line per record plus a summary"""
+        payload = {
+            "records": [
+                {"firstName": "Anna", "birthDate": "15.06.1990", "birthTime": "14:30", "birthPlace": "Berlin, Germany"},
+                {"firstName": "Bernd", "birthDate": "15.06.1990", "birthTime": "14:30", "birthPlace": "Berlin, Germany"},
+                {"firstName": "Clara", "birthDate": "31.02.1990", "birthTime": "14:30", "birthPlace": "Berlin, Germany"},
+            ]
+        }
+        response = client.post("/api/hd-chart/batch", json=payload)
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("application/x-ndjson")
+        lines = [json.loads(line) for line in response.text.splitlines()]
+        assert len(lines) == 4
+        results = {line["index"]: line for line in lines[:-1]}
+        assert results[2]["error"]["field"] == "birthDate"
+        if "chart" in results[0]:
+            assert results[0]["chart"]["firstName"] == "Anna"
+            assert results[1]["chart"]["firstName"] == "Bernd"
+            assert results[0]["chart"]["type"] == results[1]["chart"]["type"]
+
+    def test_rejects_oversized_batch(self, monkeypatch):
+        """Test that batches above CHART_BATCH_MAX_RECORDS fail request validation"""
+        monkeypatch.setenv("CHART_BATCH_MAX_RECORDS", "1")
+        record = {"firstName": "Anna", "birthDate": "15.06.1990", "birthTime": "14:30", "birthPlace": "Berlin, Germany"}
+        response = client.post("/api/hd-chart/batch", json={"records": [record, record]})
+
+        assert response.status_code == 422
+        assert response.json()["detail"][0]["loc"] == ["body", "records"]
+        assert "höchstens 1 Datensätze" in response.json()["detail"][0]["msg"]
+
+    def test_rejects_empty_batch(self):
+        """Test that an empty batch fails request validation"""
+        response = client.post("/api/hd-chart/batch", json={"records": []})
+        assert response.status_code == 422
@@ -0,0 +1,179 @@
+"""Test in-process chart result cache"""
+
+from datetime import datetime
+
+import pytest
+import pytz
+from fastapi.testclient import TestClient
+
+import src.main
+from src.main import app
+from src.models.chart import (
+    AuthorityInfo,
+    ChartResponse,
+    IncarnationCross,
+    ProfileInfo,
+    TypeInfo,
+)
+from src.services.chart_cache import ChartCache
+
+
+def _chart(first_name: str = "Anna") -> ChartResponse:
+    """Build a minimal chart"""
+    return ChartResponse(
+        firstName=first_name,
+        type=TypeInfo(code="1", label="Generator", shortDescription="..."),
+        authority=AuthorityInfo(code="sacral", label="Sakral", decisionHint="..."),
+        profile=ProfileInfo(code="1/3", shortDescription="..."),
+        centers=[],
+        channels=[],
+        gates={"conscious": [], "unconscious": []},
+        incarnationCross=IncarnationCross(code="1-2-3-4", name="Test", gates=["1", "2", "3", "4"]),
+        shortImpulse="...",
+        calculationSource="SwissEphemeris",
+    )
+
+
+class TestChartCache:
+    """Test ChartCache behaviour"""
+
+    def test_key_normalizes_to_utc_minute(self):
+        """Test that equal instants in different zones share a key"""
+        berlin = pytz.timezone("Europe/Berlin").localize(datetime(1990, 6, 15, 14, 30, 42))
+        utc = datetime(1990, 6, 15, 12, 30, tzinfo=pytz.UTC)
+        assert ChartCache.make_key(berlin, "swiss_ephemeris") == ChartCache.make_key(utc, "swiss_ephemeris")
+        assert ChartCache.make_key(utc, "swiss_ephemeris") != ChartCache.make_key(utc, "openastro_api")
+
+    def test_hit_injects_name(self):
+        """Test that hits return a copy carrying the requester's name"""
+        cache = ChartCache()
+        key = ("1990-06-15T12:30Z", "swiss_ephemeris")
+        cache.put(key, _chart("Anna"))
+
+        hit = cache.get(key, "Bernd")
+        assert hit is not None
+        assert hit.firstName == "Bernd"
+        assert cache.get(key, "Anna").firstName == "Anna"
+        assert cache.stats()["hits"] == 2
+
+    def test_miss_counts(self):
+        """Test that unknown keys are misses"""
+        cache = ChartCache()
+        assert cache.get(("x", "y"), "Anna") is None
+        assert cache.stats()["misses"] == 1
+
+    def test_lru_eviction_by_entries(self):
+        """Test that the least recently used entry is evicted first"""
+        cache = ChartCache(max_entries=2)
+        cache.put(("a", "s"), _chart())
+        cache.put(("b", "s"), _chart())
+        cache.get(("a", "s"), "Anna")
+        cache.put(("c", "s"), _chart())
+
+        assert cache.get(("b", "s"), "Anna") is None
+        assert cache.get(("a", "s"), "Anna") is not None
+        assert cache.stats()["evictions"] == 1
+
+    def test_eviction_by_bytes(self):
+        """Test that the byte budget bounds the cache"""
+        size = len(_chart().model_dump_json())
+        cache = ChartCache(max_entries=100, max_bytes=size * 3)
+        for i in range(5):
+            cache.put((str(i), "s"), _chart())
+
+        stats = cache.stats()
+        assert stats["entries"] == 3
+        assert stats["bytes"] <= size * 3
+
+    def test_ttl_expiry(self, clock):
+        """Test that entries expire after their TTL"""
+        cache = ChartCache(ttl_seconds=10, clock=clock)
+        cache.put(("a", "s"), _chart())
+
+        clock.now = 9.9
+        assert cache.get(("a", "s"), "Anna") is not None
+        clock.now = 10.0
+        assert cache.get(("a", "s"), "Anna") is None
+        assert cache.stats()["expirations"] == 1
+        assert cache.stats()["entries"] == 0
+
+    def test_disabled(self):
+        """Test that a disabled cache never stores anything"""
+        cache = ChartCache(enabled=False)
+        cache.put(("a", "s"), _chart())
+        assert cache.get(("a", "s"), "Anna") is None
+        assert cache.stats()["entries"] == 0
+
+
+class TestChartCacheEndpoints:
+    """Test cache integration in /api/hd-chart and admin routes"""
+
+    @pytest.fixture
+    def client(self, monkeypatch):
+        """Client with a fresh cache and no rate limit"""
+        monkeypatch.setattr(src.main, "chart_cache", ChartCache())
+        monkeypatch.setattr("src.api.routes.admin.get_chart_cache", lambda: src.main.chart_cache)
+        monkeypatch.setattr(app.state.limiter, "enabled", False)
+        monkeypatch.setenv("ADMIN_API_TOKEN", "secret-token")
+        return TestClient(app)
+
+    def test_repeat_request_is_served_from_cache(self, client):
+        """Test that the second request for the same instant hits the cache"""
+        payload = {
+            "firstName": "Anna",
+            "birthDate": "15.06.1990",
+            "birthTime": "14:30",
+            "birthTimeApproximate": False,
+            "birthPlace": "Berlin, Germany",
+        }
+        first = client.post("/api/hd-chart", json=payload)
+        second = client.post("/api/hd-chart", json={**payload, "firstName": "Bernd"})
+
+        assert first.status_code == 200
+        assert second.status_code == 200
+        assert second.json()["firstName"] == "Bernd"
+        assert {k: v for k, v in first.json().items() if k != "firstName"} == {
+            k: v for k, v in second.json().items() if k != "firstName"
+        }
+        assert src.main.chart_cache.stats()["hits"] == 1
+
+    def test_failover_chart_is_keyed_by_serving_source(self, client, monkeypatch):
+        """Test that a chart served by another source is not returned for the preferred one"""
+        payload = {
+            "firstName": "Anna",
+            "birthDate": "15.06.1990",
+            "birthTime": "14:30",
+            "birthTimeApproximate": False,
+            "birthPlace": "Berlin, Germany",
+        }
+        monkeypatch.setattr(src.main, "chart_source_name", lambda: "NASA_JPL")
+        assert client.post("/api/hd-chart", json=payload).json()["calculationSource"] == "SwissEphemeris"
+        client.post("/api/hd-chart", json=payload)
+        assert src.main.chart_cache.stats()["hits"] == 0
+
+        monkeypatch.setattr(src.main, "chart_source_name", lambda: "SwissEphemeris")
+        client.post("/api/hd-chart", json=payload)
+        assert src.main.chart_cache.stats()["hits"] == 1
+
+    def test_admin_requires_token(self, client):
+        """Test that admin routes reject missing or wrong tokens"""
+        assert client.get("/api/admin/cache").status_code == 403
+        assert client.get("/api/admin/cache", headers={"X-Admin-Token": "wrong"}).status_code == 403
+
+    def test_admin_disabled_without_configured_token(self, client, monkeypatch):
+        """Test that admin routes stay closed when no token is configured"""
+        monkeypatch.delenv("ADMIN_API_TOKEN")
+        assert client.get("/api/admin/cache", headers={"X-Admin-Token": ""}).status_code == 403
+
+    def test_admin_inspect_and_flush(self, client):
+        """Test that admins can read stats and flush the cache"""
+        src.main.chart_cache.put(("1990-06-15T12:30Z", "swiss_ephemeris"), _chart())
+        headers = {"X-Admin-Token": "secret-token"}
+
+        stats = client.get("/api/admin/cache", headers=headers)
+        assert stats.status_code == 200
+        assert stats.json()["entries"] == 1
+
+        flushed = client.delete("/api/admin/cache", headers=headers)
+        assert flushed.json() == {"flushed": 1}
+        assert src.main.chart_cache.stats()["entries"] == 0
@@ -0,0 +1,95 @@
+"""Test fragment-based chart JSON encoding"""
+
+import asyncio
+
+import numpy as np
+import pytest
+from fastapi.responses import JSONResponse
+from fastapi.routing import serialize_response
+from fastapi.testclient import TestClient
+from fastapi.utils import create_model_field
+
+from src.api.responses import ChartFragments, ChartJSONResponse, get_chart_fragments
+from src.main import app
+from src.models.chart import ChartResponse, ProfileInfo
+from src.services.calculation.activations import BODIES, ActivationSet
+from src.services.calculation.bodygraph_calculator import BodygraphCalculator
+
+client = TestClient(app)
+
+
+def _charts(count, name="Anna", seed=0):
+    """Charts for random positions"""
+    calculator = BodygraphCalculator()
+    rng = np.random.default_rng(seed)
+    for _ in range(count):
+        yield calculator.calculate_chart(
+            ActivationSet.from_longitudes(BODIES, rng.uniform(0, 360, len(BODIES)).tolist(), 0.0, "test"),
+            ActivationSet.from_longitudes(BODIES, rng.uniform(0, 360, len(BODIES)).tolist(), 0.0, "test"),
+            name,
+        )
+
+
+def _response_model_body(chart: ChartResponse) -> bytes:
+    """Encode a chart the way FastAPI's response_model path does"""
+    field = create_model_field(name="Response_chart", type_=ChartResponse, mode="serialization")
+    content = asyncio.run(serialize_response(field=field, response_content=chart))
+    return JSONResponse(content).body
+
+
+class TestChartFragments:
+    """Test ChartFragments.encode"""
+
+    def test_byte_identical_to_response_model(self):
+        """Test that fragment encoding equals the response_model output"""
+        fragments = get_chart_fragments()
+        for chart in _charts(100, name="Jürgen-Öz"):
+            assert fragments.encode(chart) == _response_model_body(chart)
+
+    def test_unwarmed_and_escaped_values(self):
+        """Test values outside the prebuilt tables and characters that need escaping"""
+        chart = next(_charts(1)).model_copy(update={
+            "firstName": 'Anna "Ä" \\ \n',
+            "profile": ProfileInfo(code="9/9", shortDescription="neu\tund </script>"),
+            "calculationSource": None,
+        })
+        assert ChartFragments().encode(chart) == _response_model_body(chart)
+
+    def test_tables_are_bounded(self):
+        """Test that fragment tables are cleared when full"""
+        fragments = ChartFragments(max_fragments=2)
+        for text in ("a", "b", "c"):
+            fragments.impulse(text)
+        assert len(fragments._tables["impulse"]) == 1
+
+    def test_other_content_renders_like_json_response(self):
+        """Test that non-chart content falls back to JSONResponse rendering"""
+        content = {"field": "birthPlace", "error": "Ort nicht gefunden."}
+        assert ChartJSONResponse(content).body == JSONResponse(content).body
+
+
+class TestChartEndpointEncoding:
+    """Test that /api/hd-chart serves fragment-encoded charts"""
+
+    def test_endpoint_body_matches_response_model(self):
+        """Test that the endpoint returns the same bytes as the response_model path"""
+        payload = {
+            "firstName": "Anna",
+            "birthDate": "15.06.1990",
+            "birthTime": "14:30",
+            "birthTimeApproximate": False,
+            "birthPlace": "Berlin, Germany",
+        }
+        response = client.post("/api/hd-chart", json=payload)
+        if response.status_code != 200:
+            pytest.skip(f"chart calculation unavailable: {response.status_code}")
+
+        assert response.headers["content-type"] == "application/json"
+        chart = ChartResponse.model_validate_json(response.content)
+        assert response.content == _response_model_body(chart)
+
+    def test_openapi_keeps_response_model(self):
+        """Test that the schema still documents ChartResponse"""
+        schema = client.get("/openapi.json").json()
+        content = schema["paths"]["/api/hd-chart"]["post"]["responses"]["200"]["content"]
+        assert content["application/json"]["schema"]["$ref"].endswith("/ChartResponse")
@@ -0,0 +1,186 @@
+"""Test the Chebyshev ephemeris artifact and source against swisseph"""
+
+from datetime import datetime
+from pathlib import Path
+
+import numpy as np
+import pytest
+import pytz
+import swisseph as swe
+from numpy.polynomial import chebyshev
+
+from src.models.celestial import CelestialBody
+from src.models.ephemeris import EphemerisConfig
+from src.models.error import ERROR_CALCULATION_FAILED, ERROR_EPHEMERIS_UNAVAILABLE
+from src.services.ephemeris import initializer as initializer_module
+from src.services.ephemeris.chebyshev import (
+    DEFAULT_JD_END,
+    DEFAULT_JD_START,
+    HEADER,
+    NUTATION,
+    ChebyshevEphemeris,
+    ChebyshevEphemerisSource,
+    ChebyshevSeries,
+)
+from src.services.ephemeris.initializer import apply_ephemeris_path
+from src.services.ephemeris.registry import EphemerisSourceRegistry
+from src.services.ephemeris.swiss_ephemeris import SwissEphemerisSource
+from src.services.shadow_validation import compare_sources
+
+EPHEMERIS_DIR = str(Path(__file__).parent.parent / "data" / "ephemeris")
+
+# Coverage: 1989-09-08 to 1991-01-01 (births in 1990 and their design dates)
+START_JD, END_JD = 2447777.5, 2448257.5
+BIRTH = pytz.UTC.localize(datetime(1990, 6, 15, 12, 30))
+
+
+@pytest.fixture(scope="module")
+def artifact_path(tmp_path_factory):
+    """Artifact fitted to swisseph, with swisseph reading the bundled files for the module"""
+    previous = initializer_module._applied_path
+    apply_ephemeris_path(EPHEMERIS_DIR)
+    path = tmp_path_factory.mktemp("chebyshev") / "chebyshev.bin"
+    ChebyshevEphemeris.build(START_JD, END_JD).save(path)
+    yield str(path)
+    swe.set_ephe_path(previous or EphemerisConfig().ephemeris_path)
+    initializer_module._applied_path = previous
+
+
+class TestChebyshevEphemeris:
+    """Test fitting, the file format and series evaluation"""
+
+    def test_load_roundtrip(self, artifact_path):
+        """Test that every series comes back with its interval, degree and coefficients"""
+        ephemeris = ChebyshevEphemeris.load(artifact_path)
+        assert ephemeris.jd_start == START_JD and ephemeris.jd_end == END_JD
+        assert set(ephemeris.series) == {NUTATION} | {
+            body for body in CelestialBody if body not in (CelestialBody.EARTH, CelestialBody.SOUTH_NODE)
+        }
+        moon = ephemeris.series[CelestialBody.MOON]
+        assert (moon.interval_days, moon.degree) == (8.0, 15)
+        assert moon.jd_end >= END_JD
+
+    def test_series_evaluation(self):
+        """Test scalar and vectorized evaluation against numpy's Chebyshev values and derivatives"""
+        rng = np.random.default_rng(0)
+        coefficients = rng.normal(size=(3, 10))
+        series = ChebyshevSeries(100.0, 4.0, coefficients)
+
+        julian_days = np.array([100.0, 101.3, 104.0, 107.9, 112.0])
+        values, speeds = series.evaluate_many(julian_days)
+        for i, jd in enumerate(julian_days):
+            index = min(int((jd - 100.0) // 4.0), 2)
+            s = (jd - 100.0 - index * 4.0) / 2.0 - 1.0
+            expected = chebyshev.chebval(s, coefficients[index])
+            slope = chebyshev.chebval(s, chebyshev.chebder(coefficients[index])) / 2.0
+            assert values[i] == pytest.approx(expected, rel=1e-12)
+            assert speeds[i] == pytest.approx(slope, rel=1e-12)
+            assert series.longitude(jd) == pytest.approx(expected, rel=1e-12)
+            assert series.longitude_with_speed(jd) == pytest.approx((expected, slope), rel=1e-12)
+
+    def test_verify_against_swiss_ephemeris(self, artifact_path):
+        """Test that every body stays far below one line width of Swiss Ephemeris"""
+        julian_days = np.random.default_rng(0).uniform(START_JD, END_JD, 300)
+        report = ChebyshevEphemeris.load(artifact_path).verify_against(SwissEphemerisSource(), julian_days)
+        assert report["passed"] is True
+        assert report["samples"] == 300
+        assert report["max_error_arcsec"] < 5.0
+        assert report["max_error_line_fraction"] < 1e-3
+        assert report["bodies"]["Moon"]["max_error_arcsec"] < 0.01
+
+    def test_rejects_foreign_file(self, tmp_path, artifact_path):
+        """Test that other files, other versions and truncated files are refused"""
+        garbage = tmp_path / "garbage.bin"
+        garbage.write_bytes(b"\0" * 256)
+        with pytest.raises(ValueError, match="Unsupported"):
+            ChebyshevEphemeris.load(garbage)
+
+        data = Path(artifact_path).read_bytes()
+        newer = tmp_path / "newer.bin"
+        newer.write_bytes(data[:8] + (99).to_bytes(4, "little") + data[12:])
+        with pytest.raises(ValueError, match="Unsupported"):
+            ChebyshevEphemeris.load(newer)
+
+        truncated = tmp_path / "truncated.bin"
+        truncated.write_bytes(data[:HEADER.size + 100])
+        with pytest.raises(ValueError, match="truncated"):
+            ChebyshevEphemeris.load(truncated)
+
+
+class TestChebyshevEphemerisSource:
+    """Test ChebyshevEphemerisSource against Swiss Ephemeris"""
+
+    def test_matches_swiss_ephemeris(self, artifact_path):
+        """Test longitudes and speeds of every body, opposite points included"""
+        source = ChebyshevEphemerisSource(artifact_path)
+        swiss = SwissEphemerisSource()
+        bodies = list(CelestialBody)
+
+        for jd in np.linspace(START_JD + 0.5, END_JD - 0.5, 25):
+            ours = source.calculate_positions(bodies, jd)
+            theirs = swiss.calculate_positions(bodies, jd)
+            for body, a, b in zip(bodies, ours, theirs):
+                delta = abs((a - b + 180.0) % 360.0 - 180.0) * 3600.0
+                assert delta < 5.0, f"{body.value} differs by {delta:.3f}\" at JD {jd}"
+
+            longitude, speed = source.calculate_position_with_speed(CelestialBody.EARTH, jd)
+            swiss_longitude, swiss_speed = swiss.calculate_position_with_speed(CelestialBody.EARTH, jd)
+            assert longitude == pytest.approx(swiss_longitude, abs=1e-4)
+            assert speed == pytest.approx(swiss_speed, abs=1e-5)
+
+    def test_vectorized_matches_scalar(self, artifact_path):
+        """Test that evaluating many Julian days at once equals one call per day"""
+        source = ChebyshevEphemerisSource(artifact_path)
+        bodies = [CelestialBody.SUN, CelestialBody.EARTH, CelestialBody.MOON, CelestialBody.SOUTH_NODE]
+        julian_days = np.linspace(START_JD, END_JD, 50)
+
+        vectorized = source.calculate_longitudes(bodies, julian_days)
+        assert vectorized.shape == (4, 50)
+        for j in (0, 17, 49):
+            assert vectorized[:, j] == pytest.approx(source.calculate_positions(bodies, julian_days[j]), abs=1e-9)
+        assert np.allclose((vectorized[1] - vectorized[0]) % 360.0, 180.0)
+
+    def test_chart_matches_swiss_ephemeris(self, artifact_path):
+        """Test that a full chart (both sides, design time solved on the artifact) is unchanged"""
+        record = compare_sources(SwissEphemerisSource(), ChebyshevEphemerisSource(artifact_path), BIRTH)
+        assert record["match"] is True
+        assert record["max_delta_arcsec"] < 5.0
+        assert abs(record["design_time_delta_seconds"]) < 60.0
+
+    def test_outside_coverage(self, artifact_path):
+        """Test that an epoch the artifact does not cover fails as a calculation error"""
+        source = ChebyshevEphemerisSource(artifact_path)
+        with pytest.raises(RuntimeError, match=ERROR_CALCULATION_FAILED):
+            source.calculate_position(CelestialBody.SUN, END_JD + 1.0)
+        with pytest.raises(RuntimeError, match=ERROR_CALCULATION_FAILED):
+            source.calculate_longitudes([CelestialBody.SUN], [START_JD, START_JD - 1.0])
+
+    def test_unavailable_without_artifact(self, tmp_path):
+        """Test that a missing or unconfigured artifact makes the source unavailable"""
+        assert ChebyshevEphemerisSource().is_available() is False
+        source = ChebyshevEphemerisSource(str(tmp_path / "missing.bin"))
+        assert source.is_available() is False
+        with pytest.raises(RuntimeError, match=ERROR_EPHEMERIS_UNAVAILABLE):
+            source.calculate_position(CelestialBody.SUN, START_JD)
+
+    def test_registry_uses_configured_artifact(self, artifact_path):
+        """Test that EPHEMERIS_CHEBYSHEV_PATH reaches the chebyshev source"""
+        config = EphemerisConfig(
+            source="chebyshev", chebyshev_path=artifact_path, supported_start_year=1990, supported_end_year=1990
+        )
+        registry = EphemerisSourceRegistry(config=config)
+        assert registry.is_available() is True
+        assert registry.get().get_source_name() == "ChebyshevEphemeris"
+        registry.shutdown()
+
+    def test_artifact_must_cover_supported_years(self, artifact_path):
+        """Test that an artifact not covering the supported years (design dates included) is unavailable"""
+        assert ChebyshevEphemerisSource(artifact_path, start_year=1990, end_year=1990).is_available() is True
+        assert ChebyshevEphemerisSource(artifact_path, start_year=1990, end_year=1991).is_available() is False
+        assert ChebyshevEphemerisSource(artifact_path, start_year=1989, end_year=1990).is_available() is False
+
+    def test_default_range_covers_births_in_2100(self):
+        """Test that the default build range reaches the end of the last supported year"""
+        assert swe.revjul(DEFAULT_JD_START)[:3] == (1849, 9, 23)
+        assert swe.revjul(DEFAULT_JD_END)[:3] == (2101, 1, 1)
+        assert DEFAULT_JD_END >= swe.julday(EphemerisConfig().supported_end_year + 1, 1, 1, 0.0)
@@ -0,0 +1,262 @@
+"""Test failover and hedged calls of the composite ephemeris source"""
+
+import threading
+import time
+from datetime import datetime
+
+import pytest
+import pytz
+
+from src.models.celestial import CelestialBody
+from src.models.ephemeris import EphemerisConfig
+from src.models.error import ERROR_EPHEMERIS_UNAVAILABLE
+from src.services.calculation.engine import calculate_chart_for_instant, chart_source_name
+from src.services.ephemeris.base import EphemerisSource
+from src.services.ephemeris.composite import CompositeEphemerisSource, SourceMetrics
+from src.services.ephemeris.registry import FAILOVER_SOURCE, EphemerisSourceRegistry
+
+BODIES = [CelestialBody.SUN, CelestialBody.EARTH, CelestialBody.MOON]
+
+
+class FakeSource(EphemerisSource):
+    """Source answering a fixed longitude after an optional delay, or failing"""
+
+    def __init__(self, name, longitude=0.0, delay=0.0, fail=False, available=True):
+        self.name = name
+        self.longitude = longitude
+        self.delay = delay
+        self.fail = fail
+        self.available = available
+        self.calls = 0
+        self._lock = threading.Lock()
+
+    def calculate_position(self, body, julian_day):
+        with self._lock:
+            self.calls += 1
+        if self.delay:
+            time.sleep(self.delay)
+        if self.fail:
+            raise RuntimeError(f"{self.name} exploded")
+        return self.longitude
+
+    def get_source_name(self):
+        return self.name
+
+    def is_available(self):
+        return self.available
+
+
+def _composite(*sources, **kwargs):
+    """Build a composite over fake sources, in the given order"""
+    return CompositeEphemerisSource([(source.name, source) for source in sources], **kwargs)
+
+
+class TestSourceMetrics:
+    """Test SourceMetrics"""
+
+    def test_quantiles_and_counters(self):
+        """Test nearest-rank quantiles over successful calls and error counting"""
+        metrics = SourceMetrics(window=100)
+        for ms in range(1, 101):
+            metrics.record(ms / 1000, ok=True)
+        metrics.record(5.0, ok=False)
+
+        assert metrics.quantile(0.95) == pytest.approx(0.095)
+        assert metrics.quantile(0.5) == pytest.approx(0.050)
+        stats = metrics.stats()
+        assert stats["calls"] == 101
+        assert stats["errors"] == 1
+        assert stats["p99_ms"] == pytest.approx(99.0)
+
+    def test_window_keeps_recent_calls(self):
+        """Test that old samples drop out of the window"""
+        metrics = SourceMetrics(window=10)
+        for _ in range(10):
+            metrics.record(1.0, ok=True)
+        for _ in range(10):
+            metrics.record(0.001, ok=True)
+        assert metrics.quantile(0.99) == pytest.approx(0.001)
+
+
+class TestFailover:
+    """Test failover across sources in priority order"""
+
+    def test_primary_serves_when_healthy(self):
+        """Test that a healthy primary answers and the secondary is not called"""
+        primary, secondary = FakeSource("A", 10.0), FakeSource("B", 20.0)
+        composite = _composite(primary, secondary)
+
+        assert composite.calculate_positions(BODIES, 2451545.0) == [10.0, 190.0, 10.0]
+        assert secondary.calls == 0
+        assert composite.get_source_name() == "A"
+
+    def test_fails_over_on_error(self):
+        """Test that an error moves the call to the next source"""
+        primary, secondary = FakeSource("A", fail=True), FakeSource("B", 20.0)
+        composite = _composite(primary, secondary)
+
+        assert composite.calculate_position(CelestialBody.SUN, 2451545.0) == 20.0
+        assert composite.get_source_name() == "B"
+        assert composite.stats()["sources"]["A"]["errors"] == 1
+
+    def test_skips_unavailable_sources(self):
+        """Test that a source reported unavailable is not called"""
+        primary, secondary = FakeSource("A", available=False), FakeSource("B", 20.0)
+        composite = _composite(primary, secondary)
+
+        assert composite.calculate_position(CelestialBody.SUN, 2451545.0) == 20.0
+        assert primary.calls == 0
+        assert composite.stats()["sources"]["A"]["skipped"] == 1
+
+    def test_all_sources_failing(self):
+        """Test that an error naming every source is raised when all fail"""
+        composite = _composite(FakeSource("A", fail=True), FakeSource("B", fail=True))
+        with pytest.raises(RuntimeError, match=ERROR_EPHEMERIS_UNAVAILABLE) as exc_info:
+            composite.calculate_position(CelestialBody.SUN, 2451545.0)
+        assert "A exploded" in str(exc_info.value)
+        assert "B exploded" in str(exc_info.value)
+        assert composite.stats()["overall"]["errors"] == 1
+
+    def test_is_available_if_any_member_is(self):
+        """Test composite availability"""
+        assert _composite(FakeSource("A", available=False), FakeSource("B")).is_available()
+        assert not _composite(FakeSource("A", available=False), FakeSource("B", available=False)).is_available()
+
+
+class TestPinning:
+    """Test that multi-call calculations stay on one member"""
+
+    def test_calculation_fails_over_as_a_whole(self):
+        """Test that a member failing midway restarts the whole calculation on the next member"""
+        primary, secondary = FakeSource("A", 10.0), FakeSource("B", 20.0)
+        composite = _composite(primary, secondary)
+
+        def chart(source):
+            first = source.calculate_position(CelestialBody.SUN, 2451545.0)
+            primary.fail = True
+            second = source.calculate_position(CelestialBody.SUN, 2451457.0)
+            return first, second, source.get_source_name()
+
+        assert composite.run_pinned(chart) == (20.0, 20.0, "B")
+        assert primary.calls == 2
+        assert secondary.calls == 2
+        assert composite.get_source_name() == "B"
+        assert composite.stats()["overall"]["calls"] == 1
+
+    def test_serving_source_name(self):
+        """Test that the first available member is reported without counting it as a skip"""
+        primary, secondary = FakeSource("A", available=False), FakeSource("B")
+        composite = _composite(primary, secondary)
+
+        assert composite.serving_source_name() == "B"
+        primary.available = True
+        assert composite.serving_source_name() == "A"
+        assert composite.stats()["sources"]["A"]["skipped"] == 0
+
+    def test_plain_source_runs_on_itself(self):
+        """Test the EphemerisSource defaults used without failover"""
+        source = FakeSource("A", 10.0)
+        assert source.run_pinned(lambda member: member) is source
+        assert source.serving_source_name() == "A"
+
+
+class TestHedging:
+    """Test hedged calls against a slow primary"""
+
+    def _warm(self, composite, samples=20):
+        """Give the primary a latency history"""
+        for _ in range(samples):
+            composite.calculate_position(CelestialBody.SUN, 2451545.0)
+
+    def test_no_hedge_before_min_samples(self):
+        """Test that calls are not hedged until the primary has enough latency samples"""
+        primary, secondary = FakeSource("A", 10.0, delay=0.001), FakeSource("B", 20.0)
+        composite = _composite(primary, secondary, hedge=True, hedge_min_samples=50)
+        self._warm(composite)
+        assert secondary.calls == 0
+        composite.close()
+
+    def test_slow_primary_is_hedged(self):
+        """Test that a call exceeding the primary's p95 is answered by the secondary"""
+        primary, secondary = FakeSource("A", 10.0, delay=0.002), FakeSource("B", 20.0)
+        composite = _composite(primary, secondary, hedge=True, hedge_min_samples=20)
+        self._warm(composite)
+        assert secondary.calls == 0
+
+        primary.delay = 0.5
+        started = time.perf_counter()
+        assert composite.calculate_position(CelestialBody.SUN, 2451545.0) == 20.0
+        elapsed = time.perf_counter() - started
+
+        assert elapsed < 0.25
+        stats = composite.stats()
+        assert stats["sources"]["B"]["hedges"] == 1
+        assert stats["sources"]["B"]["hedge_wins"] == 1
+        assert composite.get_source_name() == "B"
+        composite.close()
+
+    def test_primary_win_is_kept(self):
+        """Test that a primary answering after the hedge was sent but before the backup still wins"""
+        primary, secondary = FakeSource("A", 10.0, delay=0.002), FakeSource("B", 20.0)
+        composite = _composite(primary, secondary, hedge=True, hedge_min_samples=20)
+        self._warm(composite)
+
+        primary.delay = 0.02
+        secondary.delay = 0.3
+        assert composite.calculate_position(CelestialBody.SUN, 2451545.0) == 10.0
+        assert composite.stats()["sources"]["B"]["hedges"] == 1
+        assert composite.stats()["sources"]["B"]["hedge_wins"] == 0
+        composite.close()
+
+    def test_hedged_primary_error_falls_over(self):
+        """Test that a failing hedged primary still yields the secondary's answer"""
+        primary, secondary = FakeSource("A", 10.0, delay=0.002), FakeSource("B", 20.0)
+        composite = _composite(primary, secondary, hedge=True, hedge_min_samples=20)
+        self._warm(composite)
+
+        primary.fail = True
+        assert composite.calculate_position(CelestialBody.SUN, 2451545.0) == 20.0
+        composite.close()
+
+
+class TestRegistryFailover:
+    """Test that EPHEMERIS_FAILOVER builds the composite as default source"""
+
+    def test_failover_chain_from_config(self):
+        """Test that the configured chain becomes the default source, with shared members"""
+        registry = EphemerisSourceRegistry(
+            config=EphemerisConfig(source="nasa_jpl", failover=["swiss_ephemeris"], hedge_requests=True)
+        )
+        source = registry.get()
+
+        assert isinstance(source, CompositeEphemerisSource)
+        assert [name for name, _ in source.sources] == ["nasa_jpl", "swiss_ephemeris"]
+        assert source.sources[1][1] is registry.get("swiss_ephemeris")
+        assert registry.default_source == FAILOVER_SOURCE
+
+        # nasa_jpl is unavailable, so Swiss Ephemeris answers
+        longitude = source.calculate_position(CelestialBody.SUN, 2451545.0)
+        assert 280.0 < longitude < 281.0
+        assert source.get_source_name() == "SwissEphemeris"
+        assert registry.stats()["source_stats"][FAILOVER_SOURCE]["sources"]["nasa_jpl"]["skipped"] == 1
+        registry.shutdown()
+
+    def test_single_source_is_not_wrapped(self):
+        """Test that without failover the configured source is used directly"""
+        registry = EphemerisSourceRegistry(config=EphemerisConfig(source="swiss_ephemeris"))
+        assert not isinstance(registry.get(), CompositeEphemerisSource)
+
+    def test_chart_is_calculated_on_one_member(self, monkeypatch):
+        """Test that a chart reports the member that served all of its positions"""
+        registry = EphemerisSourceRegistry(
+            config=EphemerisConfig(source="nasa_jpl", failover=["swiss_ephemeris"])
+        )
+        monkeypatch.setattr("src.services.ephemeris.source_factory.get_source_registry", lambda: registry)
+
+        chart = calculate_chart_for_instant(datetime(1990, 6, 15, 12, 30, tzinfo=pytz.UTC), "Anna")
+        assert chart.calculationSource == "SwissEphemeris"
+        assert chart_source_name() == "SwissEphemeris"
+        stats = registry.get().stats()
+        assert stats["overall"]["calls"] == 1
+        assert stats["sources"]["swiss_ephemeris"]["calls"] == 1
+        registry.shutdown()
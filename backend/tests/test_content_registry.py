@@ -0,0 +1,115 @@
+"""Test content registry"""
+
+import json
+import os
+
+import pytest
+
+from src.services.calculation.bodygraph_calculator import BodygraphCalculator
+from src.services.content_registry import ContentRegistry
+from src.services.normalization_service import NormalizationService
+
+
+@pytest.fixture
+def data_dir(tmp_path):
+    """Write a minimal set of content files"""
+    (tmp_path / "incarnation_crosses.json").write_text(json.dumps({
+        "1": {"name": "Sphinx", "right_angle": "Rechtwinkliges Kreuz der Sphinx"},
+    }), encoding="utf-8")
+    (tmp_path / "impulses.json").write_text(json.dumps({
+        "1": {"sacral": "Vertraue deinem Sakral."},
+    }), encoding="utf-8")
+    (tmp_path / "profiles.json").write_text(json.dumps({
+        "1/3": "Forscherin",
+    }), encoding="utf-8")
+    return tmp_path
+
+
+def rewrite(path, content):
+    """Write a file and move its mtime forward so the change is visible"""
+    stat = path.stat()
+    path.write_text(json.dumps(content), encoding="utf-8")
+    os.utime(path, (stat.st_atime, stat.st_mtime + 10))
+
+
+class TestContentRegistry:
+    """Test lookups, immutability and reloading"""
+
+    def test_lookups(self, data_dir):
+        """Test cross, impulse and profile lookups"""
+        registry = ContentRegistry(data_dir)
+        assert registry.incarnation_cross_name(1, "right_angle") == "Rechtwinkliges Kreuz der Sphinx"
+        assert registry.incarnation_cross_name(1, "left_angle") is None
+        assert registry.incarnation_cross_name(64, "right_angle") is None
+        assert registry.impulse("1", "sacral") == "Vertraue deinem Sakral."
+        assert registry.impulse("5", "lunar") is None
+        assert registry.profile_description("1/3") == "Forscherin"
+
+    def test_tables_are_immutable(self, data_dir):
+        """Test that shared tables cannot be modified"""
+        snapshot = ContentRegistry(data_dir).snapshot
+        with pytest.raises(TypeError):
+            snapshot.profiles["1/3"] = "changed"
+        with pytest.raises(TypeError):
+            snapshot.crosses[1]["right_angle"] = "changed"
+
+    def test_reload_on_mtime_change(self, clock, data_dir):
+        """Test that changed files are picked up after the reload interval"""
+        registry = ContentRegistry(data_dir, reload_interval=5.0, clock=clock)
+        rewrite(data_dir / "profiles.json", {"1/3": "Neue Beschreibung"})
+
+        clock.now = 1.0
+        assert registry.profile_description("1/3") == "Forscherin"
+
+        clock.now = 6.0
+        assert registry.profile_description("1/3") == "Neue Beschreibung"
+        assert registry.reloads == 1
+
+    def test_no_reload_without_change(self, clock, data_dir):
+        """Test that unchanged files are not re-read"""
+        registry = ContentRegistry(data_dir, reload_interval=1.0, clock=clock)
+        snapshot = registry.snapshot
+        clock.now = 10.0
+        assert registry.snapshot is snapshot
+        assert registry.reloads == 0
+
+    def test_invalid_file_keeps_previous_content(self, clock, data_dir):
+        """Test that a broken edit does not wipe loaded content"""
+        registry = ContentRegistry(data_dir, reload_interval=0.0, clock=clock)
+        path = data_dir / "impulses.json"
+        stat = path.stat()
+        path.write_text("{ broken", encoding="utf-8")
+        os.utime(path, (stat.st_atime, stat.st_mtime + 10))
+
+        assert registry.impulse("1", "sacral") == "Vertraue deinem Sakral."
+
+    def test_missing_directory_uses_fallbacks(self, tmp_path):
+        """Test that missing files give empty tables and default texts"""
+        calculator = BodygraphCalculator(content=ContentRegistry(tmp_path / "missing"))
+        assert calculator._generate_impulse("1", "sacral") == (
+            "Vertraue deiner inneren Autorität - sie kennt deinen Weg."
+        )
+        assert calculator._determine_incarnation_cross(1, "1/3") == "Kreuz von Tor 1"
+        assert calculator._determine_profile(1, 3).shortDescription == "Dein einzigartiges Profil."
+
+
+class TestRegistryConsumers:
+    """Test calculator and normalizer use the shipped content"""
+
+    def test_bodygraph_uses_shipped_files(self):
+        """Test that the calculator reads crosses, impulses and profiles from config/data"""
+        calculator = BodygraphCalculator()
+        assert calculator._determine_incarnation_cross(1, "1/3") == "Rechtwinkliges Kreuz der Sphinx"
+        assert calculator._generate_impulse("5", "lunar") == (
+            "Im Rhythmus des Mondes findest du deine einzigartige Perspektive."
+        )
+        assert calculator._determine_profile(1, 3).shortDescription.startswith("Du bist eine Forscherin")
+
+    def test_normalizer_maps_german_authority_codes(self):
+        """Test that API authority codes resolve to the shared impulses"""
+        assert NormalizationService._generate_impulse("1", "sakral") == (
+            "Deine sakrale Antwort zeigt dir den Weg zu echter Erfüllung."
+        )
+        assert NormalizationService._generate_impulse("3", "milz") == (
+            "Deine spontane Wahrnehmung führt dich zu den richtigen Entscheidungen."
+        )
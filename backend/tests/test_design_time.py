@@ -0,0 +1,137 @@
+"""Test design-time solver"""
+
+import asyncio
+from datetime import datetime
+
+import pytest
+import pytz
+from fastapi.testclient import TestClient
+
+from src.main import app
+from src.models.celestial import CelestialBody
+from src.services.calculation.engine import CalculationEngine
+from src.services.calculation.design_time import (
+    DesignTimeStats,
+    calculate_design_datetime,
+    design_time_stats,
+    solve_design_julian_day,
+)
+from src.services.ephemeris.swiss_ephemeris import SwissEphemerisSource
+
+
+@pytest.fixture
+def source():
+    """Create Swiss Ephemeris source"""
+    return SwissEphemerisSource()
+
+
+def _solve_in_worker(year: int) -> datetime:
+    """Solve one design time; runs in an engine worker process."""
+    birth = datetime(year, 3, 1, 12, 0, tzinfo=pytz.UTC)
+    return calculate_design_datetime(birth, SwissEphemerisSource())
+
+
+def _arc(source, birth_jd, design_jd):
+    """Sun arc between design and birth moments in degrees"""
+    birth = source.calculate_position(CelestialBody.SUN, birth_jd)
+    design = source.calculate_position(CelestialBody.SUN, design_jd)
+    return (birth - design) % 360.0
+
+
+class TestSolveDesignJulianDay:
+    """Test Newton/secant design-time solver"""
+
+    @pytest.mark.parametrize(
+        "birth_jd",
+        [2415020.5, 2433282.5, 2447892.6, 2451545.0, 2460000.25, 2469807.5],
+    )
+    def test_converges_to_arc_second_precision(self, source, birth_jd):
+        """Test that the arc is hit well within one arc-second"""
+        solution = solve_design_julian_day(birth_jd, source)
+
+        assert solution.converged
+        assert abs(solution.residual) < 1.0 / 3600.0
+        assert _arc(source, birth_jd, solution.julian_day) == pytest.approx(88.0, abs=1.0 / 3600.0)
+        # Birth evaluation plus 2-3 design-side evaluations
+        assert solution.iterations <= 4
+        assert 86.0 < birth_jd - solution.julian_day < 93.0
+
+    def test_custom_target_arc(self, source):
+        """Test that other arcs are solved as well"""
+        solution = solve_design_julian_day(2451545.0, source, target_arc=30.0)
+        assert solution.converged
+        assert _arc(source, 2451545.0, solution.julian_day) == pytest.approx(30.0, abs=1e-4)
+
+    def test_reports_non_convergence(self, source):
+        """Test that an exhausted iteration budget is reported, not hidden"""
+        solution = solve_design_julian_day(2451545.0, source, tolerance=0.0, max_iterations=2)
+        assert solution.converged is False
+        assert solution.iterations == 3
+
+
+class TestCalculateDesignDatetime:
+    """Test datetime wrapper around the solver"""
+
+    def test_returns_aware_utc_datetime(self, source):
+        """Test that the design moment keeps the UTC timezone and is ~88 days earlier"""
+        birth = datetime(1990, 6, 15, 12, 30, tzinfo=pytz.UTC)
+        design = calculate_design_datetime(birth, source)
+
+        assert design.tzinfo is not None
+        assert 86 < (birth - design).total_seconds() / 86400 < 93
+
+    def test_records_stats(self, source):
+        """Test that solver runs are recorded for monitoring"""
+        before = design_time_stats.snapshot()["solves"]
+        calculate_design_datetime(datetime(1985, 5, 21, 14, 30, tzinfo=pytz.UTC), source)
+        assert design_time_stats.snapshot()["solves"] == before + 1
+
+    def test_stats_reset(self):
+        """Test that counters can be cleared"""
+        stats = DesignTimeStats()
+        assert stats.snapshot() == {
+            "solves": 0,
+            "mean_iterations": 0.0,
+            "max_iterations": 0,
+            "max_abs_residual_deg": 0.0,
+            "not_converged": 0,
+        }
+
+    def test_drain_and_merge(self, source):
+        """Test that drained counters reset the source and add up in the target"""
+        worker, parent = DesignTimeStats(), DesignTimeStats()
+        jd = source.datetime_to_julian_day(datetime(1990, 6, 15, 12, 30))
+        worker.record(solve_design_julian_day(jd, source))
+        worker.record(solve_design_julian_day(jd + 100, source))
+        expected = worker.snapshot()
+
+        parent.merge(worker.drain())
+        assert worker.snapshot()["solves"] == 0
+        assert parent.snapshot() == expected
+
+
+class TestDesignTimeStatsExposure:
+    """Test that solver stats reach the admin API"""
+
+    def test_process_mode_merges_worker_stats(self):
+        """Test that solves in engine worker processes are counted in the parent"""
+        engine = CalculationEngine(max_workers=1, max_queue=0, mode="process")
+        before = design_time_stats.snapshot()["solves"]
+        try:
+            design = asyncio.run(engine.run(_solve_in_worker, 1984))
+        finally:
+            engine.shutdown()
+        assert design.year == 1983
+        assert design_time_stats.snapshot()["solves"] == before + 1
+
+    def test_admin_endpoint(self, source, monkeypatch):
+        """Test GET /api/admin/design-time returns the shared counters"""
+        monkeypatch.setenv("ADMIN_API_TOKEN", "secret-token")
+        calculate_design_datetime(datetime(1985, 5, 21, 14, 30, tzinfo=pytz.UTC), source)
+        client = TestClient(app)
+
+        assert client.get("/api/admin/design-time").status_code == 403
+        stats = client.get("/api/admin/design-time", headers={"X-Admin-Token": "secret-token"}).json()
+        assert stats == design_time_stats.snapshot()
+        assert stats["solves"] >= 1
+        assert 0 < stats["mean_iterations"] <= stats["max_iterations"]
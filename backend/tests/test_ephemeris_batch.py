@@ -0,0 +1,88 @@
+"""Test batched multi-body position API on ephemeris sources"""
+
+import pytest
+
+import src.services.ephemeris.swiss_ephemeris as swiss_module
+from src.models.celestial import CelestialBody
+from src.services.ephemeris.base import EphemerisSource
+from src.services.ephemeris.swiss_ephemeris import SwissEphemerisSource
+
+JD_J2000 = 2451545.0
+
+
+class CountingSource(EphemerisSource):
+    """Minimal source that records every single-body call"""
+
+    def __init__(self):
+        self.calls = []
+
+    def calculate_position(self, body, julian_day):
+        self.calls.append(body)
+        return float(list(CelestialBody).index(body) * 20)
+
+    def get_source_name(self):
+        return "Counting"
+
+    def is_available(self):
+        return True
+
+
+class TestDefaultBatch:
+    """Test the EphemerisSource default batch implementation"""
+
+    def test_opposite_points_are_derived(self):
+        """Test that Earth and South Node never trigger their own calculation"""
+        source = CountingSource()
+        bodies = list(CelestialBody)
+        longitudes = source.calculate_positions(bodies, JD_J2000)
+
+        assert len(longitudes) == len(bodies)
+        assert len(source.calls) == 11
+        assert CelestialBody.EARTH not in source.calls
+        assert CelestialBody.SOUTH_NODE not in source.calls
+
+        by_body = dict(zip(bodies, longitudes))
+        assert by_body[CelestialBody.EARTH] == (by_body[CelestialBody.SUN] + 180.0) % 360.0
+        assert by_body[CelestialBody.SOUTH_NODE] == (by_body[CelestialBody.NORTH_NODE] + 180.0) % 360.0
+
+    def test_preserves_request_order(self):
+        """Test that results follow the order of the requested bodies"""
+        source = CountingSource()
+        bodies = [CelestialBody.SOUTH_NODE, CelestialBody.MOON, CelestialBody.EARTH]
+        longitudes = source.calculate_positions(bodies, JD_J2000)
+
+        assert longitudes == [
+            (source.calculate_position(CelestialBody.NORTH_NODE, JD_J2000) + 180.0) % 360.0,
+            source.calculate_position(CelestialBody.MOON, JD_J2000),
+            (source.calculate_position(CelestialBody.SUN, JD_J2000) + 180.0) % 360.0,
+        ]
+
+
+class TestSwissBatch:
+    """Test SwissEphemerisSource.calculate_positions"""
+
+    def test_matches_single_body_calculation(self):
+        """Test that batched longitudes equal per-body longitudes"""
+        source = SwissEphemerisSource()
+        bodies = list(CelestialBody)
+        batched = source.calculate_positions(bodies, JD_J2000)
+
+        for body, longitude in zip(bodies, batched):
+            assert longitude == pytest.approx(
+                source.get_ecliptic_longitude(body, JD_J2000), abs=1e-12
+            )
+
+    def test_one_swisseph_call_per_physical_body(self, monkeypatch):
+        """Test that a full chart moment costs 11 swisseph calls"""
+        calls = []
+        real_calc_ut = swiss_module.swe.calc_ut
+
+        def counting_calc_ut(*args):
+            calls.append(args[1])
+            return real_calc_ut(*args)
+
+        monkeypatch.setattr(swiss_module.swe, "calc_ut", counting_calc_ut)
+        SwissEphemerisSource().calculate_positions(list(CelestialBody), JD_J2000)
+
+        assert len(calls) == 11
+        assert len(set(calls)) == 11
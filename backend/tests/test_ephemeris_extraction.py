@@ -0,0 +1,151 @@
+"""Test streaming, hash-verified ephemeris extraction"""
+
+import hashlib
+import os
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from src.models.ephemeris_storage import Base, EphemerisFile
+from src.services.ephemeris.extraction import (
+    EXTRACTED,
+    FAILED,
+    SKIPPED,
+    EphemerisIntegrityError,
+    extract_ephemeris_files,
+    extract_file,
+    iter_file_chunks,
+    list_stored_files,
+)
+
+FILES = {
+    "sepl_18.se1": os.urandom(300_000),
+    "semo_18.se1": os.urandom(123_457),
+    "seas_18.se1": b"",
+}
+
+
+@pytest.fixture
+def engine(tmp_path):
+    """Create a SQLite database holding the test files"""
+    engine = create_engine(
+        f"sqlite:///{tmp_path / 'ephemeris.db'}", connect_args={"check_same_thread": False}
+    )
+    Base.metadata.create_all(engine)
+    session = sessionmaker(bind=engine)()
+    for filename, data in FILES.items():
+        session.add(EphemerisFile(
+            filename=filename,
+            file_data=data,
+            file_size=len(data),
+            sha256_hash=hashlib.sha256(data).hexdigest(),
+        ))
+    session.commit()
+    session.close()
+    yield engine
+    engine.dispose()
+
+
+def _stored(engine, filename):
+    """Get the manifest entry of one file"""
+    return next(stored for stored in list_stored_files(engine) if stored.filename == filename)
+
+
+class TestStreaming:
+    """Test manifest and chunked blob reads"""
+
+    def test_manifest_is_largest_first(self, engine):
+        """Test that the manifest lists metadata of every file, largest first"""
+        manifest = list_stored_files(engine)
+        assert [stored.filename for stored in manifest] == ["sepl_18.se1", "semo_18.se1", "seas_18.se1"]
+        assert manifest[0].file_size == 300_000
+
+    def test_chunks_reassemble_blob(self, engine):
+        """Test that chunks are bounded and reassemble the exact blob"""
+        stored = _stored(engine, "semo_18.se1")
+        chunks = [bytes(chunk) for chunk in iter_file_chunks(engine, stored.id, stored.file_size, 10_000)]
+
+        assert max(len(chunk) for chunk in chunks) == 10_000
+        assert len(chunks) == 13
+        assert b"".join(chunks) == FILES["semo_18.se1"]
+
+
+class TestExtraction:
+    """Test extract_file and extract_ephemeris_files"""
+
+    def test_extracts_all_files(self, engine, tmp_path):
+        """Test that all files are written with matching content and no temp files remain"""
+        out = tmp_path / "ephe"
+        totals = extract_ephemeris_files(engine, str(out), workers=3, chunk_size=50_000)
+
+        assert totals["files"] == 3
+        assert totals["extracted"] == 3
+        assert totals["failed"] == 0
+        assert totals["bytes"] == sum(len(data) for data in FILES.values())
+        for filename, data in FILES.items():
+            assert (out / filename).read_bytes() == data
+        assert sorted(path.name for path in out.iterdir()) == sorted(FILES)
+
+    def test_skips_files_with_matching_hash(self, engine, tmp_path):
+        """Test that a second run skips current files and repairs a corrupted one"""
+        out = tmp_path / "ephe"
+        extract_ephemeris_files(engine, str(out), chunk_size=50_000)
+        corrupted = bytearray(FILES["semo_18.se1"])
+        corrupted[100] ^= 0xFF
+        (out / "semo_18.se1").write_bytes(bytes(corrupted))
+
+        results = {}
+        totals = extract_ephemeris_files(
+            engine, str(out), chunk_size=50_000, progress=lambda result: results.update({result.filename: result})
+        )
+
+        assert totals["skipped"] == 2
+        assert totals["extracted"] == 1
+        assert results["semo_18.se1"].status == EXTRACTED
+        assert results["sepl_18.se1"].status == SKIPPED
+        assert (out / "semo_18.se1").read_bytes() == FILES["semo_18.se1"]
+
+    def test_force_reextracts_current_files(self, engine, tmp_path):
+        """Test that force extracts files even if their hash matches"""
+        out = tmp_path / "ephe"
+        extract_ephemeris_files(engine, str(out))
+        totals = extract_ephemeris_files(engine, str(out), force=True)
+        assert totals["extracted"] == 3
+
+    def test_hash_mismatch_keeps_existing_file(self, engine, tmp_path):
+        """Test that a blob not matching its stored hash is never renamed into place"""
+        out = tmp_path / "ephe"
+        out.mkdir()
+        (out / "sepl_18.se1").write_bytes(b"old")
+        session = sessionmaker(bind=engine)()
+        session.query(EphemerisFile).filter_by(filename="sepl_18.se1").update({"sha256_hash": "0" * 64})
+        session.commit()
+        session.close()
+
+        with pytest.raises(EphemerisIntegrityError):
+            extract_file(engine, _stored(engine, "sepl_18.se1"), out, chunk_size=50_000)
+        assert (out / "sepl_18.se1").read_bytes() == b"old"
+        assert [path.name for path in out.iterdir()] == ["sepl_18.se1"]
+
+    def test_failures_do_not_stop_other_files(self, engine, tmp_path):
+        """Test that a failing file is reported while the others are extracted"""
+        session = sessionmaker(bind=engine)()
+        session.query(EphemerisFile).filter_by(filename="semo_18.se1").update({"file_size": 999_999})
+        session.commit()
+        session.close()
+
+        results = []
+        totals = extract_ephemeris_files(engine, str(tmp_path / "ephe"), progress=results.append)
+
+        assert totals["failed"] == 1
+        assert totals["extracted"] == 2
+        failed = [result for result in results if result.status == FAILED]
+        assert failed[0].filename == "semo_18.se1"
+        assert "EphemerisIntegrityError" in failed[0].error
+
+    def test_rejects_path_in_filename(self, engine, tmp_path):
+        """Test that stored names cannot escape the output directory"""
+        stored = _stored(engine, "sepl_18.se1")._replace(filename="../evil.se1")
+        with pytest.raises(ValueError):
+            extract_file(engine, stored, tmp_path)
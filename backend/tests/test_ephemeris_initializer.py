@@ -0,0 +1,147 @@
+"""Test ephemeris path application, coverage checks, warm-up and the /ready probe"""
+
+from pathlib import Path
+
+import pytest
+import swisseph as swe
+from fastapi.testclient import TestClient
+
+from src.main import app
+from src.models.ephemeris import EphemerisConfig
+from src.services.ephemeris import initializer as initializer_module
+from src.services.ephemeris.initializer import (
+    STATUS_FAILED,
+    STATUS_PENDING,
+    STATUS_READY,
+    EphemerisInitializer,
+    apply_ephemeris_path,
+    block_file_names,
+    file_block,
+)
+
+client = TestClient(app)
+
+EPHEMERIS_DIR = str(Path(__file__).parent.parent / "data" / "ephemeris")
+
+
+@pytest.fixture(autouse=True)
+def restore_ephemeris_path():
+    """Restore the process-wide swisseph path after each test"""
+    previous = initializer_module._applied_path
+    yield
+    swe.set_ephe_path(previous or EphemerisConfig().ephemeris_path)
+    initializer_module._applied_path = previous
+
+
+class TestFileNames:
+    """Test mapping years to Swiss Ephemeris file names"""
+
+    def test_blocks(self):
+        """Test that years map to their 600-year file"""
+        assert block_file_names(file_block(1850)) == ["sepl_18.se1", "semo_18.se1"]
+        assert block_file_names(file_block(2399)) == ["sepl_18.se1", "semo_18.se1"]
+        assert block_file_names(file_block(2400)) == ["sepl_24.se1", "semo_24.se1"]
+        assert block_file_names(file_block(1799)) == ["sepl_12.se1", "semo_12.se1"]
+        assert block_file_names(file_block(-1)) == ["seplm06.se1", "semom06.se1"]
+
+    def test_required_files_span_range(self):
+        """Test that a range crossing a block boundary needs both blocks"""
+        initializer = EphemerisInitializer(EPHEMERIS_DIR, 1750, 2100)
+        assert initializer.required_files() == ["sepl_12.se1", "semo_12.se1", "sepl_18.se1", "semo_18.se1"]
+        assert initializer.missing_files() == ["sepl_12.se1", "semo_12.se1"]
+
+    def test_rejects_inverted_range(self):
+        """Test that an end year before the start year is rejected"""
+        with pytest.raises(ValueError):
+            EphemerisInitializer(EPHEMERIS_DIR, 2100, 1900)
+
+
+class TestInitialize:
+    """Test EphemerisInitializer.initialize"""
+
+    def test_ready_with_bundled_files(self):
+        """Test that the bundled files cover the default range and are warmed"""
+        initializer = EphemerisInitializer(EPHEMERIS_DIR, 1850, 2100)
+        assert initializer.status()["status"] == STATUS_PENDING
+
+        assert initializer.initialize() is True
+        status = initializer.status()
+        assert initializer.ready
+        assert status["status"] == STATUS_READY
+        assert status["missing_files"] == []
+        assert status["warmed_bytes"] > 1_000_000
+        assert status["probes"] == 3 * 11
+
+        # Calculations in this process now use the files instead of Moshier
+        _, retflags = swe.calc_ut(swe.julday(1990, 6, 15, 12.0), swe.MOON, swe.FLG_SWIEPH)
+        assert retflags & swe.FLG_SWIEPH
+
+    def test_fails_on_missing_files(self, tmp_path):
+        """Test that a directory without the required files is reported as failed"""
+        initializer = EphemerisInitializer(str(tmp_path), 1850, 2100)
+
+        assert initializer.initialize() is False
+        status = initializer.status()
+        assert status["status"] == STATUS_FAILED
+        assert status["missing_files"] == ["sepl_18.se1", "semo_18.se1"]
+        assert "FileNotFoundError" in status["error"]
+
+    def test_fails_on_damaged_files(self, tmp_path):
+        """Test that files swisseph cannot read fail the probes"""
+        for name in block_file_names(file_block(1850)):
+            (tmp_path / name).write_bytes(b"not an ephemeris file")
+        initializer = EphemerisInitializer(str(tmp_path), 1850, 2100)
+
+        assert initializer.initialize() is False
+        assert initializer.status()["status"] == STATUS_FAILED
+
+    def test_fails_on_moshier_fallback(self, monkeypatch):
+        """Test that positions not flagged as Swiss Ephemeris data fail instead of silently using Moshier"""
+        monkeypatch.setattr(
+            initializer_module.swe, "calc_ut", lambda jd, body, flags: ((0.0,) * 6, swe.FLG_MOSEPH | swe.FLG_SPEED)
+        )
+        initializer = EphemerisInitializer(EPHEMERIS_DIR, 1850, 2100)
+
+        assert initializer.initialize() is False
+        assert "Moshier" in initializer.status()["error"]
+
+    def test_retry_after_failure(self, tmp_path):
+        """Test that a failed initializer can be run again once files are present"""
+        initializer = EphemerisInitializer(str(tmp_path), 1850, 2100)
+        assert initializer.initialize() is False
+
+        for name in block_file_names(file_block(1850)):
+            (tmp_path / name).write_bytes((Path(EPHEMERIS_DIR) / name).read_bytes())
+        assert initializer.initialize() is True
+
+    def test_apply_path_once(self, monkeypatch):
+        """Test that the same path is only passed to swisseph once"""
+        calls = []
+        monkeypatch.setattr(initializer_module.swe, "set_ephe_path", calls.append)
+        initializer_module._applied_path = None
+
+        apply_ephemeris_path("/a")
+        apply_ephemeris_path("/a")
+        apply_ephemeris_path("/b")
+        assert calls == ["/a", "/b"]
+
+
+class TestReadyEndpoint:
+    """Test GET /ready"""
+
+    def test_not_ready_until_warm(self, monkeypatch):
+        """Test that /ready answers 503 before initialization and 200 after, while /health stays 200"""
+        import src.main
+
+        initializer = EphemerisInitializer(EPHEMERIS_DIR, 1850, 2100)
+        monkeypatch.setattr(src.main, "ephemeris_initializer", initializer)
+
+        response = client.get("/ready")
+        assert response.status_code == 503
+        assert response.json()["status"] == STATUS_PENDING
+        assert client.get("/health").status_code == 200
+
+        initializer.initialize()
+        response = client.get("/ready")
+        assert response.status_code == 200
+        assert response.json()["status"] == STATUS_READY
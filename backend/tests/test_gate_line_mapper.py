@@ -0,0 +1,83 @@
+"""Test gate/line mapping"""
+
+import numpy as np
+import pytest
+
+from src.services.calculation.gate_line_mapper import (
+    BASE_WIDTH,
+    COLOR_WIDTH,
+    GATE_WIDTH,
+    LINE_WIDTH,
+    TONE_WIDTH,
+    WHEEL_START,
+    ecliptic_to_activation,
+    ecliptic_to_gate_line,
+    map_longitudes,
+)
+
+
+class TestScalarMapping:
+    """Test scalar gate/line and activation mapping"""
+
+    def test_wheel_start(self):
+        """Test that 58° is the start of gate 41, line 1"""
+        assert ecliptic_to_gate_line(58.0) == (41, 1)
+        assert ecliptic_to_activation(58.0) == (41, 1, 1, 1, 1)
+
+    def test_known_positions(self):
+        """Test gates across the wheel"""
+        assert ecliptic_to_gate_line(58.0 + GATE_WIDTH) == (19, 1)
+        assert ecliptic_to_gate_line(58.0 + GATE_WIDTH + 2.5 * LINE_WIDTH) == (19, 3)
+        # Just below the wheel start is the last line of gate 60
+        assert ecliptic_to_gate_line(57.999) == (60, 6)
+
+    def test_sub_line_levels(self):
+        """Test color, tone and base inside one line"""
+        longitude = WHEEL_START + 2 * COLOR_WIDTH + 3 * TONE_WIDTH + 4.5 * BASE_WIDTH
+        activation = ecliptic_to_activation(longitude)
+        assert (activation.color, activation.tone, activation.base) == (3, 4, 5)
+
+    def test_boundary_rounding_is_clamped(self):
+        """Test that values just below a boundary never give line 7 or gate position 65"""
+        for boundary in np.arange(WHEEL_START, WHEEL_START + 360.0, GATE_WIDTH):
+            below = float(np.nextafter(boundary, 0.0))
+            gate, line = ecliptic_to_gate_line(below)
+            assert 1 <= gate <= 64 and 1 <= line <= 6
+        assert ecliptic_to_gate_line(float(np.nextafter(WHEEL_START + 360.0, 0.0))) == (60, 6)
+
+
+class TestVectorizedMapping:
+    """Test the NumPy mapping"""
+
+    def test_matches_scalar(self):
+        """Test that array results equal the scalar wrapper"""
+        rng = np.random.default_rng(5)
+        longitudes = np.concatenate([
+            rng.uniform(-10.0, 370.0, 20000),
+            np.arange(0.0, 360.0, BASE_WIDTH * 7.0),
+        ])
+        mapped = map_longitudes(longitudes)
+        for i in range(0, len(longitudes), 13):
+            expected = ecliptic_to_activation(float(longitudes[i]))
+            assert tuple(int(level[i]) for level in mapped) == tuple(expected)
+
+    def test_ranges_and_shape(self):
+        """Test level ranges and that the input shape is kept"""
+        longitudes = np.random.default_rng(1).uniform(0.0, 360.0, (100, 50))
+        mapped = map_longitudes(longitudes)
+        assert mapped.gate.shape == (100, 50)
+        assert mapped.gate.min() >= 1 and mapped.gate.max() <= 64
+        assert mapped.line.min() >= 1 and mapped.line.max() <= 6
+        assert mapped.color.max() <= 6 and mapped.tone.max() <= 6
+        assert mapped.base.min() >= 1 and mapped.base.max() <= 5
+
+    def test_every_gate_once_per_wheel(self):
+        """Test that line 1 of each of the 64 wheel positions maps to a distinct gate"""
+        starts = WHEEL_START + GATE_WIDTH * np.arange(64) + LINE_WIDTH / 2
+        gates = map_longitudes(starts).gate
+        assert sorted(gates.tolist()) == list(range(1, 65))
+
+    @pytest.mark.parametrize("longitude", [0.0, 123.456, 359.999])
+    def test_accepts_lists(self, longitude):
+        """Test that plain lists are accepted"""
+        assert int(map_longitudes([longitude]).gate[0]) == ecliptic_to_gate_line(longitude)[0]
@@ -0,0 +1,190 @@
+"""Test offline gazetteer"""
+
+import pytest
+
+from src.services.gazetteer import Gazetteer, build_gazetteer, iter_geonames, normalize_place_name
+from src.services.geocoding_service import GeocodingService
+
+# Minimal GeoNames rows: id, name, asciiname, alternatenames, lat, lng,
+# feature class/code, country, cc2, admin1-4, population, elevation, dem, tz, modified
+GEONAMES_ROWS = [
+    ["2867714", "München", "Muenchen", "Munich,Monaco di Baviera,Minga", "48.13743", "11.57549",
+     "P", "PPLA", "DE", "", "02", "091", "09162", "09162000", "1260391", "", "524", "Europe/Berlin", "2023-10-12"],
+    ["2950159", "Berlin", "Berlin", "Berlino,Berlín", "52.52437", "13.41053",
+     "P", "PPLC", "DE", "", "16", "00", "11000", "11000000", "3426354", "", "74", "Europe/Berlin", "2022-04-12"],
+    ["4500546", "Berlin", "Berlin", "", "39.79123", "-74.92905",
+     "P", "PPL", "US", "", "NJ", "007", "", "", "7588", "", "46", "America/New_York", "2017-05-23"],
+    ["2643743", "London", "London", "Londres,Londra", "51.50853", "-0.12574",
+     "P", "PPLC", "GB", "", "ENG", "GLA", "", "", "8961989", "", "25", "Europe/London", "2023-01-12"],
+    ["2988507", "Paris", "Paris", "Paname,Parigi", "48.85341", "2.3488",
+     "P", "PPLC", "FR", "", "11", "75", "751", "75056", "2138551", "", "42", "Europe/Paris", "2023-02-21"],
+    ["4717560", "Paris", "Paris", "", "33.66094", "-95.55551",
+     "P", "PPLA2", "US", "", "TX", "277", "", "", "24782", "", "183", "America/Chicago", "2017-03-09"],
+    ["2925533", "Frankfurt am Main", "Frankfurt am Main", "Frankfurt", "50.11552", "8.68417",
+     "P", "PPLA2", "DE", "", "05", "064", "06412", "06412000", "650000", "", "112", "Europe/Berlin", "2023-01-12"],
+    ["2925535", "Frankfurt (Oder)", "Frankfurt (Oder)", "Frankfurt", "52.34714", "14.55062",
+     "P", "PPLA3", "DE", "", "11", "00", "12053", "12053000", "57015", "", "28", "Europe/Berlin", "2022-06-23"],
+    ["4887398", "Chicago", "Chicago", "", "41.85003", "-87.65005",
+     "P", "PPLA2", "US", "", "IL", "031", "", "", "2720546", "", "180", "America/Chicago", "2022-05-26"],
+    ["5746545", "Portland", "Portland", "", "45.52345", "-122.67621",
+     "P", "PPLA2", "US", "", "OR", "051", "", "", "652503", "", "15", "America/Los_Angeles", "2019-09-05"],
+    ["4975802", "Portland", "Portland", "", "43.66147", "-70.25533",
+     "P", "PPLA2", "US", "", "ME", "005", "", "", "66881", "", "9", "America/New_York", "2017-05-23"],
+    ["9999999", "Kleindorf", "Kleindorf", "", "50.0", "10.0",
+     "P", "PPL", "DE", "", "", "", "", "", "12", "", "", "Europe/Berlin", "2020-01-01"],
+]
+
+
+@pytest.fixture
+def gazetteer(tmp_path):
+    """Build a small gazetteer from GeoNames-style rows"""
+    dump = tmp_path / "cities.txt"
+    dump.write_text("\n".join("\t".join(row) for row in GEONAMES_ROWS) + "\n", encoding="utf-8")
+    output = tmp_path / "gazetteer.bin"
+    build_gazetteer(iter_geonames(dump), output)
+    gaz = Gazetteer(output)
+    yield gaz
+    gaz.close()
+
+
+class TestNormalizePlaceName:
+    """Test place name normalization"""
+
+    def test_diacritics_and_transliteration(self):
+        """Test that umlaut spellings normalize to the same key"""
+        assert normalize_place_name("München") == "munchen"
+        assert normalize_place_name("Muenchen") == "munchen"
+        assert normalize_place_name("MÜNCHEN") == "munchen"
+
+    def test_punctuation_collapsed(self):
+        """Test that punctuation and repeated spaces collapse to one space"""
+        assert normalize_place_name("  Frankfurt am Main  ") == "frankfurt am main"
+        assert normalize_place_name("Saint-Étienne") == "saint etienne"
+
+
+class TestGazetteer:
+    """Test gazetteer lookups"""
+
+    def test_alternate_spellings(self, gazetteer):
+        """Test München, Muenchen and Munich resolve to the same place"""
+        entries = {gazetteer.lookup(name) for name in ("München", "Muenchen", "Munich", "munich")}
+        assert len(entries) == 1
+        entry = entries.pop()
+        assert entry.timezone == "Europe/Berlin"
+        assert entry.latitude == pytest.approx(48.13743, abs=1e-4)
+        assert entry.longitude == pytest.approx(11.57549, abs=1e-4)
+
+    def test_most_populous_wins(self, gazetteer):
+        """Test that an unqualified name resolves to the largest place"""
+        assert gazetteer.lookup("Berlin").country_code == "DE"
+
+    def test_country_qualifier(self, gazetteer):
+        """Test that a country qualifier selects among homonyms"""
+        assert gazetteer.lookup("Berlin, Deutschland").country_code == "DE"
+        us = gazetteer.lookup("Berlin, USA")
+        assert us.country_code == "US"
+        assert us.timezone == "America/New_York"
+
+    def test_unmatched_qualifier_is_a_miss(self, gazetteer):
+        """Test that qualifiers selecting no candidate return None instead of the largest place"""
+        assert gazetteer.lookup("Paris").timezone == "Europe/Paris"
+        assert gazetteer.lookup("Paris, Frankreich").timezone == "Europe/Paris"
+        assert gazetteer.lookup("Paris, USA").timezone == "America/Chicago"
+        assert gazetteer.lookup("Paris, Texas") is None
+        assert gazetteer.lookup("Paris, TX") is None
+        assert gazetteer.lookup("Frankfurt").latitude == pytest.approx(50.11552, abs=1e-4)
+        assert gazetteer.lookup("Frankfurt, Oder") is None
+        assert gazetteer.lookup("London, Greater London") is None
+
+    def test_state_code_is_not_a_country(self, gazetteer):
+        """Test that a US state code read as an ISO country code does not pick a place"""
+        # "IL" is Israel as a country code; no candidate matches, so the lookup misses
+        assert gazetteer.lookup("Chicago, IL") is None
+        assert gazetteer.lookup("Chicago, USA").timezone == "America/Chicago"
+        assert gazetteer.lookup("Chicago").timezone == "America/Chicago"
+
+    def test_every_qualifier_must_match(self, gazetteer):
+        """Test that an unmatched state is not dropped when a later qualifier names the country"""
+        assert gazetteer.lookup("Portland").timezone == "America/Los_Angeles"
+        assert gazetteer.lookup("Portland, USA").timezone == "America/Los_Angeles"
+        assert gazetteer.lookup("Portland, Maine, USA") is None
+        assert gazetteer.lookup("Portland, ME, USA") is None
+        assert gazetteer.lookup("Portland, Maine") is None
+        assert gazetteer.lookup("Berlin, Deutschland, USA") is None
+        assert gazetteer.lookup("Berlin, Germany, Deutschland").country_code == "DE"
+
+    def test_miss(self, gazetteer):
+        """Test that unknown places return None"""
+        assert gazetteer.lookup("Atlantis") is None
+        assert gazetteer.lookup(" , ") is None
+
+    def test_min_population(self, tmp_path):
+        """Test that small places can be left out of the index"""
+        dump = tmp_path / "cities.txt"
+        dump.write_text("\n".join("\t".join(row) for row in GEONAMES_ROWS), encoding="utf-8")
+        output = tmp_path / "small.bin"
+        build_gazetteer(iter_geonames(dump, min_population=1000), output)
+        gaz = Gazetteer(output)
+        assert gaz.lookup("Kleindorf") is None
+        assert gaz.lookup("Berlin") is not None
+        gaz.close()
+
+    def test_rejects_foreign_file(self, tmp_path):
+        """Test that files without the gazetteer header are rejected"""
+        path = tmp_path / "bogus.bin"
+        path.write_bytes(b"\x00" * 64)
+        with pytest.raises(ValueError):
+            Gazetteer(path)
+
+
+class TestGeocodingServiceGazetteer:
+    """Test GeocodingService resolution order"""
+
+    def test_gazetteer_before_nominatim(self, gazetteer, monkeypatch):
+        """Test that gazetteer hits do not call Nominatim"""
+        service = GeocodingService(gazetteer=gazetteer)
+
+        def fail(*args, **kwargs):
+            raise AssertionError("Nominatim should not be called")
+
+        monkeypatch.setattr(service.geolocator, "geocode", fail)
+        lat, lng, tz = service.get_location_data("Muenchen, Germany")
+        assert tz == "Europe/Berlin"
+        assert lat == pytest.approx(48.13743, abs=1e-4)
+
+    def test_miss_falls_back_to_nominatim(self, gazetteer, monkeypatch):
+        """Test that gazetteer misses go to Nominatim"""
+        service = GeocodingService(gazetteer=gazetteer)
+        calls = []
+
+        class FakeLocation:
+            latitude = 47.0
+            longitude = 8.0
+
+        def geocode(place_name, **kwargs):
+            calls.append(place_name)
+            return FakeLocation()
+
+        monkeypatch.setattr(service.geolocator, "geocode", geocode)
+        lat, lng, tz = service.get_location_data("Atlantis")
+        assert calls == ["Atlantis"]
+        assert (lat, lng) == (47.0, 8.0)
+        assert tz == "Europe/Zurich"
+
+    def test_unmatched_qualifier_falls_back_to_nominatim(self, gazetteer, monkeypatch):
+        """Test that "Paris, Texas" is geocoded by Nominatim, not resolved to Europe/Paris"""
+        service = GeocodingService(gazetteer=gazetteer)
+        calls = []
+
+        class FakeLocation:
+            latitude = 33.66094
+            longitude = -95.55551
+
+        def geocode(place_name, **kwargs):
+            calls.append(place_name)
+            return FakeLocation()
+
+        monkeypatch.setattr(service.geolocator, "geocode", geocode)
+        lat, lng, tz = service.get_location_data("Paris, Texas")
+        assert calls == ["Paris, Texas"]
+        assert tz == "America/Chicago"
@@ -3,6 +3,7 @@
 import pytest
 from pydantic import ValidationError
 from src.models.chart import (
+    ChartBatchRequest,
     ChartRequest,
     TypeInfo,
     AuthorityInfo,
@@ -64,6 +65,22 @@ class TestChartRequest:
             )
 
 
+class TestChartBatchRequest:
+    """Test ChartBatchRequest model"""
+
+    def test_size_limit_from_config(self, monkeypatch):
+        """Test that the record limit is read from CHART_BATCH_MAX_RECORDS and checked before parsing"""
+        monkeypatch.setenv("CHART_BATCH_MAX_RECORDS", "2")
+        record = {"firstName": "John", "birthDate": "15.06.1990", "birthTime": "14:30", "birthPlace": "Berlin"}
+
+        assert len(ChartBatchRequest(records=[record, record]).records) == 2
+        with pytest.raises(ValidationError) as exc_info:
+            ChartBatchRequest(records=[record, record, {}])
+        errors = exc_info.value.errors()
+        assert len(errors) == 1
+        assert errors[0]["loc"] == ("records",)
+
+
 class TestChartResponse:
     """Test ChartResponse model"""
 
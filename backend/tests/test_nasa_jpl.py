@@ -0,0 +1,195 @@
+"""Test the SPK kernel reader and the local NASA JPL source against swisseph"""
+
+from datetime import datetime
+from pathlib import Path
+
+import numpy as np
+import pytest
+import pytz
+import swisseph as swe
+from numpy.polynomial import chebyshev
+
+from src.models.celestial import CelestialBody
+from src.models.ephemeris import EphemerisConfig
+from src.models.error import ERROR_CALCULATION_FAILED, ERROR_EPHEMERIS_UNAVAILABLE
+from src.services.ephemeris import initializer as initializer_module
+from src.services.ephemeris.initializer import apply_ephemeris_path
+from src.services.ephemeris.nasa_jpl import NASAJPLSource
+from src.services.ephemeris.registry import EphemerisSourceRegistry
+from src.services.ephemeris.spk import SPKError, SPKKernel
+from src.services.ephemeris.swiss_ephemeris import SwissEphemerisSource
+from src.services.shadow_validation import compare_sources
+from tests.spk_fixture import J2000, SECONDS_PER_DAY, Segment, build_kernel_from_swisseph, write_spk
+
+EPHEMERIS_DIR = str(Path(__file__).parent.parent / "data" / "ephemeris")
+
+# Kernel coverage: 1989-09-08 to 1991-01-09 (births in 1990 and their design dates)
+START_JD, END_JD = 2447777.5, 2448265.5
+BIRTH = pytz.UTC.localize(datetime(1990, 6, 15, 12, 30))
+
+
+@pytest.fixture(scope="module")
+def kernel_path(tmp_path_factory):
+    """DE-like kernel fitted to swisseph, with swisseph reading the bundled files for the module"""
+    previous = initializer_module._applied_path
+    apply_ephemeris_path(EPHEMERIS_DIR)
+    path = tmp_path_factory.mktemp("jpl") / "swisseph.bsp"
+    build_kernel_from_swisseph(path, START_JD, END_JD)
+    yield str(path)
+    swe.set_ephe_path(previous or EphemerisConfig().ephemeris_path)
+    initializer_module._applied_path = previous
+
+
+def _polynomial_segment(target=1, center=0, count=4, degree=5, interval_days=8.0, seed=0):
+    """Segment with random coefficients starting at J2000"""
+    rng = np.random.default_rng(seed)
+    coefficients = rng.normal(size=(count, 3, degree + 1)) * 1e6
+    return Segment(target, center, 0.0, interval_days * SECONDS_PER_DAY, coefficients)
+
+
+class TestSPKKernel:
+    """Test DAF/SPK parsing and Chebyshev evaluation"""
+
+    def test_segments_and_chain(self, kernel_path):
+        """Test that summaries are read and Earth/Moon chain through the Earth-Moon barycenter"""
+        kernel = SPKKernel(kernel_path)
+        assert kernel.targets == [1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 301, 399]
+        assert kernel.center_of(399) == 3
+        assert kernel.center_of(3) == 0
+        first, last = kernel.coverage(301)
+        assert first == pytest.approx((START_JD - J2000) * SECONDS_PER_DAY)
+        assert last == pytest.approx((END_JD - J2000) * SECONDS_PER_DAY)
+        kernel.close()
+
+    def test_evaluates_chebyshev_series(self, tmp_path):
+        """Test positions against numpy's Chebyshev evaluation and velocities against a finite difference"""
+        segment = _polynomial_segment()
+        path = tmp_path / "poly.bsp"
+        write_spk(path, [segment])
+        kernel = SPKKernel(str(path))
+
+        days = np.array([0.0, 3.3, 8.0, 17.25, 31.9])
+        seconds = days * SECONDS_PER_DAY
+        positions, velocities = kernel.relative_state(1, seconds)
+
+        for i, day in enumerate(days):
+            record = min(int(day // 8.0), 3)
+            s = (day - (record * 8.0 + 4.0)) / 4.0
+            expected = [chebyshev.chebval(s, segment.coefficients[record, axis]) for axis in range(3)]
+            assert positions[i] == pytest.approx(expected, rel=1e-12)
+
+        # Records of random coefficients are discontinuous, so stay inside one
+        step, inner = 1.0, [1, 3]
+        ahead, _ = kernel.relative_state(1, seconds[inner] + step)
+        behind, _ = kernel.relative_state(1, seconds[inner] - step)
+        assert velocities[inner] == pytest.approx((ahead - behind) / (2 * step), rel=1e-6)
+        kernel.close()
+
+    def test_later_segment_takes_precedence(self, tmp_path):
+        """Test that overlapping coverage is served by the segment stored last"""
+        old = _polynomial_segment(seed=1)
+        new = Segment(1, 0, 8.0 * SECONDS_PER_DAY, 8.0 * SECONDS_PER_DAY, np.zeros((1, 3, 6)))
+        path = tmp_path / "overlap.bsp"
+        write_spk(path, [old, new])
+        kernel = SPKKernel(str(path))
+
+        seconds = np.array([4.0, 12.0, 20.0]) * SECONDS_PER_DAY
+        positions, _ = kernel.relative_state(1, seconds)
+        assert np.all(positions[1] == 0.0)
+        assert np.all(positions[[0, 2]] != 0.0)
+        kernel.close()
+
+    def test_outside_coverage(self, tmp_path):
+        """Test that an epoch outside every segment is rejected"""
+        path = tmp_path / "poly.bsp"
+        write_spk(path, [_polynomial_segment()])
+        kernel = SPKKernel(str(path))
+        with pytest.raises(SPKError, match="outside the coverage"):
+            kernel.relative_state(1, np.array([-1.0 * SECONDS_PER_DAY]))
+        with pytest.raises(SPKError, match="not in"):
+            kernel.relative_state(399, np.array([0.0]))
+        kernel.close()
+
+    def test_rejects_other_files(self, tmp_path):
+        """Test that a file that is not an SPK kernel is rejected"""
+        path = tmp_path / "garbage.bsp"
+        path.write_bytes(b"\0" * 4096)
+        with pytest.raises(SPKError):
+            SPKKernel(str(path))
+
+
+class TestNASAJPLSource:
+    """Test NASAJPLSource longitudes against Swiss Ephemeris"""
+
+    def test_matches_swiss_ephemeris(self, kernel_path):
+        """Test that every body agrees with swisseph to within one arcsecond"""
+        source = NASAJPLSource(kernel_path)
+        swiss = SwissEphemerisSource()
+        bodies = list(CelestialBody)
+
+        for jd in np.linspace(START_JD + 1.0, END_JD - 1.0, 25):
+            ours = source.calculate_positions(bodies, jd)
+            theirs = swiss.calculate_positions(bodies, jd)
+            for body, a, b in zip(bodies, ours, theirs):
+                delta = abs((a - b + 180.0) % 360.0 - 180.0) * 3600.0
+                assert delta < 1.0, f"{body.value} differs by {delta:.3f}\" at JD {jd}"
+        source.close()
+
+    def test_vectorized_matches_scalar(self, kernel_path):
+        """Test that evaluating many Julian days at once equals one call per day"""
+        source = NASAJPLSource(kernel_path)
+        bodies = [CelestialBody.SUN, CelestialBody.MOON, CelestialBody.NORTH_NODE, CelestialBody.SOUTH_NODE]
+        julian_days = np.linspace(START_JD + 2.0, END_JD - 2.0, 50)
+
+        vectorized = source.calculate_longitudes(bodies, julian_days)
+        assert vectorized.shape == (4, 50)
+        for j in (0, 17, 49):
+            assert vectorized[:, j] == pytest.approx(source.calculate_positions(bodies, julian_days[j]), abs=1e-9)
+        assert np.allclose((vectorized[3] - vectorized[2]) % 360.0, 180.0)
+
+    def test_chart_matches_swiss_ephemeris(self, kernel_path):
+        """Test that a full chart (both sides, design time solved on the kernel) is unchanged"""
+        record = compare_sources(SwissEphemerisSource(), NASAJPLSource(kernel_path), BIRTH)
+        assert record["match"] is True
+        assert record["max_delta_arcsec"] < 1.0
+        assert abs(record["design_time_delta_seconds"]) < 60.0
+
+    def test_outside_kernel_range(self, kernel_path):
+        """Test that an epoch the kernel does not cover fails as a calculation error"""
+        source = NASAJPLSource(kernel_path)
+        with pytest.raises(RuntimeError, match=ERROR_CALCULATION_FAILED):
+            source.calculate_position(CelestialBody.SUN, END_JD + 100.0)
+
+    def test_unavailable_without_kernel(self, tmp_path):
+        """Test that a missing, unconfigured or incomplete kernel makes the source unavailable"""
+        assert NASAJPLSource().is_available() is False
+        assert NASAJPLSource(str(tmp_path / "missing.bsp")).is_available() is False
+
+        path = tmp_path / "partial.bsp"
+        write_spk(path, [_polynomial_segment()])
+        source = NASAJPLSource(str(path))
+        assert source.is_available() is False
+        with pytest.raises(RuntimeError, match=ERROR_EPHEMERIS_UNAVAILABLE):
+            source.calculate_position(CelestialBody.SUN, J2000)
+
+    def test_registry_uses_configured_kernel(self, kernel_path):
+        """Test that EPHEMERIS_JPL_KERNEL_PATH reaches the nasa_jpl source"""
+        config = EphemerisConfig(
+            source="nasa_jpl", jpl_kernel_path=kernel_path, supported_start_year=1990, supported_end_year=1990
+        )
+        registry = EphemerisSourceRegistry(config=config)
+        assert registry.is_available() is True
+        assert registry.get().get_source_name() == "NASA_JPL"
+        registry.shutdown()
+
+    def test_kernel_must_cover_supported_years(self, kernel_path):
+        """Test that a kernel not covering the supported years (design dates included) is unavailable"""
+        assert NASAJPLSource(kernel_path, start_year=1990, end_year=1990).is_available() is True
+        assert NASAJPLSource(kernel_path, start_year=1990, end_year=1991).is_available() is False
+        assert NASAJPLSource(kernel_path, start_year=1989, end_year=1990).is_available() is False
+
+        # Default range 1850-2100, like de440s.bsp which starts 1849-12-26
+        source = NASAJPLSource.from_config(EphemerisConfig(jpl_kernel_path=kernel_path))
+        assert source.is_available() is False
+        with pytest.raises(RuntimeError, match="supported years 1850-2100"):
+            source.calculate_position(CelestialBody.SUN, 2448000.0)
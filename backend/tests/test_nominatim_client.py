@@ -0,0 +1,207 @@
+"""Test async Nominatim client against a local stub server"""
+
+import asyncio
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+
+from src.services.geocoding_service import GeocodingService
+from src.services.nominatim_client import NominatimClient, TokenBucket
+
+PLACES = {
+    "Zürich": ("47.3769", "8.5417"),
+    "Wien": ("48.2082", "16.3738"),
+    "Graz": ("47.0707", "15.4395"),
+}
+
+
+class StubNominatim:
+    """Minimal /search endpoint that records requests"""
+
+    def __init__(self, delay: float = 0.0):
+        self.delay = delay
+        self.requests = []
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                query = parse_qs(urlparse(self.path).query)["q"][0]
+                stub.requests.append((time.monotonic(), query, self.headers.get("User-Agent")))
+                time.sleep(stub.delay)
+                coords = PLACES.get(query)
+                body = json.dumps([{"lat": coords[0], "lon": coords[1]}] if coords else []).encode()
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.url = f"http://127.0.0.1:{self.server.server_address[1]}"
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+
+    def close(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+
+@pytest.fixture
+def stub():
+    """Start a stub Nominatim server"""
+    server = StubNominatim()
+    yield server
+    server.close()
+
+
+def make_client(stub, **kwargs) -> NominatimClient:
+    kwargs.setdefault("rate_per_second", 100.0)
+    kwargs.setdefault("burst", 10)
+    return NominatimClient(base_url=stub.url, user_agent="hd-test", **kwargs)
+
+
+class TestTokenBucket:
+    """Test token bucket scheduling"""
+
+    def test_queues_instead_of_failing(self):
+        """Test that callers beyond the burst wait for tokens"""
+        async def run():
+            bucket = TokenBucket(rate=20.0, capacity=1)
+            start = time.monotonic()
+            await asyncio.gather(*(bucket.acquire() for _ in range(4)))
+            return time.monotonic() - start
+
+        # First token is immediate, the other three arrive every 50 ms
+        assert asyncio.run(run()) >= 0.14
+
+    def test_deadline(self):
+        """Test that waits longer than the deadline are rejected up front"""
+        async def run():
+            bucket = TokenBucket(rate=1.0, capacity=1)
+            await bucket.acquire()
+            await bucket.acquire(deadline=time.monotonic() + 0.1)
+
+        with pytest.raises(TimeoutError):
+            asyncio.run(run())
+
+
+class TestNominatimClient:
+    """Test lookups, coalescing, throttling and deadlines"""
+
+    def test_geocode(self, stub):
+        """Test that coordinates are parsed and the user agent is sent"""
+        async def run():
+            client = make_client(stub)
+            try:
+                return await client.geocode("Zürich")
+            finally:
+                await client.aclose()
+
+        assert asyncio.run(run()) == (47.3769, 8.5417)
+        assert stub.requests[0][2] == "hd-test"
+
+    def test_not_found(self, stub):
+        """Test that an empty result returns None"""
+        async def run():
+            client = make_client(stub)
+            try:
+                return await client.geocode("Atlantis")
+            finally:
+                await client.aclose()
+
+        assert asyncio.run(run()) is None
+
+    def test_concurrent_lookups_coalesce(self, stub):
+        """Test that concurrent lookups of one place send a single request"""
+        stub.delay = 0.1
+
+        async def run():
+            client = make_client(stub)
+            try:
+                results = await asyncio.gather(*(client.geocode("Wien") for _ in range(10)))
+                return results, client.stats()
+            finally:
+                await client.aclose()
+
+        results, stats = asyncio.run(run())
+        assert results == [(48.2082, 16.3738)] * 10
+        assert len(stub.requests) == 1
+        assert stats["coalesced"] == 9
+        assert stats["in_flight"] == 0
+
+    def test_rate_limit_spaces_requests(self, stub):
+        """Test that distinct lookups are queued at the configured rate"""
+        async def run():
+            client = make_client(stub, rate_per_second=10.0, burst=1)
+            try:
+                start = time.monotonic()
+                results = await asyncio.gather(*(client.geocode(name) for name in PLACES))
+                return results, time.monotonic() - start
+            finally:
+                await client.aclose()
+
+        results, elapsed = asyncio.run(run())
+        assert all(result is not None for result in results)
+        assert len(stub.requests) == 3
+        # First request goes out immediately, the other two wait 100 ms each
+        assert elapsed >= 0.19
+
+    def test_deadline(self, stub):
+        """Test that a slow server raises TimeoutError within the deadline"""
+        stub.delay = 0.5
+
+        async def run():
+            client = make_client(stub)
+            try:
+                start = time.monotonic()
+                with pytest.raises(TimeoutError):
+                    await client.geocode("Graz", timeout=0.1)
+                return time.monotonic() - start
+            finally:
+                await client.aclose()
+
+        assert asyncio.run(run()) < 0.4
+
+    def test_new_event_loop_closes_previous_client(self, stub):
+        """Test that moving to another event loop closes the HTTP client of the previous one"""
+        client = make_client(stub)
+        assert asyncio.run(client.geocode("Wien")) == (48.2082, 16.3738)
+        first = client._client
+
+        async def run():
+            try:
+                return await client.geocode("Graz")
+            finally:
+                await client.aclose()
+
+        assert asyncio.run(run()) == (47.0707, 15.4395)
+        assert first is not None and first.is_closed
+
+
+class TestGeocodingServiceAsync:
+    """Test GeocodingService.get_location_data_async"""
+
+    def test_known_location_skips_network(self, stub):
+        """Test that known locations do not reach Nominatim"""
+        service = GeocodingService(nominatim=make_client(stub))
+        result = asyncio.run(service.get_location_data_async("Berlin, Germany"))
+        assert result == (52.5200, 13.4050, "Europe/Berlin")
+        assert stub.requests == []
+
+    def test_nominatim_fallback(self, stub):
+        """Test that unknown places resolve through Nominatim with a timezone"""
+        service = GeocodingService(nominatim=make_client(stub))
+        lat, lng, tz = asyncio.run(service.get_location_data_async("Zürich"))
+        assert (lat, lng) == (47.3769, 8.5417)
+        assert tz == "Europe/Zurich"
+
+    def test_miss(self, stub):
+        """Test that places Nominatim does not know return None"""
+        service = GeocodingService(nominatim=make_client(stub))
+        assert asyncio.run(service.get_location_data_async("Atlantis")) == (None, None, None)
@@ -0,0 +1,229 @@
+"""Test OpenAstroAPISource batching, retries and circuit breaking against a local stub server"""
+
+import random
+import socket
+from urllib.parse import parse_qs, urlparse
+
+import httpx
+import pytest
+
+from src.models.celestial import CelestialBody
+from src.models.error import ERROR_CALCULATION_FAILED, ERROR_EPHEMERIS_UNAVAILABLE
+from src.services.ephemeris.circuit_breaker import CLOSED, HALF_OPEN, OPEN, CircuitBreaker
+from src.services.ephemeris.openastro_api import OpenAstroAPISource
+from src.services.ephemeris.swiss_ephemeris import SwissEphemerisSource
+from tests.openastro_stub import OpenAstroStub
+
+JD = 2447963.1041666665  # 15.03.1990 14:30 UTC
+
+
+@pytest.fixture
+def stub():
+    """Run the stub API for one test"""
+    with OpenAstroStub() as server:
+        yield server
+
+
+def _source(url, sleeps=None, breaker=None, max_retries=3):
+    """Build a source that records backoffs instead of sleeping"""
+    return OpenAstroAPISource(
+        api_url=url,
+        timeout=2.0,
+        max_retries=max_retries,
+        backoff_base=0.1,
+        backoff_max=0.3,
+        breaker=breaker,
+        sleep=(sleeps.append if sleeps is not None else lambda seconds: None),
+        rng=random.Random(1),
+    )
+
+
+class TestCircuitBreaker:
+    """Test CircuitBreaker state transitions"""
+
+    def test_opens_after_threshold(self, clock):
+        """Test that consecutive failures open the circuit and a success resets the count"""
+        breaker = CircuitBreaker(failure_threshold=3, reset_timeout=10.0, clock=clock)
+        breaker.record_failure()
+        breaker.record_failure()
+        breaker.record_success()
+        breaker.record_failure()
+        breaker.record_failure()
+        assert breaker.state == CLOSED
+
+        breaker.record_failure()
+        assert breaker.state == OPEN
+        assert breaker.allow() is False
+        assert breaker.stats()["rejected"] == 1
+
+    def test_half_open_allows_single_trial(self, clock):
+        """Test that after the timeout exactly one trial goes through"""
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=10.0, clock=clock)
+        breaker.record_failure()
+
+        clock.now += 10.0
+        assert breaker.state == HALF_OPEN
+        assert breaker.allow() is True
+        assert breaker.allow() is False
+
+        breaker.record_failure()
+        assert breaker.state == OPEN
+        clock.now += 10.0
+        assert breaker.allow() is True
+        breaker.record_success()
+        assert breaker.state == CLOSED
+        assert breaker.stats()["opened"] == 2
+
+    def test_can_attempt_does_not_take_the_trial(self, clock):
+        """Test that can_attempt reports the trial slot without reserving it"""
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=10.0, clock=clock)
+        assert breaker.can_attempt() is True
+        breaker.record_failure()
+        assert breaker.can_attempt() is False
+
+        clock.now += 10.0
+        assert breaker.can_attempt() is True
+        assert breaker.can_attempt() is True
+        assert breaker.allow() is True
+        assert breaker.can_attempt() is False
+
+
+class TestBatching:
+    """Test that one request fetches all bodies of a moment"""
+
+    def test_one_request_per_julian_day(self, stub):
+        """Test that a full chart side costs a single GET and no HEAD probes"""
+        source = _source(stub.url)
+        bodies = list(CelestialBody)
+        longitudes = source.calculate_positions(bodies, JD)
+
+        assert stub.requests == [("GET", stub.requests[0][1])]
+        query = parse_qs(urlparse(stub.requests[0][1]).query)
+        assert sorted(int(i) for i in query["bodies"][0].split(",")) == list(range(11))
+        expected = SwissEphemerisSource().calculate_positions(bodies, JD)
+        assert longitudes == pytest.approx(expected, abs=1e-9)
+        source.close()
+
+    def test_connections_are_reused(self, stub):
+        """Test that successive requests share the pooled client"""
+        source = _source(stub.url)
+        client = source._get_client()
+        for offset in range(5):
+            source.calculate_position(CelestialBody.MOON, JD + offset)
+        assert source._get_client() is client
+        assert stub.get_requests() == 5
+        assert source.stats()["http2"] in (True, False)
+        source.close()
+
+
+class TestRetries:
+    """Test retries with jittered backoff"""
+
+    def test_transient_errors_are_retried(self, stub):
+        """Test that 503 and 429 are retried with growing, jittered, capped backoffs"""
+        stub.fail_with = [503, 429, 502]
+        sleeps = []
+        source = _source(stub.url, sleeps)
+
+        assert source.calculate_position(CelestialBody.SUN, JD) == pytest.approx(
+            SwissEphemerisSource().calculate_position(CelestialBody.SUN, JD), abs=1e-9
+        )
+        assert stub.get_requests() == 4
+        assert len(sleeps) == 3
+        for retry, seconds in enumerate(sleeps, start=1):
+            assert 0.0 <= seconds <= min(0.3, 0.1 * 2 ** (retry - 1))
+        assert source.stats()["retries"] == 3
+
+    def test_exhausted_retries_report_unavailable(self, stub):
+        """Test that a request failing every attempt raises an unavailable error"""
+        stub.down = True
+        source = _source(stub.url, max_retries=2)
+
+        with pytest.raises(RuntimeError, match=ERROR_EPHEMERIS_UNAVAILABLE):
+            source.calculate_position(CelestialBody.SUN, JD)
+        assert stub.get_requests() == 3
+        assert source.breaker.stats()["consecutive_failures"] == 1
+
+    def test_client_errors_are_not_retried(self, stub):
+        """Test that a 400 fails once without retries and without counting against the circuit"""
+        stub.fail_with = [400]
+        source = _source(stub.url)
+
+        with pytest.raises(RuntimeError, match=ERROR_CALCULATION_FAILED):
+            source.calculate_position(CelestialBody.SUN, JD)
+        assert stub.get_requests() == 1
+        assert source.breaker.state == CLOSED
+
+    def test_connection_refused(self):
+        """Test that an unreachable host is retried and reported as unavailable"""
+        with socket.socket() as sock:
+            sock.bind(("127.0.0.1", 0))
+            port = sock.getsockname()[1]
+        sleeps = []
+        source = _source(f"http://127.0.0.1:{port}/v1", sleeps, max_retries=1)
+
+        with pytest.raises(RuntimeError, match=ERROR_EPHEMERIS_UNAVAILABLE):
+            source.calculate_position(CelestialBody.SUN, JD)
+        assert len(sleeps) == 1
+
+
+class TestCircuitBreaking:
+    """Test that the source fails fast while the upstream is down"""
+
+    def test_fails_fast_and_recovers(self, clock, stub):
+        """Test that an open circuit skips the network until a trial request succeeds"""
+        breaker = CircuitBreaker(failure_threshold=2, reset_timeout=30.0, clock=clock)
+        source = _source(stub.url, breaker=breaker, max_retries=0)
+        stub.down = True
+
+        for _ in range(2):
+            with pytest.raises(RuntimeError):
+                source.calculate_position(CelestialBody.SUN, JD)
+        assert breaker.state == OPEN
+        requests = stub.get_requests()
+
+        with pytest.raises(RuntimeError, match="circuit is open"):
+            source.calculate_position(CelestialBody.SUN, JD)
+        assert stub.get_requests() == requests
+        assert source.is_available() is False
+        assert len(stub.requests) == requests
+
+        stub.down = False
+        clock.now += 30.0
+        assert source.calculate_position(CelestialBody.SUN, JD) > 0.0
+        assert breaker.state == CLOSED
+        assert source.is_available() is True
+
+    def test_unexpected_error_ends_half_open_trial(self, clock, stub, monkeypatch):
+        """Test that a trial failing with a non-transport error reopens the circuit"""
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=30.0, clock=clock)
+        source = _source(stub.url, breaker=breaker, max_retries=0)
+        breaker.record_failure()
+        clock.now += 30.0
+
+        def broken_get(*args, **kwargs):
+            raise httpx.InvalidURL("bad query")
+
+        monkeypatch.setattr(source._get_client(), "get", broken_get)
+        with pytest.raises(httpx.InvalidURL):
+            source.calculate_position(CelestialBody.SUN, JD)
+        assert breaker.state == OPEN
+        assert source.is_available() is False
+
+        monkeypatch.undo()
+        clock.now += 30.0
+        assert source.calculate_position(CelestialBody.SUN, JD) > 0.0
+        assert breaker.state == CLOSED
+
+    def test_unavailable_while_trial_in_flight(self, clock, stub):
+        """Test that is_available reports False while the half-open trial is running"""
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=30.0, clock=clock)
+        source = _source(stub.url, breaker=breaker)
+        breaker.record_failure()
+        clock.now += 30.0
+        assert source.is_available() is True
+
+        assert breaker.allow() is True
+        assert source.is_available() is False
+        breaker.record_success()
+        assert source.is_available() is True
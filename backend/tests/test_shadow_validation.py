@@ -0,0 +1,213 @@
+"""Test shadow validation of charts against a secondary ephemeris source"""
+
+import json
+import random
+import threading
+from datetime import datetime
+
+import pytest
+import pytz
+from fastapi.testclient import TestClient
+
+import src.main
+from src.main import app
+from src.models.celestial import CelestialBody
+from src.models.shadow import ShadowValidationConfig
+from src.services.ephemeris.composite import CompositeEphemerisSource
+from src.services.ephemeris.swiss_ephemeris import SwissEphemerisSource
+from src.services.shadow_validation import ShadowValidator, compare_sources
+
+BIRTH = pytz.UTC.localize(datetime(1990, 6, 15, 12, 30))
+
+
+class OffsetSource(SwissEphemerisSource):
+    """Swiss Ephemeris with a fixed offset on one body, optionally blocking until released"""
+
+    def __init__(self, body=CelestialBody.MOON, offset=0.0, gate=None):
+        super().__init__()
+        self.body = body
+        self.offset = offset
+        self.gate = gate
+
+    def calculate_positions(self, bodies, julian_day):
+        if self.gate is not None:
+            self.gate.wait(timeout=5.0)
+        longitudes = super().calculate_positions(bodies, julian_day)
+        return [
+            (longitude + self.offset) % 360.0 if body == self.body else longitude
+            for body, longitude in zip(bodies, longitudes)
+        ]
+
+    def get_source_name(self):
+        return "Offset"
+
+
+class FailingOffsetSource(OffsetSource):
+    """OffsetSource whose position batches fail after the first one"""
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.batches = 0
+
+    def calculate_positions(self, bodies, julian_day):
+        self.batches += 1
+        if self.batches > 1:
+            raise RuntimeError("Offset exploded")
+        return super().calculate_positions(bodies, julian_day)
+
+
+def _validator(secondary, **kwargs):
+    """Build a validator comparing Swiss Ephemeris against the given source"""
+    primary = SwissEphemerisSource()
+    sources = {None: primary, "openastro_api": secondary}
+    return ShadowValidator(resolve=sources.__getitem__, sun_table=lambda: None, **kwargs)
+
+
+class TestCompareSources:
+    """Test compare_sources"""
+
+    def test_identical_sources_match(self):
+        """Test that the same ephemeris yields zero deltas and no differences"""
+        record = compare_sources(SwissEphemerisSource(), OffsetSource(), BIRTH)
+
+        assert record["match"] is True
+        assert record["max_delta_arcsec"] == 0.0
+        assert record["design_time_delta_seconds"] == 0.0
+        assert set(record["deltas_arcsec"]) == {"personality", "design"}
+        assert len(record["deltas_arcsec"]["personality"]) == len(CelestialBody)
+
+    def test_offset_is_reported(self):
+        """Test that a shifted body shows up as delta and as gate/line difference"""
+        record = compare_sources(SwissEphemerisSource(), OffsetSource(offset=3.0), BIRTH)
+
+        assert record["deltas_arcsec"]["personality"]["Moon"] == pytest.approx(10800.0, abs=1e-3)
+        assert record["deltas_arcsec"]["design"]["Moon"] == pytest.approx(10800.0, abs=1e-3)
+        assert record["deltas_arcsec"]["personality"]["Sun"] == 0.0
+        assert record["max_delta_arcsec"] == pytest.approx(10800.0, abs=1e-3)
+        moon = [d for d in record["activation_differences"] if d["body"] == "Moon"]
+        assert {d["side"] for d in moon} == {"personality", "design"}
+        assert record["match"] is False
+        assert record["secondary"] == "Offset"
+
+    def test_primary_stays_on_one_failover_member(self):
+        """Test that a composite primary failing between the sides is recalculated and reported on one member"""
+        failing = FailingOffsetSource(offset=3.0)
+        primary = CompositeEphemerisSource([("offset", failing), ("swiss", SwissEphemerisSource())])
+        record = compare_sources(primary, OffsetSource(), BIRTH)
+
+        assert failing.batches == 2
+        assert record["primary"] == "SwissEphemeris"
+        assert record["max_delta_arcsec"] == 0.0
+        assert record["match"] is True
+
+    def test_deltas_wrap_around_aries(self):
+        """Test that deltas across 0° are reported as the short way round"""
+        record = compare_sources(SwissEphemerisSource(), OffsetSource(offset=359.0), BIRTH)
+        assert record["deltas_arcsec"]["personality"]["Moon"] == pytest.approx(-3600.0, abs=1e-3)
+
+
+class TestShadowValidator:
+    """Test sampling, the background worker and recorded metrics"""
+
+    def test_sampling(self):
+        """Test that sampling follows the configured rate and the enabled flag"""
+        assert not _validator(OffsetSource(), sample_rate=0.0).should_sample()
+        assert _validator(OffsetSource(), sample_rate=1.0).should_sample()
+        assert not _validator(OffsetSource(), sample_rate=1.0, enabled=False).should_sample()
+
+        validator = _validator(OffsetSource(), sample_rate=0.25, rng=random.Random(7))
+        share = sum(validator.should_sample() for _ in range(4000)) / 4000
+        assert 0.2 < share < 0.3
+
+    def test_disabled_by_default(self):
+        """Test that shadow validation is off unless configured"""
+        assert ShadowValidator.from_config(ShadowValidationConfig()).should_sample() is False
+
+    def test_records_and_logs_comparisons(self, tmp_path):
+        """Test that comparisons update counters, keep mismatches and append to the JSONL log"""
+        log_path = tmp_path / "shadow.jsonl"
+        validator = _validator(OffsetSource(offset=3.0), log_path=str(log_path))
+
+        assert validator.submit(BIRTH)
+        validator.close(wait=True)
+
+        stats = validator.stats()
+        assert stats["sampled"] == 1
+        assert stats["compared"] == 1
+        assert stats["mismatches"] == 1
+        assert stats["pending"] == 0
+        assert stats["activation_mismatches"]["personality.Moon"] == 1
+        assert stats["max_delta_arcsec"]["Moon"] == pytest.approx(10800.0, abs=1e-3)
+        assert stats["recent_mismatches"][0]["birth_utc"] == "1990-06-15T12:30:00+00:00"
+
+        lines = log_path.read_text().splitlines()
+        assert len(lines) == 1
+        assert json.loads(lines[0])["match"] is False
+
+    def test_drops_samples_when_behind(self):
+        """Test that samples beyond max_pending are dropped instead of queued"""
+        gate = threading.Event()
+        validator = _validator(OffsetSource(gate=gate), max_pending=2)
+
+        assert validator.submit(BIRTH)
+        assert validator.submit(BIRTH)
+        assert not validator.submit(BIRTH)
+        gate.set()
+        validator.close(wait=True)
+
+        stats = validator.stats()
+        assert stats["dropped"] == 1
+        assert stats["compared"] == 2
+        assert stats["mismatches"] == 0
+
+    def test_errors_are_counted(self):
+        """Test that a failing secondary source is counted, not raised"""
+        validator = _validator(OffsetSource())
+        validator._resolve = lambda name: (_ for _ in ()).throw(RuntimeError("down"))
+
+        validator.submit(BIRTH)
+        validator.close(wait=True)
+        assert validator.stats()["errors"] == 1
+        assert validator.stats()["pending"] == 0
+
+
+class TestShadowEndpoint:
+    """Test shadow validation behind /api/hd-chart"""
+
+    @pytest.fixture
+    def gate(self):
+        """Event releasing the secondary source"""
+        gate = threading.Event()
+        yield gate
+        gate.set()
+
+    @pytest.fixture
+    def client(self, monkeypatch, gate):
+        """Client whose every chart request is shadow-validated against a blocked source"""
+        validator = _validator(OffsetSource(offset=3.0, gate=gate), sample_rate=1.0)
+        monkeypatch.setattr(src.main, "shadow_validator", validator)
+        monkeypatch.setattr("src.api.routes.admin.get_shadow_validator", lambda: validator)
+        monkeypatch.setattr(app.state.limiter, "enabled", False)
+        monkeypatch.setenv("ADMIN_API_TOKEN", "secret-token")
+        yield TestClient(app)
+        validator.close()
+
+    def test_response_does_not_wait_for_comparison(self, client, gate):
+        """Test that the chart is returned while the comparison is still blocked"""
+        payload = {
+            "firstName": "Anna",
+            "birthDate": "15.06.1990",
+            "birthTime": "14:30",
+            "birthTimeApproximate": False,
+            "birthPlace": "Berlin, Germany",
+        }
+        response = client.post("/api/hd-chart", json=payload)
+        assert response.status_code == 200
+        assert src.main.shadow_validator.stats()["compared"] == 0
+
+        gate.set()
+        src.main.shadow_validator.close(wait=True)
+        stats = client.get("/api/admin/shadow", headers={"X-Admin-Token": "secret-token"}).json()
+        assert stats["sampled"] == 1
+        assert stats["compared"] == 1
+        assert stats["recent_mismatches"][0]["birth_utc"] == "1990-06-15T12:30:00+00:00"
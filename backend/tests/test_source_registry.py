@@ -0,0 +1,168 @@
+"""Test the ephemeris source registry and OpenAstro client lifecycle"""
+
+import time
+
+import httpx
+import pytest
+
+from src.models.celestial import CelestialBody
+from src.models.ephemeris import EphemerisConfig
+from src.models.error import ERROR_EPHEMERIS_UNAVAILABLE
+from src.services.ephemeris.base import EphemerisSource
+from src.services.ephemeris.openastro_api import OpenAstroAPISource
+from src.services.ephemeris.registry import EphemerisSourceRegistry
+from src.services.ephemeris.source_factory import get_ephemeris_source
+from src.services.ephemeris.swiss_ephemeris import SwissEphemerisSource
+
+
+class CountingSource(EphemerisSource):
+    """Source counting availability checks and close() calls"""
+
+    def __init__(self, available=True):
+        self.available = available
+        self.checks = 0
+        self.closed = 0
+
+    def calculate_position(self, body, julian_day):
+        return 0.0
+
+    def get_source_name(self):
+        return "Counting"
+
+    def is_available(self):
+        self.checks += 1
+        if self.available is None:
+            raise RuntimeError("probe failed")
+        return self.available
+
+    def close(self):
+        self.closed += 1
+
+
+def _registry(source=None, clock=None, **config):
+    """Build a registry whose configured source is a CountingSource"""
+    source = source or CountingSource()
+    built = []
+
+    def build(cfg):
+        built.append(cfg)
+        return source
+
+    registry = EphemerisSourceRegistry(
+        config=EphemerisConfig(source="swiss_ephemeris", **config),
+        builders={"swiss_ephemeris": build},
+        clock=clock or time.monotonic,
+    )
+    return registry, source, built
+
+
+class TestRegistry:
+    """Test EphemerisSourceRegistry"""
+
+    def test_source_is_built_once(self):
+        """Test that every get returns the same instance, aliases included"""
+        registry, source, built = _registry()
+        assert registry.get() is source
+        assert registry.get("swiss_ephemeris") is source
+        assert registry.get("swiss") is source
+        assert len(built) == 1
+
+    def test_unknown_source(self):
+        """Test that an unknown source name is rejected"""
+        registry, _, _ = _registry()
+        with pytest.raises(ValueError):
+            registry.get("tarot")
+
+    def test_default_follows_configuration(self):
+        """Test that the configured EPHEMERIS_SOURCE is the default source"""
+        registry = EphemerisSourceRegistry(config=EphemerisConfig(source="nasa_jpl"))
+        assert registry.get().get_source_name() == "NASA_JPL"
+        assert registry.is_available() is False
+
+    def test_availability_is_cached_for_ttl(self, clock):
+        """Test that availability is checked live only after the TTL expired"""
+        registry, source, _ = _registry(clock=clock, availability_ttl_seconds=30.0)
+
+        assert registry.is_available() is True
+        source.available = False
+        clock.now += 29.0
+        assert registry.is_available() is True
+        assert source.checks == 1
+
+        clock.now += 2.0
+        assert registry.is_available() is False
+        assert source.checks == 2
+
+    def test_failing_check_counts_as_unavailable(self):
+        """Test that an exception from is_available is cached as unavailable"""
+        registry, _, _ = _registry(source=CountingSource(available=None))
+        assert registry.is_available() is False
+        assert registry.stats()["availability"]["swiss_ephemeris"]["available"] is False
+
+    def test_background_refresh_and_shutdown(self):
+        """Test that startup refreshes availability in the background and shutdown closes sources"""
+        registry, source, _ = _registry(availability_refresh_seconds=0.01)
+        registry.startup()
+        assert registry.stats()["refreshing"] is True
+
+        deadline = time.monotonic() + 2.0
+        while source.checks < 3 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert source.checks >= 3
+
+        registry.shutdown()
+        checks = source.checks
+        time.sleep(0.05)
+        assert source.checks == checks
+        assert source.closed == 1
+        assert registry.stats()["sources"] == []
+
+    def test_factory_uses_shared_sources(self):
+        """Test that the source factory no longer builds a source per call"""
+        source = get_ephemeris_source()
+        assert source is get_ephemeris_source()
+        assert isinstance(get_ephemeris_source("swiss"), SwissEphemerisSource)
+
+
+class TestOpenAstroLifecycle:
+    """Test that OpenAstro no longer probes per body and closes its client explicitly"""
+
+    def _source(self, handler):
+        """Build a source whose HTTP client uses a mock transport"""
+        source = OpenAstroAPISource(api_url="http://openastro.test/v1", max_retries=0)
+        source._client = httpx.Client(transport=httpx.MockTransport(handler))
+        return source
+
+    def test_no_availability_probe_per_body(self):
+        """Test that a batch sends a single position request and no HEAD probe"""
+        requests = []
+
+        def handler(request):
+            requests.append(request.method)
+            return httpx.Response(200, json={"positions": {str(i): 10.0 for i in range(11)}})
+
+        source = self._source(handler)
+        longitudes = source.calculate_positions(list(CelestialBody), 2451545.0)
+
+        assert len(longitudes) == len(CelestialBody)
+        assert requests == ["GET"]
+
+    def test_connection_error_reports_unavailable(self):
+        """Test that an unreachable API is reported as unavailable"""
+
+        def handler(request):
+            raise httpx.ConnectError("connection refused")
+
+        source = self._source(handler)
+        with pytest.raises(RuntimeError, match=ERROR_EPHEMERIS_UNAVAILABLE):
+            source.calculate_position(CelestialBody.SUN, 2451545.0)
+
+    def test_close(self):
+        """Test that close() closes the pooled client and a later request opens a new one"""
+        source = self._source(lambda request: httpx.Response(200, json={"longitude": 1.0}))
+        client = source._client
+
+        source.close()
+        assert client.is_closed
+        assert source._client is None
+        source.close()
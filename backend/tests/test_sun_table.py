@@ -0,0 +1,106 @@
+"""Test precomputed Sun-longitude table"""
+
+from datetime import datetime
+
+import numpy as np
+import pytest
+import pytz
+
+from src.models.celestial import CelestialBody
+from src.services.calculation.design_time import MIN_SUN_SPEED, calculate_design_datetime
+from src.services.calculation.sun_table import DEFAULT_JD_END, DEFAULT_JD_START, SunLongitudeTable
+from src.services.ephemeris.swiss_ephemeris import SwissEphemerisSource
+
+JD_START = 2447800.5  # 1989-09-05
+JD_END = 2448500.5  # 1991-08-06
+
+
+@pytest.fixture(scope="module")
+def source():
+    """Create Swiss Ephemeris source"""
+    return SwissEphemerisSource()
+
+
+@pytest.fixture(scope="module")
+def table_path(source, tmp_path_factory):
+    """Build a two-year table once and save it"""
+    path = tmp_path_factory.mktemp("sun_table") / "sun_table.bin"
+    SunLongitudeTable.build(source, JD_START, JD_END).save(path)
+    return path
+
+
+class TestSunLongitudeTable:
+    """Test table interpolation, inverse and persistence"""
+
+    def test_load_roundtrip(self, table_path):
+        """Test that a saved table loads with the same range"""
+        table = SunLongitudeTable.load(table_path)
+        assert table.jd_start == JD_START
+        assert table.jd_end == JD_END
+        assert np.all(np.diff(table.longitudes) > 0)
+
+    def test_interpolated_longitude_matches_ephemeris(self, source, table_path):
+        """Test that interpolated longitudes are within 0.01 arc-seconds"""
+        table = SunLongitudeTable.load(table_path)
+        for jd in np.linspace(JD_START + 0.3, JD_END - 0.3, 50):
+            expected = source.calculate_position(CelestialBody.SUN, jd)
+            delta = (table.longitude(jd) - expected + 180.0) % 360.0 - 180.0
+            assert abs(delta) < 0.01 / 3600.0
+
+    def test_verify_against_solver(self, source, table_path):
+        """Test that table design moments agree with the ephemeris solver"""
+        table = SunLongitudeTable.load(table_path)
+        birth_jds = np.linspace(JD_START + 95.0, JD_END, 40)
+        report = table.verify_against(source, birth_jds, tolerance_seconds=0.5)
+        assert report["passed"], report
+
+    def test_vectorized_matches_scalar(self, table_path):
+        """Test that batch lookups equal single lookups"""
+        table = SunLongitudeTable.load(table_path)
+        birth_jds = np.linspace(JD_START + 95.0, JD_END, 25)
+        batch = table.design_julian_day(birth_jds)
+        singles = [table.design_julian_day(float(jd)) for jd in birth_jds]
+        assert np.allclose(batch, singles, rtol=0, atol=1e-9)
+
+    def test_out_of_range(self, table_path):
+        """Test that moments outside the table are rejected"""
+        table = SunLongitudeTable.load(table_path)
+        with pytest.raises(ValueError):
+            table.design_julian_day(JD_START + 10.0)
+        with pytest.raises(ValueError):
+            table.design_julian_day(JD_END + 1.0)
+
+    def test_rejects_foreign_file(self, tmp_path):
+        """Test that files without the table header are rejected"""
+        path = tmp_path / "bogus.bin"
+        path.write_bytes(b"\x00" * 64)
+        with pytest.raises(ValueError):
+            SunLongitudeTable.load(path)
+
+    def test_default_range_covers_supported_years(self, source):
+        """Test that every 1850-2100 birth and its earliest design moment fall in the default range"""
+        first = source.datetime_to_julian_day(pytz.UTC.localize(datetime(1850, 1, 1)))
+        last = source.datetime_to_julian_day(pytz.UTC.localize(datetime(2100, 12, 31, 23, 59)))
+        assert DEFAULT_JD_START <= first - 88.0 / MIN_SUN_SPEED
+        assert last <= DEFAULT_JD_END
+
+
+class TestDesignDatetimeWithTable:
+    """Test calculate_design_datetime table path"""
+
+    def test_table_and_solver_agree(self, source, table_path):
+        """Test that the table path gives the same design moment as the solver"""
+        table = SunLongitudeTable.load(table_path)
+        birth = datetime(1990, 6, 15, 12, 30, tzinfo=pytz.UTC)
+
+        from_table = calculate_design_datetime(birth, source, sun_table=table)
+        from_solver = calculate_design_datetime(birth, source)
+
+        assert abs((from_table - from_solver).total_seconds()) < 1.0
+
+    def test_falls_back_outside_table(self, source, table_path):
+        """Test that births outside the table use the ephemeris solver"""
+        table = SunLongitudeTable.load(table_path)
+        birth = datetime(2005, 1, 1, 0, 0, tzinfo=pytz.UTC)
+        design = calculate_design_datetime(birth, source, sun_table=table)
+        assert 86 < (birth - design).total_seconds() / 86400 < 93
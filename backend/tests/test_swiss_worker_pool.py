@@ -0,0 +1,84 @@
+"""Test persistent swisseph worker pool"""
+
+import pytest
+import swisseph as swe
+
+from src.services.ephemeris import worker_pool as worker_pool_module
+from src.services.ephemeris.swiss_ephemeris import SwissEphemerisSource
+from src.services.ephemeris.worker_pool import SwissWorkerPool, check_worker_pool
+
+FLAGS = swe.FLG_SWIEPH | swe.FLG_SPEED
+JD_J2000 = 2451545.0
+
+
+@pytest.fixture(scope="module")
+def pool():
+    """Start a small pool once for the module"""
+    worker_pool = SwissWorkerPool(size=1, request_timeout=30.0)
+    worker_pool.start()
+    yield worker_pool
+    worker_pool.shutdown()
+
+
+class TestSwissWorkerPool:
+    """Test SwissWorkerPool requests, health checks and respawning"""
+
+    def test_batch_matches_in_process_calculation(self, pool):
+        """Test that one request returns every body and matches direct swisseph"""
+        bodies = [swe.SUN, swe.MOON, swe.TRUE_NODE]
+        results = pool.calculate(JD_J2000, bodies, FLAGS)
+
+        assert len(results) == len(bodies)
+        for body, (longitude, speed) in zip(bodies, results):
+            expected = swe.calc_ut(JD_J2000, body, FLAGS)[0]
+            assert longitude == pytest.approx(expected[0], abs=1e-9)
+            assert speed == pytest.approx(expected[3], abs=1e-9)
+
+    def test_health_check(self, pool):
+        """Test that live workers answer pings"""
+        assert pool.health_check() is True
+
+    def test_respawns_crashed_worker(self, pool):
+        """Test that a killed worker is replaced and the pool keeps answering"""
+        worker = pool._idle.get()
+        worker.process.kill()
+        worker.process.join(timeout=5)
+        pool._idle.put(worker)
+
+        respawns_before = pool.respawns
+        longitude, _ = pool.calculate(JD_J2000, [swe.SUN], FLAGS)[0]
+
+        assert pool.respawns == respawns_before + 1
+        assert 0.0 <= longitude < 360.0
+
+    def test_invalid_size(self):
+        """Test that an empty pool is rejected"""
+        with pytest.raises(ValueError):
+            SwissWorkerPool(size=0)
+
+
+class TestWorkerPoolHealthCheck:
+    """Test the periodic health check run by SwissEphemerisSource.is_available"""
+
+    def test_unstarted_pool_is_not_spawned(self, monkeypatch):
+        """Test that checking an unused pool neither spawns workers nor fails"""
+        idle = SwissWorkerPool(size=1)
+        monkeypatch.setattr(worker_pool_module, "_pool", idle)
+        assert check_worker_pool() is None
+        assert idle.started is False
+        assert SwissEphemerisSource().is_available() is True
+
+    def test_availability_check_replaces_dead_worker(self, pool, monkeypatch):
+        """Test that the availability refresh respawns a crashed worker before a request hits it"""
+        monkeypatch.setattr(worker_pool_module, "_pool", pool)
+        worker = pool._idle.get()
+        worker.process.kill()
+        worker.process.join(timeout=5)
+        pool._idle.put(worker)
+
+        respawns, checks = pool.respawns, pool.health_checks
+        assert SwissEphemerisSource().is_available() is True
+        assert pool.respawns == respawns + 1
+        assert pool.health_checks == checks + 1
+        assert pool.stats()["failed_health_checks"] >= 1
+        assert SwissEphemerisSource().stats()["worker_pool"]["idle"] == 1
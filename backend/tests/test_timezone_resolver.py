@@ -0,0 +1,94 @@
+"""Test grid-quantized timezone resolver"""
+
+import random
+
+import pytest
+from timezonefinder import TimezoneFinder
+
+from src.services.timezone_resolver import (
+    BOUNDARY,
+    TimezoneResolver,
+    _polygon_overlaps_box,
+    parse_bounds,
+)
+
+
+@pytest.fixture(scope="module")
+def finder():
+    """Load TimezoneFinder once"""
+    return TimezoneFinder()
+
+
+@pytest.fixture
+def resolver(finder):
+    """Create a resolver sharing the loaded finder"""
+    return TimezoneResolver(finder=finder, exact_cache_size=16)
+
+
+class TestTimezoneResolver:
+    """Test cell table lookups against TimezoneFinder"""
+
+    def test_matches_timezone_finder(self, resolver, finder):
+        """Test that resolved zones equal exact lookups worldwide and in Europe"""
+        rng = random.Random(7)
+        points = [(rng.uniform(-89.0, 89.0), rng.uniform(-180.0, 180.0)) for _ in range(1500)]
+        points += [(rng.uniform(45.5, 55.5), rng.uniform(5.5, 17.5)) for _ in range(1500)]
+        for lat, lng in points:
+            assert resolver.timezone_at(lat, lng) == finder.timezone_at(lng=lng, lat=lat)
+
+    def test_interior_cells_skip_polygon_test(self, resolver, finder):
+        """Test that interior cells answer from the table without an exact lookup"""
+        resolver.precompute(45.5, 55.5, 5.5, 17.5)
+        interior = next(cell for cell, zone in resolver._cells.items() if zone != BOUNDARY)
+        row, col = divmod(interior, resolver._cols)
+        lat = (row + 0.5) * resolver.cell_degrees - 90.0
+        lng = (col + 0.5) * resolver.cell_degrees - 180.0
+
+        assert resolver.timezone_at(lat, lng) == finder.timezone_at(lng=lng, lat=lat)
+        lookups = resolver.stats()["lookups"]
+        assert lookups["cell"]["count"] == 1
+        assert lookups["exact"]["count"] == 0
+        assert lookups["classify"]["count"] == 0
+
+    def test_boundary_lookups_are_memoized(self, resolver):
+        """Test that repeated boundary lookups hit the exact-result cache"""
+        # Kehl/Strasbourg: the Rhine border runs through this cell
+        resolver.timezone_at(48.5734, 7.7521)
+        resolver.timezone_at(48.5734, 7.7521)
+        lookups = resolver.stats()["lookups"]
+        assert lookups["exact"]["count"] == 1
+        assert lookups["exact_cached"]["count"] == 1
+
+    def test_exact_cache_bounded(self, resolver):
+        """Test that the exact-result cache stays within its size"""
+        for i in range(40):
+            resolver.timezone_at(48.5734 + i * 1e-4, 7.7521)
+        assert resolver.stats()["cells"]["exact_cached"] <= 16
+
+    def test_stats_report_load_and_table(self, resolver):
+        """Test that stats include finder, table and per-mode sections"""
+        resolver.timezone_at(52.52, 13.405)
+        stats = resolver.stats()
+        assert stats["finder"]["in_memory"] is True
+        assert stats["cells"]["entries"] >= 1
+        assert set(stats["lookups"]) == {"cell", "exact", "exact_cached", "classify"}
+
+
+class TestHelpers:
+    """Test bounds parsing and overlap test"""
+
+    def test_parse_bounds(self):
+        """Test that bounds parse and empty values disable precomputation"""
+        assert parse_bounds("45.5,55.5,5.5,17.5") == (45.5, 55.5, 5.5, 17.5)
+        assert parse_bounds("") is None
+        assert parse_bounds(None) is None
+
+    def test_polygon_overlaps_box(self):
+        """Test convex polygon / box overlap"""
+        square = [(0.0, 0.0), (2.0, 0.0), (2.0, 2.0), (0.0, 2.0)]
+        assert _polygon_overlaps_box(square, 1.0, 3.0, 1.0, 3.0)
+        assert _polygon_overlaps_box(square, 0.5, 1.5, 0.5, 1.5)
+        assert not _polygon_overlaps_box(square, 2.5, 3.0, 0.0, 1.0)
+        # Diagonal edge passes near but not through the box corner
+        triangle = [(0.0, 0.0), (2.0, 0.0), (0.0, 2.0)]
+        assert not _polygon_overlaps_box(triangle, 1.1, 2.0, 1.1, 2.0)